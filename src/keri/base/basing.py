@@ -43,8 +43,10 @@ class Habitat:
         ks (keeping.Keeper): lmdb key store
         mgr (keeping.Manager): creates and rotates keys in key store
         ridx (int): rotation index (inception == 0) needed for key replay
-        kevers (dict): of eventing.Kever(s) keyed by qb64 prefix
+        kevers (dict | eventing.KeverCache): of eventing.Kever(s) keyed by qb64 prefix
         db (dbing.Baser): lmdb data base for KEL etc
+        strict (Boolean): True means reverify own signatures when ingesting
+            own msgs into .kvy. Otherwise trust them
         kvy (eventing.Kevery): instance for local processing of local msgs
         parser (eventing.Parser):  parses local messages for .kvy
         iserder (coring.Serder): own inception event
@@ -60,7 +62,8 @@ class Habitat:
                  isith=None, icount=1, nsith=None, ncount=None,
                  toad=None, wits=None,
                  salt=None, tier=None,
-                 transferable=True, temp=False, erase=True):
+                 transferable=True, temp=False, erase=True, keverCacheSize=None,
+                 mapSize=None, durability=None, keys=None, strict=False):
         """
         Initialize instance.
 
@@ -84,11 +87,23 @@ class Habitat:
             temp is Boolean used for persistence of lmdb ks and db directories
                 and mode for key generation
             erase is Boolean True means erase private keys once stale
+            keverCacheSize is int max number of Kevers held in memory when
+                .kevers not provided. None means hold all Kevers in plain dict
+            mapSize is int initial lmdb map size in bytes of .db and .ks when
+                not provided. None means LMDBer default
+            durability is str lmdb durability mode of .db when not provided
+                See LMDBer.Durabilities. None means LMDBer default 'sync'
+            keys is optional tuple (verfers, digers, cst, nst) of keys already
+                incepted in .ks such as by Manager.inceptMany. None means
+                incept keys here
+            strict is Boolean True means reverify own signatures when
+                ingesting own msgs
         """
         self.name = name
         self.transferable = transferable
         self.temp = temp
         self.erase = erase
+        self.strict = True if strict else False
 
         if nsith is None:
             nsith = isith
@@ -99,8 +114,13 @@ class Habitat:
             code = coring.MtrDex.Ed25519N
         pidx = None
 
-        self.db = db if db is not None else dbing.Baser(name=name, temp=self.temp)
-        self.ks = ks if ks is not None else keeping.Keeper(name=name, temp=self.temp)
+        self.db = db if db is not None else dbing.Baser(name=name,
+                                                        temp=self.temp,
+                                                        mapSize=mapSize,
+                                                        durability=durability)
+        self.ks = ks if ks is not None else keeping.Keeper(name=name,
+                                                           temp=self.temp,
+                                                           mapSize=mapSize)
 
         # for persisted Habitats, check the KOM first to see if there is an existing one we can restart from
         # otherwise initialize a new one
@@ -123,12 +143,17 @@ class Habitat:
 
         self.mgr = keeping.Manager(keeper=self.ks, pidx=pidx, salt=salt, tier=tier)
         self.ridx = 0  # rotation index of latest establishment event
-        self.kevers = kevers if kevers is not None else dict()
+        if kevers is None:
+            kevers = (eventing.KeverCache(db=self.db, size=keverCacheSize)
+                      if keverCacheSize is not None else dict())
+        self.kevers = kevers
 
         if existing:
             self.reinitialize()
         else:
-            if secrecies:
+            if keys is not None:  # keys already incepted in bulk
+                verfers, digers, cst, nst = keys
+            elif secrecies:
                 verferies, digers = self.mgr.ingest(secrecies,
                                                     ncount=ncount,
                                                     stem=self.name,
@@ -162,31 +187,143 @@ class Habitat:
             self.mgr.move(old=opre, new=self.pre)
 
             sigers = self.mgr.sign(ser=self.iserder.raw, verfers=verfers)
-            msg = eventing.messagize(self.iserder, sigers=sigers)
 
             self.kvy = eventing.Kevery(kevers=self.kevers, db=self.db, opre=self.pre, local=True)
             self.psr = eventing.Parser(framed=True, kvy=self.kvy)
 
-            self.psr.processOne(ims=msg)
+            # own event just signed so ingest directly. Message built when sent
+            self.kvy.processLocal(serder=self.iserder, sigers=sigers,
+                                  strict=self.strict)
             if self.pre not in self.kevers:
                 raise kering.ConfigurationError("Improper Habitat inception for "
                                                 "pre={}.".format(self.pre))
 
             kom.put(keys=habKeys, data=HabitatRecord(name=name, prefix=self.pre))
 
-    def reinitialize(self):
+    @classmethod
+    def inceptMany(cls, names, ks, db, params=None, kevers=None,
+                   salt=None, tier=None, workers=None, **kwa):
+        """
+        Returns list of Habitats one per name in names incepted in bulk in
+        shared ks and db. The keys of all the Habitats are stretched together
+        in parallel by Manager.inceptMany. The witness and prefix parameters
+        of every Habitat are validated before any write. All the writes to ks
+        and db of all the inceptions, keys included, then commit in one
+        transaction each so any failure aborts them all.
+
+        Parameters:
+            names is list of str aliases one per Habitat
+            ks is keystore lmdb Keeper instance
+            db is database lmdb Baser instance
+            params is optional list of dicts of Habitat parameters one per
+                name that override the shared ones in kwa such as isith,
+                icount, nsith, ncount, toad, wits, code and transferable
+            kevers is dict of Kever instance keyed by qb64 prefix
+            salt is qb64 salt for creating key pairs
+            tier is security tier for generating keys from salt
+            workers is int max number of concurrent key stretches. None means
+                number of cpus
+            kwa is shared Habitat parameters of all names
+        """
+        if params is None:
+            params = [dict() for name in names]
+        if len(params) != len(names):
+            raise ValueError("Mismatch of {} params for {} names."
+                             "".format(len(params), len(names)))
+        params = [dict(kwa, **param) for param in params]
+
+        if salt is None:
+            salt = coring.Salter(raw=b'0123456789abcdef').qb64
+        if kevers is None:
+            kevers = dict()
+
+        kom = Komer(db=db, schema=HabitatRecord, subdb='habitats.')
+        incepts = []  # key parameters of Manager.incept one per name
+        for name, param in zip(names, params):
+            if kom.get(keys=('hab', name)) is not None:
+                raise ValueError("Already incepted Habitat name={}.".format(name))
+            isith = param.get("isith")
+            icount = param.get("icount", 1)
+            nsith = param.get("nsith", isith)
+            ncount = param.get("ncount", icount)
+            transferable = param.get("transferable", True)
+            cls._checkIncept(transferable=transferable,
+                             ncount=ncount if transferable else 0,
+                             toad=param.get("toad"), wits=param.get("wits"),
+                             code=param.get("code", coring.MtrDex.Blake3_256))
+            incepts.append(dict(isith=isith, icount=icount, nsith=nsith,
+                                ncount=ncount if transferable else 0,
+                                stem=name, transferable=transferable,
+                                temp=param.get("temp", False)))
+
+        with ks.batch(), db.batch():  # one commit each for keys and Habitats
+            mgr = keeping.Manager(keeper=ks, salt=salt, tier=tier, workers=workers)
+            try:
+                keyss = mgr.inceptMany(params=incepts)  # nested in ks batch
+            finally:
+                mgr.close()
+
+            return [cls(name=name, ks=ks, db=db, kevers=kevers, salt=salt,
+                        tier=tier, keys=keys, **param)
+                    for name, param, keys in zip(names, params, keyss)]
+
+    @staticmethod
+    def _checkIncept(transferable=True, ncount=1, toad=None, wits=None,
+                     code=coring.MtrDex.Blake3_256):
+        """
+        Raises ValueError or DerivationError if inception of Habitat with
+        these witness and prefix parameters would fail. Builds throwaway
+        inception event with placeholder keys so nothing is written.
+        """
+        if not transferable:
+            code = coring.MtrDex.Ed25519N
+        verfer = coring.Verfer(raw=bytes(32),
+                               code=(coring.MtrDex.Ed25519 if transferable
+                                     else coring.MtrDex.Ed25519N))
+        nxt = (coring.Nexter(digs=[coring.Diger(ser=verfer.qb64b).qb64
+                                   for i in range(ncount)]).qb64
+               if ncount else "")
+        eventing.incept(keys=[verfer.qb64], nxt=nxt, toad=toad, wits=wits,
+                        code=code)
+
+    def reinitialize(self, verify=False):
+        """
+        Reload .kevers from the key state records persisted in .db in
+        O(prefixes) instead of replaying and reverifying every KEL.
+        Falls back to full replay when .db has no key state record for .pre
+        such as a database written before key state records were persisted.
+
+        Parameters:
+            verify (Boolean): True means also reverify reloaded key state
+                against the persisted KELs. To reverify in the background
+                instead run .kvy.verifyKeversIter() from a doer.
+        """
         if self.pre is None:
             raise kering.ConfigurationError("Improper Habitat reinitialization missing prefix")
 
         self.kvy = eventing.Kevery(kevers=self.kevers, db=self.db, opre=self.pre, local=True)
         self.psr = eventing.Parser(framed=True, kvy=self.kvy)
 
-        msgs = self.replay()
-        self.psr.process(ims=bytearray(msgs), kvy=self.kvy)
-
-        msgs = self.replayAll()
-        tkvy = eventing.Kevery(kevers=self.kevers, db=self.db, opre=self.pre, local=False)
-        self.psr.process(ims=bytearray(msgs), kvy=tkvy)
+        if self.db.getState(key=self.pre.encode("utf-8")) is not None:
+            self.kvy.reloadKevers()
+            if verify:
+                verifier = self.kvy.verifyKeversIter()
+                try:
+                    while True:
+                        next(verifier)
+                except StopIteration as ex:
+                    bads = ex.value
+                if bads:
+                    raise kering.ConfigurationError("Unverified key state for "
+                                                    "pres={}.".format(bads))
+
+        else:  # no persisted key state so replay and reverify all KELs
+            msgs = self.replay()
+            self.psr.process(ims=bytearray(msgs), kvy=self.kvy)
+
+            msgs = self.replayAll()
+            tkvy = eventing.Kevery(kevers=self.kevers, db=self.db, opre=self.pre, local=False)
+            self.psr.process(ims=bytearray(msgs), kvy=tkvy)
 
         # ridx for replay may be an issue when loading from existing
         sit = json.loads(bytes(self.ks.getSit(key=self.pre)).decode("utf-8"))
@@ -265,15 +402,14 @@ class Habitat:
                                  data=data)
 
         sigers = self.mgr.sign(ser=serder.raw, verfers=verfers)
-        msg = eventing.messagize(serder, sigers=sigers)
 
         # update own key event verifier state
-        self.psr.processOne(ims=bytearray(msg))  # make copy as kvr deletes
+        self.kvy.processLocal(serder=serder, sigers=sigers, strict=self.strict)
         if kever.serder.dig != serder.dig:
             raise kering.ValidationError("Improper Habitat rotation for "
                                          "pre={}.".format(self.pre))
         self.ridx += 1  # successful rotate so increment for next time
-        return msg
+        return eventing.messagize(serder, sigers=sigers)
 
     def interact(self, data=None):
         """
@@ -287,22 +423,23 @@ class Habitat:
                                    data=data)
 
         sigers = self.mgr.sign(ser=serder.raw, verfers=kever.verfers)
-        msg = eventing.messagize(serder, sigers=sigers)
 
         # update own key event verifier state
-        self.psr.processOne(ims=bytearray(msg))  # make copy as kvy deletes
+        self.kvy.processLocal(serder=serder, sigers=sigers, strict=self.strict)
         if kever.serder.dig != serder.dig:
             raise kering.ValidationError("Improper Habitat interaction for "
                                          "pre={}.".format(self.pre))
 
-        return msg
+        return eventing.messagize(serder, sigers=sigers)
 
-    def query(self, pre, res, dt=None, dta=None, dtb=None):
+    def query(self, pre, res, dt=None, dta=None, dtb=None, fn=None, limit=None):
         """
         Returns query message for querying for a single element of type res
+        fn and limit if any page a replay of logs from fn of at most limit msgs
         """
         kever = self.kever
-        serder = eventing.query(pre=pre,res=res, dt=dt, dta=dta, dtb=dtb)
+        serder = eventing.query(pre=pre,res=res, dt=dt, dta=dta, dtb=dtb,
+                                fn=fn, limit=limit)
 
         sigers = self.mgr.sign(ser=serder.raw, verfers=kever.verfers)
         msg = eventing.messagize(serder, sigers=sigers)
@@ -329,15 +466,16 @@ class Habitat:
             sigers = self.mgr.sign(ser=serder.raw,
                                    verfers=self.kever.verfers,
                                    indexed=True)
-            msg = eventing.messagize(serder=reserder, sigers=sigers, seal=seal)
+            tsgs = [(self.kever.prefixer, coring.Seqner(sn=self.kever.lastEst.s),
+                     coring.Diger(qb64=self.kever.lastEst.d), sigers)]
+            self.ingest(serder=reserder, tsgs=tsgs)  # process local copy into db
+            return eventing.messagize(serder=reserder, sigers=sigers, seal=seal)
         else:
             cigars = self.mgr.sign(ser=serder.raw,
                                    verfers=self.kever.verfers,
                                    indexed=False)
-            msg = eventing.messagize(reserder, cigars=cigars)
-
-        self.psr.processOne(ims=bytearray(msg))  # process local copy into db
-        return msg
+            self.ingest(serder=reserder, cigars=cigars)  # process local copy into db
+            return eventing.messagize(reserder, cigars=cigars)
 
     def witness(self, serder):
         """
@@ -369,9 +507,24 @@ class Habitat:
                                pubs=[self.pre],
                                indices=[index])
 
-        msg = eventing.messagize(reserder, wigers=wigers, pipelined=True)
-        self.psr.processOne(ims=bytearray(msg))  # process local copy into db
-        return msg
+        self.ingest(serder=reserder, wigers=wigers)  # process local copy into db
+        return eventing.messagize(reserder, wigers=wigers, pipelined=True)
+
+    def ingest(self, serder, **kwa):
+        """
+        Process own msg of serder with attachments in kwa into own db through
+        trusted local ingest of .kvy. As with the Parser errors are logged not
+        raised since receipts of events not yet seen are escrowed.
+
+        Parameters:
+            serder is Serder instance of own msg
+            kwa is attachments sigers, wigers, cigars or tsgs of
+                Kevery.processLocal
+        """
+        try:
+            self.kvy.processLocal(serder=serder, strict=self.strict, **kwa)
+        except kering.ValidationError as ex:
+            logger.error("Habitat local ingest error: %s\n", ex.args[0])
 
     def endorse(self, serder):
         """
@@ -522,10 +675,11 @@ class Habitat:
                 yield msgs
 
             elif cueKin in ("replay", ):
-                msgs = cue["msgs"]
-                print("processing replay")
-                print(msgs)
-                yield msgs
+                msgs = cue["msgs"]  # bytes like or lazy cursor of chunks
+                if isinstance(msgs, (bytes, bytearray, memoryview)):
+                    yield msgs
+                else:  # pull each chunk only when consumer is ready
+                    yield from msgs
 
 
 class Komer:
@@ -547,7 +701,9 @@ class Komer:
         """
         self.db = db
         self.schema = schema
-        self.sdb = self.db.env.open_db(key=subdb.encode("utf-8"))
+        # join write batch if any since a second write txn would deadlock
+        self.sdb = self.db.env.open_db(key=subdb.encode("utf-8"),
+                                       txn=self.db._txn)
         self.kind = kind
         self.serializer = self._serializer(kind)
         self.deserializer = self._deserializer(kind)
@@ -5,7 +5,9 @@ keri.base.directing module
 
 simple direct mode demo support classes
 """
+import heapq
 import os
+import selectors
 
 from hio.base import doing
 from hio.core import wiring
@@ -47,7 +49,7 @@ def setupController(name="who", sith=None, count=1, temp=False,
     director = Director(hab=hab, client=client, tock=0.125)
     reactor = Reactor(hab=hab, client=client)
 
-    server = serving.Server(host="", port=localPort, wl=wl)
+    server = SelectServer(host="", port=localPort, wl=wl)
     serverDoer = doing.ServerDoer(server=server)
     directant = Directant(hab=hab, server=server)
     # Reactants created on demand by directant
@@ -149,6 +151,10 @@ class Reactor(doing.DoDoer):
         .opts is dict of injected options for its generator .do
         .doers is list of Doers or Doer like generator functions
 
+    Class Attributes:
+        .TxHigh is int high water mark of bytes queued on .client before
+            .cueDo pulls the next chunk of a replay cue
+
     Attributes:
         .hab is Habitat instance of local controller's context
         .client is TCP Client instance.
@@ -187,6 +193,8 @@ class Reactor(doing.DoDoer):
 
     """
 
+    TxHigh = 65536  # bytes queued to send before pulling more of replay
+
     def __init__(self, hab, client, indirect=False, doers=None, **kwa):
         """
         Initialize instance.
@@ -281,6 +289,8 @@ class Reactor(doing.DoDoer):
             for msg in self.hab.processCuesIter(self.kevery.cues):
                 self.sendMessage(msg, label="chit or receipt")
                 yield  # throttle just do one cue at a time
+                while len(self.client.txbs) >= self.TxHigh:  # backpressure
+                    yield  # wait for client to drain before pulling more
             yield
         return False  # should never get here except forced close
 
@@ -305,7 +315,7 @@ class Reactor(doing.DoDoer):
             add to doers list
         """
         while True:
-            self.kevery.processEscrows()
+            self.kevery.processWokenEscrows()
             yield
         return False  # should never get here except forced close
 
@@ -317,12 +327,219 @@ class Reactor(doing.DoDoer):
         logger.info("%s sent %s:\n%s\n\n", self.hab.pre, label, bytes(msg))
 
 
+class SelectRemoter(serving.Remoter):
+    """
+    Remoter for SelectServer. Notifies its server when bytes are queued to
+    send so the server only services sends of remoters with pending bytes.
+
+    See serving.Remoter for inherited attributes and methods
+
+    Attributes:
+        .selector is selectors.BaseSelector of server .cs is registered with
+        .sending is set of ca of server remoters with bytes queued to send
+    """
+
+    def __init__(self, selector=None, sending=None, **kwa):
+        """
+        Initialization method for instance.
+
+        Parameters:
+            selector is selectors.BaseSelector of server
+            sending is set of server to add .ca to when bytes queued to send
+            kwa is serving.Remoter parameters
+        """
+        super(SelectRemoter, self).__init__(**kwa)
+        self.selector = selector
+        self.sending = sending if sending is not None else set()
+
+    def close(self):
+        """
+        Unregister from .selector then shutdown and close connected socket .cs
+        """
+        if self.cs and self.selector is not None:
+            try:
+                self.selector.unregister(self.cs)
+            except (KeyError, ValueError):  # not registered
+                pass
+        super(SelectRemoter, self).close()
+
+    def tx(self, data):
+        """
+        Queue data onto .txbs and notify server
+        """
+        super(SelectRemoter, self).tx(data)
+        self.sending.add(self.ca)
+
+
+class SelectServer(serving.Server):
+    """
+    Nonblocking TCP Server that services its sockets by readiness notification
+    from selectors (epoll on linux) instead of polling every connection on
+    every .service. Only ready sockets, remoters with bytes to send and
+    expired timers get work so idle connections cost nothing per service.
+    Consumers such as Directant get the connections that need attention
+    from .popReady instead of iterating .ixes.
+
+    See serving.Server for inherited attributes and methods
+
+    Attributes:
+        .selector is selectors.DefaultSelector of listen and remoter sockets
+        .ready is set of ca of remoters that are new, received bytes, were
+            cutoff or whose timer expired since last .popReady
+        .sending is set of ca of remoters with bytes queued to send
+        .deadlines is heap of duples (tyme, ca) of remoter timer expirations.
+            Refreshed timers are rescheduled lazily when their entry pops
+        .backlog is int size of listen queue of pending connects
+    """
+
+    Backlog = 1024  # listen queue size so bursts of connects are not refused
+
+    def __init__(self, backlog=None, **kwa):
+        """
+        Initialization method for instance.
+
+        Parameters:
+            backlog is int size of listen queue of pending connects
+            kwa is serving.Server parameters
+        """
+        self.backlog = backlog if backlog is not None else self.Backlog
+        self.selector = selectors.DefaultSelector()
+        self.ready = set()
+        self.sending = set()
+        self.deadlines = []
+        super(SelectServer, self).__init__(**kwa)
+
+    def open(self):
+        """
+        Opens binds listen socket in non blocking mode and registers it
+        """
+        if not super(SelectServer, self).open():
+            return False
+        self.ss.listen(self.backlog)  # deeper than serving.Server default
+        self.selector.register(self.ss, selectors.EVENT_READ)
+        return True
+
+    def close(self):
+        """
+        Unregister and close all sockets
+        """
+        if self.ss:
+            try:
+                self.selector.unregister(self.ss)
+            except (KeyError, ValueError):  # not registered
+                pass
+        super(SelectServer, self).close()
+
+    def serviceAxes(self):
+        """
+        For each newly accepted connection in .axes create SelectRemoter,
+        register it with .selector and add to .ixes keyed by ca
+        """
+        self.serviceAccepts()  # populate .axes
+        while self.axes:
+            cs, ca = self.axes.popleft()
+            if ca != cs.getpeername():
+                raise ValueError("Accepted socket host addresses malformed for "
+                                 "peer. ca {0} != {1}\n".format(ca, cs.getpeername()))
+            remoter = SelectRemoter(tymth=self.tymth,
+                                    ha=cs.getsockname(),
+                                    ca=ca,
+                                    cs=cs,
+                                    bs=self.bs,
+                                    wl=self.wl,
+                                    timeout=self.timeout,
+                                    selector=self.selector,
+                                    sending=self.sending)
+            if ca in self.ixes and self.ixes[ca] is not remoter:
+                self.removeIx(ca)
+            self.ixes[ca] = remoter
+            self.selector.register(cs, selectors.EVENT_READ, ca)
+            if remoter.timeout > 0.0:
+                heapq.heappush(self.deadlines, (self.tyme + remoter.timeout, ca))
+            self.ready.add(ca)  # new connection
+
+    def popReady(self):
+        """
+        Returns set of ca of remoters that need attention and resets .ready
+        """
+        ready, self.ready = self.ready, set()
+        return ready
+
+    def serviceReady(self):
+        """
+        Service receives of readable remoters
+        """
+        for key, events in self.selector.select(timeout=0):
+            if key.fileobj is self.ss:  # pending accepts
+                self.serviceConnects()
+                continue
+            ca = key.data
+            ix = self.ixes.get(ca)
+            if ix is None:
+                continue
+            if events & selectors.EVENT_READ:
+                ix.serviceReceives()
+                self.ready.add(ca)
+            if events & selectors.EVENT_WRITE:  # writable again so send
+                self.sending.add(ca)
+
+    def serviceSendsReady(self):
+        """
+        Service sends of remoters with bytes queued to send. Remoters whose
+        socket would block wait for a writable notification
+        """
+        sending = list(self.sending)
+        self.sending.clear()  # in place since shared with remoters
+        for ca in sending:
+            ix = self.ixes.get(ca)
+            if ix is None or not ix.cs:
+                continue
+            ix.serviceSends()
+            if ix.cutoff:
+                self.ready.add(ca)
+            elif ix.txbs:  # partial send so wait until writable
+                self.selector.modify(ix.cs, selectors.EVENT_READ | selectors.EVENT_WRITE, ca)
+            else:
+                self.selector.modify(ix.cs, selectors.EVENT_READ, ca)
+
+    def serviceTimers(self):
+        """
+        Mark remoters whose timer expired as ready and reschedule the others
+        """
+        tyme = self.tyme
+        while self.deadlines and self.deadlines[0][0] <= tyme:
+            _, ca = heapq.heappop(self.deadlines)
+            ix = self.ixes.get(ca)
+            if ix is None:  # already removed
+                continue
+            if ix.tymer.expired:
+                self.ready.add(ca)
+            else:  # refreshed so reschedule
+                heapq.heappush(self.deadlines, (tyme + ix.tymer.remaining, ca))
+
+    def service(self):
+        """
+        Service accepts, receives and sends of ready sockets and expired timers.
+        """
+        if not self.opened:
+            return
+        self.serviceReady()
+        self.serviceSendsReady()
+        self.serviceTimers()
+
+
 class Directant(doing.DoDoer):
     """
     Directant class with TCP Server.
     Responds to initiated connections from a remote Director by creating and
     running a Reactant per connection. Each Reactant has TCP remoter.
 
+    With a SelectServer the Directant is readiness driven. Only connections
+    from SelectServer.popReady and Reactants with work still pending are
+    serviced, by calling Reactant.service, so idle connections cost nothing
+    per tick. With any other Server every connection is polled each tick
+    and each Reactant runs as a doer.
+
     Directant Subclass of DoDoer with doers list from do generator methods:
         .serviceDo
 
@@ -345,6 +562,8 @@ class Directant(doing.DoDoer):
         .hab is Habitat instance of local controller's context
         .server is TCP client instance. Assumes operated by another doer.
         .rants is dict of Reactants indexed by connection address
+        .active is set of connection addresses of Reactants with work still
+            pending when readiness driven
 
     Inherited Properties:
         .tyme is float relative cycle time of associated Tymist .tyme obtained
@@ -392,6 +611,7 @@ class Directant(doing.DoDoer):
         self.hab = hab
         self.server = server  # use server for cx
         self.rants = dict()
+        self.active = set()
         doers = doers if doers is not None else []
         doers.extend([self.serviceDo])
         super(Directant, self).__init__(doers=doers, **kwa)
@@ -429,22 +649,60 @@ class Directant(doing.DoDoer):
             add to doers list
         """
         while True:
-            for ca, ix in list(self.server.ixes.items()):
-                if ix.cutoff:
-                    self.closeConnection(ca)
-                    continue
+            if isinstance(self.server, SelectServer):
+                self.serviceReady()
+            else:
+                self.serviceAll()
+            yield
+        return False  # should never get here
 
-                if ca not in self.rants:  # create Reactant and extend doers with it
-                    rant = Reactant(tymth=self.tymth, hab=self.hab, remoter=ix)
-                    self.rants[ca] = rant
-                    # add Reactant (rant) doer to running doers
-                    self.extend(doers=[rant])  # open and run rant as doer
+    def serviceAll(self):
+        """
+        Poll every connection on .server. Creates Reactant for each new
+        connection and adds it to running doers. Closes cutoff and timed out
+        connections.
+        """
+        for ca, ix in list(self.server.ixes.items()):
+            if ix.cutoff:
+                self.closeConnection(ca)
+                continue
 
-                if ix.timeout > 0.0 and ix.tymer.expired:
-                    self.closeConnection(ca)  # also removes rant
+            if ca not in self.rants:  # create Reactant and extend doers with it
+                rant = Reactant(tymth=self.tymth, hab=self.hab, remoter=ix)
+                self.rants[ca] = rant
+                # add Reactant (rant) doer to running doers
+                self.extend(doers=[rant])  # open and run rant as doer
 
-            yield
-        return False  # should never get here
+            if ix.timeout > 0.0 and ix.tymer.expired:
+                self.closeConnection(ca)  # also removes rant
+
+    def serviceReady(self):
+        """
+        Service only ready connections of SelectServer .server and Reactants
+        with work still pending. Creates Reactant for each new connection and
+        closes cutoff and timed out connections.
+        """
+        cas = self.server.popReady()
+        if self.active:
+            cas |= self.active
+            self.active = set()
+
+        for ca in cas:
+            ix = self.server.ixes.get(ca)
+            if ix is None:  # removed elsewhere
+                self.rants.pop(ca, None)
+                continue
+
+            if ix.cutoff or (ix.timeout > 0.0 and ix.tymer.expired):
+                self.closeConnection(ca)  # also removes rant
+                continue
+
+            rant = self.rants.get(ca)
+            if rant is None:
+                rant = Reactant(tymth=self.tymth, hab=self.hab, remoter=ix)
+                self.rants[ca] = rant
+            if rant.service():  # work still pending so service again next tick
+                self.active.add(ca)
 
     def closeConnection(self, ca):
         """
@@ -453,6 +711,7 @@ class Directant(doing.DoDoer):
         if ca in self.server.ixes:  # remoter still there
             self.server.ixes[ca].serviceSends()  # send final bytes to socket
         self.server.removeIx(ca)
+        self.active.discard(ca)
         if ca in self.rants:  # remove rant (Reactant) if any
             self.remove([self.rants[ca]])  # close and remove rant from doers list
             del self.rants[ca]
@@ -462,6 +721,8 @@ class Reactant(doing.DoDoer):
     """
     Reactant Subclass of DoDoer with doers list from do generator methods:
         .msgDo, .cueDo, and .escrowDo.
+    When readiness driven by Directant it is not run as a doer. Instead
+    .service does one nonblocking pass of the same work when ready.
     Enables continuous scheduling of doers (do generator instances or functions)
 
     Implements Doist like functionality to allow nested scheduling of doers.
@@ -470,11 +731,19 @@ class Reactant(doing.DoDoer):
 
     Scheduling hierarchy: Doist->DoDoer...->DoDoer->Doers
 
+    Class Attributes:
+        .TxHigh is int high water mark of bytes queued on .remoter before
+            .cueDo pulls the next chunk of a replay cue
+
     Attributes:
         .hab is Habitat instance of local controller's context
         .kevery is Kevery instance
         .remoter is TCP Remoter instance for connection from remote TCP client.
 
+    Hidden:
+        ._processor is generator of .parser for .service created on first use
+        ._cuer is iterator of msgs of cues for .service while not exhausted
+
     Inherited Attributes:
         .done is Boolean completion state:
             True means completed
@@ -515,6 +784,8 @@ class Reactant(doing.DoDoer):
 
     """
 
+    TxHigh = 65536  # bytes queued to send before pulling more of replay
+
     def __init__(self, hab, remoter, doers=None, **kwa):
         """
         Initialize instance.
@@ -540,6 +811,8 @@ class Reactant(doing.DoDoer):
         self.parser = eventing.Parser(ims=self.remoter.rxbs,
                                       framed=True,
                                       kvy=self.kevery)
+        self._processor = None
+        self._cuer = None
         doers = doers if doers is not None else []
         doers.extend([self.msgDo, self.cueDo, self.escrowDo])
         super(Reactant, self).__init__(doers=doers, **kwa)
@@ -605,6 +878,8 @@ class Reactant(doing.DoDoer):
             for msg in self.hab.processCuesIter(self.kevery.cues):
                 self.sendMessage(msg, label="chit or receipt or replay")
                 yield  # throttle just do one cue at a time
+                while len(self.remoter.txbs) >= self.TxHigh:  # backpressure
+                    yield  # wait for remoter to drain before pulling more
             yield
         return False  # should never get here except forced close
 
@@ -629,10 +904,41 @@ class Reactant(doing.DoDoer):
             add to doers list
         """
         while True:
-            self.kevery.processEscrows()
+            self.kevery.processWokenEscrows()
             yield
         return False  # should never get here except forced close
 
+    def service(self):
+        """
+        Returns True if work is still pending after one nonblocking pass of
+        the work of .msgDo, .cueDo and .escrowDo. Otherwise False so nothing
+        to do until more bytes are received. Used by readiness driven
+        Directant instead of running this Reactant as a doer.
+        Stops pulling cue msgs while .TxHigh bytes are queued to send.
+        """
+        ims = self.parser.ims
+        if ims:
+            if self._processor is None:
+                self._processor = self.parser.processor()
+            while ims:  # process all complete msgs
+                size = len(ims)
+                next(self._processor)
+                if len(ims) == size:  # partial msg so wait for more bytes
+                    break
+
+        if self._cuer is None and self.kevery.cues:
+            self._cuer = self.hab.processCuesIter(self.kevery.cues)
+        while self._cuer is not None and len(self.remoter.txbs) < self.TxHigh:
+            try:
+                msg = next(self._cuer)
+            except StopIteration:
+                self._cuer = None
+                break
+            self.sendMessage(msg, label="chit or receipt or replay")
+
+        self.kevery.processWokenEscrows()
+        return bool(self._cuer is not None or self.kevery.cues or self.kevery.wakes)
+
     def sendMessage(self, msg, label=""):
         """
         Sends message msg and loggers label if any
@@ -7,7 +7,6 @@ simple indirect mode demo support classes
 """
 
 from hio.base import doing
-from hio.core.tcp import serving
 
 from .. import help
 from ..db import dbing
@@ -17,12 +16,17 @@ from . import basing, keeping, directing
 logger = help.ogler.getLogger()
 
 
-def setupWitness(name="witness", localPort=5620):
-
+def setupWitness(name="witness", localPort=5620, mapSize=None, durability=None):
+    """
+    Returns doers for witness named name listening on localPort.
+    mapSize and durability configure the witness lmdb databases.
+    See dbing.LMDBer
+    """
     wsith = 1
 
     hab = basing.Habitat(name=name, temp=False, transferable=False,
-                            isith=wsith, icount=1,)
+                            isith=wsith, icount=1, mapSize=mapSize,
+                            durability=durability)
     logger.info("\nWitness- %s:\nNamed %s on TCP port %s.\n\n",
                 hab.pre, hab.name, localPort)
 
@@ -30,7 +34,7 @@ def setupWitness(name="witness", localPort=5620):
     ksDoer = keeping.KeeperDoer(keeper=hab.ks)  # doer do reopens if not opened and closes
     dbDoer = dbing.BaserDoer(baser=hab.db)  # doer do reopens if not opened and closes
 
-    server = serving.Server(host="", port=localPort)
+    server = directing.SelectServer(host="", port=localPort)
     serverDoer = doing.ServerDoer(server=server)
     directant = directing.Directant(hab=hab, server=server)
 
@@ -218,7 +222,7 @@ class Indirector(doing.DoDoer):
             add to doers list
         """
         while True:
-            self.kevery.processEscrows()
+            self.kevery.processWokenEscrows()
             yield
         return False  # should never get here except forced close
 
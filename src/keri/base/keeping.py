@@ -29,7 +29,8 @@ import math
 
 from typing import Union
 from dataclasses import dataclass, asdict, field
-from collections import namedtuple, deque
+from collections import namedtuple, deque, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from hio.base import doing
 
@@ -643,6 +644,7 @@ class Creator:
 
     Methods:
         .create is method to create key pair
+        .submit is method to create key pair futures
 
     Hidden:
 
@@ -662,6 +664,18 @@ class Creator:
         """
         return []
 
+    def submit(self, pool=None, **kwa):
+        """
+        Returns list of futures of signers one per key pair as .create.
+        Base creates now so futures are done. pool is ignored
+        """
+        futures = []
+        for signer in self.create(**kwa):
+            future = Future()
+            future.set_result(signer)
+            futures.append(future)
+        return futures
+
     @property
     def salt(self):
         """
@@ -782,7 +796,8 @@ class SaltyCreator(Creator):
         return self.salter.tier
 
     def create(self, codes=None, count=1, code=coring.MtrDex.Ed25519_Seed,
-               pidx=0, ridx=0, kidx=0, transferable=True, temp=False, **kwa):
+               pidx=0, ridx=0, kidx=0, transferable=True, temp=False,
+               pool=None, **kwa):
         """
         Returns list of signers one per kidx in kidxs
 
@@ -795,20 +810,41 @@ class SaltyCreator(Creator):
             kidx is int starting key index for key pair set
             transferable is Boolean, True means use trans deriv code. Otherwise nontrans
             temp is Boolean True means use temp level for testing
+            pool is optional Executor to stretch each key in parallel
+        """
+        return [future.result() for future in
+                self.submit(codes=codes, count=count, code=code, pidx=pidx,
+                            ridx=ridx, kidx=kidx, transferable=transferable,
+                            temp=temp, pool=pool)]
+
+    def submit(self, codes=None, count=1, code=coring.MtrDex.Ed25519_Seed,
+               pidx=0, ridx=0, kidx=0, transferable=True, temp=False,
+               pool=None, **kwa):
+        """
+        Returns list of futures of signers one per kidx as .create.
+        Each key is stretched as its own task on pool when provided so the
+        argon2 stretches run concurrently. Otherwise stretches now in order.
+        The stretch does not hold the GIL so a thread pool runs on all cores.
+
+        Parameters:
+            see .create
         """
-        signers = []
         if not codes:  # if not codes make list len count of same code
             codes = [code for i in range(count)]
 
+        futures = []
         stem = self.stem if self.stem else "{:x}".format(pidx)  # if not stem use pidx
         for i, code in enumerate(codes):
             path = "{}{:x}{:x}".format(stem, ridx, kidx + i)
-            signers.append(self.salter.signer(path=path,
-                                              code=code,
-                                              transferable=transferable,
-                                              tier=self.tier,
-                                              temp=temp))
-        return signers
+            kwa = dict(path=path, code=code, transferable=transferable,
+                       tier=self.tier, temp=temp)
+            if pool is not None:
+                futures.append(pool.submit(self.salter.signer, **kwa))
+            else:
+                future = Future()
+                future.set_result(self.salter.signer(**kwa))
+                futures.append(future)
+        return futures
 
 
 class Creatory:
@@ -871,6 +907,15 @@ class Manager:
 
     Attributes:
         .keeper is Keeper instance (LMDB)
+        .cacheSize is int max number of Signers held in memory by .signers.
+            0 means no caching
+        .workers is int max number of key stretches run at once. Each salty
+            stretch uses the memory of its tier so workers also bounds memory.
+            0 or 1 means stretch serially in calling thread
+        .prestretch is Boolean True means after incept and rotate stretch the
+            keys of the following rotation in the background so that rotate
+            finds them ready. The private keys are then held in memory until
+            used or until .clearSigners
 
     Properties:
 
@@ -880,9 +925,17 @@ class Manager:
        ._pidx is initial pidx prefix index use attribute because keeper may not be open on init
        ._salt is initial salt use attribute because keeper may not be open on init
        ._tier is initial security tier use attribute because keeper may not be open on init
+       ._signers is OrderedDict of Signers keyed by qb64 public key least
+            recently used first. Saves a db read and Verfer derivation per
+            signature. Entries are dropped when their private keys are erased
+       ._pool is ThreadPoolExecutor for key stretching created lazily
+       ._stretches is dict of pending prestretches keyed by qb64 pre whose
+            values are duples (params, futures)
     """
+    CacheSize = 64  # default max number of Signers in memory
 
-    def __init__(self, keeper=None, pidx=None, salt=None, tier=None):
+    def __init__(self, keeper=None, pidx=None, salt=None, tier=None,
+                 cacheSize=None, workers=None, prestretch=False):
         """
         Setup Manager.
 
@@ -891,12 +944,24 @@ class Manager:
             pidx is int prefix index of next new created key pair sequence
             salt is qb64 of root salt. Makes random root salt if not provided
             tier is default SecTier for root salt
+            cacheSize is int max number of Signers in memory. None means
+                .CacheSize. 0 means no caching
+            workers is int max number of concurrent key stretches. None means
+                number of cpus
+            prestretch is Boolean True means stretch keys of the following
+                rotation in the background
 
         """
         if keeper is None:
             keeper = Keeper()
 
         self.keeper = keeper
+        self.cacheSize = cacheSize if cacheSize is not None else self.CacheSize
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.prestretch = True if prestretch else False
+        self._signers = OrderedDict()
+        self._pool = None
+        self._stretches = dict()
         self._pidx = pidx if pidx is not None else 0
         self._salt = salt if salt is not None else coring.Salter().qb64
         self._tier = tier if tier is not None else coring.Tiers.low
@@ -1016,6 +1081,72 @@ class Manager:
 
         """
         pidx, rootSalt, rootTier = self.setup()  # pidx, salt, tier for new sequence
+        pool = self._getPool() if (self.workers > 1 and not temp) else None
+        pending = self._submitIncept(pidx=pidx, rootSalt=rootSalt,
+                                     rootTier=rootTier, pool=pool,
+                                     icodes=icodes, icount=icount, icode=icode,
+                                     isith=isith, ncodes=ncodes, ncount=ncount,
+                                     ncode=ncode, nsith=nsith, dcode=dcode,
+                                     algo=algo, salt=salt, stem=stem, tier=tier,
+                                     rooted=rooted, transferable=transferable,
+                                     temp=temp)
+        return self._storeIncept(**pending)
+
+
+    def inceptMany(self, params=None, count=1, **kwa):
+        """
+        Returns list of tuples (verfers, digers, cst, nst) one per incepted
+        prefix as .incept. Incepts many prefixes at once. The key stretches of
+        all the prefixes are submitted together so they run concurrently on
+        the pool and all the .keeper writes commit in one transaction.
+        Any failure aborts the writes of all the prefixes.
+
+        Parameters:
+            params is list of dicts of .incept parameters one per prefix.
+                Each dict overrides the shared parameters in kwa
+                None means count prefixes all with the shared parameters
+            count is int number of prefixes when params not provided
+            kwa is shared .incept parameters of all prefixes
+
+        Each prefix gets its own pidx in order so prefixes without a stem
+        derive distinct keys from the same salt.
+        """
+        if params is None:
+            params = [dict() for i in range(count)]
+        params = [dict(kwa, **param) for param in params]
+
+        pidx, rootSalt, rootTier = self.setup()
+        pool = self._getPool() if self.workers > 1 else None
+        pendings = []
+        for i, param in enumerate(params):
+            pendings.append(self._submitIncept(pidx=pidx + i, rootSalt=rootSalt,
+                                               rootTier=rootTier,
+                                               pool=(pool if not param.get("temp")
+                                                     else None),
+                                               **param))
+
+        with self.keeper.batch():  # one commit for all prefixes
+            return [self._storeIncept(**pending) for pending in pendings]
+
+
+    def _submitIncept(self, pidx, rootSalt, rootTier, pool=None,
+                      icodes=None, icount=1, icode=coring.MtrDex.Ed25519_Seed,
+                      isith=None, ncodes=None, ncount=1,
+                      ncode=coring.MtrDex.Ed25519_Seed, nsith=None,
+                      dcode=coring.MtrDex.Blake3_256,
+                      algo=Algos.salty, salt=None, stem=None, tier=None,
+                      rooted=True, transferable=True, temp=False):
+        """
+        Returns dict of pending inception for ._storeIncept after submitting
+        the key stretches of the inception to pool if any.
+
+        Parameters:
+            pidx is int prefix index of inception
+            rootSalt is str qb64 root salt from .setup
+            rootTier is str root tier from .setup
+            pool is optional Executor for key stretches
+            others see .incept
+        """
         ridx = 0  # rotation index
         kidx = 0  # key pair index
 
@@ -1032,24 +1163,44 @@ class Manager:
                 raise ValueError("Invalid icount={} must be > 0.".format(icount))
             icodes = [icode for i in range(icount)]
 
-        isigners = creator.create(codes=icodes,
-                                  pidx=pidx, ridx=ridx, kidx=kidx,
-                                  transferable=transferable, temp=temp)
-        verfers = [signer.verfer for signer in isigners]
-
-        if isith is None:
-            isith = "{:x}".format(max(1, math.ceil(len(isigners) / 2)))
-        cst = coring.Tholder(sith=isith).sith  # current signing threshold
-
         if not ncodes:  # all same code, make list of len ncount of same code
             if ncount < 0:  # next may be zero if non-trans
                 raise ValueError("Invalid ncount={} must be >= 0.".format(ncount))
             ncodes = [ncode for i in range(ncount)]
 
+        # submit both sets at once so all stretches run concurrently on pool
+        ifutures = creator.submit(codes=icodes,
+                                  pidx=pidx, ridx=ridx, kidx=kidx,
+                                  transferable=transferable, temp=temp, pool=pool)
         # count set to 0 to ensure does not create signers if ncodes is empty
-        nsigners = creator.create(codes=ncodes, count=0,
+        nfutures = creator.submit(codes=ncodes, count=0,
                                   pidx=pidx, ridx=ridx+1, kidx=kidx+len(icodes),
-                                  transferable=transferable, temp=temp)
+                                  transferable=transferable, temp=temp, pool=pool)
+
+        return dict(creator=creator, algo=algo, pidx=pidx, ridx=ridx, kidx=kidx,
+                    icodes=icodes, ncodes=ncodes, isith=isith, nsith=nsith,
+                    dcode=dcode, transferable=transferable, temp=temp,
+                    ifutures=ifutures, nfutures=nfutures)
+
+
+    def _storeIncept(self, creator, algo, pidx, ridx, kidx, icodes, ncodes,
+                     isith, nsith, dcode, transferable, temp, ifutures, nfutures):
+        """
+        Returns tuple (verfers, digers, cst, nst) as .incept after waiting on
+        the key stretches of pending inception from ._submitIncept and
+        storing its keys in .keeper
+
+        Parameters:
+            see ._submitIncept and .incept
+        """
+        isigners = [future.result() for future in ifutures]
+        nsigners = [future.result() for future in nfutures]
+        verfers = [signer.verfer for signer in isigners]
+
+        if isith is None:
+            isith = "{:x}".format(max(1, math.ceil(len(isigners) / 2)))
+        cst = coring.Tholder(sith=isith).sith  # current signing threshold
+
         digers = [coring.Diger(ser=signer.verfer.qb64b, code=dcode) for signer in nsigners]
 
         if nsith is None:
@@ -1097,6 +1248,12 @@ class Manager:
         self.keeper.putPubs(key=riKey(pre, ri=ridx+1),
                             val=json.dumps(ps.nxt.pubs).encode("utf-8"))
 
+        if self.prestretch and ncodes:  # guess next rotation reuses ncodes
+            self._prestretch(pre=verfers[0].qb64, creator=creator, algo=algo,
+                             codes=ncodes, pidx=self.getPidx(), ridx=ridx+2,
+                             kidx=kidx+len(icodes)+len(ncodes),
+                             transferable=transferable, temp=temp)
+
         return (verfers, digers, cst, nst)
 
 
@@ -1164,6 +1321,10 @@ class Manager:
         if not self.keeper.putPre(key=new, val=new):
             raise ValueError("Failed assiging new pre={}.".format(new))
 
+        # pending prestretch follows pre so next rotation of new uses it
+        if old in self._stretches:
+            self._stretches[new] = self._stretches.pop(old)
+
 
     def rotate(self, pre, codes=None, count=1, code=coring.MtrDex.Ed25519_Seed,
                      sith=None, dcode=coring.MtrDex.Blake3_256,
@@ -1245,10 +1406,23 @@ class Manager:
         ridx = ps.new.ridx + 1
         kidx = ps.nxt.kidx + len(ps.new.pubs)
 
-        # count set to 0 to ensure does not create signers if codes is empty
-        signers = creator.create(codes=codes, count=0,
-                                 pidx=pidx, ridx=ridx, kidx=kidx,
-                                 transferable=transferable, temp=temp)
+        # use keys prestretched in background when made for this rotation
+        params = self._stretchParams(creator=creator, algo=pp.algo, codes=codes,
+                                     pidx=pidx, ridx=ridx, kidx=kidx,
+                                     transferable=transferable, temp=temp)
+        pending = self._stretches.pop(pre, None)
+        if pending is not None and pending[0] == params:
+            signers = [future.result() for future in pending[1]]
+        else:
+            if pending is not None:  # guessed wrong so discard
+                for future in pending[1]:
+                    future.cancel()
+            pool = self._getPool() if (self.workers > 1 and not temp) else None
+            # count set to 0 to ensure does not create signers if codes is empty
+            signers = creator.create(codes=codes, count=0,
+                                     pidx=pidx, ridx=ridx, kidx=kidx,
+                                     transferable=transferable, temp=temp,
+                                     pool=pool)
         digers = [coring.Diger(ser=signer.verfer.qb64b, code=dcode) for signer in signers]
 
         if sith is None:
@@ -1274,6 +1448,12 @@ class Manager:
         if erase:
             for pub in old.pubs:  # remove old prikeys
                 self.keeper.delPri(key=pub.encode("utf-8"))
+                self._signers.pop(pub, None)
+
+        if self.prestretch and codes:  # guess next rotation reuses codes
+            self._prestretch(pre=pre, creator=creator, algo=pp.algo, codes=codes,
+                             pidx=pidx, ridx=ridx+1, kidx=kidx+len(codes),
+                             transferable=transferable, temp=temp)
 
         return (verfers, digers, cst, nst)
 
@@ -1308,47 +1488,124 @@ class Manager:
         then signs ser with eah pub
         returns list of sigers indexed else list of cigars if not
         """
-        signers = []
+        return self.signMany(sers=[ser], pubs=pubs, verfers=verfers,
+                             indexed=indexed, indices=indices)[0]
 
+
+    def signMany(self, sers, pubs=None, verfers=None, indexed=True, indices=None):
+        """
+        Returns list with one list of signatures per ser in sers in order.
+        Each list is as returned by .sign for that ser. Looks up the signers
+        once for the whole batch.
+
+        Parameters:
+            sers is list of bytes serializations to sign
+            pubs, verfers, indexed, indices are as .sign
+        """
         if pubs is None and verfers is None:
             raise ValueError("pubs or verfers required")
 
         if pubs:
-            for pub in pubs:
-                verfer = coring.Verfer(qb64=pub)  # needed to know if nontrans
-                raw = self.keeper.getPri(key=pub)
-                if raw is None:
-                    raise ValueError("Missing prikey in db for pubkey={}".format(pub))
-                signer = coring.Signer(qb64b=bytes(raw),
-                                       transferable=verfer.transferable)
-                signers.append(signer)
-
+            signers = [self._signer(pub) for pub in pubs]
         else:
-            for verfer in verfers:
-                pub = verfer.qb64
-                raw = self.keeper.getPri(key=pub)
-                if raw is None:
-                    raise ValueError("Missing prikey in db for pubkey={}".format(pub))
-                signer = coring.Signer(qb64b=bytes(raw),
-                                       transferable=verfer.transferable)
-                signers.append(signer)
+            signers = [self._signer(verfer.qb64) for verfer in verfers]
 
         if indices and len(indices) != len(signers):
             raise ValueError("Mismatch length indices={} and resultant signers "
                              "list={}".format(len(indices), len(signers)))
 
         if indexed or indices:
-            sigers = []
-            for i, signer in enumerate(signers):
-                if indices:
-                    i = indices[i]  # get index from indices
-                sigers.append(signer.sign(ser, index=i))  # assigns .verfer to siger
-            return sigers
+            if not indices:
+                indices = range(len(signers))
+            # assigns .verfer to each siger
+            return [[signer.sign(ser, index=i) for i, signer in zip(indices, signers)]
+                    for ser in sers]
         else:
-            cigars = []
-            for signer in signers:
-                cigars.append(signer.sign(ser))  # assigns .verfer to cigar
-            return cigars
+            # assigns .verfer to each cigar
+            return [[signer.sign(ser) for signer in signers] for ser in sers]
+
+
+    def _signer(self, pub):
+        """
+        Returns Signer for qb64 str public key pub from .signers cache if
+        there else from private key in .keeper and caches it.
+        Raises ValueError if no private key for pub.
+        """
+        if hasattr(pub, "decode"):
+            pub = pub.decode("utf-8")
+        if (signer := self._signers.get(pub)) is not None:
+            self._signers.move_to_end(pub)
+            return signer
+
+        verfer = coring.Verfer(qb64=pub)  # needed to know if nontrans
+        raw = self.keeper.getPri(key=pub)
+        if raw is None:
+            raise ValueError("Missing prikey in db for pubkey={}".format(pub))
+        signer = coring.Signer(qb64b=bytes(raw),
+                               transferable=verfer.transferable)
+        if self.cacheSize > 0:
+            self._signers[pub] = signer
+            while len(self._signers) > self.cacheSize:
+                self._signers.popitem(last=False)  # evict least recently used
+        return signer
+
+
+    def clearSigners(self):
+        """
+        Clears cache of Signers and pending prestretches so private keys are
+        only held in .keeper
+        """
+        self._signers.clear()
+        for params, futures in self._stretches.values():
+            for future in futures:
+                future.cancel()
+        self._stretches.clear()
+
+
+    def close(self):
+        """
+        Clears signers and shuts down key stretching pool if any
+        """
+        self.clearSigners()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+    def _getPool(self):
+        """
+        Returns key stretching pool creating it if needed
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=max(1, self.workers),
+                                            thread_name_prefix="keri-stretch")
+        return self._pool
+
+
+    @staticmethod
+    def _stretchParams(creator, algo, codes, pidx, ridx, kidx, transferable, temp):
+        """
+        Returns tuple of all the parameters that determine the keys of a set
+        so a prestretched set is only used when it matches exactly
+        """
+        return (algo, creator.salt, creator.stem, creator.tier, tuple(codes),
+                pidx, ridx, kidx, transferable, temp)
+
+
+    def _prestretch(self, pre, creator, algo, codes, pidx, ridx, kidx,
+                    transferable, temp):
+        """
+        Submits background stretch of key set for a later rotation of pre
+        """
+        if algo != Algos.salty:  # random keys are cheap and not reproducible
+            return
+        params = self._stretchParams(creator=creator, algo=algo, codes=codes,
+                                     pidx=pidx, ridx=ridx, kidx=kidx,
+                                     transferable=transferable, temp=temp)
+        futures = creator.submit(codes=codes, pidx=pidx, ridx=ridx, kidx=kidx,
+                                 transferable=transferable, temp=temp,
+                                 pool=self._getPool())
+        self._stretches[pre] = (params, futures)
 
 
     def ingest(self, secrecies, ncount=1, ncode=coring.MtrDex.Ed25519_Seed,
@@ -1554,6 +1811,7 @@ class Manager:
         if erase and oldpubs:
             for pub in oldpubs:  # remove old prikeys
                 self.keeper.delPri(key=pub.encode("utf-8"))
+                self._signers.pop(pub, None)
 
         verfers = [coring.Verfer(qb64=pub) for pub in newpubs]
         digers = [coring.Diger(ser=pub.encode("utf-8"), code=code) for pub in nxtpubs]
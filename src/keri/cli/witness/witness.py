@@ -11,15 +11,19 @@ import logging
 from keri import __version__
 from keri import help  # logger support
 from keri.base import directing, indirecting
+from keri.db import dbing
 
 
-def runWitness(name="witness", local=5621, expire=0.0):
+def runWitness(name="witness", local=5621, expire=0.0, mapSize=None,
+               durability=None):
     """
     Setup and run one witness
     """
 
     doers = indirecting.setupWitness(name=name,
-                                    localPort=local)
+                                    localPort=local,
+                                    mapSize=mapSize,
+                                    durability=durability)
 
     directing.runController(doers=doers, expire=expire)
 
@@ -45,6 +49,16 @@ def parseArgs(version=__version__):
                    action='store',
                    default="witness",
                    help="Name of controller. Default is eve. Choices are bob, sam, or eve.")
+    p.add_argument('-m', '--mapsize',
+                   action='store',
+                   type=int,
+                   default=None,
+                   help="Initial lmdb map size in bytes. Grows when full. Default is 10 MiB.")
+    p.add_argument('-d', '--durability',
+                   action='store',
+                   default=None,
+                   choices=dbing.LMDBer.Durabilities,
+                   help="lmdb durability mode. Default is sync.")
 
 
     args = p.parse_args()
@@ -65,7 +79,9 @@ def main():
 
     runWitness(name=args.name,
                local=args.local,
-               expire=args.expire)
+               expire=args.expire,
+               mapSize=args.mapsize,
+               durability=args.durability)
 
     logger.info("\n******* Ended Witness for %s listening on %s"
                  ".******\n\n", args.name, args.local)
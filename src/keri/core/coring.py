@@ -3,14 +3,18 @@
 keri.core.coring module
 
 """
+import os
 import re
 import json
 import copy
+import threading
 
-from dataclasses import dataclass, astuple
-from collections import namedtuple, deque
+from dataclasses import dataclass
+from functools import lru_cache
+from collections import namedtuple
 from base64 import urlsafe_b64encode as encodeB64
 from base64 import urlsafe_b64decode as decodeB64
+from concurrent.futures import ThreadPoolExecutor
 from math import ceil
 from fractions import Fraction
 from orderedset import OrderedSet
@@ -29,7 +33,7 @@ from ..kering import (EmptyMaterialError, RawMaterialError, UnknownCodeError,
                       ShortageError, UnexpectedCodeError, DeserializationError,
                       UnexpectedCountCodeError, UnexpectedOpCodeError)
 from ..kering import Versionage, Version
-from ..help.helping import sceil, nowIso8601
+from ..help.helping import nowIso8601
 
 Serialage = namedtuple("Serialage", 'json mgpk cbor')
 
@@ -63,6 +67,10 @@ VEREX = b'KERI(?P<major>[0-9a-f])(?P<minor>[0-9a-f])(?P<kind>[A-Z]{4})(?P<size>[
 Rever = re.compile(VEREX) #compile is faster
 MINSNIFFSIZE = 12 + VERFULLSIZE  # min bytes in buffer to sniff else need more
 
+# reused compact JSON encoder since json.dumps builds new encoder for non-default args
+JSONEncoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+@lru_cache(maxsize=1024)  # few distinct version strings so memoize parse
 def Deversify(vs):
     """
     Returns tuple(kind, version, size)
@@ -115,6 +123,12 @@ B64ChrByIdx[62] = '-'
 B64ChrByIdx[63] = '_'
 # Map char to Base64 index
 B64IdxByChr = {char: index for index, char in B64ChrByIdx.items()}
+# Table driven lookups so conversions need no dict lookup or decode per char.
+# B64Chrs is str of Base64 chars in index order so B64Chrs[index] is char
+B64Chrs = "".join(B64ChrByIdx[index] for index in range(64))
+# B64IdxByOrd is 256 entry tuple indexed by byte (char ordinal) whose value is
+# the Base64 index of that char or None when not a Base64 char.
+B64IdxByOrd = tuple(B64IdxByChr.get(chr(o)) for o in range(256))
 
 
 def intToB64(i, l=1):
@@ -122,15 +136,14 @@ def intToB64(i, l=1):
     Returns conversion of int i to Base64 str
     l is min number of b64 digits left padded with Base64 0 == "A" char
     """
-    d = deque()  # deque of characters base64
-    d.appendleft(B64ChrByIdx[i % 64])
-    i = i // 64
+    d = B64Chrs[i & 0x3f]
+    i >>= 6
     while i:
-        d.appendleft(B64ChrByIdx[i % 64])
-        i = i // 64
-    for j in range(l - len(d)):  # range(x)  x <= 0 means do not iterate
-        d.appendleft("A")
-    return ( "".join(d))
+        d = B64Chrs[i & 0x3f] + d
+        i >>= 6
+    if len(d) < l:
+        d = "A" * (l - len(d)) + d
+    return d
 
 
 def intToB64b(i, l=1):
@@ -144,12 +157,16 @@ def intToB64b(i, l=1):
 def b64ToInt(s):
     """
     Returns conversion of Base64 str s or bytes to int
+    Raises ValueError if s has any non Base64 chars
     """
-    if hasattr(s, 'decode'):
-        s = s.decode("utf-8")
+    if hasattr(s, 'encode'):
+        s = s.encode("utf-8")
     i = 0
-    for e, c in enumerate(reversed(s)):
-        i |= B64IdxByChr[c] << (e * 6)  # same as i += B64IdxByChr[c] * (64 ** e)
+    try:
+        for o in s:  # bytes bytearray or memoryview iterate as ints
+            i = (i << 6) | B64IdxByOrd[o]
+    except TypeError as ex:  # None entry so not a Base64 char
+        raise ValueError("Invalid Base64 chars in {}.".format(s)) from ex
     return i
 
 
@@ -165,7 +182,7 @@ def b64ToB2(s):
     """
     i = b64ToInt(s)
     i <<= 2 * (len(s) % 4)  # add 2 bits right padding for each sextet
-    n = sceil(len(s) * 3 / 4)  # compute min number of ocetets to hold all sextets
+    n = (len(s) * 3 + 3) // 4  # compute min number of ocetets to hold all sextets
     return (i.to_bytes(n, 'big'))
 
 
@@ -179,7 +196,7 @@ def b2ToB64(b, l):
     """
     if hasattr(b, 'encode'):
         b = b.encode("utf-8")  # convert to bytes
-    n = sceil(l * 3 / 4)  # number of bytes needed for l sextets
+    n = (l * 3 + 3) // 4  # number of bytes needed for l sextets
     if n > len(b):
         raise ValueError("Not enough bytes in {} to nab {} sextets.".format(b, l))
     i = int.from_bytes(b[:n], 'big')
@@ -196,7 +213,7 @@ def nabSextets(b, l):
     """
     if hasattr(b, 'encode'):
         b = b.encode("utf-8")  # convert to bytes
-    n = sceil(l * 3 / 4)  # number of bytes needed for l sextets
+    n = (l * 3 + 3) // 4  # number of bytes needed for l sextets
     if n > len(b):
         raise ValueError("Not enough bytes in {} to nab {} sextets.".format(b, l))
     i = int.from_bytes(b[:n], 'big')
@@ -264,7 +281,7 @@ class CryNonTransCodex:
     Ed448N:        str = "1AAC"  # Ed448 non-transferable prefix public signing verification key. Basic derivation.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 CryNonTransDex = CryNonTransCodex()  #  Make instance
 
@@ -285,7 +302,7 @@ class CryDigCodex:
     SHA2_256:             str = 'I'  #  SHA2 256 bit digest self-addressing derivation.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 CryDigDex = CryDigCodex()  #  Make instance
 
@@ -335,7 +352,7 @@ class MatterCodex:
 
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 MtrDex = MatterCodex()
 
@@ -351,7 +368,7 @@ class NonTransCodex:
     Ed448N:        str = "1AAC"  # Ed448 non-transferable prefix public signing verification key. Basic derivation.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 NonTransDex = NonTransCodex()  #  Make instance
 
@@ -376,7 +393,7 @@ class DigCodex:
     SHA2_512:             str = '0G'  # SHA2 512 bit digest self-addressing derivation.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 DigDex =DigCodex()  #  Make instance
 
@@ -387,6 +404,47 @@ DigDex =DigCodex()  #  Make instance
 # fs is the full size int number of chars in code plus appended material if any
 Sizage = namedtuple("Sizage", "hs ss fs")
 
+
+def hardTable(sizes):
+    """
+    Returns 256 entry tuple for flat first byte dispatch of text (qb64b) codes.
+    Indexed by ordinal of last char of each code selector in sizes. The value
+    is the hard size, hs, of codes with that selector or 0 if not a selector.
+    Selectors are one char for Matter and Indexer and two chars for Counter
+    where the first is always '-'.
+
+    Parameters:
+        sizes (dict): maps code selector chars to int hard size hs
+    """
+    table = [0] * 256
+    for selector, hs in sizes.items():
+        table[ord(selector[-1])] = hs
+    return tuple(table)
+
+
+def bardTable(sizes):
+    """
+    Returns tuple for flat leading bits dispatch of binary (qb2) codes.
+    Indexed by int of first byte of qb2 for one char code selectors or by int
+    of first 12 bits of qb2 for two char code selectors. The value is the hard
+    size, hs, of codes with that selector or 0 if not a selector.
+
+    Parameters:
+        sizes (dict): maps code selector chars to int hard size hs
+    """
+    sl = len(next(iter(sizes)))  # selector length all same length
+    if sl == 1:  # index by first byte holds first sextet plus 2 bits
+        table = [0] * 256
+        for selector, hs in sizes.items():
+            i = b64ToInt(selector) << 2
+            table[i:i + 4] = [hs] * 4
+    else:  # index by first 12 bits holds first two sextets exactly
+        table = [0] * 4096
+        for selector, hs in sizes.items():
+            table[b64ToInt(selector)] = hs
+    return tuple(table)
+
+
 class Matter:
     """
     Matter is fully qualified cryptographic material primitive base class for
@@ -412,8 +470,11 @@ class Matter:
         ._raw is bytes value for .raw property
         ._infil is method to compute fully qualified Base64 from .raw and .code
         ._exfil is method to extract .code and .raw from fully qualified Base64
+        ._qb64b is cached bytes value for .qb64b derived on first access
+        ._qb2 is cached bytes value for .qb2 derived on first access
 
     """
+    __slots__ = ("_code", "_raw", "_size", "_qb64b", "_qb2")  # no instance __dict__
     Codex = MtrDex
     # Sizes table maps from bytes Base64 first code char to int of hard size, hs,
     # (stable) of code. The soft size, ss, (unstable) is always 0 for Matter
@@ -459,8 +520,14 @@ class Matter:
                 '9A': Sizage(hs=2, ss=2, fs=None),
             }
     # Bizes table maps to hard size, hs, of code from bytes holding sextets
-    # converted from first code char. Used for ._bexfil.
+    # converted from first code char.
     Bizes = ({b64ToB2(c): hs for c, hs in Sizes.items()})
+    # Hards table is Sizes as 256 entry tuple indexed by first byte of qb64b.
+    # Value is hard size, hs, or 0 when unsupported. Used for ._exfil.
+    Hards = hardTable(Sizes)
+    # Bards table is Sizes as 256 entry tuple indexed by first byte of qb2.
+    # Value is hard size, hs, or 0 when unsupported. Used for ._bexfil.
+    Bards = bardTable(Sizes)
 
 
     def __init__(self, raw=None, code=MtrDex.Ed25519N, size=None,
@@ -486,6 +553,8 @@ class Matter:
         Else when qb64b or qb64 or qb2 provided extract and assign .raw and .code
 
         """
+        self._qb64b = None  # lazily derived .qb64b
+        self._qb2 = None  # lazily derived .qb2
         if raw is not None:  #  raw provided
             if not code:
                 raise EmptyMaterialError("Improper initialization need either "
@@ -512,7 +581,7 @@ class Matter:
 
             self._size = size
 
-            rawsize = Matter._rawSize(code)
+            rawsize = Matter._rawSize(code, size)
             raw = raw[:rawsize]  # copy only exact size from raw stream
             if len(raw) != rawsize:  # forbids shorter
                 raise RawMaterialError("Not enougth raw bytes for code={}"
@@ -526,7 +595,7 @@ class Matter:
         elif qb64b is not None:
             self._exfil(qb64b)
             if strip:  # assumes bytearray
-                del qb64b[:self.Codes[self.code].fs]
+                del qb64b[:self._fullSize()]  # may be variable length fs
 
         elif qb64 is not None:
             self._exfil(qb64)
@@ -534,7 +603,7 @@ class Matter:
         elif qb2 is not None:
             self._bexfil(qb2)
             if strip:  # assumes bytearray
-                del qb2[:self.Codes[self.code].fs*3//4]
+                del qb2[:self._fullSize() * 3 // 4]  # may be variable length fs
 
         else:
             raise EmptyMaterialError("Improper initialization need either "
@@ -616,7 +685,9 @@ class Matter:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
         """
-        return self._infil()
+        if self._qb64b is None:  # derive lazily once then cache
+            self._qb64b = self._infil()
+        return self._qb64b
 
 
     @property
@@ -635,7 +706,9 @@ class Matter:
         Property qb2:
         Returns Fully Qualified Binary Version Bytes
         """
-        return self._binfil()
+        if self._qb2 is None:  # derive lazily once then cache
+            self._qb2 = self._binfil()
+        return self._qb2
 
 
     @property
@@ -697,27 +770,26 @@ class Matter:
         """
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material, Need more characters.")
+        if hasattr(qb64b, "encode"):  # str so convert once to bytes
+            qb64b = qb64b.encode("utf-8")
 
-        first = qb64b[:1]  # extract first char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
-        if first not in self.Sizes:
-            if first[0] == '-':
+        first = qb64b[0]  # first char code selector as byte
+        cs = self.Hards[first]  # get hard code size by flat dispatch
+        if not cs:  # unsupported code start
+            if first == 0x2d:  # '-'
                 raise UnexpectedCountCodeError("Unexpected count code start"
                                                "while extracing Matter.")
-            elif first[0] == '_':
+            elif first == 0x5f:  # '_'
                 raise UnexpectedOpCodeError("Unexpected  op code start"
                                                "while extracing Matter.")
             else:
-                raise UnexpectedCodeError("Unsupported code start char={}.".format(first))
+                raise UnexpectedCodeError("Unsupported code start char={}."
+                                          "".format(chr(first)))
 
-        cs = self.Sizes[first]  # get hard code size
         if len(qb64b) < cs:  # need more bytes
             raise ShortageError("Need {} more characters.".format(cs-len(qb64b)))
 
-        code = qb64b[:cs]  # extract hard code
-        if hasattr(code, "decode"):
-            code = code.decode("utf-8")
+        code = bytes(qb64b[:cs]).decode("utf-8")  # extract hard code
         if code not in self.Codes:
             raise UnexpectedCodeError("Unsupported code ={}.".format(code))
 
@@ -728,10 +800,7 @@ class Matter:
             if bs % 4:
                 raise ValidationError("Whole code size not multiple of 4 for "
                                       "variable length material. bs={}.".format(bs))
-            size = qb64b[hs:hs+ss]  # extract size chars
-            if hasattr(size, "decode"):
-                size = size.decode("utf-8")
-            size = b64ToInt(size)  # compute int size
+            size = b64ToInt(qb64b[hs:hs+ss])  # compute int size from size chars
             fs = (size * 4) + bs
 
         # assumes that unit tests on Matter and MatterCodex ensure that
@@ -742,8 +811,8 @@ class Matter:
         if len(qb64b) < fs:  # need more bytes
             raise ShortageError("Need {} more chars.".format(fs-len(qb64b)))
         qb64b = qb64b[:fs]  # fully qualified primitive code plus material
-        if hasattr(qb64b, "encode"):  # only convert extracted chars from stream
-            qb64b = qb64b.encode("utf-8")
+        if isinstance(qb64b, memoryview):  # copy only extracted chars from view
+            qb64b = qb64b.tobytes()
 
         # strip off prepended code and append pad characters
         ps = bs % 4  # pad size ps = bs mod 4
@@ -781,6 +850,7 @@ class Matter:
                                             "".format(size, code))
             # both is hard code + converted index
             both = "{}{}".format(code, intToB64(size, l=ss))
+            fs = (size * 4) + bs
         else:
             both = code
 
@@ -788,7 +858,7 @@ class Matter:
         if len(both) != bs:
             raise InvalidCodeSizeError("Mismatch code size = {} with table = {}."
                                           .format(bs, len(code)))
-        n = sceil(bs * 3 / 4)  # number of b2 bytes to hold b64 code
+        n = (bs * 3 + 3) // 4  # number of b2 bytes to hold b64 code
         bcode = b64ToInt(both).to_bytes(n,'big')  # right aligned b2 code
 
         full = bcode + raw
@@ -808,35 +878,35 @@ class Matter:
         if not qb2:  # empty need more bytes
             raise ShortageError("Empty material, Need more bytes.")
 
-        first = nabSextets(qb2, 1)  # extract first sextet as code selector
-        if first not in self.Bizes:
-            if first[0] == b'\xf8':  # b64ToB2('-')
+        cs = self.Bards[qb2[0]]  # get code hard size by flat first byte dispatch
+        if not cs:  # unsupported code start
+            first = qb2[0] >> 2  # first sextet
+            if first == 0x3e:  # b64ToInt('-')
                 raise UnexpectedCountCodeError("Unexpected count code start"
                                                "while extracing Matter.")
-            elif first[0] == b'\xfc':  #  b64ToB2('_')
+            elif first == 0x3f:  #  b64ToInt('_')
                 raise UnexpectedOpCodeError("Unexpected  op code start"
                                                "while extracing Matter.")
             else:
-                raise UnexpectedCodeError("Unsupported code start sextet={}.".format(first))
+                raise UnexpectedCodeError("Unsupported code start sextet={}."
+                                          "".format(first))
 
-        cs = self.Bizes[first]  # get code hard size equvalent sextets
-        bcs = sceil(cs * 3 / 4)  # bcs is min bytes to hold cs sextets
+        bcs = (cs * 3 + 3) // 4  # bcs is min bytes to hold cs sextets
         if len(qb2) < bcs:  # need more bytes
             raise ShortageError("Need {} more bytes.".format(bcs-len(qb2)))
 
-        # bode = nabSextets(qb2, cs)  # b2 version of hard part of code
         code = b2ToB64(qb2, cs)  # extract and convert hard part of code
         if code not in self.Codes:
             raise UnexpectedCodeError("Unsupported code ={}.".format(code))
 
         hs, ss, fs = self.Codes[code]
         bs = hs + ss  # both hs and ss
+        bbs = (bs * 3 + 3) // 4  # bbs is min bytes to hold bs sextets
         size = None
         if not fs:  # compute fs from size chars in ss part of code
             if bs % 4:
                 raise ValidationError("Whole code size not multiple of 4 for "
                                       "variable length material. bs={}.".format(bs))
-            bbs = ceil(bs * 3 / 4)  # bbs is min bytes to hold bs sextets
             if len(qb2) < bbs:  # need more bytes
                 raise ShortageError("Need {} more bytes.".format(bbs-len(qb2)))
 
@@ -848,7 +918,7 @@ class Matter:
         # .Codes and .Sizes are well formed.
         # hs == cs and ss == 0 and not fs % 4 and hs > 0 and fs > hs
 
-        bfs = sceil(fs * 3 / 4)  # bfs is min bytes to hold fs sextets
+        bfs = (fs * 3 + 3) // 4  # bfs is min bytes to hold fs sextets
         if len(qb2) < bfs:  # need more bytes
             raise ShortageError("Need {} more bytes.".format(bfs-len(qb2)))
         qb2 = qb2[:bfs]  # fully qualified primitive code plus material
@@ -856,7 +926,6 @@ class Matter:
         # right shift to right align raw material
         i = int.from_bytes(qb2, 'big')
         i >>= 2 * (bs % 4)
-        bbs = ceil(bs * 3 / 4)  # bbs is min bytes to hold bs sextets
         raw = i.to_bytes(bfs, 'big')[bbs:]  # extract raw
 
         if len(raw) != (len(qb2) - bbs):  # exact lengths
@@ -908,6 +977,7 @@ class Seqner(Matter):
 
 
     """
+    __slots__ = ()
     def __init__(self, raw=None, qb64b=None, qb64=None, qb2=None,
                  code=MtrDex.Salt_128, sn=None, snh=None, **kwa):
         """
@@ -1009,6 +1079,7 @@ class Dater(Matter):
     Methods:
 
     """
+    __slots__ = ()
     ToB64 = str.maketrans(":.+", "cdp")
     FromB64 = str.maketrans("cdp", ":.+")
 
@@ -1073,6 +1144,7 @@ class Verfer(Matter):
         verify: verifies signature
 
     """
+    __slots__ = ("_verify",)
     def __init__(self, **kwa):
         """
         Assign verification cipher suite function to ._verify
@@ -1117,6 +1189,160 @@ class Verfer(Matter):
         return True
 
 
+class Verifier:
+    """
+    Verifier is batch signature verification engine. Verifies a batch of
+    (verfer, sig, ser) triples and returns a matching list of booleans.
+    Large batches are split into chunks that are verified in parallel on a
+    thread pool. The libsodium verify call does not hold the GIL so the
+    chunks run concurrently on multiple cores. Small batches or a single
+    worker are verified serially in the calling thread.
+
+    Any object with a compatible .verify(triples) method may be used in
+    place of Verifier, for example a backend with a native batch primitive.
+
+    Triples verified ahead of time with .prime are memoized so that a later
+    .verify of the same triple is only a set lookup. This lets a pipeline
+    verify signatures in parallel before events are applied in order.
+    The memo is per thread so one Verifier, with one pool, may be shared by
+    all the Keverys of a process.
+
+    Attributes:
+        .workers is int maximum number of pool threads. 0 or 1 means serial
+        .batch is int minimum batch size before the pool is used
+        .memo is set of (key, sig, ser) bytes triples verified by .prime
+            in calling thread
+
+    Methods:
+        verify: verifies batch of triples
+        prime: verifies batch of triples and memoizes verified ones
+        clear: clears .memo
+        close: shuts down pool if any
+
+    Hidden:
+        ._pool is ThreadPoolExecutor instance created lazily on first use
+        ._local is threading.local of per thread memo
+        ._lock is threading.Lock guarding creation of ._pool
+
+    """
+    Batch = 8  # minimum number of triples in batch to dispatch to pool
+
+    def __init__(self, workers=None, batch=None):
+        """
+        Initialize instance
+
+        Parameters:
+            workers is int maximum number of pool threads. None means number
+                of cpus. 0 or 1 means always verify serially
+            batch is int minimum batch size to dispatch to pool. None means
+                use class default .Batch
+        """
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.batch = batch if batch is not None else self.Batch
+        self._local = threading.local()  # memo is per thread
+        self._lock = threading.Lock()
+        self._pool = None
+
+
+    @property
+    def memo(self):
+        """
+        Returns set of memoized verified triples of calling thread
+        """
+        if not hasattr(self._local, "memo"):
+            self._local.memo = set()
+        return self._local.memo
+
+
+    def verify(self, triples):
+        """
+        Returns list of booleans one for each triple in triples in order.
+        True means sig verifies on ser using verfer. False otherwise.
+
+        Parameters:
+            triples is iterable of (verfer, sig, ser) tuples where:
+                verfer is Verfer instance of public key
+                sig is bytes raw signature
+                ser is bytes serialization that was signed
+        """
+        triples = list(triples)
+        if not self.memo:
+            return self._verifyBatch(triples)
+
+        results = [(verfer.raw, bytes(sig), bytes(ser)) in self.memo
+                   for verfer, sig, ser in triples]
+        misses = [i for i, hit in enumerate(results) if not hit]
+        if misses:  # verify the ones not memoized
+            verifieds = self._verifyBatch([triples[i] for i in misses])
+            for i, verified in zip(misses, verifieds):
+                results[i] = verified
+        return results
+
+
+    def prime(self, triples):
+        """
+        Returns list of booleans as .verify. Memoizes each triple that verifies
+        so that a later .verify of the same triple does not verify it again.
+
+        Parameters:
+            triples is iterable of (verfer, sig, ser) tuples as .verify
+        """
+        triples = list(triples)
+        results = self.verify(triples)
+        for (verfer, sig, ser), verified in zip(triples, results):
+            if verified:
+                self.memo.add((verfer.raw, bytes(sig), bytes(ser)))
+        return results
+
+
+    def clear(self):
+        """
+        Clears memoized verified triples
+        """
+        self.memo.clear()
+
+
+    def _verifyBatch(self, triples):
+        """
+        Returns list of booleans from verifying list of triples. Uses pool
+        when batch is large enough otherwise verifies serially.
+        """
+        if self.workers <= 1 or len(triples) < max(self.batch, 2):
+            return self._verifyChunk(triples)
+
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers,
+                                                thread_name_prefix="keri-verify")
+            pool = self._pool
+
+        size = ceil(len(triples) / self.workers)  # triples per chunk
+        chunks = [triples[i:i + size] for i in range(0, len(triples), size)]
+        results = []
+        for result in pool.map(self._verifyChunk, chunks):
+            results.extend(result)
+        return results
+
+
+    def close(self):
+        """
+        Shut down thread pool if any. Verifier may still be used afterwards
+        in which case a new pool is created when needed.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+
+    @staticmethod
+    def _verifyChunk(triples):
+        """
+        Returns list of booleans from serially verifying triples
+        """
+        return [verfer.verify(sig, ser) for verfer, sig, ser in triples]
+
+
 class Cigar(Matter):
     """
     Cigar is Matter subclass holding a nonindexed signature with verfer property.
@@ -1153,6 +1379,7 @@ class Cigar(Matter):
         ._exfil is method to extract .code and .raw from fully qualified Base64
 
     """
+    __slots__ = ("_verfer",)
     def __init__(self, verfer=None, **kwa):
         """
         Assign verfer to ._verfer attribute
@@ -1198,6 +1425,7 @@ class Signer(Matter):
         sign: create signature
 
     """
+    __slots__ = ("_sign", "_verfer")
     def __init__(self,raw=None, code=MtrDex.Ed25519_Seed, transferable=True, **kwa):
         """
         Assign signing cipher suite function to ._sign
@@ -1311,6 +1539,7 @@ class Salter(Matter):
         ._exfil is method to extract .code and .raw from fully qualified Base64
 
     """
+    __slots__ = ("tier",)
     Tier = Tiers.low
 
     def __init__(self, raw=None, code=MtrDex.Salt_128, tier=None, **kwa):
@@ -1417,6 +1646,7 @@ class Diger(Matter):
         ._exfil is method to extract .code and .raw from fully qualified Base64
 
     """
+    __slots__ = ("_verify",)
     def __init__(self, raw=None, ser=None, code=MtrDex.Blake3_256, **kwa):
         """
         Assign digest verification function to ._verify
@@ -1617,6 +1847,7 @@ class Nexter(Matter):
 
 
     """
+    __slots__ = ("_digest",)
     def __init__(self, limen=None, sith=None, digs=None, keys=None, ked=None,
                  code=MtrDex.Blake3_256, **kwa):
         """
@@ -1787,6 +2018,7 @@ class Prefixer(Matter):
         ._infil is method to compute fully qualified Base64 from .raw and .code
         ._exfil is method to extract .code and .raw from fully qualified Base64
     """
+    __slots__ = ("_derive", "_verify")
     Dummy = "#"  # dummy spaceholder char for pre. Must not be a valid Base64 char
     # element labels to exclude in digest or signature derivation from inception icp
     IcpExcludes = ["i"]
@@ -2046,7 +2278,7 @@ class IndexerCodex:
     Label:              str = '0B'  # Variable len label L=N*4 <= 4095 char quadlets
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 IdrDex = IndexerCodex()
 
@@ -2063,7 +2295,7 @@ class IndexedSigCodex:
     Ed448_Sig:          str = '0A'  # Ed448 signature.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 IdxSigDex = IndexedSigCodex()  #  Make instance
 
@@ -2097,6 +2329,7 @@ class Indexer:
         ._exfil is method to extract .code and .raw from fully qualified Base64
 
     """
+    __slots__ = ("_code", "_raw", "_index", "_qb64b", "_qb2")  # no instance __dict__
     Codex = IdrDex
     # Sizes table maps from bytes Base64 first code char to int of hard size, hs,
     # (stable) of code. The soft size, ss, (unstable) is always > 0 for Indexer.
@@ -2113,8 +2346,14 @@ class Indexer:
                 '0B': Sizage(hs=2, ss=2, fs=None),
             }
     # Bizes table maps to hard size, hs, of code from bytes holding sextets
-    # converted from first code char. Used for ._bexfil.
+    # converted from first code char.
     Bizes = ({b64ToB2(c): hs for c, hs in Sizes.items()})
+    # Hards table is Sizes as 256 entry tuple indexed by first byte of qb64b.
+    # Value is hard size, hs, or 0 when unsupported. Used for ._exfil.
+    Hards = hardTable(Sizes)
+    # Bards table is Sizes as 256 entry tuple indexed by first byte of qb2.
+    # Value is hard size, hs, or 0 when unsupported. Used for ._bexfil.
+    Bards = bardTable(Sizes)
 
     def __init__(self, raw=None, code=IdrDex.Ed25519_Sig, index=0,
                  qb64b=None, qb64=None, qb2=None, strip=False):
@@ -2138,6 +2377,8 @@ class Indexer:
         .raw and .code and .index
 
         """
+        self._qb64b = None  # lazily derived .qb64b
+        self._qb2 = None  # lazily derived .qb2
         if raw is not None:  #  raw provided
             if not code:
                 raise EmptyMaterialError("Improper initialization need either "
@@ -2174,7 +2415,7 @@ class Indexer:
         elif qb64b is not None:
             self._exfil(qb64b)
             if strip:  # assumes bytearray
-                del qb64b[:len(self.qb64b)]  # may be variable length fs
+                del qb64b[:self._fullSize()]  # may be variable length fs
 
         elif qb64 is not None:
             self._exfil(qb64)
@@ -2182,7 +2423,7 @@ class Indexer:
         elif qb2 is not None:
             self._bexfil(qb2)
             if strip:  # assumes bytearray
-                del qb2[:len(self.qb2)]  # may be variable length fs
+                del qb2[:self._fullSize() * 3 // 4]  # may be variable length fs
 
         else:
             raise EmptyMaterialError("Improper initialization need either "
@@ -2198,6 +2439,16 @@ class Indexer:
         return ( (fs - (hs + ss)) * 3 // 4 )
 
 
+    def _fullSize(self):
+        """
+        Returns full size in chars for .code and .index
+        """
+        hs, ss, fs = self.Codes[self.code]  # get sizes
+        if not fs:  # compute fs from .index
+            fs = (self.index * 4) + hs + ss
+        return fs
+
+
     @property
     def code(self):
         """
@@ -2232,7 +2483,9 @@ class Indexer:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
         """
-        return self._infil()
+        if self._qb64b is None:  # derive lazily once then cache
+            self._qb64b = self._infil()
+        return self._qb64b
 
 
     @property
@@ -2251,7 +2504,9 @@ class Indexer:
         Property qb2:
         Returns Fully Qualified Binary Version Bytes
         """
-        return self._binfil()
+        if self._qb2 is None:  # derive lazily once then cache
+            self._qb2 = self._binfil()
+        return self._qb2
 
 
     def _infil(self):
@@ -2287,27 +2542,26 @@ class Indexer:
         """
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material, Need more characters.")
+        if hasattr(qb64b, "encode"):  # str so convert once to bytes
+            qb64b = qb64b.encode("utf-8")
 
-        first = qb64b[:1]  # extract first char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
-        if first not in self.Sizes:
-            if first[0] == '-':
+        first = qb64b[0]  # first char code selector as byte
+        cs = self.Hards[first]  # get hard code size by flat dispatch
+        if not cs:  # unsupported code start
+            if first == 0x2d:  # '-'
                 raise UnexpectedCountCodeError("Unexpected count code start"
                                                "while extracing Indexer.")
-            elif first[0] == '_':
+            elif first == 0x5f:  # '_'
                 raise UnexpectedOpCodeError("Unexpected  op code start"
                                                "while extracing Indexer.")
             else:
-                raise UnexpectedCodeError("Unsupported code start char={}.".format(first))
+                raise UnexpectedCodeError("Unsupported code start char={}."
+                                          "".format(chr(first)))
 
-        cs = self.Sizes[first]  # get hard code size
         if len(qb64b) < cs:  # need more bytes
             raise ShortageError("Need {} more characters.".format(cs-len(qb64b)))
 
-        hard = qb64b[:cs] # get hard code
-        if hasattr(hard, "decode"):
-            hard = hard.decode("utf-8")
+        hard = bytes(qb64b[:cs]).decode("utf-8")  # get hard code
         if hard not in self.Codes:
             raise UnexpectedCodeError("Unsupported code ={}.".format(hard))
 
@@ -2320,10 +2574,7 @@ class Indexer:
         if len(qb64b) < bs:  # need more bytes
             raise ShortageError("Need {} more characters.".format(bs-len(qb64b)))
 
-        index = qb64b[hs:hs+ss]  # extract index chars
-        if hasattr(index, "decode"):
-            index = index.decode("utf-8")
-        index = b64ToInt(index)  # compute int index
+        index = b64ToInt(qb64b[hs:hs+ss])  # compute int index from index chars
 
         if not fs:  # compute fs from index
             if bs % 4:
@@ -2335,8 +2586,8 @@ class Indexer:
             raise ShortageError("Need {} more chars.".format(fs-len(qb64b)))
 
         qb64b = qb64b[:fs]  # fully qualified primitive code plus material
-        if hasattr(qb64b, "encode"):  # only convert extracted chars from stream
-            qb64b = qb64b.encode("utf-8")
+        if isinstance(qb64b, memoryview):  # copy only extracted chars from view
+            qb64b = qb64b.tobytes()
 
         # strip off prepended code and append pad characters
         ps = bs % 4  # pad size ps = cs mod 4
@@ -2378,7 +2629,7 @@ class Indexer:
             raise InvalidCodeSizeError("Mismatch code size = {} with table = {}."
                                           .format(bs, len(both)))
 
-        n = sceil(bs * 3 / 4)  # number of b2 bytes to hold b64 code + index
+        n = (bs * 3 + 3) // 4  # number of b2 bytes to hold b64 code + index
         bcode = b64ToInt(both).to_bytes(n,'big')  # right aligned b2 code
 
         full = bcode + raw
@@ -2398,23 +2649,23 @@ class Indexer:
         if not qb2:  # empty need more bytes
             raise ShortageError("Empty material, Need more bytes.")
 
-        first = nabSextets(qb2, 1)  # extract first sextet as code selector
-        if first not in self.Bizes:
-            if first[0] == b'\xf8':  # b64ToB2('-')
+        cs = self.Bards[qb2[0]]  # get code hard size by flat first byte dispatch
+        if not cs:  # unsupported code start
+            first = qb2[0] >> 2  # first sextet
+            if first == 0x3e:  # b64ToInt('-')
                 raise UnexpectedCountCodeError("Unexpected count code start"
-                                               "while extracing Matter.")
-            elif first[0] == b'\xfc':  #  b64ToB2('_')
+                                               "while extracing Indexer.")
+            elif first == 0x3f:  #  b64ToInt('_')
                 raise UnexpectedOpCodeError("Unexpected  op code start"
-                                               "while extracing Matter.")
+                                               "while extracing Indexer.")
             else:
-                raise UnexpectedCodeError("Unsupported code start sextet={}.".format(first))
+                raise UnexpectedCodeError("Unsupported code start sextet={}."
+                                          "".format(first))
 
-        cs = self.Bizes[first]  # get code hard size equvalent sextets
-        bcs = sceil(cs * 3 / 4)  # bcs is min bytes to hold cs sextets
+        bcs = (cs * 3 + 3) // 4  # bcs is min bytes to hold cs sextets
         if len(qb2) < bcs:  # need more bytes
             raise ShortageError("Need {} more bytes.".format(bcs-len(qb2)))
 
-        # bode = nabSextets(qb2, cs)  # b2 version of hard part of code
         hard = b2ToB64(qb2, cs)  # extract and convert hard part of code
         if hard not in self.Codes:
             raise UnexpectedCodeError("Unsupported code ={}.".format(hard))
@@ -2425,7 +2676,7 @@ class Indexer:
         # .Codes and .Sizes are well formed.
         # hs == cs and hs > 0 and ss > 0 and (fs >= hs + ss if fs is not None else True)
 
-        bbs = ceil(bs * 3 / 4)  # bbs is min bytes to hold bs sextets
+        bbs = (bs * 3 + 3) // 4  # bbs is min bytes to hold bs sextets
         if len(qb2) < bbs:  # need more bytes
             raise ShortageError("Need {} more bytes.".format(bbs-len(qb2)))
 
@@ -2434,7 +2685,7 @@ class Indexer:
         if not fs:
             fs = (index * 4) + bs
 
-        bfs = sceil(fs * 3 / 4)  # bfs is min bytes to hold fs sextets
+        bfs = (fs * 3 + 3) // 4  # bfs is min bytes to hold fs sextets
         if len(qb2) < bfs:  # need more bytes
             raise ShortageError("Need {} more bytes.".format(bfs-len(qb2)))
 
@@ -2471,6 +2722,7 @@ class Siger(Indexer):
 
 
     """
+    __slots__ = ("_verfer",)
     def __init__(self, verfer=None, **kwa):
         """
         Assign verfer to ._verfer
@@ -2538,7 +2790,7 @@ class CounterCodex:
 
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 CtrDex = CounterCodex()
 
@@ -2572,6 +2824,7 @@ class Counter:
         ._exfil is method to extract .code and .raw from fully qualified Base64
 
     """
+    __slots__ = ("_code", "_count", "_qb64b", "_qb2")  # no instance __dict__
     Codex = CtrDex
     # Sizes table maps from bytes Base64 first two code chars to int of
     # hard size, hs,(stable) of code. The soft size, ss, (unstable) for Counter
@@ -2612,8 +2865,14 @@ class Counter:
                 '-0Z': Sizage(hs=3, ss=5, fs=8)
             }
     # Bizes table maps to hard size, hs, of code from bytes holding sextets
-    # converted from first two code char. Used for ._bexfil.
+    # converted from first two code char.
     Bizes = ({b64ToB2(c): hs for c, hs in Sizes.items()})
+    # Hards table is Sizes as 256 entry tuple indexed by second byte of qb64b.
+    # Value is hard size, hs, or 0 when unsupported. Used for ._exfil.
+    Hards = hardTable(Sizes)
+    # Bards table is Sizes as 4096 entry tuple indexed by first 12 bits of qb2.
+    # Value is hard size, hs, or 0 when unsupported. Used for ._bexfil.
+    Bards = bardTable(Sizes)
 
 
     def __init__(self, code=None, count=1, qb64b=None, qb64=None,
@@ -2637,6 +2896,8 @@ class Counter:
         .code and .count
 
         """
+        self._qb64b = None  # lazily derived .qb64b
+        self._qb2 = None  # lazily derived .qb2
         if code is not None:  #  code provided
             if code not in self.Codes:
                 raise UnknownCodeError("Unsupported code={}.".format(code))
@@ -2697,7 +2958,9 @@ class Counter:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
         """
-        return self._infil()
+        if self._qb64b is None:  # derive lazily once then cache
+            self._qb64b = self._infil()
+        return self._qb64b
 
 
     @property
@@ -2716,7 +2979,9 @@ class Counter:
         Property qb2:
         Returns Fully Qualified Binary Version Bytes
         """
-        return self._binfil()
+        if self._qb2 is None:  # derive lazily once then cache
+            self._qb2 = self._binfil()
+        return self._qb2
 
     def _infil(self):
         """
@@ -2751,24 +3016,26 @@ class Counter:
         """
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material, Need more characters.")
+        if hasattr(qb64b, "encode"):  # str so convert once to bytes
+            qb64b = qb64b.encode("utf-8")
+
+        if len(qb64b) < 2:  # need more bytes for two char code selector
+            raise ShortageError("Need {} more characters.".format(2-len(qb64b)))
 
-        first = qb64b[:2]  # extract first two char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
-        if first not in self.Sizes:
-            if first[0] == '_':
+        # two char code selector is '-' then char dispatched by flat table
+        cs = self.Hards[qb64b[1]] if qb64b[0] == 0x2d else 0
+        if not cs:  # unsupported code start
+            if qb64b[0] == 0x5f:  # '_'
                 raise UnexpectedOpCodeError("Unexpected op code start"
                                                "while extracing Counter.")
             else:
-                raise UnexpectedCodeError("Unsupported code start ={}.".format(first))
+                raise UnexpectedCodeError("Unsupported code start ={}."
+                                          "".format(bytes(qb64b[:2]).decode("utf-8")))
 
-        cs = self.Sizes[first]  # get hard code size
         if len(qb64b) < cs:  # need more bytes
             raise ShortageError("Need {} more characters.".format(cs-len(qb64b)))
 
-        hard = qb64b[:cs]  # get hard code
-        if hasattr(hard, "decode"):
-            hard = hard.decode("utf-8")
+        hard = bytes(qb64b[:cs]).decode("utf-8")  # get hard code
         if hard not in self.Codes:
             raise UnexpectedCodeError("Unsupported code ={}.".format(hard))
 
@@ -2782,10 +3049,7 @@ class Counter:
         if len(qb64b) < bs:  # need more bytes
             raise ShortageError("Need {} more characters.".format(bs-len(qb64b)))
 
-        count = qb64b[hs:hs+ss]  # extract count chars
-        if hasattr(count, "decode"):
-            count = count.decode("utf-8")
-        count = b64ToInt(count)  # compute int count
+        count = b64ToInt(qb64b[hs:hs+ss])  # compute int count from count chars
 
         self._code = hard
         self._count = count
@@ -2825,16 +3089,20 @@ class Counter:
         if not qb2:  # empty need more bytes
             raise ShortageError("Empty material, Need more bytes.")
 
-        first = nabSextets(qb2, 2)  # extract first two sextets as code selector
-        if first not in self.Bizes:
-            if first[0] == b'\xfc':  #  b64ToB2('_')
+        if len(qb2) < 2:  # need more bytes for two sextet code selector
+            raise ShortageError("Need {} more bytes.".format(2-len(qb2)))
+
+        # two sextet code selector is first 12 bits dispatched by flat table
+        cs = self.Bards[(qb2[0] << 4) | (qb2[1] >> 4)]
+        if not cs:  # unsupported code start
+            if qb2[0] >> 2 == 0x3f:  #  b64ToInt('_')
                 raise UnexpectedOpCodeError("Unexpected  op code start"
-                                               "while extracing Matter.")
+                                               "while extracing Counter.")
             else:
-                raise UnexpectedCodeError("Unsupported code start sextet={}.".format(first))
+                raise UnexpectedCodeError("Unsupported code start sextets={}."
+                                          "".format(bytes(qb2[:2])))
 
-        cs = self.Bizes[first]  # get code hard size equvalent sextets
-        bcs = sceil(cs * 3 / 4)  # bcs is min bytes to hold cs sextets
+        bcs = (cs * 3 + 3) // 4  # bcs is min bytes to hold cs sextets
         if len(qb2) < bcs:  # need more bytes
             raise ShortageError("Need {} more bytes.".format(bcs-len(qb2)))
 
@@ -2848,7 +3116,7 @@ class Counter:
         # .Codes and .Sizes are well formed.
         # hs == cs and hs > 0 and ss > 0 and fs = hs + ss and not fs % 4
 
-        bbs = ceil(bs * 3 / 4)  # bbs is min bytes to hold bs sextets
+        bbs = (bs * 3 + 3) // 4  # bbs is min bytes to hold bs sextets
         if len(qb2) < bbs:  # need more bytes
             raise ShortageError("Need {} more bytes.".format(bbs-len(qb2)))
 
@@ -2889,7 +3157,18 @@ class Serder:
           ._version is Versionage instance of event version
           ._size is int of number of bytes in serialed event only
           ._code is default code for .diger
-          ._diger is Diger instance of digest of .raw
+          ._diger is Diger instance of digest of .raw or None until first access
+          ._verfers is list of Verfers of .verfers or None until first access
+          ._werfers is list of Verfers of .werfers or None until first access
+          ._sn is int of .sn or None until first access
+          ._pre is str of .pre or None until first access
+
+    Lazy:
+        .diger, .verfers, .werfers, .sn and .pre are computed on first access
+        and memoized until .raw, .ked or .kind is set again. So an event whose
+        digest is never used is never digested and each event is digested at
+        most once. Returned .verfers and .werfers lists are shared so do not
+        mutate them.
 
     Note:
         loads and jumps of json use str whereas cbor and msgpack use bytes
@@ -2934,7 +3213,8 @@ class Serder:
         if len(raw) < MINSNIFFSIZE:
             raise ShortageError("Need more bytes.")
 
-        match = Rever.search(raw)  #  Rever's regex takes bytes
+        # version string must start within first 12 bytes so only search those
+        match = Rever.search(bytes(raw[:MINSNIFFSIZE]))  #  Rever's regex takes bytes
         if not match or match.start() > 12:
             raise VersionError("Invalid version string in raw = {}".format(raw))
 
@@ -2967,6 +3247,8 @@ class Serder:
                                "".format(version.major, version.minor, Version))
         if len(raw) < size:
             raise ShortageError("Need more bytes.")
+        if isinstance(raw, memoryview):  # copy only this event out of view
+            raw = raw[:size].tobytes()
 
         if kind == Serials.json:
             try:
@@ -3006,11 +3288,20 @@ class Serder:
             version is Versionage instance
 
         Assumes only supports Version
+
+        Serializes once. The version string is fixed size so the size of raw
+        does not depend on the size field of the version string in ked. The
+        old version string is always located by a bounded bytes search at
+        the front of raw and the final one spliced in its place only when it
+        differs.
         """
         if "v" not in ked:
             raise ValueError("Missing or empty version string in key event dict = {}".format(ked))
 
-        knd, version, size = Deversify(ked["v"])  # extract kind and version
+        ovs = ked["v"]
+        if len(ovs) != VERFULLSIZE:
+            raise ValueError("Invalid version string = {}".format(ovs))
+        knd, version, size = Deversify(ovs)  # extract kind and version
         if version != Version:
             raise ValueError("Unsupported version = {}.{}".format(version.major,
                                                                     version.minor))
@@ -3022,7 +3313,7 @@ class Serder:
             raise ValueError("Invalid serialization kind = {}".format(kind))
 
         if kind == Serials.json:
-            raw = json.dumps(ked, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+            raw = JSONEncoder.encode(ked).encode("utf-8")
 
         elif kind == Serials.mgpk:
             raw = msgpack.dumps(ked)
@@ -3034,19 +3325,15 @@ class Serder:
             raise ValueError("Invalid serialization kind = {}".format(kind))
 
         size = len(raw)
-
-        match = Rever.search(raw)  #  Rever's regex takes bytes
-        if not match or match.start() > 12:
-            raise ValueError("Invalid version string in raw = {}".format(raw))
-
-        fore, back = match.span()  #  full version string
         # update vs with latest kind version size
         vs = Versify(version=version, kind=kind, size=size)
-        # replace old version string in raw with new one
-        raw = b'%b%b%b' % (raw[:fore], vs.encode("utf-8"), raw[back:])
-        if size != len(raw):  # substitution messed up
-            raise ValueError("Malformed version string size = {}".format(vs))
-        ked["v"] = vs  #  update ked
+        fore = raw.find(ovs.encode("utf-8"), 0, MINSNIFFSIZE)
+        if fore < 0 or fore > 12:  # version string must lead even if unchanged
+            raise ValueError("Invalid version string in raw = {}".format(raw))
+        if vs != ovs:  # replace old version string in raw with new one
+            raw = b'%b%b%b' % (raw[:fore], vs.encode("utf-8"),
+                               raw[fore + VERFULLSIZE:])
+            ked["v"] = vs  #  update ked
 
         return (raw, kind, ked, version)
 
@@ -3077,6 +3364,17 @@ class Serder:
         return (self.diger.compare(ser=self.raw, dig=dig, diger=diger))
 
 
+    def _uncache(self):
+        """
+        Clears memoized lazily computed views of .raw and .ked
+        """
+        self._diger = None
+        self._verfers = None
+        self._werfers = None
+        self._sn = None
+        self._pre = None
+
+
     @property
     def raw(self):
         """ raw property getter """
@@ -3092,7 +3390,7 @@ class Serder:
         self._kind = kind
         self._version = version
         self._size = size
-        self._diger = Diger(ser=self._raw, code=self._code)
+        self._uncache()
 
 
     @property
@@ -3111,7 +3409,7 @@ class Serder:
         self._kind = kind
         self._size = size
         self._version = version
-        self._diger = Diger(ser=self._raw, code=self._code)
+        self._uncache()
 
 
     @property
@@ -3130,7 +3428,7 @@ class Serder:
         self._kind = kind
         self._size = size
         self._version = version
-        self._diger = Diger(ser=self._raw, code=self._code)
+        self._uncache()
 
 
     @property
@@ -3150,7 +3448,10 @@ class Serder:
         """
         Returns Diger of digest of self.raw
         diger (digest material) property getter
+        Computed on first access
         """
+        if self._diger is None:
+            self._diger = Diger(ser=self._raw, code=self._code)
         return self._diger
 
 
@@ -3178,13 +3479,16 @@ class Serder:
         Returns list of Verfer instances as converted from .ked['k'].
         One for each key.
         verfers property getter
+        Computed on first access
         """
-        if "k" in self.ked:  # establishment event
-            keys = self.ked["k"]
-        else:  # non-establishment event
-            keys =  []
+        if self._verfers is None:
+            if "k" in self.ked:  # establishment event
+                keys = self.ked["k"]
+            else:  # non-establishment event
+                keys =  []
 
-        return [Verfer(qb64=key) for key in keys]
+            self._verfers = [Verfer(qb64=key) for key in keys]
+        return self._verfers
 
 
     @property
@@ -3193,13 +3497,16 @@ class Serder:
         Returns list of Verfer instances as converted from .ked['k'].
         One for each witness.
         werfers property getter
+        Computed on first access
         """
-        if "w" in self.ked:  # inception establishment event
-            wits = self.ked["b"]
-        else:  # non-establishment event
-            wits =  []
+        if self._werfers is None:
+            if "w" in self.ked:  # inception establishment event
+                wits = self.ked["b"]
+            else:  # non-establishment event
+                wits =  []
 
-        return [Verfer(qb64=wit) for wit in wits]
+            self._werfers = [Verfer(qb64=wit) for wit in wits]
+        return self._werfers
 
 
     @property
@@ -3207,8 +3514,11 @@ class Serder:
         """
         Returns int of .ked["s"] (sequence number)
         sn (sequence number) property getter
+        Computed on first access
         """
-        return int(self.ked["s"], 16)
+        if self._sn is None:
+            self._sn = int(self.ked["s"], 16)
+        return self._sn
 
 
     @property
@@ -3216,8 +3526,11 @@ class Serder:
         """
         Returns str qb64  of .ked["i"] (identifier prefix)
         pre (identifier prefix) property getter
+        Computed on first access
         """
-        return self.ked["i"]
+        if self._pre is None:
+            self._pre = self.ked["i"]
+        return self._pre
 
 
     @property
@@ -6,32 +6,41 @@ keri.core.eventing module
 import datetime
 import json
 import logging
-from collections import namedtuple, deque
-from dataclasses import dataclass, astuple
+import time
+from collections import namedtuple, deque, OrderedDict
+from collections.abc import MutableMapping
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
 from math import ceil
 
+import lmdb
 from orderedset import OrderedSet as oset
 
-from .coring import MtrDex, NonTransDex, CtrDex, Counter
+from .coring import MtrDex, NonTransDex, CtrDex, Counter, Matter, Indexer
+from .coring import b64ToInt, b2ToB64, encodeB64, decodeB64
 from .coring import Seqner, Siger, Cigar, Dater
-from .coring import Verfer, Diger, Nexter, Prefixer, Serder, Tholder
+from .coring import Verfer, Verifier, Diger, Nexter, Prefixer, Serder, Tholder
 from .coring import Versify, Serials, Ilks
 from .. import help
-from ..db.dbing import dgKey, snKey, fnKey, splitKeySN, Baser
-from ..help.helping import nowIso8601, fromIso8601
-from ..kering import (ExtractionError, ShortageError, ColdStartError,
+from ..db.dbing import dgKey, snKey, fnKey, splitKeySN, Baser, regrowing
+from ..help.helping import nowIso8601
+from ..kering import (KeriError, ExtractionError, ShortageError, ColdStartError,
                       SizedGroupError, UnexpectedCountCodeError,
+                      UnexpectedCodeError,
                       ValidationError, MissingSignatureError,
                       MissingWitnessSignatureError,
                       MissingDelegationError, OutOfOrderError,
                       LikelyDuplicitousError, UnverifiedWitnessReceiptError,
-                      UnverifiedReceiptError, UnverifiedTransferableReceiptError)
+                      UnverifiedReceiptError, UnverifiedTransferableReceiptError,
+                      MissingEntryError, VersionError, DatabaseError)
 from ..kering import Version
 
 logger = help.ogler.getLogger()
 
 EscrowTimeoutPS = 3600  # seconds for partial signed escrow timeout
 
+DefaultVerifier = Verifier()  # shared by Keverys so one lazy pool per process
+
 ICP_LABELS = ["v", "i", "s", "t", "kt", "k", "n",
               "bt", "b", "c",  "a"]
 DIP_LABELS = ["v", "i", "s", "t", "kt", "k", "n",
@@ -56,7 +65,7 @@ class TraitCodex:
     NoBackers:       str = 'NB'  # Do not allow any backers for registry
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 TraitDex = TraitCodex()  # Make instance
 
@@ -143,13 +152,17 @@ class ColdCodex:
     CtOpB2:    int = 0o7  # CountCode or OpCode Base2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 ColdDex = ColdCodex()  # Make instance
 
 Coldage = namedtuple("Coldage", 'msg txt bny')  # stream cold start status
 Colds = Coldage(msg='msg', txt='txt', bny='bny')
 
+# Extracted attachments of one msg, each is list of extracted primitives or
+# tuples of primitives one for each attached item
+Attachage = namedtuple("Attachage", 'sigers wigers cigars trqs tsgs frcs sscs')
+
 # Future make Cues dataclasses  instead of dicts. Dataclasses so may be converted
 # to/from dicts easily  example: dict(kin="receipt", serder=serder)
 
@@ -420,7 +433,7 @@ def deTransReceiptQuintuple(data, strip=False):
     return (ediger, sprefixer, sseqner, sdiger, siger)
 
 
-def verifySigs(serder, sigers, verfers):
+def verifySigs(serder, sigers, verfers, verifier=None, verified=False):
     """
     Returns tuple of (vsigers, vindices) where:
         vsigers is list  of unique verified sigers with assigned verfer
@@ -435,6 +448,10 @@ def verifySigs(serder, sigers, verfers):
         serder is Serder of signed event
         sigers is list of indexed Siger instances (signatures)
         verfers is list of Verfer instance (public keys)
+        verifier is optional Verifier instance used to verify all the sigers
+            as one batch. None means verify serially in this thread
+        verified is Boolean True means sigers are own signatures just made
+            locally so trust them without verifying. Indexes still checked
 
     """
     if sigers is None:
@@ -454,11 +471,19 @@ def verifySigs(serder, sigers, verfers):
                                   "{}.".format(siger.index, serder.ked))
         siger.verfer = verfers[siger.index]  # assign verfer
 
+    if verified:  # trusted own signatures
+        results = [True] * len(usigers)
+    else:
+        if verifier is None:
+            verifier = Verifier(workers=0)  # serial
+        results = verifier.verify([(siger.verfer, siger.raw, serder.raw)
+                                   for siger in usigers])
+
     # create lists of unique verified signatures and indices
     vindices = []
     vsigers = []
-    for siger in usigers:
-        if siger.verfer.verify(siger.raw, serder.raw):
+    for siger, verified in zip(usigers, results):
+        if verified:
             vindices.append(siger.index)
             vsigers.append(siger)
 
@@ -967,6 +992,7 @@ def state(pre,
           wits=None, # default to []
           cnfg=None, # default to []
           dpre=None,
+          fn=None,
           version=Version,
           kind=Serials.json,
           ):
@@ -992,6 +1018,8 @@ def state(pre,
         wits is list of witness prefixes qb64
         cnfg is list of strings TraitDex of configuration traits
         dpre is qb64 of delegator's identifier prefix if any
+        fn is int first seen ordinal of latest event if any. Only included
+            in local key state records, not in key state notices to others
         version is Version instance
         kind is serialization kind
 
@@ -1065,7 +1093,8 @@ def state(pre,
                          "state.".format(eevt))
 
     incpt = eilk in (Ilks.icp, Ilks.dip)
-    validateSN(eevt.s, inceptive=incpt)
+    if incpt or eevt.s != "0":  # latest est is inception when only ixns since
+        validateSN(eevt.s, inceptive=incpt)
 
     if len(oset(eevt.br)) != len(eevt.br):  # duplicates in cuts
         raise ValueError("Invalid cuts = {} in latest est event, has duplicates"
@@ -1091,6 +1120,8 @@ def state(pre,
                ee=eevt._asdict(),  # latest est event dict
                di=dpre if dpre is not None else ""
                )
+    if fn is not None:  # local key state record
+        ksd["f"] = "{:x}".format(fn)  # hex string no leading zeros lowercase
 
     return Serder(ked=ksd)  # return serialized ksd
 
@@ -1100,6 +1131,8 @@ def query(pre,
           dt=None,
           dta=None,
           dtb=None,
+          fn=None,
+          limit=None,
           version=Version,
           kind=Serials.json):
 
@@ -1112,6 +1145,8 @@ def query(pre,
         dig is digest of previous event qb64
         sn is int sequence number
         data is list of dicts of comitted data such as seals
+        fn is int first seen ordinal number to start replay at if any
+        limit is int maximum number of messages in replay page if any
         version is Version instance
         kind is serialization kind
     """
@@ -1131,6 +1166,11 @@ def query(pre,
     if dtb is not None:
         qry["dtb"] = dt
 
+    if fn is not None:
+        qry["fn"] = "{:x}".format(fn)  # hex string no leading zeros lowercase
+
+    if limit is not None:
+        qry["limit"] = "{:x}".format(limit)
 
     ked = dict(v=vs,  # version string
                t=ilk,
@@ -1229,6 +1269,8 @@ class Kever:
         .local is Boolean (from kevery when provided)
             True means only process msgs for own events if .opre
             False means only process msgs for not own events if .opre
+        .verifier is Verifier instance for batch signature verification
+            (from kevery when provided)
         .version is version of current event state
         .prefixer is prefixer instance for current event state
         .sn is sequence number int
@@ -1256,12 +1298,14 @@ class Kever:
     EstOnly = False
     DoNotDelegate = False
 
-    def __init__(self, serder, sigers, wigers=None, baser=None, estOnly=None,
+    def __init__(self, serder=None, sigers=None, wigers=None, baser=None, estOnly=None,
                  seqner=None, diger=None, firner=None, dater=None,
-                 kevers=None, cues=None, opre=None, local=False, check=False):
+                 kevers=None, cues=None, opre=None, local=False, check=False,
+                 verifier=None, state=None, verified=False):
         """
         Create incepting kever and state from inception serder
         Verify incepting serder against sigers raises ValidationError if not
+        Or when state provided reload kever from persisted key state record
 
         Parameters:
             serder is Serder instance of inception event
@@ -1295,6 +1339,14 @@ class Kever:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            verifier is Verifier instance for batch signature verification.
+                None means verify serially
+            state is Serder instance of persisted key state record from
+                baser. When provided reload state from it instead of
+                verifying an inception serder and sigers
+            verified is Boolean True means sigers are own signatures just made
+                locally so trust them without verifying. Thresholds,
+                delegation and witnessing are still validated
         """
 
         if baser is None:
@@ -1304,6 +1356,14 @@ class Kever:
         self.cues = cues
         self.opre = opre
         self.local = True if local else False
+        self.verifier = verifier if verifier is not None else Verifier(workers=0)
+
+        if state is not None:  # reload persisted state without reverifying KEL
+            self.reload(state=state)
+            return
+
+        if serder is None or sigers is None:
+            raise TypeError("Missing required serder and sigers or state.")
 
         # may update state as we go because if invalid we fail to finish init
         self.version = serder.version  # version dispatch ?
@@ -1336,7 +1396,8 @@ class Kever:
                                                             toad=self.toad,
                                                             wits=self.wits,
                                                             seqner=seqner,
-                                                            diger=diger)
+                                                            diger=diger,
+                                                            verified=verified)
 
         self.delegator = delegator
         if self.delegator is None:
@@ -1351,6 +1412,41 @@ class Kever:
                                 firner=firner, dater=dater)
 
 
+    def reload(self, state):
+        """
+        Reload key state attributes from persisted key state record serder
+        state without replaying or reverifying the KEL. Only the latest event
+        is read from .baser.
+
+        Parameters:
+            state is Serder instance of key state record from .baser.stts
+        """
+        ked = state.ked
+        self.version = state.version
+        self.prefixer = Prefixer(qb64=state.pre)
+        self.sn = state.sn
+        self.fn = int(ked["f"], 16) if "f" in ked else None
+        self.ilk = ked["te"]
+        self.tholder = Tholder(sith=ked["kt"])
+        self.verfers = state.verfers
+        self.nexter = Nexter(qb64=ked["n"]) if ked["n"] else None
+        self.toad = int(ked["bt"], 16)
+        self.wits = ked["b"]
+        self.cuts = ked["ee"]["br"]
+        self.adds = ked["ee"]["ba"]
+        self.estOnly = TraitDex.EstOnly in ked["c"]
+        self.doNotDelegate = TraitDex.DoNotDelegate in ked["c"]
+        self.lastEst = LastEstLoc(s=int(ked["ee"]["s"], 16), d=ked["ee"]["d"])
+        self.delegator = ked["di"] if ked["di"] else None
+        self.delegated = True if self.delegator else False
+
+        raw = self.baser.getEvt(dgKey(self.prefixer.qb64b, ked["d"]))
+        if raw is None:
+            raise MissingEntryError("Missing event for dig={} of key state "
+                                    "for pre={}.".format(ked["d"], state.pre))
+        self.serder = Serder(raw=bytes(raw))
+
+
     @property
     def transferable(self):
         """
@@ -1442,7 +1538,7 @@ class Kever:
 
 
     def update(self, serder,  sigers, wigers=None, seqner=None, diger=None,
-               firner=None, dater=None, check=False):
+               firner=None, dater=None, check=False, verified=False):
         """
         Not an inception event. Verify event serder and indexed signatures
         in sigers and update state
@@ -1467,6 +1563,8 @@ class Kever:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            verified is Boolean True means sigers are own signatures just made
+                locally so trust them without verifying
 
         """
         if not self.transferable:  # not transferable so no events after inception allowed
@@ -1506,7 +1604,8 @@ class Kever:
                                                                 toad=toad,
                                                                 wits=wits,
                                                                 seqner=seqner,
-                                                                diger=diger)
+                                                                diger=diger,
+                                                                verified=verified)
 
             if delegator != self.delegator:  #
                 raise ValidationError("Erroneous attempted  delegated rotation"
@@ -1517,28 +1616,29 @@ class Kever:
 
 
             # nxt and signatures verify so update state
-            self.sn = sn
-            self.serder = serder  #  need whole serder for digest agility compare
-            self.ilk = ilk
-            self.tholder = tholder
-            self.verfers = serder.verfers
-            # update .nexter
-            nxt = ked["n"]
-            self.nexter = Nexter(qb64=nxt) if nxt else None  # check for empty
-
-            self.toad = toad
-            self.wits = wits
-            self.cuts = cuts
-            self.adds = adds
-
-            # last establishment event location need this to recognize recovery events
-            self.lastEst = LastEstLoc(s=self.sn, d=self.serder.diger.qb64)
-
-            # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
-            # all validated above so may add to KEL and FEL logs as first seen
-            self.fn = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                    first=True if not check else False, seqner=seqner, diger=diger,
-                                    firner=firner, dater=dater)
+            with self._staged():  # state restored if its writes abort
+                self.sn = sn
+                self.serder = serder  #  need whole serder for digest agility compare
+                self.ilk = ilk
+                self.tholder = tholder
+                self.verfers = serder.verfers
+                # update .nexter
+                nxt = ked["n"]
+                self.nexter = Nexter(qb64=nxt) if nxt else None  # check for empty
+
+                self.toad = toad
+                self.wits = wits
+                self.cuts = cuts
+                self.adds = adds
+
+                # last establishment event location need this to recognize recovery events
+                self.lastEst = LastEstLoc(s=self.sn, d=self.serder.diger.qb64)
+
+                # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
+                # all validated above so may add to KEL and FEL logs as first seen
+                self.fn = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
+                                        first=True if not check else False, seqner=seqner, diger=diger,
+                                        firner=firner, dater=dater)
 
 
         elif ilk == Ilks.ixn:  # subsequent interaction event
@@ -1571,17 +1671,19 @@ class Kever:
                                                                 tholder=self.tholder,
                                                                 wigers=wigers,
                                                                 toad=self.toad,
-                                                                wits=self.wits)
+                                                                wits=self.wits,
+                                                                verified=verified)
 
             # update state
-            self.sn = sn
-            self.serder = serder  # need for digest agility includes .serder.diger
-            self.ilk = ilk
+            with self._staged():  # state restored if its writes abort
+                self.sn = sn
+                self.serder = serder  # need for digest agility includes .serder.diger
+                self.ilk = ilk
 
-            # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
-            # all validated above so may add to KEL and FEL logs as first seen
-            self.fn = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                    first=True if not check else False)  # First seen accepted
+                # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
+                # all validated above so may add to KEL and FEL logs as first seen
+                self.fn = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
+                                        first=True if not check else False)  # First seen accepted
 
         else:  # unsupported event ilk so discard
             raise ValidationError("Unsupported ilk = {} for evt = {}.".format(ilk, ked))
@@ -1739,7 +1841,8 @@ class Kever:
 
 
     def valSigsDelWigs(self, serder, sigers, verfers, tholder,
-                       wigers, toad, wits, seqner=None, diger=None):
+                       wigers, toad, wits, seqner=None, diger=None,
+                       verified=False):
         """
         Returns triple (sigers, delegator, wigers) where:
         sigers is unique validated signature verified members of inputed sigers
@@ -1768,6 +1871,8 @@ class Kever:
                 If this event is not delegated then seqner is ignored
             diger is Diger instance of of delegating event digest.
                 If this event is not delegated then diger is ignored
+            verified is Boolean True means sigers are own signatures just made
+                locally so trust them without verifying. wigers always verified
 
         """
         if len(verfers) < self.tholder.size:
@@ -1777,7 +1882,9 @@ class Kever:
                                        serder.ked))
 
         # get unique verified sigers and indices lists from sigers list
-        sigers, indices = verifySigs(serder=serder, sigers=sigers, verfers=verfers)
+        sigers, indices = verifySigs(serder=serder, sigers=sigers,
+                                     verfers=verfers, verifier=self.verifier,
+                                     verified=verified)
         # sigers  now have .verfer assigned
 
         werfers = [Verfer(qb64=wit) for wit in wits]
@@ -1785,7 +1892,8 @@ class Kever:
             #werfers.append(Verfer(qb64=wit))
 
         # get unique verified wigers and windices lists from wigers list
-        wigers, windices = verifySigs(serder=serder, sigers=wigers, verfers=werfers)
+        wigers, windices = verifySigs(serder=serder, sigers=wigers,
+                                      verfers=werfers, verifier=self.verifier)
         # each wiger now has werfer of corresponding wit
 
         # check if fully signed
@@ -1916,6 +2024,20 @@ class Kever:
         return delegator  # return delegator prefix
 
 
+    @contextmanager
+    def _staged(self):
+        """
+        Context manager of write batch for updating key state of this Kever
+        together with the writes that log it. The prior key state is restored
+        if the batch aborts, including when an enclosing batch aborts later,
+        so the key state in memory is never ahead of the database.
+        """
+        prior = dict(vars(self))
+        with self.baser.batch():
+            self.baser.onAbort(lambda: vars(self).update(prior))
+            yield
+
+
     def logEvent(self, serder, sigers=None, wigers=None, first=False,
                  seqner=None, diger=None, firner=None, dater=None):
         """
@@ -1942,36 +2064,43 @@ class Kever:
                 When dater provided then use dater for first seen datetime
         """
         fn = None
-        dgkey = dgKey(self.prefixer.qb64b, self.serder.diger.qb64b)
-        dtsb = nowIso8601().encode("utf-8")
-        self.baser.putDts(dgkey, dtsb)  #  idempotent do not change dts if already
-        if sigers:
-            self.baser.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
-        if wigers:
-            self.baser.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        self.baser.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
-        if first:  # append event dig to first seen database in order
-            if seqner and diger: # authorized delegated or issued event
-                couple = seqner.qb64b + diger.qb64b
-                self.baser.setAes(dgkey, couple)  # authorizer event seal (delegator/issuer)
-            fn = self.baser.appendFe(self.prefixer.qb64b, self.serder.diger.qb64b)
-            if firner and fn != firner.sn:  # cloned replay but replay fn not match
-                if self.cues is not None:
-                    self.cues.append(dict(kin="noticeBadCloneFN", serder=serder,
-                                fn=fn, firner=firner, dater=dater))
-                logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
-                            "ordinal fn %s and clone fn %s \nEvent=\n%s\n",
-                             self.prefixer.qb64, fn, firner.sn,
+        with self.baser.batch():  # all writes for event commit at once
+            dgkey = dgKey(self.prefixer.qb64b, self.serder.diger.qb64b)
+            dtsb = nowIso8601().encode("utf-8")
+            self.baser.putDts(dgkey, dtsb)  #  idempotent do not change dts if already
+            if sigers:
+                self.baser.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
+            if wigers:
+                self.baser.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            self.baser.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
+            if first:  # append event dig to first seen database in order
+                if seqner and diger: # authorized delegated or issued event
+                    couple = seqner.qb64b + diger.qb64b
+                    self.baser.setAes(dgkey, couple)  # authorizer event seal (delegator/issuer)
+                fn = self.baser.appendFe(self.prefixer.qb64b, self.serder.diger.qb64b)
+                if firner and fn != firner.sn:  # cloned replay but replay fn not match
+                    if self.cues is not None:
+                        self.cues.append(dict(kin="noticeBadCloneFN", serder=serder,
+                                    fn=fn, firner=firner, dater=dater))
+                    logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
+                                "ordinal fn %s and clone fn %s \nEvent=\n%s\n",
+                                 self.prefixer.qb64, fn, firner.sn,
+                                 json.dumps(serder.ked, indent=1))
+                if dater:  # cloned replay use original's dts from dater
+                    dtsb = dater.dtsb
+                self.baser.setDts(dgkey, dtsb)  # first seen so set dts to now
+                if serder.ked["t"] in (Ilks.icp, Ilks.dip, Ilks.rot, Ilks.drt):
+                    # index est event so fetchEstEvent is one range seek
+                    self.baser.setEst(snKey(self.prefixer.qb64b, self.sn),
+                                      self.serder.diger.qb64b)
+                # persist key state record so kevers reload without KEL replay
+                self.baser.setState(self.prefixer.qb64b, self.state(fn=fn).raw)
+                logger.info("Kever state: %s First seen ordinal %s at %s\nEvent=\n%s\n",
+                             self.prefixer.qb64, fn, dtsb.decode("utf-8"),
                              json.dumps(serder.ked, indent=1))
-            if dater:  # cloned replay use original's dts from dater
-                dtsb = dater.dtsb
-            self.baser.setDts(dgkey, dtsb)  # first seen so set dts to now
-            logger.info("Kever state: %s First seen ordinal %s at %s\nEvent=\n%s\n",
-                         self.prefixer.qb64, fn, dtsb.decode("utf-8"),
-                         json.dumps(serder.ked, indent=1))
-        self.baser.addKe(snKey(self.prefixer.qb64b, self.sn), self.serder.diger.qb64b)
-        logger.info("Kever state: %s Added to KEL valid event=\n%s\n",
-                        self.prefixer.qb64, json.dumps(serder.ked, indent=1))
+            self.baser.addKe(snKey(self.prefixer.qb64b, self.sn), self.serder.diger.qb64b)
+            logger.info("Kever state: %s Added to KEL valid event=\n%s\n",
+                            self.prefixer.qb64, json.dumps(serder.ked, indent=1))
         return fn  # will be fn int if first else None
 
 
@@ -1985,13 +2114,14 @@ class Kever:
             sigers is list of Siger instances of indexed controller sigs
             wigers is optional list of Siger instance of indexed witness sigs
         """
-        dgkey = dgKey(serder.preb, serder.digb)
-        self.baser.putDts(dgkey, nowIso8601().encode("utf-8"))   # idempotent
-        self.baser.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        if wigers:
-            self.baser.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        self.baser.putEvt(dgkey, serder.raw)
-        self.baser.addPse(snKey(serder.preb, serder.sn), serder.digb)
+        with self.baser.batch():  # all writes for escrow commit at once
+            dgkey = dgKey(serder.preb, serder.digb)
+            self.baser.putDts(dgkey, nowIso8601().encode("utf-8"))   # idempotent
+            self.baser.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            if wigers:
+                self.baser.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            self.baser.putEvt(dgkey, serder.raw)
+            self.baser.addPse(snKey(serder.preb, serder.sn), serder.digb)
         logger.info("Kever state: Escrowed partially signed "
                      "event = %s\n", serder.ked)
 
@@ -2021,23 +2151,26 @@ class Kever:
             wigers is list of Siger instance of indexed witness sigs
             sigers is optional list of Siger instances of indexed controller sigs
         """
-        dgkey = dgKey(serder.preb, serder.digb)
-        self.baser.putDts(dgkey, nowIso8601().encode("utf-8"))  # idempotent
-        self.baser.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if sigers:
-            self.baser.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.baser.putEvt(dgkey, serder.raw)
-        self.baser.addPwe(snKey(serder.preb, serder.sn), serder.digb)
+        with self.baser.batch():  # all writes for escrow commit at once
+            dgkey = dgKey(serder.preb, serder.digb)
+            self.baser.putDts(dgkey, nowIso8601().encode("utf-8"))  # idempotent
+            self.baser.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if sigers:
+                self.baser.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.baser.putEvt(dgkey, serder.raw)
+            self.baser.addPwe(snKey(serder.preb, serder.sn), serder.digb)
         logger.info("Kever state: Escrowed partially witnessed "
                      "event = %s\n", serder.ked)
 
 
-    def state(self, kind=Serials.json):
+    def state(self, kind=Serials.json, fn=None):
         """
         Returns Serder instance of current key state notification message
 
         Parameters:
             kind is serialization kind for message json, cbor, mgpk
+            fn is int first seen ordinal of latest event for local key state
+                record. None means key state notice without fn
         """
         eevt = StateEstEvent(s="{:x}".format(self.lastEst.s),
                              d=self.lastEst.d,
@@ -2057,16 +2190,146 @@ class Kever:
                       keys=[verfer.qb64 for verfer in self.verfers],
                       eevt=eevt,
                       sith=self.tholder.sith,
-                      nxt=self.nexter.qb64,
+                      nxt=self.nexter.qb64 if self.nexter else "",
                       toad=self.toad,
                       wits=self.wits,
                       cnfg = cnfg,
                       dpre=self.delegator,
+                      fn=fn,
                       kind=kind
                      )
                )
 
 
+class KeverCache(MutableMapping):
+    """
+    KeverCache is mapping of Kever instances keyed by qb64 identifier prefix
+    that holds at most .size Kevers in memory. Least recently used Kevers are
+    evicted and rehydrated on demand from the key state record persisted in
+    .db by Kever.logEvent. Drop in replacement for the .kevers dict of Kevery
+    and Habitat so memory is bounded when tracking millions of prefixes.
+    Deleting a Kever also deletes its key state record so that it is no
+    longer contained.
+
+    Attributes:
+        .db is Baser instance with persisted key state records
+        .size is int max number of Kevers in memory. None means unbounded
+        .loader is callable that takes qb64 pre and returns rehydrated Kever
+            or None. Assigned by the first Kevery given this cache
+        .hits is int count of lookups found in memory
+        .misses is int count of lookups not found in memory
+        .evicts is int count of Kevers evicted from memory
+
+    Properties:
+        .metrics is dict of cache hit, miss and eviction counts
+
+    """
+    Size = 10000  # default max number of Kevers in memory
+
+    def __init__(self, db, size=None, loader=None):
+        """
+        Initialize instance
+
+        Parameters:
+            db is Baser instance with persisted key state records
+            size is int max number of Kevers in memory. None means .Size
+            loader is callable that takes qb64 pre and returns Kever or None
+        """
+        self.db = db
+        self.size = size if size is not None else self.Size
+        self.loader = loader
+        self.hits = 0
+        self.misses = 0
+        self.evicts = 0
+        self._kevers = OrderedDict()  # least recently used first
+        self._unsaved = set()  # held prefixes without key state record when set
+
+
+    @property
+    def metrics(self):
+        """
+        Returns dict of cache metrics
+        """
+        return dict(size=self.size, held=len(self._kevers), hits=self.hits,
+                    misses=self.misses, evicts=self.evicts)
+
+
+    def __getitem__(self, pre):
+        if pre in self._kevers:
+            self.hits += 1
+            self._kevers.move_to_end(pre)
+            return self._kevers[pre]
+
+        self.misses += 1
+        kever = self.loader(pre) if self.loader is not None else None
+        if kever is None:
+            raise KeyError(pre)
+        self[pre] = kever
+        return kever
+
+
+    def __setitem__(self, pre, kever):
+        self._kevers[pre] = kever
+        self._kevers.move_to_end(pre)
+        if self.db.getState(pre.encode("utf-8")) is None:  # not persisted yet
+            self._unsaved.add(pre)
+        while self.size is not None and len(self._kevers) > self.size:
+            epre, ekever = self._kevers.popitem(last=False)
+            key = epre.encode("utf-8")
+            if self.db.getState(key) is None:  # not persisted such as check mode
+                self.db.setState(key, ekever.state(fn=ekever.fn).raw)
+            self._unsaved.discard(epre)
+            self.evicts += 1
+
+
+    def __delitem__(self, pre):
+        held = self._kevers.pop(pre, None) is not None
+        self._unsaved.discard(pre)
+        saved = isinstance(pre, str) and self.db.delState(pre.encode("utf-8"))
+        if not (held or saved):
+            raise KeyError(pre)
+
+
+    def clear(self):
+        """
+        Removes all Kevers from memory and their key state records from .db
+        """
+        self._kevers.clear()
+        self._unsaved.clear()
+        self.db.delStates()
+
+
+    def _unsavedIter(self):
+        """
+        Returns iterator of held prefixes without key state record in .db.
+        Prunes those persisted since they were set
+        """
+        for pre in list(self._unsaved):
+            if self.db.getState(pre.encode("utf-8")) is None:
+                yield pre
+            else:
+                self._unsaved.discard(pre)
+
+
+    def __contains__(self, pre):
+        if pre in self._kevers:
+            return True
+        if not isinstance(pre, str):
+            return False
+        return self.db.getState(pre.encode("utf-8")) is not None
+
+
+    def __iter__(self):
+        for key, _ in self.db.getStateItemIter():
+            yield key.decode("utf-8")
+        yield from self._unsavedIter()  # held but not persisted
+
+
+    def __len__(self):
+        return self.db.cntStates() + sum(1 for _ in self._unsavedIter())
+
+
+
 class Kevery:
     """
     Kevery (Key Event Message Processing Facility) processes an incoming
@@ -2081,7 +2344,8 @@ class Kevery:
     Attributes:
         .ims is bytearray incoming message stream
         .cues is deque of Cues i.e. notices of events or requests to respond to
-        .kevers is dict of existing kevers indexed by pre (qb64) of each Kever
+        .kevers is dict or KeverCache of existing kevers indexed by pre (qb64)
+                of each Kever
         .db is instance of LMDB Baser object
         .framed is Boolean stream is packet framed If True Else not framed
         .pipeline is Boolean, True means use pipeline processor to process
@@ -2089,6 +2353,14 @@ class Kevery:
         .opre is fully qualified base64 identifier prefix of own identifier if any
         .local is Boolean, True means only process msgs for own events if .opre
                            False means only process msgs for not own events if .opre
+        .verifier is Verifier instance for batch signature verification
+        .wakes is set of qb64 prefixes whose escrows to process on next
+                woken escrow pass
+        .deps is dict of sets of qb64 escrowed prefixes keyed by qb64 prefix
+                each waits on i.e. delegator or transferable receipter
+        .escrowing is Boolean, True means in escrow pass so reprocessed
+                escrowed msgs do not wake their own prefix
+        .walked is float monotonic time of last full escrow walk or None if not yet
 
     Properties:
         .kever own Kever if self.pre else None
@@ -2103,20 +2375,24 @@ class Kevery:
     TimeoutUWE = 3600  # seconds to timeout unverified receipt escrows
     TimeoutURE = 3600  # seconds to timeout unverified receipt escrows
     TimeoutVRE = 3600  # seconds to timeout unverified transferable receipt escrows
+    TimeoutWalk = 600  # seconds between full escrow walks so stale escrows expire
 
-
-    def __init__(self, cues=None, kevers=None, db=None, opre=None, local=False, indirect=False):
+    def __init__(self, cues=None, kevers=None, db=None, opre=None, local=False,
+                 indirect=False, verifier=None):
         """
         Initialize instance:
 
         Parameters:
             cues is deque if cues to create responses to messages
-            kevers is dict of Kever instances of key state in db
+            kevers is dict or KeverCache of Kever instances of key state in db
             db is Baser instance
             opre is local or own identifier prefix. Some restriction if present
             local is Boolean, True means only process msgs for own events if .pre
                         False means only process msgs for not own events if .pre
             indirect is Boolean, True means don't cue receipts
+            verifier is Verifier instance for batch signature verification of
+                events, receipts and escrows. None means use shared module
+                DefaultVerifier whose pool lives for the process
         """
         self.cues = cues if cues is not None else deque()
         self.kevers = kevers if kevers is not None else dict()
@@ -2126,6 +2402,13 @@ class Kevery:
         self.opre = opre  # local prefix for restrictions on local events
         self.local = True if local else False  # local vs nonlocal restrictions
         self.indirect = True if indirect else False
+        self.verifier = verifier if verifier is not None else DefaultVerifier
+        if isinstance(self.kevers, KeverCache) and self.kevers.loader is None:
+            self.kevers.loader = self.loadKever  # rehydrate evicted on demand
+        self.wakes = set()  # prefixes whose escrows may now be unblocked
+        self.deps = dict()  # escrowed prefixes keyed by prefix they wait on
+        self.escrowing = False
+        self.walked = None  # None forces full walk on first woken escrow pass
 
 
     @property
@@ -2136,9 +2419,196 @@ class Kevery:
         return self.kevers[self.opre] if self.opre else None
 
 
+    def reloadKevers(self):
+        """
+        Reload .kevers from persisted key state records in .db without
+        replaying and reverifying each KEL. Cost is O(prefixes) not O(events).
+        Returns int number of reloaded Kevers
+        """
+        if isinstance(self.kevers, KeverCache):  # rehydrates on demand instead
+            return 0
+
+        count = 0
+        for pre, raw in self.db.getStateItemIter():
+            state = Serder(raw=raw)
+            self.kevers[state.pre] = Kever(state=state,
+                                           baser=self.db,
+                                           kevers=self.kevers,
+                                           cues=self.cues,
+                                           opre=self.opre,
+                                           local=self.local and state.pre == self.opre,
+                                           verifier=self.verifier)
+            count += 1
+        return count
+
+
+    def loadKever(self, pre):
+        """
+        Returns Kever for pre rehydrated from its persisted key state record
+        in .db or None if no record. Used as loader of KeverCache .kevers
+
+        Parameters:
+            pre is qb64 identifier prefix
+        """
+        raw = self.db.getState(pre.encode("utf-8"))
+        if raw is None:
+            return None
+        state = Serder(raw=bytes(raw))
+        return Kever(state=state,
+                     baser=self.db,
+                     kevers=self.kevers,
+                     cues=self.cues,
+                     opre=self.opre,
+                     local=self.local and state.pre == self.opre,
+                     verifier=self.verifier)
+
+
+    def verifyKeversIter(self, pres=None):
+        """
+        Returns generator that reverifies reloaded key state in .kevers by
+        replaying the persisted KEL of each prefix from .db into a scratch
+        Kevery backed by a temporary Baser and comparing the resultant key
+        states. Yields after each prefix so may run in background from a doer.
+        Cues kin "invalidKeyState" for each prefix whose state did not verify.
+        Generator returns list of qb64 prefixes whose state did not verify.
+
+        Parameters:
+            pres is list of qb64 prefixes to reverify. None means all .kevers
+        """
+        pres = list(pres if pres is not None else self.kevers)
+        bads = []
+        tdb = Baser(name="verify", temp=True)
+        try:
+            kvy = Kevery(db=tdb, verifier=self.verifier)
+            psr = Parser(framed=True, cloned=True, kvy=kvy)
+            for pre in pres:
+                msgs = bytearray()
+                try:
+                    for msg in self.db.clonePreIter(pre=pre):
+                        msgs.extend(msg)
+                except MissingEntryError as ex:  # replay what is there then compare
+                    logger.info("Kevery verify error on replay of pre=%s: %s",
+                                pre, ex.args[0])
+                psr.process(ims=msgs)
+                yield
+
+            kvy.processEscrows()  # delegated may escrow until delegator replayed
+
+            for pre in pres:
+                kever = self.kevers.get(pre)
+                tkever = kvy.kevers.get(pre)
+                if (kever is None or tkever is None or
+                        kever.state().raw != tkever.state().raw):
+                    bads.append(pre)
+                    self.cues.append(dict(kin="invalidKeyState", pre=pre))
+                    logger.info("Kevery unverified key state for pre=%s.", pre)
+        finally:
+            tdb.close(clear=True)
+
+        return bads
+
+
+    def wake(self, pre):
+        """
+        Wake escrows of prefix pre and of all escrowed prefixes that depend on
+        pre so they are processed on next woken escrow pass.
+
+        Parameters:
+            pre is qb64 or qb64b prefix whose escrows may now be unblocked
+        """
+        if not isinstance(pre, str):
+            pre = bytes(pre).decode("utf-8")
+        self.wakes.add(pre)
+        self.wakes.update(self.deps.pop(pre, ()))
+
+
+    def depend(self, pre, dep):
+        """
+        Index escrowed prefix pre as waiting on prefix dep so that acceptance
+        of an event of dep wakes the escrows of pre.
+
+        Parameters:
+            pre is qb64 or qb64b prefix with escrowed msgs
+            dep is qb64 or qb64b prefix waited on i.e. delegator or receipter
+        """
+        if not isinstance(pre, str):
+            pre = bytes(pre).decode("utf-8")
+        if not isinstance(dep, str):
+            dep = bytes(dep).decode("utf-8")
+        self.deps.setdefault(dep, set()).add(pre)
+
+
+    def owned(self, pre):
+        """
+        Returns True if pre is own .opre in local mode so that own signatures
+        on its events may be trusted without verifying them
+
+        Parameters:
+            pre is qb64 str identifier prefix
+        """
+        return True if (self.local and self.opre and self.opre == pre) else False
+
+
+    @regrowing("db")
+    def processLocal(self, serder, sigers=None, wigers=None, cigars=None,
+                     tsgs=None, seqner=None, diger=None, strict=False):
+        """
+        Trusted local ingest of own message just built and signed by this
+        process. Processes serder with its attachments as the Parser would but
+        directly from the Serder and Siger instances, so there is no CESR
+        serialization or parse. Unless strict, own signatures are trusted
+        without verifying them. Signatures of others are always verified.
+        Unlike the Parser, errors are raised to the caller not logged.
+
+        Parameters:
+            serder is Serder instance of own event or receipt
+            sigers is list of Siger instances of own indexed signatures of event
+            wigers is list of Siger instances of indexed witness signatures
+            cigars is list of Cigar instances of nontrans receipt couples
+            tsgs is list of tuples (prefixer, seqner, diger, sigers) of
+                transferable indexed sig groups of receipt
+            seqner is Seqner instance of delegating event sequence number
+            diger is Diger instance of delegating event digest
+            strict is Boolean True means verify own signatures anyway
+        """
+        verified = not strict
+        ilk = serder.ked["t"]
+        if ilk in (Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt):  # event
+            if not sigers:
+                raise ValidationError("Missing attached signature(s) for evt "
+                                      "= {}.".format(serder.ked))
+            self.processEvent(serder=serder, sigers=sigers, wigers=wigers,
+                              seqner=seqner, diger=diger, verified=verified)
+
+        elif ilk == Ilks.rct:  # receipt
+            if not (cigars or wigers or tsgs):
+                raise ValidationError("Missing attached signatures on receipt"
+                                      "msg = {}.".format(serder.ked))
+            if cigars:
+                self.processReceipt(serder=serder, cigars=cigars,
+                                    verified=verified and
+                                    all(self.owned(cigar.verfer.qb64)
+                                        for cigar in cigars))
+            if wigers:
+                self.processReceiptWitness(serder=serder, wigers=wigers,
+                                           verified=verified and
+                                           all(self.owned(wiger.verfer.qb64)
+                                               for wiger in wigers))
+            if tsgs:
+                self.processReceiptTrans(serder=serder, tsgs=tsgs,
+                                         verified=verified and
+                                         all(self.owned(prefixer.qb64)
+                                             for prefixer, _, _, _ in tsgs))
+
+        else:
+            raise ValidationError("Unsupported local ilk = {} for msg = {}."
+                                  "".format(ilk, serder.ked))
+
+
+    @regrowing("db")
     def processEvent(self, serder, sigers, wigers=None,
                      seqner=None, diger=None,
-                     firner=None, dater=None, check=False):
+                     firner=None, dater=None, check=False, verified=False):
         """
         Process one event serder with attached indexd signatures sigers
 
@@ -2161,6 +2631,9 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            verified is Boolean True means sigers are own signatures just made
+                locally so accept event without reverifying them.
+                Only honored in local mode for own .opre
         """
         # fetch ked ilk  pre, sn, dig to see how to process
         ked = serder.ked
@@ -2185,6 +2658,12 @@ class Kevery:
                     raise ValueError("Local event pre={} when nonlocal mode."
                                                       "".format(pre))
 
+        if not self.escrowing:  # new copy or sigs may unblock escrows of pre
+            self.wake(pre)
+        if ilk == Ilks.dip:  # delegated so may escrow waiting on delegator
+            self.depend(pre, ked["di"])
+        elif ilk == Ilks.drt and pre in self.kevers and self.kevers[pre].delegator:
+            self.depend(pre, self.kevers[pre].delegator)
 
         if pre not in self.kevers:  #  first seen event for pre
             if ilk in (Ilks.icp, Ilks.dip):  # first seen and inception so verify event keys
@@ -2204,8 +2683,12 @@ class Kevery:
                               cues=self.cues,
                               opre=self.opre,
                               local=self.local,
-                              check=check)
+                              check=check,
+                              verifier=self.verifier,
+                              verified=verified and self.owned(pre))
                 self.kevers[pre] = kever  # not exception so add to kevers
+                self.db.onAbort(lambda: self.kevers.pop(pre, None))  # batch if any
+                self.wake(pre)  # wake escrows of pre and its dependents
 
                 if not self.indirect or not self.opre or self.opre != pre:  # not own event when owned
                     # create cue for receipt   direct mode for now
@@ -2231,11 +2714,13 @@ class Kevery:
                     # get unique verified lists of sigers and indices from sigers
                     sigers, indices = verifySigs(serder=serder,
                                                  sigers=sigers,
-                                                 verfers=eserder.verfers)
+                                                 verfers=eserder.verfers,
+                                                 verifier=self.verifier)
 
                     wigers, windices = verifySigs(serder=serder,
                                                   sigers=wigers,
-                                                  verfers=eserder.werfers)
+                                                  verfers=eserder.werfers,
+                                                  verifier=self.verifier)
 
                     if sigers or wigers:  # at least one verified sig or wig so log evt
                         # not first seen inception so ignore return
@@ -2262,7 +2747,9 @@ class Kevery:
                     # Otherwise adds to KELs
                     kever.update(serder=serder, sigers=sigers, wigers=wigers,
                                  seqner=seqner, diger=diger,
-                                 firner=firner, dater=dater, check=check)
+                                 firner=firner, dater=dater, check=check,
+                                 verified=verified and self.owned(pre))
+                    self.wake(pre)  # wake escrows of pre and its dependents
 
                     if not self.indirect or not self.opre or self.opre != pre:  # not own event when owned
                         # create cue for receipt   direct mode for now
@@ -2280,7 +2767,8 @@ class Kevery:
                         # get unique verified lists of sigers and indices from sigers
                         sigers, indices = verifySigs(serder=serder,
                                                      sigers=sigers,
-                                                     verfers=eserder.verfers)
+                                                     verfers=eserder.verfers,
+                                                     verifier=self.verifier)
 
                         # only verify wigers if lastest est event of current key state
                         # matches est event of processed event
@@ -2289,7 +2777,8 @@ class Kevery:
                             werfers = [Verfer(qb64=wit) for wit in kever.wits]
                             wigers, windices = verifySigs(serder=serder,
                                                           sigers=wigers,
-                                                          verfers=werfers)
+                                                          verfers=werfers,
+                                                          verifier=self.verifier)
                         else:
                             wigers = []
 
@@ -2302,7 +2791,7 @@ class Kevery:
                         raise LikelyDuplicitousError("Likely Duplicitous event={}.".format(ked))
 
 
-    def processReceiptWitness(self, serder, wigers):
+    def processReceiptWitness(self, serder, wigers, verified=False):
         """
         Process one witness receipt serder with attached witness sigers
 
@@ -2312,6 +2801,8 @@ class Kevery:
                 signature in .raw. Index is offset into witness list of latest
                 establishment event for receipted event. Signature uses key pair
                 derived from nontrans witness prefix in associated witness list.
+            verified is Boolean True means wigers are own signatures just made
+                locally so trust them without verifying
 
         Receipt dict labels
             vs  # version string
@@ -2324,6 +2815,8 @@ class Kevery:
         ked = serder.ked
         pre = serder.pre
         sn = self.validateSN(ked)
+        if not self.escrowing:  # new receipts may unblock escrows of pre
+            self.wake(pre)
 
         # Only accept receipt if for last seen version of event at sn
         snkey = snKey(pre=pre, sn=sn)
@@ -2341,7 +2834,8 @@ class Kevery:
                 raise ValidationError("Stale receipt at sn = {} for rct = {}."
                                       "".format(ked["s"], ked))
 
-            # process each couple verify sig and write to db
+            # process each couple assign verfer and collect to verify
+            vwigers = []
             for wiger in wigers:
                 # assign verfers from witness list
                 kever = self.kevers[pre]  # get key state
@@ -2363,7 +2857,14 @@ class Kevery:
                                                json.dumps(serder.ked, indent=1))
                         continue  # skip own receipt attachment on non-local event
 
-                if wiger.verfer.verify(wiger.raw, lserder.raw):
+                vwigers.append(wiger)
+
+            # verify collected sigs as one batch and write verified to db
+            results = ([True] * len(vwigers) if verified else
+                       self.verifier.verify([(wiger.verfer, wiger.raw, lserder.raw)
+                                             for wiger in vwigers]))
+            for wiger, verified in zip(vwigers, results):
+                if verified:
                     # write receipt indexed sig to database
                     self.db.addWig(key=dgkey, val=wiger.qb64b)
 
@@ -2374,7 +2875,7 @@ class Kevery:
                                                 "".format(ked))
 
 
-    def processReceipt(self, serder, cigars):
+    def processReceipt(self, serder, cigars, verified=False):
         """
         Process one receipt serder with attached cigars
 
@@ -2382,6 +2883,8 @@ class Kevery:
             serder is Serder instance of serialized receipt message not receipted message
             cigars is list of Cigar instances that contain receipt couple
                 signature in .raw and public key in .verfer
+            verified is Boolean True means cigars are own signatures just made
+                locally so trust them without verifying
 
         Receipt dict labels
             vs  # version string
@@ -2394,6 +2897,8 @@ class Kevery:
         ked = serder.ked
         pre = serder.pre
         sn = self.validateSN(ked)
+        if not self.escrowing:  # new receipts may unblock escrows of pre
+            self.wake(pre)
 
         # Only accept receipt if for last seen version of event at sn
         snkey = snKey(pre=pre, sn=sn)
@@ -2411,7 +2916,8 @@ class Kevery:
                 raise ValidationError("Stale receipt at sn = {} for rct = {}."
                                       "".format(ked["s"], ked))
 
-            # process each couple verify sig and write to db
+            # process each couple collect to verify
+            vcigars = []
             for cigar in cigars:
                 if cigar.verfer.transferable:  # skip transferable verfers
                     continue  # skip invalid couplets
@@ -2428,7 +2934,14 @@ class Kevery:
                                                json.dumps(serder.ked, indent=1))
                         continue  # skip own receipt attachment on non-local event
 
-                if cigar.verfer.verify(cigar.raw, lserder.raw):
+                vcigars.append(cigar)
+
+            # verify collected sigs as one batch and write verified to db
+            results = ([True] * len(vcigars) if verified else
+                       self.verifier.verify([(cigar.verfer, cigar.raw, lserder.raw)
+                                             for cigar in vcigars]))
+            for cigar, verified in zip(vcigars, results):
+                if verified:
                     kever = self.kevers[pre]  # get key state to check if witness
                     rpre = cigar.verfer.qb64  # prefix of receiptor
                     if rpre in kever.wits:  # its a witness receipt
@@ -2462,6 +2975,8 @@ class Kevery:
         ked = serder.ked
         pre = serder.pre
         sn = self.validateSN(ked)
+        if not self.escrowing:  # new receipts may unblock escrows of pre
+            self.wake(pre)
 
         # Only accept receipt if event is latest event at sn. Means its been
         # first seen and is the most recent first seen with that sn
@@ -2482,7 +2997,8 @@ class Kevery:
             raise ValidationError("Mismatch replay event at sn = {} with db."
                                   "".format(ked["s"]))
 
-        # process each couple to verify sig and write to db
+        # process each couple collect to verify
+        vcigars = []
         for cigar in cigars:
             if cigar.verfer.transferable:  # skip transferable verfers
                 continue  # skip invalid couplets
@@ -2499,7 +3015,13 @@ class Kevery:
                                            json.dumps(serder.ked, indent=1))
                     continue  # skip own receipt attachment on non-local event
 
-            if cigar.verfer.verify(cigar.raw, serder.raw):
+            vcigars.append(cigar)
+
+        # verify collected sigs as one batch and write verified to db
+        results = self.verifier.verify([(cigar.verfer, cigar.raw, serder.raw)
+                                        for cigar in vcigars])
+        for cigar, verified in zip(vcigars, results):
+            if verified:
                 kever = self.kevers[pre]  # get key state to check if witness
                 rpre = cigar.verfer.qb64  # prefix of receiptor
                 if rpre in kever.wits:  # its a witness receipt
@@ -2512,7 +3034,7 @@ class Kevery:
                     self.db.addRct(key=dgKey(pre, ldig), val=couple)
 
 
-    def processReceiptTrans(self, serder, tsgs):
+    def processReceiptTrans(self, serder, tsgs, verified=False):
         """
         Process one transferable validator receipt (chit) serder with attached sigers
 
@@ -2520,6 +3042,8 @@ class Kevery:
             serder is chit serder (transferable validator receipt message)
             tsgs is tist of tuples from extracted transferable indexed sig groups
                 each converted group is tuple of (i,s,d) triple plus list of sigs
+            verified is Boolean True means sigers are own signatures just made
+                locally so trust them without verifying
 
         Receipt dict labels
             vs  # version string
@@ -2533,6 +3057,8 @@ class Kevery:
         ked = serder.ked
         pre = serder.pre
         sn = self.validateSN(ked)
+        if not self.escrowing:  # new receipts may unblock escrows of pre
+            self.wake(pre)
 
         # Only accept receipt if for last seen version of event at sn
         ldig = self.db.getKeLast(key=snKey(pre=pre, sn=sn))  # retrieve dig of last event at sn.
@@ -2597,7 +3123,13 @@ class Kevery:
                         raise ValidationError("Index = {} to large for keys."
                                                   "".format(siger.index))
                     siger.verfer = sverfers[siger.index]  # assign verfer
-                    if siger.verfer.verify(siger.raw, lserder.raw):  # verify sig
+
+                # verify sigs as one batch
+                results = ([True] * len(sigers) if verified else
+                           self.verifier.verify([(siger.verfer, siger.raw, lserder.raw)
+                                                 for siger in sigers]))
+                for siger, verified in zip(sigers, results):
+                    if verified:
                         # good sig so write receipt quadruple to database
                         quadruple = sprefixer.qb64b + sseqner.qb64b + sdiger.qb64b + siger.qb64b
                         self.db.addVrc(key=dgKey(pre=pre, dig=ldig),
@@ -2625,6 +3157,8 @@ class Kevery:
         ked = serder.ked
         pre = serder.pre
         sn = self.validateSN(ked)
+        if not self.escrowing:  # new receipts may unblock escrows of pre
+            self.wake(pre)
 
         if firner:  # retrieve last event by fn ordinal
             ldig = self.db.getFe(key=fnKey(pre=pre, sn=firner.sn))
@@ -2686,7 +3220,7 @@ class Kevery:
                                               "".format(siger.index))
 
                 siger.verfer = sverfers[siger.index]  # assign verfer
-                if not siger.verfer.verify(siger.raw, serder.raw):  # verify sig
+                if not self.verifier.verify([(siger.verfer, siger.raw, serder.raw)])[0]:  # verify sig
                     logger.info("Kevery unescrow error: Bad trans receipt sig."
                              "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
 
@@ -2774,7 +3308,7 @@ class Kevery:
                                            json.dumps(serder.ked, indent=1))
                     continue  # skip own receipt attachment on non-local event
 
-            if cigar.verfer.verify(cigar.raw, serder.raw):
+            if self.verifier.verify([(cigar.verfer, cigar.raw, serder.raw)])[0]:
                 # write receipt couple to database
                 couple = cigar.verfer.qb64b + cigar.qb64b
                 self.db.addRct(key=dgKey(pre=pre, dig=ldig), val=couple)
@@ -2837,7 +3371,7 @@ class Kevery:
                         raise ValidationError("Index = {} to large for keys."
                                                   "".format(siger.index))
                     siger.verfer = sverfers[siger.index]  # assign verfer
-                    if not siger.verfer.verify(siger.raw, serder.raw):  # verify sig
+                    if not self.verifier.verify([(siger.verfer, siger.raw, serder.raw)])[0]:  # verify sig
                         logger.info("Kevery unescrow error: Bad trans receipt sig."
                                  "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
 
@@ -2876,12 +3410,18 @@ class Kevery:
 
         if res == "logs":
             pre = qry["i"]
-            cloner = self.db.cloneIter(pre=pre, fn=0)  # create iterator at 0
-            msgs = bytearray()  # outgoing messages
-            for msg in cloner:
-                msgs.extend(msg)
-
-            self.cues.append(dict(kin="replay", msgs=msgs))
+            try:
+                fn = int(qry["fn"], 16) if "fn" in qry else 0
+                limit = int(qry["limit"], 16) if "limit" in qry else None
+            except (TypeError, ValueError) as ex:
+                raise ValidationError("Invalid fn or limit in query = {}."
+                                      "".format(ked)) from ex
+            if fn < 0 or (limit is not None and limit < 0):
+                raise ValidationError("Invalid fn or limit in query = {}."
+                                      "".format(ked))
+            # lazy cursor so replay is streamed as the connection drains
+            cursor = self.db.cloneCursorIter(pre=pre, fn=fn, limit=limit)
+            self.cues.append(dict(kin="replay", msgs=cursor))
         else:
             raise ValidationError("invalid query message {} for evt = {}".format(ilk, ked))
 
@@ -2917,7 +3457,16 @@ class Kevery:
             pre is qb64 of identifier prefix for KEL
             sn is int sequence number of event in KEL of pre
         """
+        if not self.db.getKeLast(key=snKey(pre, sn)):
+            return None  # no event at sn
 
+        if (item := self.db.getEstItemLast(pre, sn)) is not None:  # indexed
+            esn, dig = item
+            raw = self.db.getEvt(key=dgKey(pre=pre, dig=dig))
+            if raw is not None:
+                return Serder(raw=bytes(raw))
+
+        # not indexed such as KEL logged before est event index so walk back
         found = False
         while not found:
             dig = bytes(self.db.getKeLast(key=snKey(pre, sn)))
@@ -2948,14 +3497,15 @@ class Kevery:
             seqner is Seqner instance of sn of event delegatint/issuing event if any
             diger is Diger instance of dig of event delegatint/issuing event if any
         """
-        dgkey = dgKey(serder.preb, serder.digb)
-        self.db.putDts(dgkey, nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        self.db.addOoe(snKey(serder.preb, serder.sn), serder.digb)
-        if seqner and diger:
-            couple = seqner.qb64b + diger.qb64b
-            self.db.putPde(dgkey, couple)   # idempotent
+        with self.db.batch():  # all writes for escrow commit at once
+            dgkey = dgKey(serder.preb, serder.digb)
+            self.db.putDts(dgkey, nowIso8601().encode("utf-8"))
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            self.db.addOoe(snKey(serder.preb, serder.sn), serder.digb)
+            if seqner and diger:
+                couple = seqner.qb64b + diger.qb64b
+                self.db.putPde(dgkey, couple)   # idempotent
         # log escrowed
         logger.info("Kevery process: escrowed out of order event=\n%s\n",
                                       json.dumps(serder.ked, indent=1))
@@ -2969,11 +3519,12 @@ class Kevery:
             serder is Serder instance of  event
             sigers is list of Siger instance for  event
         """
-        dgkey = dgKey(serder.preb, serder.digb)
-        self.db.putDts(dgkey, nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        self.db.addLde(snKey(serder.preb, serder.sn), serder.digb)
+        with self.db.batch():  # all writes for escrow commit at once
+            dgkey = dgKey(serder.preb, serder.digb)
+            self.db.putDts(dgkey, nowIso8601().encode("utf-8"))
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            self.db.addLde(snKey(serder.preb, serder.sn), serder.digb)
         # log duplicitous
         logger.info("Kevery process: escrowed likely duplicitous event=\n%s\n",
                                             json.dumps(serder.ked, indent=1))
@@ -3004,13 +3555,14 @@ class Kevery:
         # so can compare digs from receipt and in database for receipted event
         # with different algos.  Can't lookup event by dig for same reason. Must
         # lookup last event by sn not by dig.
-        self.db.putDts(dgKey(serder.preb, dig), nowIso8601().encode("utf-8"))
-        for wiger in wigers:  # escrow each couple
-            # don't know witness pre yet without witness list so no verfer in wiger
-            #if wiger.verfer.transferable:  # skip transferable verfers
-                #continue  # skip invalid triplets
-            couple = dig.encode("utf-8") + wiger.qb64b
-            self.db.addUwe(key=snKey(serder.preb, serder.sn), val=couple)
+        with self.db.batch():  # all writes for escrow commit at once
+            self.db.putDts(dgKey(serder.preb, dig), nowIso8601().encode("utf-8"))
+            for wiger in wigers:  # escrow each couple
+                # don't know witness pre yet without witness list so no verfer in wiger
+                #if wiger.verfer.transferable:  # skip transferable verfers
+                    #continue  # skip invalid triplets
+                couple = dig.encode("utf-8") + wiger.qb64b
+                self.db.addUwe(key=snKey(serder.preb, serder.sn), val=couple)
         # log escrowed
         logger.info("Kevery process: escrowed unverified witness indexed receipt"
                     " of pre= %s sn=%x dig=%s\n", serder.pre, serder.sn, dig)
@@ -3038,12 +3590,13 @@ class Kevery:
         # so can compare digs from receipt and in database for receipted event
         # with different algos.  Can't lookup event by dig for same reason. Must
         # lookup last event by sn not by dig.
-        self.db.putDts(dgKey(serder.preb, dig), nowIso8601().encode("utf-8"))
-        for cigar in cigars:  # escrow each triple
-            if cigar.verfer.transferable:  # skip transferable verfers
-                continue  # skip invalid triplets
-            triple = dig.encode("utf-8") + cigar.verfer.qb64b + cigar.qb64b
-            self.db.addUre(key=snKey(serder.preb, serder.sn), val=triple)  # should be snKey
+        with self.db.batch():  # all writes for escrow commit at once
+            self.db.putDts(dgKey(serder.preb, dig), nowIso8601().encode("utf-8"))
+            for cigar in cigars:  # escrow each triple
+                if cigar.verfer.transferable:  # skip transferable verfers
+                    continue  # skip invalid triplets
+                triple = dig.encode("utf-8") + cigar.verfer.qb64b + cigar.qb64b
+                self.db.addUre(key=snKey(serder.preb, serder.sn), val=triple)  # should be snKey
         # log escrowed
         logger.info("Kevery process: escrowed unverified receipt of pre= %s "
                      " sn=%x dig=%s\n", serder.pre, serder.sn, dig)
@@ -3089,6 +3642,7 @@ class Kevery:
             for siger in sigers:  # escrow each quintlet
                 quintuple = prelet + siger.qb64b  # quintuple
                 self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+            self.depend(serder.pre, prefixer.qb64)  # wake on receipter event
             # log escrowed
             logger.info("Kevery process: escrowed unverified transferable receipt "
                          "of pre=%s sn=%x dig=%s by pre=%s\n", serder.pre,
@@ -3132,6 +3686,7 @@ class Kevery:
         for siger in sigers:  # escrow each quintlet
             quintuple = prelet + siger.qb64b  # quintuple
             self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+        self.depend(serder.pre, prefixer.qb64)  # wake on receipter event
         # log escrowed
         logger.info("Kevery process: escrowed unverified transferable receipt "
                      "of pre=%s sn=%x dig=%s by pre=%s\n", serder.pre,
@@ -3166,27 +3721,30 @@ class Kevery:
         quintuple = (serder.digb + sprefixer.qb64b + sseqner.qb64b +
                      sdiger.qb64b + siger.qb64b)
         self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+        self.depend(serder.pre, sprefixer.qb64)  # wake on receipter event
         # log escrowed
         logger.info("Kevery process: escrowed unverified transferabe validator "
                      "receipt of pre= %s sn=%x dig=%s\n", serder.pre, serder.sn,
                      serder.dig)
 
 
-    def processEscrows(self):
+    def processEscrows(self, pres=None):
         """
         Iterate throush escrows and process any that may now be finalized
 
         Parameters:
+            pres is set of qb64 prefixes whose escrows to process.
+                None means process escrows of all prefixes
         """
-
+        self.escrowing = True
         try:
-            self.processEscrowOutOfOrders()
-            self.processEscrowUnverWitness()
-            self.processEscrowPartialWigs()
-            self.processEscrowPartialSigs()
-            self.processEscrowDuplicitous()
-            self.processEscrowUnverNonTrans()
-            self.processEscrowUnverTrans()
+            self.processEscrowOutOfOrders(pres=pres)
+            self.processEscrowUnverWitness(pres=pres)
+            self.processEscrowPartialWigs(pres=pres)
+            self.processEscrowPartialSigs(pres=pres)
+            self.processEscrowDuplicitous(pres=pres)
+            self.processEscrowUnverNonTrans(pres=pres)
+            self.processEscrowUnverTrans(pres=pres)
 
         except Exception as ex:  # log diagnostics errors etc
             if logger.isEnabledFor(logging.DEBUG):
@@ -3194,8 +3752,76 @@ class Kevery:
             else:
                 logger.error("Kevery escrow process error: %s\n", ex.args[0])
 
+        finally:
+            self.escrowing = False
+
+
+    def processWokenEscrows(self):
+        """
+        Process escrows of only those prefixes woken since last pass instead of
+        walking every escrow table on every pass. Idle pass with nothing woken
+        does no database reads.
+
+        Walks all escrows on first pass so escrows persisted before a restart
+        are processed and their dependencies indexed, and again at most every
+        .TimeoutWalk seconds so stale escrows still time out.
+        """
+        now = time.monotonic()
+        if self.walked is None or (now - self.walked) >= self.TimeoutWalk:
+            self.walked = now
+            self.wakes = set()  # full walk covers all woken
+            self.processEscrows()
+
+        elif self.wakes:
+            pres, self.wakes = self.wakes, set()  # wakes during pass go to next pass
+            self.processEscrows(pres=pres)
+
+
+    def sweepEscrow(self, name, timeout):
+        """
+        Remove stale entries from escrow table name that were escrowed more
+        than timeout seconds ago using the .db escrow expiry index so cost is
+        proportional to the number of stale entries not the size of the escrow.
+
+        Parameters:
+            name is bytes name of escrow table in .db such as b'ooes'
+            timeout is number of seconds after which escrow entry is stale
+        """
+        dts = (datetime.datetime.now(datetime.timezone.utc) -
+               datetime.timedelta(seconds=timeout)).isoformat()
+        for ekey, eval in self.db.delExpiredEscrows(name, dts):
+            logger.info("Kevery unescrowed: Stale escrow in %s at key=%s "
+                        "val=%s\n", name, ekey, eval)
+
 
-    def processEscrowOutOfOrders(self):
+    @staticmethod
+    def _escrowItemsIter(getter, pres=None):
+        """
+        Returns generator of escrow items (ekey, val) from escrow table items
+        iterator method getter. Restarts getter after last key of each batch
+        of dups.
+
+        Parameters:
+            getter is escrow table method getXyzItemsNextIter(key=b'')
+            pres is set of qb64 prefixes whose escrow items to iterate.
+                None means iterate escrow items of all prefixes
+        """
+        starts = ([b''] if pres is None else
+                  [(pre + ".").encode("utf-8") for pre in sorted(pres)])
+        for start in starts:
+            key = ekey = start  # both start same. when same after iteration then done
+            while True:  # break when done
+                for ekey, val in getter(key=key):
+                    if not bytes(ekey).startswith(start):  # past escrows of pre
+                        ekey = key  # so done
+                        break
+                    yield (ekey, val)
+                if ekey == key:  # still same so no escrows found on last while iteration
+                    break
+                key = ekey  # setup next while iteration, with key after ekey
+
+
+    def processEscrowOutOfOrders(self, pres=None):
         """
         Process events escrowed by Kever that are recieved out-of-order.
         An event is out of order if its prior event has not been accepted into its KEL.
@@ -3231,104 +3857,85 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pres is set of qb64 prefixes whose escrows to process.
+                None means process escrows of all prefixes
         """
 
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, edig in self.db.getOoeItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(edig)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                 " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow =  datetime.datetime.now(datetime.timezone.utc)
-                    dte = fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutOOE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                 " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
-                        # no event so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event at."
-                                 "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt at dig = {}."
-                                              "".format(bytes(edig)))
-
-                    eserder = Serder(raw=bytes(eraw))  # escrowed event
-
-                    #  get sigs and attach
-                    sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
-                    if not sigs:  #  otherwise its a list of sigs
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event sigs at."
-                                 "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt sigs at "
-                                              "dig = {}.".format(bytes(edig)))
-
-                    # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in  sigs]
-                    self.processEvent(serder=eserder, sigers=sigers)
-
-                    # If process does NOT validate event with sigs, becasue it is
-                    # still out of order then process will attempt to re-escrow
-                    # and then raise OutOfOrderError (subclass of ValidationError)
-                    # so we can distinquish between ValidationErrors that are
-                    # re-escrow vs non re-escrow. We want process to be idempotent
-                    # with respect to processing events that result in escrow items.
-                    # On re-escrow attempt by process, Ooe escrow is called by
-                    # Kevery.self.escrowOOEvent Which calls
-                    # self.db.addOoe(snKey(pre, sn), serder.digb)
-                    # which in turn will not enter dig as dup if one already exists.
-                    # So re-escrow attempt will not change the escrowed ooe db.
-                    # Non re-escrow ValidationError means some other issue so unescrow.
-                    # No error at all means processed successfully so also unescrow.
-
-                except OutOfOrderError as ex:
-                    # still waiting on missing prior event to validate
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
-
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
-
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded in valid event: "
-                             "event=\n%s\n", json.dumps(eserder.ked, indent=1))
-
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey #  setup next while iteration, with key after ekey
+        self.sweepEscrow(b'ooes', self.TimeoutOOE)  # remove stale first
+
+        for ekey, edig in self._escrowItemsIter(self.db.getOoeItemsNextIter,
+                                               pres=pres):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+
+                # get the escrowed event using edig
+                eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
+                if eraw is None:
+                    # no event so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event at."
+                             "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt at dig = {}."
+                                          "".format(bytes(edig)))
+
+                eserder = Serder(raw=bytes(eraw))  # escrowed event
+
+                #  get sigs and attach
+                sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
+                if not sigs:  #  otherwise its a list of sigs
+                    # no sigs so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event sigs at."
+                             "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt sigs at "
+                                          "dig = {}.".format(bytes(edig)))
+
+                # process event
+                sigers = [Siger(qb64b=bytes(sig)) for sig in  sigs]
+                self.processEvent(serder=eserder, sigers=sigers)
+
+                # If process does NOT validate event with sigs, becasue it is
+                # still out of order then process will attempt to re-escrow
+                # and then raise OutOfOrderError (subclass of ValidationError)
+                # so we can distinquish between ValidationErrors that are
+                # re-escrow vs non re-escrow. We want process to be idempotent
+                # with respect to processing events that result in escrow items.
+                # On re-escrow attempt by process, Ooe escrow is called by
+                # Kevery.self.escrowOOEvent Which calls
+                # self.db.addOoe(snKey(pre, sn), serder.digb)
+                # which in turn will not enter dig as dup if one already exists.
+                # So re-escrow attempt will not change the escrowed ooe db.
+                # Non re-escrow ValidationError means some other issue so unescrow.
+                # No error at all means processed successfully so also unescrow.
+
+            except OutOfOrderError as ex:
+                # still waiting on missing prior event to validate
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than out of order so remove from OO escrow
+                self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded in valid event: "
+                         "event=\n%s\n", json.dumps(eserder.ked, indent=1))
 
 
-    def processEscrowPartialSigs(self):
+
+    def processEscrowPartialSigs(self, pres=None):
         """
         Process events escrowed by Kever that were only partially fulfilled,
         either due to missing signatures or missing dependent events like a
@@ -3361,112 +3968,93 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pres is set of qb64 prefixes whose escrows to process.
+                None means process escrows of all prefixes
         """
 
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, edig in self.db.getPseItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    dgkey = dgKey(pre, bytes(edig))
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgkey)
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                 " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow =  datetime.datetime.now(datetime.timezone.utc)
-                    dte = fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPSE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                 " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgkey)
-                    if eraw is None:
-                        # no event so so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event at."
-                                 "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt at dig = {}."
-                                              "".format(bytes(edig)))
-
-                    eserder = Serder(raw=bytes(eraw))  # escrowed event
-                    #  get sigs and attach
-                    sigs = self.db.getSigs(dgkey)
-                    if not sigs:  #  otherwise its a list of sigs
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event sigs at."
-                                 "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt sigs at "
-                                              "dig = {}.".format(bytes(edig)))
-
-                    # seal source (delegator issuer if any)
-                    seqner = diger = None
-                    couple = self.db.getPde(dgkey)
-                    if couple is not None:
-                        seqner, diger = deSourceCouple(couple)
-
-                    # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in  sigs]
-                    self.processEvent(serder=eserder, sigers=sigers,
-                                      seqner=seqner, diger=diger)
-
-                    # If process does NOT validate sigs or delegation seal (when delegated),
-                    # but there is still one valid signature then process will
-                    # attempt to re-escrow and then raise MissingSignatureError
-                    # or MissingDelegationSealError (subclass of ValidationError)
-                    # so we can distinquish between ValidationErrors that are
-                    # re-escrow vs non re-escrow. We want process to be idempotent
-                    # with respect to processing events that result in escrow items.
-                    # On re-escrow attempt by process, Pse escrow is called by
-                    # Kever.self.escrowPSEvent Which calls
-                    # self.db.addPse(snKey(pre, sn), serder.digb)
-                    # which in turn will not enter dig as dup if one already exists.
-                    # So re-escrow attempt will not change the escrowed pse db.
-                    # Non re-escrow ValidationError means some other issue so unescrow.
-                    # No error at all means processed successfully so also unescrow.
-
-                except (MissingSignatureError, MissingDelegationError) as ex:
-                    # still waiting on missing sigs or missing seal to validate
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
-
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than waiting on sigs or seal so remove from escrow
-                    self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
-
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
-                    self.db.delPde(dgkey)  # remove escrow if any
-                    logger.info("Kevery unescrow succeeded in valid event: "
-                             "event=\n%s\n", json.dumps(eserder.ked, indent=1))
-
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey #  setup next while iteration, with key after ekey
+        self.sweepEscrow(b'pses', self.TimeoutPSE)  # remove stale first
+
+        for ekey, edig in self._escrowItemsIter(self.db.getPseItemsNextIter,
+                                               pres=pres):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                dgkey = dgKey(pre, bytes(edig))
+
+                # get the escrowed event using edig
+                eraw = self.db.getEvt(dgkey)
+                if eraw is None:
+                    # no event so so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event at."
+                             "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt at dig = {}."
+                                          "".format(bytes(edig)))
+
+                eserder = Serder(raw=bytes(eraw))  # escrowed event
+                #  get sigs and attach
+                sigs = self.db.getSigs(dgkey)
+                if not sigs:  #  otherwise its a list of sigs
+                    # no sigs so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event sigs at."
+                             "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt sigs at "
+                                          "dig = {}.".format(bytes(edig)))
+
+                # seal source (delegator issuer if any)
+                seqner = diger = None
+                couple = self.db.getPde(dgkey)
+                if couple is not None:
+                    seqner, diger = deSourceCouple(couple)
+
+                # process event
+                sigers = [Siger(qb64b=bytes(sig)) for sig in  sigs]
+                self.processEvent(serder=eserder, sigers=sigers,
+                                  seqner=seqner, diger=diger)
+
+                # If process does NOT validate sigs or delegation seal (when delegated),
+                # but there is still one valid signature then process will
+                # attempt to re-escrow and then raise MissingSignatureError
+                # or MissingDelegationSealError (subclass of ValidationError)
+                # so we can distinquish between ValidationErrors that are
+                # re-escrow vs non re-escrow. We want process to be idempotent
+                # with respect to processing events that result in escrow items.
+                # On re-escrow attempt by process, Pse escrow is called by
+                # Kever.self.escrowPSEvent Which calls
+                # self.db.addPse(snKey(pre, sn), serder.digb)
+                # which in turn will not enter dig as dup if one already exists.
+                # So re-escrow attempt will not change the escrowed pse db.
+                # Non re-escrow ValidationError means some other issue so unescrow.
+                # No error at all means processed successfully so also unescrow.
+
+            except (MissingSignatureError, MissingDelegationError) as ex:
+                # still waiting on missing sigs or missing seal to validate
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than waiting on sigs or seal so remove from escrow
+                self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
+
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
+                self.db.delPde(dgkey)  # remove escrow if any
+                logger.info("Kevery unescrow succeeded in valid event: "
+                         "event=\n%s\n", json.dumps(eserder.ked, indent=1))
 
 
-    def processEscrowPartialWigs(self):
+    def processEscrowPartialWigs(self, pres=None):
         """
         Process events escrowed by Kever that were only partially fulfilled
         due to missing signatures from witnesses. Events only make into this
@@ -3501,121 +4089,102 @@ class Kevery:
                         Get and Attach Witness Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pres is set of qb64 prefixes whose escrows to process.
+                None means process escrows of all prefixes
         """
 
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, edig in self.db.getPweItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(edig)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                 " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow =  datetime.datetime.now(datetime.timezone.utc)
-                    dte = fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPWE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                 " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
-                        # no event so so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event at."
-                                 "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt at dig = {}."
-                                              "".format(bytes(edig)))
-
-                    eserder = Serder(raw=bytes(eraw))  # escrowed event
-
-                    #  get sigs
-                    sigs = self.db.getSigs(dgKey(pre, bytes(edig)))  # list of sigs
-                    if not sigs:  # empty list
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event sigs at."
-                                 "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt sigs at "
-                                              "dig = {}.".format(bytes(edig)))
-
-                    #  get wigs
-                    wigs = self.db.getWigs(dgKey(pre, bytes(edig)))  # list of wigs
-
-                    if not wigs:  # empty list
-                        # wigs maybe empty while waiting for first witness signature
-                        # which may not arrive until some time after event is fully signed
-                        # so just log for debugging but do not unescrow by raising
-                        # ValidationError
-                        logger.info("Kevery unescrow wigs: No event wigs yet at."
-                                 "dig = %s\n", bytes(edig))
-
-                        #raise ValidationError("Missing escrowed evt wigs at "
-                                              #"dig = {}.".format(bytes(edig)))
-
-                    # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
-                    wigers = [Siger(qb64b=bytes(wig)) for wig in wigs]
-                    self.processEvent(serder=eserder, sigers=sigers, wigers=wigers)
-
-                    # If process does NOT validate wigs then process will attempt
-                    # to re-escrow and then raise MissingWitnessSignatureError
-                    # (subclass of ValidationError)
-                    # so we can distinquish between ValidationErrors that are
-                    # re-escrow vs non re-escrow. We want process to be idempotent
-                    # with respect to processing events that result in escrow items.
-                    # On re-escrow attempt by process, Pwe escrow is called by
-                    # Kever.self.escrowPWEvent Which calls
-                    # self.db.addPwe(snKey(pre, sn), serder.digb)
-                    # which in turn will NOT enter dig as dup if one already exists.
-                    # So re-escrow attempt will not change the escrowed pwe db.
-                    # Non re-escrow ValidationError means some other issue so unescrow.
-                    # No error at all means processed successfully so also unescrow.
-                    # Assumes that controller signature validation and delegation
-                    # validation will be successful as event would not be in
-                    # partially witnessed escrow unless they had already validated
-
-                except MissingWitnessSignatureError as ex:
-                    # still waiting on missing witness sigs
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
-
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than waiting on sigs or seal so remove from escrow
-                    self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
-
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded in valid event: "
-                             "event=\n%s\n", json.dumps(eserder.ked, indent=1))
-
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey #  setup next while iteration, with key after ekey
+        self.sweepEscrow(b'pwes', self.TimeoutPWE)  # remove stale first
+
+        for ekey, edig in self._escrowItemsIter(self.db.getPweItemsNextIter,
+                                               pres=pres):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+
+                # get the escrowed event using edig
+                eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
+                if eraw is None:
+                    # no event so so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event at."
+                             "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt at dig = {}."
+                                          "".format(bytes(edig)))
+
+                eserder = Serder(raw=bytes(eraw))  # escrowed event
+
+                #  get sigs
+                sigs = self.db.getSigs(dgKey(pre, bytes(edig)))  # list of sigs
+                if not sigs:  # empty list
+                    # no sigs so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event sigs at."
+                             "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt sigs at "
+                                          "dig = {}.".format(bytes(edig)))
+
+                #  get wigs
+                wigs = self.db.getWigs(dgKey(pre, bytes(edig)))  # list of wigs
+
+                if not wigs:  # empty list
+                    # wigs maybe empty while waiting for first witness signature
+                    # which may not arrive until some time after event is fully signed
+                    # so just log for debugging but do not unescrow by raising
+                    # ValidationError
+                    logger.info("Kevery unescrow wigs: No event wigs yet at."
+                             "dig = %s\n", bytes(edig))
+
+                    #raise ValidationError("Missing escrowed evt wigs at "
+                                          #"dig = {}.".format(bytes(edig)))
+
+                # process event
+                sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
+                wigers = [Siger(qb64b=bytes(wig)) for wig in wigs]
+                self.processEvent(serder=eserder, sigers=sigers, wigers=wigers)
+
+                # If process does NOT validate wigs then process will attempt
+                # to re-escrow and then raise MissingWitnessSignatureError
+                # (subclass of ValidationError)
+                # so we can distinquish between ValidationErrors that are
+                # re-escrow vs non re-escrow. We want process to be idempotent
+                # with respect to processing events that result in escrow items.
+                # On re-escrow attempt by process, Pwe escrow is called by
+                # Kever.self.escrowPWEvent Which calls
+                # self.db.addPwe(snKey(pre, sn), serder.digb)
+                # which in turn will NOT enter dig as dup if one already exists.
+                # So re-escrow attempt will not change the escrowed pwe db.
+                # Non re-escrow ValidationError means some other issue so unescrow.
+                # No error at all means processed successfully so also unescrow.
+                # Assumes that controller signature validation and delegation
+                # validation will be successful as event would not be in
+                # partially witnessed escrow unless they had already validated
+
+            except MissingWitnessSignatureError as ex:
+                # still waiting on missing witness sigs
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than waiting on sigs or seal so remove from escrow
+                self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded in valid event: "
+                         "event=\n%s\n", json.dumps(eserder.ked, indent=1))
 
-    def processEscrowDuplicitous(self):
+
+    def processEscrowDuplicitous(self, pres=None):
         """
         Process events escrowed by Kever that are likely duplicitous.
         An event is likely duplicitous if a different version of event already
@@ -3650,101 +4219,82 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pres is set of qb64 prefixes whose escrows to process.
+                None means process escrows of all prefixes
         """
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, edig in self.db.getLdeItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(edig)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                 " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow =  datetime.datetime.now(datetime.timezone.utc)
-                    dte = fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutLDE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                 " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
-                        # no event so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event at."
-                                 "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt at dig = {}."
-                                              "".format(bytes(edig)))
-
-                    eserder = Serder(raw=bytes(eraw))  # escrowed event
-
-                    #  get sigs and attach
-                    sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
-                    if not sigs:  #  otherwise its a list of sigs
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event sigs at."
-                                 "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt sigs at "
-                                              "dig = {}.".format(bytes(edig)))
-
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
-                    self.processEvent(serder=eserder, sigers=sigers)
-
-                    # If process does NOT validate event with sigs, becasue it is
-                    # still out of order then process will attempt to re-escrow
-                    # and then raise OutOfOrderError (subclass of ValidationError)
-                    # so we can distinquish between ValidationErrors that are
-                    # re-escrow vs non re-escrow. We want process to be idempotent
-                    # with respect to processing events that result in escrow items.
-                    # On re-escrow attempt by process, Ooe escrow is called by
-                    # Kevery.self.escrowOOEvent Which calls
-                    # self.db.addOoe(snKey(pre, sn), serder.digb)
-                    # which in turn will not enter dig as dup if one already exists.
-                    # So re-escrow attempt will not change the escrowed ooe db.
-                    # Non re-escrow ValidationError means some other issue so unescrow.
-                    # No error at all means processed successfully so also unescrow.
-
-                except LikelyDuplicitousError as ex:
-                    # still can't determine if duplicitous
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
-
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than likely duplicitous so remove from escrow
-                    self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
-
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded in valid event: "
-                             "event=\n%s\n", json.dumps(eserder.ked, indent=1))
-
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey #  setup next while iteration, with key after ekey
+        self.sweepEscrow(b'ldes', self.TimeoutLDE)  # remove stale first
+
+        for ekey, edig in self._escrowItemsIter(self.db.getLdeItemsNextIter,
+                                               pres=pres):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+
+                # get the escrowed event using edig
+                eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
+                if eraw is None:
+                    # no event so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event at."
+                             "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt at dig = {}."
+                                          "".format(bytes(edig)))
+
+                eserder = Serder(raw=bytes(eraw))  # escrowed event
+
+                #  get sigs and attach
+                sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
+                if not sigs:  #  otherwise its a list of sigs
+                    # no sigs so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Missing event sigs at."
+                             "dig = %s\n", bytes(edig))
+
+                    raise ValidationError("Missing escrowed evt sigs at "
+                                          "dig = {}.".format(bytes(edig)))
+
+                sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
+                self.processEvent(serder=eserder, sigers=sigers)
+
+                # If process does NOT validate event with sigs, becasue it is
+                # still out of order then process will attempt to re-escrow
+                # and then raise OutOfOrderError (subclass of ValidationError)
+                # so we can distinquish between ValidationErrors that are
+                # re-escrow vs non re-escrow. We want process to be idempotent
+                # with respect to processing events that result in escrow items.
+                # On re-escrow attempt by process, Ooe escrow is called by
+                # Kevery.self.escrowOOEvent Which calls
+                # self.db.addOoe(snKey(pre, sn), serder.digb)
+                # which in turn will not enter dig as dup if one already exists.
+                # So re-escrow attempt will not change the escrowed ooe db.
+                # Non re-escrow ValidationError means some other issue so unescrow.
+                # No error at all means processed successfully so also unescrow.
+
+            except LikelyDuplicitousError as ex:
+                # still can't determine if duplicitous
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than likely duplicitous so remove from escrow
+                self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded in valid event: "
+                         "event=\n%s\n", json.dumps(eserder.ked, indent=1))
 
-    def processEscrowUnverWitness(self):
+
+    def processEscrowUnverWitness(self, pres=None):
         """
         Process escrowed unverified event receipts from witness receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -3791,152 +4341,133 @@ class Kevery:
                         compare dig so same event
                         verify wigs via wigers
                         If successful then remove from escrow table
+
+        Parameters:
+            pres is set of qb64 prefixes whose escrows to process.
+                None means process escrows of all prefixes
         """
 
         ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, ecouple in self.db.getUweItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow db key
-                    ediger, wiger = deWitnessCouple(ecouple)  #  escrow diger wiger
-
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(ediger.qb64b)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                 " at dig = %s\n", ediger.qb64b)
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(ediger.qb64b))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow =  datetime.datetime.now(datetime.timezone.utc)
-                    dte = fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutUWE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                 " at dig = %s\n", ediger.qb64b)
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(ediger.qb64b))
-
-                    # lookup database dig of the receipted event in pwes escrow
-                    # using pre and sn lastEvt
-                    snkey = snKey(pre, sn)
-                    found = False
-                    for raw in self.db.getPwesIter(key=snkey):  # search entries
-                        dig = bytes(raw)  # database dig of receipted event
-                        raw = self.db.getEvt(dgKey(pre, dig))  # get the escrowed event using dig
-                        serder = Serder(raw=bytes(raw))  # receipted event
-                        #  compare digs
-                        if not ediger.compare(ser=serder.raw, dig=dig):
-                            continue  # not match keep looking
-
-                        # assign verfers from witness list
-                        if serder.ked['t'] in (Ilks.icp, Ilks.dip):  # inceptiom
-                            wits = serder.ked['b']  # get wits from event itself
-                            if len(oset(wits)) != len(wits):
-                                raise ValidationError("Invalid wits = {}, has duplicates for evt = {}."
-                                                 "".format(wits, serder.ked))
-
-                        elif serder.ked['t'] in (Ilks.rot, Ilks.drt):  # rotation
-                            # calculate wits from rotation and kever key state.
-                            wits = self.kevers[serder.pre].wits  # get wits from key state
-                            cuts = serder.ked['br']
-                            adds = serder.ked['ba']
-                            witset = oset(wits)
-                            cutset = oset(cuts)
-                            addset = oset(adds)
-                            if len(cutset) != len(cuts):
-                                raise ValidationError("Invalid cuts = {}, has duplicates for evt = "
-                                                 "{}.".format(cuts, serder.ked))
-
-                            if (witset & cutset) != cutset:  #  some cuts not in wits
-                                raise ValidationError("Invalid cuts = {}, not all members in wits"
-                                                 " for evt = {}.".format(cuts, serder.ked))
-
-                            if len(addset) != len(adds):
-                                raise ValidationError("Invalid adds = {}, has duplicates for evt = "
-                                                 "{}.".format(adds, serder.ked))
-
-                            if cutset & addset:  # non empty intersection
-                                raise ValidationError("Intersecting cuts = {} and  adds = {} for "
-                                                 "evt = {}.".format(cuts, adds, serder.ked))
-
-                            if witset & addset:  # non empty intersection
-                                raise ValidationError("Intersecting wits = {} and  adds = {} for "
-                                                 "evt = {}.".format(self.wits, adds, serder.ked))
-
-                            wits = list((witset - cutset) | addset)
-
-                        else:  # interaction so get wits from kever key state
-                            # would not be in this escrow if out of order event
-                            wits = self.kevers[serder.pre].wits  # get wits fromkey state
-
-                        if wiger.index >= len(wits):  # bad index
-                            # raise ValidationError which removes from escrow below
-                            logger.info("Kevery unescrow error: Bad witness receipt"
-                               " index=%i for pre=%s sn=%x\n", wiger.index, pre, sn)
-
-                            raise ValidationError("Bad escrowed witness receipt "
-                                              "index={} at pre={} sn={:x}."
-                                              "".format(wiger.index, pre, sn))
-
-                        wiger.verfer = Verfer(qb64=wits[wiger.index])
-                        if not wiger.verfer.verify(wiger.raw, serder.raw): # not verify
-                            # raise ValidationError which unescrows below
-                            logger.info("Kevery unescrow error: Bad witness receipt"
-                                     " wig. pre=%s sn=%x\n", pre, sn)
-
-                            raise ValidationError("Bad escrowed witness receipt wig"
-                                                  " at pre={} sn={:x}."
-                                                  "".format( pre, sn))
-
-                        # write receipt wig to database
-                        self.db.addWig(key=dgKey(pre, serder.dig), val=wiger.qb64b)
-                        found = True
-                        break  # done with search will unescrow below
-
-                    if not found:  # no partial witness escrow of event found
-                        # so keep in escrow by raising UnverifiedWitnessReceiptError
-                        logger.info("Kevery unescrow error: Missing witness "
-                                 "receipted evt at pre=%s sn=%x\n", (pre, sn))
-
-                        raise UnverifiedWitnessReceiptError("Missing witness "
-                            "receipted evt at pre={}  sn={:x}".format(pre, sn))
-
-                except UnverifiedWitnessReceiptError as ex:
-                    # still waiting on missing prior event to validate
-                    # only happens if we process above
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
-
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delUwe(snKey(pre, sn), ecouple)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
-
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delUwe(snKey(pre, sn), ecouple)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded for event=\n%s\n",
-                                json.dumps(serder.ked, indent=1))
-
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey #  setup next while iteration, with key after ekey
+        self.sweepEscrow(b'uwes', self.TimeoutUWE)  # remove stale first
 
+        for ekey, ecouple in self._escrowItemsIter(self.db.getUweItemsNextIter,
+                                               pres=pres):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow db key
+                ediger, wiger = deWitnessCouple(ecouple)  #  escrow diger wiger
+
+
+                # lookup database dig of the receipted event in pwes escrow
+                # using pre and sn lastEvt
+                snkey = snKey(pre, sn)
+                found = False
+                for raw in self.db.getPwesIter(key=snkey):  # search entries
+                    dig = bytes(raw)  # database dig of receipted event
+                    raw = self.db.getEvt(dgKey(pre, dig))  # get the escrowed event using dig
+                    serder = Serder(raw=bytes(raw))  # receipted event
+                    #  compare digs
+                    if not ediger.compare(ser=serder.raw, dig=dig):
+                        continue  # not match keep looking
+
+                    # assign verfers from witness list
+                    if serder.ked['t'] in (Ilks.icp, Ilks.dip):  # inceptiom
+                        wits = serder.ked['b']  # get wits from event itself
+                        if len(oset(wits)) != len(wits):
+                            raise ValidationError("Invalid wits = {}, has duplicates for evt = {}."
+                                             "".format(wits, serder.ked))
+
+                    elif serder.ked['t'] in (Ilks.rot, Ilks.drt):  # rotation
+                        # calculate wits from rotation and kever key state.
+                        wits = self.kevers[serder.pre].wits  # get wits from key state
+                        cuts = serder.ked['br']
+                        adds = serder.ked['ba']
+                        witset = oset(wits)
+                        cutset = oset(cuts)
+                        addset = oset(adds)
+                        if len(cutset) != len(cuts):
+                            raise ValidationError("Invalid cuts = {}, has duplicates for evt = "
+                                             "{}.".format(cuts, serder.ked))
+
+                        if (witset & cutset) != cutset:  #  some cuts not in wits
+                            raise ValidationError("Invalid cuts = {}, not all members in wits"
+                                             " for evt = {}.".format(cuts, serder.ked))
+
+                        if len(addset) != len(adds):
+                            raise ValidationError("Invalid adds = {}, has duplicates for evt = "
+                                             "{}.".format(adds, serder.ked))
+
+                        if cutset & addset:  # non empty intersection
+                            raise ValidationError("Intersecting cuts = {} and  adds = {} for "
+                                             "evt = {}.".format(cuts, adds, serder.ked))
+
+                        if witset & addset:  # non empty intersection
+                            raise ValidationError("Intersecting wits = {} and  adds = {} for "
+                                             "evt = {}.".format(self.wits, adds, serder.ked))
+
+                        wits = list((witset - cutset) | addset)
+
+                    else:  # interaction so get wits from kever key state
+                        # would not be in this escrow if out of order event
+                        wits = self.kevers[serder.pre].wits  # get wits fromkey state
+
+                    if wiger.index >= len(wits):  # bad index
+                        # raise ValidationError which removes from escrow below
+                        logger.info("Kevery unescrow error: Bad witness receipt"
+                           " index=%i for pre=%s sn=%x\n", wiger.index, pre, sn)
+
+                        raise ValidationError("Bad escrowed witness receipt "
+                                          "index={} at pre={} sn={:x}."
+                                          "".format(wiger.index, pre, sn))
+
+                    wiger.verfer = Verfer(qb64=wits[wiger.index])
+                    if not self.verifier.verify([(wiger.verfer, wiger.raw, serder.raw)])[0]: # not verify
+                        # raise ValidationError which unescrows below
+                        logger.info("Kevery unescrow error: Bad witness receipt"
+                                 " wig. pre=%s sn=%x\n", pre, sn)
+
+                        raise ValidationError("Bad escrowed witness receipt wig"
+                                              " at pre={} sn={:x}."
+                                              "".format( pre, sn))
+
+                    # write receipt wig to database
+                    self.db.addWig(key=dgKey(pre, serder.dig), val=wiger.qb64b)
+                    found = True
+                    break  # done with search will unescrow below
+
+                if not found:  # no partial witness escrow of event found
+                    # so keep in escrow by raising UnverifiedWitnessReceiptError
+                    logger.info("Kevery unescrow error: Missing witness "
+                             "receipted evt at pre=%s sn=%x\n", (pre, sn))
+
+                    raise UnverifiedWitnessReceiptError("Missing witness "
+                        "receipted evt at pre={}  sn={:x}".format(pre, sn))
+
+            except UnverifiedWitnessReceiptError as ex:
+                # still waiting on missing prior event to validate
+                # only happens if we process above
+                if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than out of order so remove from OO escrow
+                self.db.delUwe(snKey(pre, sn), ecouple)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
+
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delUwe(snKey(pre, sn), ecouple)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded for event=\n%s\n",
+                            json.dumps(serder.ked, indent=1))
 
-    def processEscrowUnverNonTrans(self):
+
+    def processEscrowUnverNonTrans(self, pres=None):
         """
         Process escrowed unverified event receipts from nontrans receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -3981,121 +4512,102 @@ class Kevery:
                         compare dig so same event
                         verify sigs via cigars
                         If successful then remove from escrow table
+
+        Parameters:
+            pres is set of qb64 prefixes whose escrows to process.
+                None means process escrows of all prefixes
         """
 
         ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, etriplet in self.db.getUreItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    ediger, sprefixer, cigar = deReceiptTriple(etriplet)
-
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(ediger.qb64b)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                 " at dig = %s\n", ediger.qb64b)
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(ediger.qb64b))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow =  datetime.datetime.now(datetime.timezone.utc)
-                    dte = fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutURE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                 " at dig = %s\n", ediger.qb64b)
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(ediger.qb64b))
-
-                    # get dig of the receipted event using pre and sn lastEvt
-                    raw = self.db.getKeLast(snKey(pre, sn))
-                    if raw is None:
-                        # no event so keep in escrow
-                        logger.info("Kevery unescrow error: Missing receipted "
-                                 "event at pre=%s sn=%x\n", (pre, sn))
-
-                        raise UnverifiedReceiptError("Missing receipted evt at pre={} "
-                                              " sn={:x}".format(pre, sn))
-
-                    dig = bytes(raw)
-                    # get receipted event using pre and edig
-                    raw = self.db.getEvt(dgKey(pre, dig))
-                    if raw is None:  # receipted event superseded so remove from escrow
-                        logger.info("Kevery unescrow error: Invalid receipted "
-                                 "event refereance at pre=%s sn=%x\n", pre, sn)
-
-                        raise ValidationError("Invalid receipted evt reference"
-                                          " at pre={} sn={:x}".format(pre, sn))
+        self.sweepEscrow(b'ures', self.TimeoutURE)  # remove stale first
 
-                    serder = Serder(raw=bytes(raw))  # receipted event
-
-                    #  compare digs
-                    if not ediger.compare(ser=serder.raw, diger=ediger):
-                        logger.info("Kevery unescrow error: Bad receipt dig."
+        for ekey, etriplet in self._escrowItemsIter(self.db.getUreItemsNextIter,
+                                               pres=pres):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                ediger, sprefixer, cigar = deReceiptTriple(etriplet)
+
+
+                # get dig of the receipted event using pre and sn lastEvt
+                raw = self.db.getKeLast(snKey(pre, sn))
+                if raw is None:
+                    # no event so keep in escrow
+                    logger.info("Kevery unescrow error: Missing receipted "
+                             "event at pre=%s sn=%x\n", (pre, sn))
+
+                    raise UnverifiedReceiptError("Missing receipted evt at pre={} "
+                                          " sn={:x}".format(pre, sn))
+
+                dig = bytes(raw)
+                # get receipted event using pre and edig
+                raw = self.db.getEvt(dgKey(pre, dig))
+                if raw is None:  # receipted event superseded so remove from escrow
+                    logger.info("Kevery unescrow error: Invalid receipted "
+                             "event refereance at pre=%s sn=%x\n", pre, sn)
+
+                    raise ValidationError("Invalid receipted evt reference"
+                                      " at pre={} sn={:x}".format(pre, sn))
+
+                serder = Serder(raw=bytes(raw))  # receipted event
+
+                #  compare digs
+                if not ediger.compare(ser=serder.raw, diger=ediger):
+                    logger.info("Kevery unescrow error: Bad receipt dig."
+                         "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
+
+                    raise ValidationError("Bad escrowed receipt dig at "
+                                      "pre={} sn={:x} receipter={}."
+                                      "".format( pre, sn, sprefixer.qb64))
+
+                #  verify sig verfer key is prefixer from triple
+                cigar.verfer = Verfer(qb64b=sprefixer.qb64b)
+                if not self.verifier.verify([(cigar.verfer, cigar.raw, serder.raw)])[0]:
+                    # no sigs so raise ValidationError which unescrows below
+                    logger.info("Kevery unescrow error: Bad receipt sig."
                              "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
 
-                        raise ValidationError("Bad escrowed receipt dig at "
+                    raise ValidationError("Bad escrowed receipt sig at "
                                           "pre={} sn={:x} receipter={}."
                                           "".format( pre, sn, sprefixer.qb64))
 
-                    #  verify sig verfer key is prefixer from triple
-                    cigar.verfer = Verfer(qb64b=sprefixer.qb64b)
-                    if not cigar.verfer.verify(cigar.raw, serder.raw):
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Bad receipt sig."
-                                 "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
+                kever = self.kevers[serder.pre]  # get key state to check if witness
+                rpre = cigar.verfer.qb64  # prefix of receiptor
+                if rpre in kever.wits:  # its a witness receipt
+                    index = kever.wits.index(rpre)
+                    # create witness indexed signature and write to db
+                    wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
+                    self.db.addWig(key=dgKey(pre, serder.dig), val=wiger.qb64b)
+                else:  # write receipt couple to database
+                    couple = cigar.verfer.qb64b + cigar.qb64b
+                    self.db.addRct(key=dgKey(pre, serder.dig), val=couple)
 
-                        raise ValidationError("Bad escrowed receipt sig at "
-                                              "pre={} sn={:x} receipter={}."
-                                              "".format( pre, sn, sprefixer.qb64))
 
-                    kever = self.kevers[serder.pre]  # get key state to check if witness
-                    rpre = cigar.verfer.qb64  # prefix of receiptor
-                    if rpre in kever.wits:  # its a witness receipt
-                        index = kever.wits.index(rpre)
-                        # create witness indexed signature and write to db
-                        wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
-                        self.db.addWig(key=dgKey(pre, serder.dig), val=wiger.qb64b)
-                    else:  # write receipt couple to database
-                        couple = cigar.verfer.qb64b + cigar.qb64b
-                        self.db.addRct(key=dgKey(pre, serder.dig), val=couple)
-
-
-                except UnverifiedReceiptError as ex:
-                    # still waiting on missing prior event to validate
-                    # only happens if we process above
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
-
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
-
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded for event=\n%s\n",
-                                json.dumps(serder.ked, indent=1))
-
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey #  setup next while iteration, with key after ekey
+            except UnverifiedReceiptError as ex:
+                # still waiting on missing prior event to validate
+                # only happens if we process above
+                if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than out of order so remove from OO escrow
+                self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded for event=\n%s\n",
+                            json.dumps(serder.ked, indent=1))
 
-    def processEscrowUnverTrans(self):
+
+    def processEscrowUnverTrans(self, pres=None):
         """
         Process event receipts from transferable identifiers (validators)
         escrowed by Kever that are unverified.
@@ -4138,143 +4650,125 @@ class Kevery:
                         compare dig so same event
                         verify sigs via sigers
                         If successful then remove from escrow table
+
+        Parameters:
+            pres is set of qb64 prefixes whose escrows to process.
+                None means process escrows of all prefixes
         """
 
         ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, equinlet in self.db.getVreItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    ediger, sprefixer, sseqner, sdiger, siger = deTransReceiptQuintuple(equinlet)
-
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(ediger.qb64b)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                 " at dig = %s\n", ediger.qb64b)
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(ediger.qb64b))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow =  datetime.datetime.now(datetime.timezone.utc)
-                    dte = fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutVRE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                 " at dig = %s\n", ediger.qb64b)
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(ediger.qb64b))
-
-                    # get dig of the receipted event using pre and sn lastEvt
-                    raw = self.db.getKeLast(snKey(pre, sn))
-                    if raw is None:
-                        # no event so keep in escrow
-                        logger.info("Kevery unescrow error: Missing receipted "
-                                 "event at pre=%s sn=%x\n", (pre, sn))
-
-                        raise UnverifiedTransferableReceiptError("Missing receipted evt at pre={} "
-                                              " sn={:x}".format(pre, sn))
-
-                    dig = bytes(raw)
-                    # get receipted event using pre and edig
-                    raw = self.db.getEvt(dgKey(pre, dig))
-                    if raw is None:  #  receipted event superseded so remove from escrow
-                        logger.info("Kevery unescrow error: Invalid receipted "
-                                 "event referenace at pre=%s sn=%x\n", pre, sn)
-
-                        raise ValidationError("Invalid receipted evt reference "
-                                              "at pre={} sn={:x}".format(pre, sn))
+        self.sweepEscrow(b'vres', self.TimeoutVRE)  # remove stale first
 
-                    serder = Serder(raw=bytes(raw))  # receipted event
+        for ekey, equinlet in self._escrowItemsIter(self.db.getVreItemsNextIter,
+                                               pres=pres):
+            try:
+                pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                ediger, sprefixer, sseqner, sdiger, siger = deTransReceiptQuintuple(equinlet)
 
-                    #  compare digs
-                    if not ediger.compare(ser=serder.raw, diger=ediger):
-                        logger.info("Kevery unescrow error: Bad receipt dig."
-                             "pre=%s sn=%x receipter=%s\n", (pre, sn, sprefixer.qb64))
 
-                        raise ValidationError("Bad escrowed receipt dig at "
+                # get dig of the receipted event using pre and sn lastEvt
+                raw = self.db.getKeLast(snKey(pre, sn))
+                if raw is None:
+                    # no event so keep in escrow
+                    logger.info("Kevery unescrow error: Missing receipted "
+                             "event at pre=%s sn=%x\n", (pre, sn))
+
+                    raise UnverifiedTransferableReceiptError("Missing receipted evt at pre={} "
+                                          " sn={:x}".format(pre, sn))
+
+                dig = bytes(raw)
+                # get receipted event using pre and edig
+                raw = self.db.getEvt(dgKey(pre, dig))
+                if raw is None:  #  receipted event superseded so remove from escrow
+                    logger.info("Kevery unescrow error: Invalid receipted "
+                             "event referenace at pre=%s sn=%x\n", pre, sn)
+
+                    raise ValidationError("Invalid receipted evt reference "
+                                          "at pre={} sn={:x}".format(pre, sn))
+
+                serder = Serder(raw=bytes(raw))  # receipted event
+
+                #  compare digs
+                if not ediger.compare(ser=serder.raw, diger=ediger):
+                    logger.info("Kevery unescrow error: Bad receipt dig."
+                         "pre=%s sn=%x receipter=%s\n", (pre, sn, sprefixer.qb64))
+
+                    raise ValidationError("Bad escrowed receipt dig at "
+                                      "pre={} sn={:x} receipter={}."
+                                      "".format( pre, sn, sprefixer.qb64))
+
+                # get receipter's last est event
+                # retrieve dig of last event at sn of receipter.
+                sdig = self.db.getKeLast(key=snKey(pre=sprefixer.qb64b,
+                                                      sn=sseqner.sn))
+                if sdig is None:
+                    # no event so keep in escrow
+                    logger.info("Kevery unescrow error: Missing receipted "
+                             "event at pre=%s sn=%x\n", pre, sn)
+
+                    raise UnverifiedTransferableReceiptError("Missing receipted evt at pre={} "
+                                          " sn={:x}".format(pre, sn))
+
+                # retrieve last event itself of receipter
+                sraw = self.db.getEvt(key=dgKey(pre=sprefixer.qb64b, dig=bytes(sdig)))
+                # assumes db ensures that sraw must not be none because sdig was in KE
+                sserder = Serder(raw=bytes(sraw))
+                if not sserder.compare(diger=sdiger):  # seal dig not match event
+                    # this unescrows
+                    raise ValidationError("Bad chit seal at sn = {} for rct = {}."
+                                          "".format(sseqner.sn, sserder.ked))
+
+                #verify sigs and if so write quadruple to database
+                verfers = sserder.verfers
+                if not verfers:
+                    raise ValidationError("Invalid seal est. event dig = {} for "
+                                          "receipt from pre ={} no keys."
+                                          "".format(sdiger.qb64, sprefixer.qb64))
+
+                # Set up quadruple
+                sealet = sprefixer.qb64b + sseqner.qb64b + sdiger.qb64b
+
+                if siger.index >= len(verfers):
+                    raise ValidationError("Index = {} to large for keys."
+                                              "".format(siger.index))
+
+                siger.verfer = verfers[siger.index]  # assign verfer
+                if not self.verifier.verify([(siger.verfer, siger.raw, serder.raw)])[0]:  # verify sig
+                    logger.info("Kevery unescrow error: Bad trans receipt sig."
+                             "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
+
+                    raise ValidationError("Bad escrowed trans receipt sig at "
                                           "pre={} sn={:x} receipter={}."
                                           "".format( pre, sn, sprefixer.qb64))
 
-                    # get receipter's last est event
-                    # retrieve dig of last event at sn of receipter.
-                    sdig = self.db.getKeLast(key=snKey(pre=sprefixer.qb64b,
-                                                          sn=sseqner.sn))
-                    if sdig is None:
-                        # no event so keep in escrow
-                        logger.info("Kevery unescrow error: Missing receipted "
-                                 "event at pre=%s sn=%x\n", pre, sn)
-
-                        raise UnverifiedTransferableReceiptError("Missing receipted evt at pre={} "
-                                              " sn={:x}".format(pre, sn))
-
-                    # retrieve last event itself of receipter
-                    sraw = self.db.getEvt(key=dgKey(pre=sprefixer.qb64b, dig=bytes(sdig)))
-                    # assumes db ensures that sraw must not be none because sdig was in KE
-                    sserder = Serder(raw=bytes(sraw))
-                    if not sserder.compare(diger=sdiger):  # seal dig not match event
-                        # this unescrows
-                        raise ValidationError("Bad chit seal at sn = {} for rct = {}."
-                                              "".format(sseqner.sn, sserder.ked))
-
-                    #verify sigs and if so write quadruple to database
-                    verfers = sserder.verfers
-                    if not verfers:
-                        raise ValidationError("Invalid seal est. event dig = {} for "
-                                              "receipt from pre ={} no keys."
-                                              "".format(sdiger.qb64, sprefixer.qb64))
+                # good sig so write receipt quadruple to database
+                quadruple = sealet + siger.qb64b
+                self.db.addVrc(key=dgKey(pre, serder.dig), val=quadruple)
 
-                    # Set up quadruple
-                    sealet = sprefixer.qb64b + sseqner.qb64b + sdiger.qb64b
 
-                    if siger.index >= len(verfers):
-                        raise ValidationError("Index = {} to large for keys."
-                                                  "".format(siger.index))
+            except UnverifiedTransferableReceiptError as ex:
+                # still waiting on missing prior event to validate
+                # only happens if we process above
+                self.depend(pre, sprefixer.qb64)  # wake on receipter event
+                if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                    logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
-                    siger.verfer = verfers[siger.index]  # assign verfer
-                    if not siger.verfer.verify(siger.raw, serder.raw):  # verify sig
-                        logger.info("Kevery unescrow error: Bad trans receipt sig."
-                                 "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
+            except Exception as ex:  # log diagnostics errors etc
+                # error other than out of order so remove from OO escrow
+                self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
+                if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                    logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                else:
+                    logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
-                        raise ValidationError("Bad escrowed trans receipt sig at "
-                                              "pre={} sn={:x} receipter={}."
-                                              "".format( pre, sn, sprefixer.qb64))
-
-                    # good sig so write receipt quadruple to database
-                    quadruple = sealet + siger.qb64b
-                    self.db.addVrc(key=dgKey(pre, serder.dig), val=quadruple)
-
-
-                except UnverifiedTransferableReceiptError as ex:
-                    # still waiting on missing prior event to validate
-                    # only happens if we process above
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
-
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
-
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded for event = %s\n", serder.ked)
-
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey #  setup next while iteration, with key after ekey
+            else:  # unescrow succeeded, remove from escrow
+                # We don't remove all escrows at pre,sn because some might be
+                # duplicitous so we process remaining escrows in spite of found
+                # valid event escrow.
+                self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
+                logger.info("Kevery unescrow succeeded for event = %s\n", serder.ked)
 
 
 
@@ -4291,6 +4785,196 @@ class Kevery:
         pass
 
 
+# Attachment group layouts keyed by count code. Each value is a tuple with
+# the primitive class of each element of one counted item. The Counter element
+# is a nested counted group of ControllerIdxSigs. Every Matter subclass sizes
+# like Matter and every Indexer subclass sizes like Indexer.
+AttachmentGroups = {
+    CtrDex.ControllerIdxSigs: (Indexer, ),
+    CtrDex.WitnessIdxSigs: (Indexer, ),
+    CtrDex.NonTransReceiptCouples: (Matter, Matter),
+    CtrDex.TransReceiptQuadruples: (Matter, Matter, Matter, Indexer),
+    CtrDex.TransIndexedSigGroups: (Matter, Matter, Matter, Counter),
+    CtrDex.FirstSeenReplayCouples: (Matter, Matter),
+    CtrDex.SealSourceCouples: (Matter, Matter),
+}
+
+
+def sizeCode(klas, ims, cold=Colds.txt):
+    """
+    Returns tuple (code, value, size) for the primitive of class klas at the
+    front of ims without creating an instance of klas, where code is the hard
+    code str, value is the int soft part (size, index or count) or None, and
+    size is the full size of the primitive in chars when cold is txt or in
+    bytes when cold is bny. Uses the flat dispatch tables klas.Hards or
+    klas.Bards and klas.Codes. Raises ShortageError if ims is too short to
+    hold the code.
+
+    Parameters:
+        klas (type): Matter, Indexer or Counter or subclass
+        ims (bytes | bytearray | memoryview): stream starting with primitive
+        cold (str): Colds.txt or Colds.bny domain of ims
+    """
+    if not ims:
+        raise ShortageError("Empty material, Need more bytes.")
+
+    counter = issubclass(klas, Counter)
+    if cold == Colds.txt:
+        if counter:  # two char selector is '-' plus dispatched char
+            if len(ims) < 2:
+                raise ShortageError("Need more characters.")
+            cs = klas.Hards[ims[1]] if ims[0] == 0x2d else 0
+        else:
+            cs = klas.Hards[ims[0]]
+        if not cs:
+            raise UnexpectedCodeError("Unsupported code start for {}."
+                                      "".format(klas.__name__))
+        if len(ims) < cs:
+            raise ShortageError("Need more characters.")
+        code = bytes(ims[:cs]).decode("utf-8")
+    elif cold == Colds.bny:
+        if counter:  # two sextet selector is first 12 bits
+            if len(ims) < 2:
+                raise ShortageError("Need more bytes.")
+            cs = klas.Bards[(ims[0] << 4) | (ims[1] >> 4)]
+        else:
+            cs = klas.Bards[ims[0]]
+        if not cs:
+            raise UnexpectedCodeError("Unsupported code start for {}."
+                                      "".format(klas.__name__))
+        if len(ims) < (cs * 3 + 3) // 4:
+            raise ShortageError("Need more bytes.")
+        code = b2ToB64(ims, cs)
+    else:
+        raise ColdStartError("Invalid stream state cold={}.".format(cold))
+
+    if code not in klas.Codes:
+        raise UnexpectedCodeError("Unsupported code ={}.".format(code))
+    hs, ss, fs = klas.Codes[code]
+    bs = hs + ss
+    value = None
+    if ss:  # extract soft part
+        if cold == Colds.txt:
+            if len(ims) < bs:
+                raise ShortageError("Need more characters.")
+            value = b64ToInt(ims[hs:bs])
+        else:
+            if len(ims) < (bs * 3 + 3) // 4:
+                raise ShortageError("Need more bytes.")
+            value = b64ToInt(b2ToB64(ims, bs)[hs:])
+        if not fs:  # variable size so soft part is size in quadlets
+            fs = (value * 4) + bs
+
+    return (code, value, fs if cold == Colds.txt else fs * 3 // 4)
+
+
+def sizeGroup(ims, cold=Colds.txt):
+    """
+    Returns size of the counted attachment group at the front of ims in chars
+    when cold is txt or in bytes when cold is bny including its counter and
+    any nested groups. Walks the group using only code tables so no primitive
+    instances are created. Raises ShortageError when ims does not yet hold
+    the full group.
+
+    Parameters:
+        ims (bytes | bytearray | memoryview): stream starting with counter
+        cold (str): Colds.txt or Colds.bny domain of ims
+    """
+    ims = memoryview(ims)
+    code, count, size = sizeCode(Counter, ims, cold=cold)
+    if code in (CtrDex.AttachedMaterialQuadlets,
+                CtrDex.BigAttachedMaterialQuadlets):  # pipelined so sized
+        size += count * 4 if cold == Colds.txt else count * 3
+    elif code in AttachmentGroups:
+        for i in range(count):
+            for klas in AttachmentGroups[code]:
+                if klas is Counter:  # nested indexed sig group
+                    icode, _, _ = sizeCode(Counter, ims[size:], cold=cold)
+                    if icode != CtrDex.ControllerIdxSigs:
+                        raise UnexpectedCountCodeError("Wrong count code={}."
+                                   "Expected code={}.".format(icode,
+                                             CtrDex.ControllerIdxSigs))
+                    size += sizeGroup(ims[size:], cold=cold)
+                else:
+                    size += sizeCode(klas, ims[size:], cold=cold)[2]
+    else:
+        raise UnexpectedCountCodeError("Unsupported count code={}."
+                                       "".format(code))
+
+    if len(ims) < size:
+        raise ShortageError("Need {} more.".format(size - len(ims)))
+    return size
+
+
+def convertStream(ims, cold=Colds.bny, strip=True):
+    """
+    Returns bytearray of message stream ims with every counted attachment
+    group converted into CESR domain cold, either Colds.bny (qb2) or
+    Colds.txt (qb64). Messages are copied as is. Each run of consecutive
+    groups in the other domain is converted en masse with one Base64 encode
+    or decode since CESR groups are 24 bit aligned. Group boundaries are found
+    with sizeGroup so no primitive instances are created.
+
+    Conversion stops at the first message or group not yet fully in ims so
+    a live stream may be converted incrementally. When strip is True the
+    converted part is stripped from the front of ims, which must then be a
+    bytearray, leaving any partial message or group for the next call.
+
+    Parameters:
+        ims (bytes | bytearray | memoryview): stream of messages with attachments
+        cold (str): Colds.bny or Colds.txt target domain of attachments
+        strip (bool): True means strip converted part from ims
+    """
+    if cold not in (Colds.txt, Colds.bny):
+        raise ColdStartError("Invalid conversion domain cold={}.".format(cold))
+
+    out = bytearray()
+    view = memoryview(ims)
+    done = 0  # offset of end of converted part of ims
+    start = 0  # offset of start of run of groups in same domain
+    run = None  # domain of current run of groups
+    while done < len(view):
+        ocold = Parser._sniff(view[done:])
+        if run is not None and ocold != run:  # end of run so flush it
+            _flushRun(out, view[start:done], run, cold)
+            run = None
+        if ocold == Colds.msg:
+            try:
+                _, _, size = Serder._sniff(view[done:])
+            except ShortageError:
+                break
+            if len(view) - done < size:
+                break
+            out.extend(view[done:done + size])
+        else:
+            try:
+                size = sizeGroup(view[done:], cold=ocold)
+            except ShortageError:
+                break
+            if run is None:
+                start, run = done, ocold
+        done += size
+
+    if run is not None:
+        _flushRun(out, view[start:done], run, cold)
+    view.release()
+    if strip:
+        del ims[:done]
+    return out
+
+
+def _flushRun(out, run, rcold, cold):
+    """
+    Appends run of attachment groups in domain rcold to out in domain cold.
+    """
+    if rcold == cold:
+        out.extend(run)
+    elif cold == Colds.bny:
+        out.extend(decodeB64(run))
+    else:
+        out.extend(encodeB64(run))
+
+
 class Parser:
     """
     Parser is stream parser that processes an incoming message stream.
@@ -4300,7 +4984,7 @@ class Parser:
     Streaming Representation)  CESR supports both binary and text formats where
     text is Base64 URL/Filesafe. The attachements in a CESR foot may be converted
     and round tripped en-masse between binary and text (Base64 URL/File).
-    CESR encoding ensures alignment on 24 bit boundaries.
+    CESR encoding ensures alignment on 24 bit boundaries. See convertStream.
 
     Only supports current version VERSION
 
@@ -4316,8 +5000,14 @@ class Parser:
                          False means only process msgs for not own events if .opre
         kvy (Kevery): route KEL message types to this instance
         tvy (Tevery): route TEL message types to this instance
+        frames (list): pending pipelined frames, each a (serder, ims, cold)
+                triple, waiting to be processed by .processFrames
+
+    Class Attributes:
+        Batch (int): max number of pending pipelined frames before processing
 
     """
+    Batch = 256  # max pending pipelined frames
 
     def __init__(self, ims=None, framed=True, pipeline=False, cloned=False,
                  kvy=None, tvy=None):
@@ -4341,6 +5031,7 @@ class Parser:
         self.cloned = True if cloned else False  # process as cloned
         self.kvy = kvy
         self.tvy = tvy
+        self.frames = []
 
     @staticmethod
     def _sniff(ims):
@@ -4426,6 +5117,41 @@ class Parser:
                 yield
 
 
+    @staticmethod
+    def _msgExtractor(ims):
+        """
+        Returns generator to extract, strip and return Serder instance of
+        message at front of input message stream, ims.
+        Yields if not enough bytes in ims to sniff version string or to fill
+        out whole message.
+
+        Resumable framing. The version string is sniffed only once, after which
+        the expected size of the message is remembered so that each wakeup
+        only compares len(ims) to size. The message is deserialized once when
+        fully received instead of reattempted on every wakeup.
+        Applies equally to KEL and TEL messages since both are framed by the
+        same version string.
+        """
+        while True:  # sniff once for kind, version, and size
+            try:
+                kind, version, size = Serder._sniff(ims)
+            except ShortageError as ex:  # need more bytes for version string
+                yield
+            else:
+                break
+
+        if version != Version:
+            raise VersionError("Unsupported version = {}.{}, expected {}."
+                               "".format(version.major, version.minor, Version))
+
+        while len(ims) < size:  # wait until rx full message
+            yield
+
+        serder = Serder(raw=ims)  # deserialize exactly once
+        del ims[:serder.size]  # strip off event from front of ims
+        return serder
+
+
     def process(self, ims=None, framed=None, pipeline=None, cloned=None,
                 kvy=None, tvy=None):
         """
@@ -4587,6 +5313,9 @@ class Parser:
                     logger.error("Parser msg non-extraction error: %s\n", ex.args[0])
             yield
 
+        if self.frames:  # apply any pending pipelined frames
+            self.processFrames(cloned=cloned, kvy=kvy, tvy=tvy)
+
         return True
 
 
@@ -4665,6 +5394,9 @@ class Parser:
             finally:
                 done = True
 
+        if self.frames:  # apply any pending pipelined frames
+            self.processFrames(cloned=cloned, kvy=kvy, tvy=tvy)
+
         return done
 
 
@@ -4795,6 +5527,8 @@ class Parser:
             ims = self.ims
 
         while not ims:
+            if self.frames:  # apply pending pipelined frames before waiting
+                self.processFrames(cloned=cloned, kvy=kvy, tvy=tvy)
             yield
 
         cold = self._sniff(ims)  # check for spurious counters at front of stream
@@ -4803,26 +5537,8 @@ class Parser:
             raise ColdStartError("Expecting message counter tritet={}"
                                  "".format(cold))
         # Otherwise its a message cold start
-        while True:# extract and deserialize message from ims
-            try:
-                serder = Serder(raw=ims)
-            except ShortageError as ex:  # need more bytes
-                yield
-            else:  # extracted successfully
-                del ims[:serder.size]  # strip off event from front of ims
-                break
+        serder = yield from self._msgExtractor(ims=ims)  # extract message
 
-        sigers = []  # list of Siger instances of attached indexed controller signatures
-        wigers = []  # list of Siger instance of attached indexed witness signatures
-        cigars = []  # List of cigars to hold nontrans rct couplets
-        # List of tuples from extracted transferable receipt (vrc) quadruples
-        trqs = []  # each converted quadruple is (prefixer, seqner, diger, siger)
-        # List of tuples from extracted transferable indexed sig groups
-        tsgs = []  # each converted group is tuple of (i,s,d) triple plus list of sigs
-        # List of tuples from extracted first seen replay couples
-        frcs = []  # each converted couple is (seqner, dater)
-        # List of tuples from extracted source seal couples (delegator or issuer)
-        sscs = []  # each converted couple is (seqner, diger) for delegating/issuing event
         pipelined = False  # all attachments in one big pipeline counted group
         # extract and deserialize attachments
         try:  # catch errors here to flush only counted part of stream
@@ -4843,171 +5559,25 @@ class Parser:
                     del ims[:pags]  # strip off from ims
                     ims = pims  # now just process substream as one counted frame
 
-                    if pipeline:
-                        pass  #  pass extracted ims to pipeline processor
-                        return
+                    if pipeline:  # defer frame to pipeline stages
+                        self.frames.append((serder, ims, cold))
+                        if len(self.frames) >= self.Batch:
+                            self.processFrames(cloned=cloned, kvy=kvy, tvy=tvy)
+                        return True  # done state
 
                     ctr = yield from self._extractor(ims=ims,
                                                      klas=Counter,
                                                      cold=cold,
                                                      abort=pipelined)
 
-                # iteratively process attachment counters (all non pipelined)
-                while True:  # do while already extracted first counter is ctr
-                    if ctr.code == CtrDex.ControllerIdxSigs:
-                        for i in range(ctr.count): # extract each attached signature
-                            siger = yield from self._extractor(ims=ims,
-                                                               klas=Siger,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            sigers.append(siger)
-
-                    elif ctr.code == CtrDex.WitnessIdxSigs:
-                        for i in range(ctr.count): # extract each attached signature
-                            wiger = yield from self._extractor(ims=ims,
-                                                               klas=Siger,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            wigers.append(wiger)
-
-                    elif ctr.code == CtrDex.NonTransReceiptCouples:
-                        # extract attached rct couplets into list of sigvers
-                        # verfer property of cigar is the identifier prefix
-                        # cigar itself has the attached signature
-
-                        for i in range(ctr.count): # extract each attached couple
-                            verfer = yield from self._extractor(ims=ims,
-                                                                klas=Verfer,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            cigar = yield from self._extractor(ims=ims,
-                                                               klas=Cigar,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            cigar.verfer = verfer
-                            cigars.append(cigar)
-
-                    elif ctr.code == CtrDex.TransReceiptQuadruples:
-                        # extract attaced trans receipt vrc quadruple
-                        # spre+ssnu+sdig+sig
-                        # spre is pre of signer of vrc
-                        # ssnu is sn of signer's est evt when signed
-                        # sdig is dig of signer's est event when signed
-                        # sig is indexed signature of signer on this event msg
-                        for i in range(ctr.count): # extract each attached quadruple
-                            prefixer = yield from  self._extractor(ims,
-                                                                   klas=Prefixer,
-                                                                   cold=cold,
-                                                                   abort=pipelined)
-                            seqner = yield from  self._extractor(ims,
-                                                                 klas=Seqner,
-                                                                 cold=cold,
-                                                                 abort=pipelined)
-                            diger = yield from  self._extractor(ims,
-                                                                klas=Diger,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            siger = yield from self._extractor(ims=ims,
-                                                               klas=Siger,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            trqs.append((prefixer, seqner, diger, siger))
-
-                    elif ctr.code == CtrDex.TransIndexedSigGroups:
-                        # extract attaced trans indexed sig groups each made of
-                        # triple pre+snu+dig plus indexed sig group
-                        # pre is pre of signer (endorser) of msg
-                        # snu is sn of signer's est evt when signed
-                        # dig is dig of signer's est event when signed
-                        # followed by counter for ControllerIdxSigs with attached
-                        # indexed sigs from trans signer (endorser).
-                        for i in range(ctr.count): # extract each attached groups
-                            prefixer = yield from  self._extractor(ims,
-                                                                   klas=Prefixer,
-                                                                   cold=cold,
-                                                                   abort=pipelined)
-                            seqner = yield from  self._extractor(ims,
-                                                                 klas=Seqner,
-                                                                 cold=cold,
-                                                                 abort=pipelined)
-                            diger = yield from  self._extractor(ims,
-                                                                klas=Diger,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            ictr = ctr = yield from self._extractor(ims=ims,
-                                                                    klas=Counter,
-                                                                    cold=cold,
-                                                                    abort=pipelined)
-                            if ctr.code != CtrDex.ControllerIdxSigs:
-                                raise UnexpectedCountCodeError("Wrong count code={}."
-                                           "Expected code={}.".format(ictr.code,
-                                                     CtrDex.ControllerIdxSigs))
-                            isigers = []
-                            for i in range(ictr.count): # extract each attached signature
-                                isiger = yield from self._extractor(ims=ims,
-                                                                    klas=Siger,
-                                                                    cold=cold,
-                                                                    abort=pipelined)
-                                isigers.append(isiger)
-                            tsgs.append((prefixer, seqner, diger, isigers))
-
-                    elif ctr.code == CtrDex.FirstSeenReplayCouples:
-                        # extract attached first seen replay couples
-                        # snu+dtm
-                        # snu is fn (first seen ordinal) of event
-                        # dtm is dt of event
-                        for i in range(ctr.count): # extract each attached quadruple
-                            firner = yield from  self._extractor(ims,
-                                                                 klas=Seqner,
-                                                                 cold=cold,
-                                                                 abort=pipelined)
-                            dater = yield from  self._extractor(ims,
-                                                                klas=Dater,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            frcs.append((firner, dater))
-
-                    elif ctr.code == CtrDex.SealSourceCouples:
-                        # extract attached first seen replay couples
-                        # snu+dig
-                        # snu is sequence number  of event
-                        # dig is digest of event
-                        for i in range(ctr.count): # extract each attached quadruple
-                            seqner = yield from  self._extractor(ims,
-                                                                klas=Seqner,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            diger = yield from  self._extractor(ims,
-                                                                klas=Diger,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            sscs.append((seqner, diger))
-
-                    else:
-                        raise UnexpectedCountCodeError("Unsupported count code={}."
-                                                  "".format(ctr.code))
-
-                    if pipelined:  # process to end of stream (group)
-                        if not ims:  # end of pipelined group frame
-                            break
-                    elif framed:
-                        # because not all in one pipeline group, each attachment
-                        # group may switch stream state txt or bny
-                        if not ims:  # end of frame
-                            break
-                        cold = self._sniff(ims)
-                        if cold == Colds.msg:  # new message so attachments done
-                            break  # finished attachments since new message
-                    else:  # process until next message
-                        # because not all in one pipeline group, each attachment
-                        # group may switch stream state txt or bny
-                        while not ims:
-                            yield  # no frame so must wait for next message
-                        cold = self._sniff(ims)  # ctr or msg
-                        if cold == Colds.msg:  # new message
-                            break  # finished attachments since new message
-
-                    ctr = yield from self._extractor(ims=ims, klas=Counter, cold=cold)
+                atc = yield from self._attachmentsExtractor(ims=ims,
+                                                            ctr=ctr,
+                                                            cold=cold,
+                                                            framed=framed,
+                                                            pipelined=pipelined)
+            else:  # no attachments
+                atc = Attachage(sigers=[], wigers=[], cigars=[], trqs=[],
+                                tsgs=[], frcs=[], sscs=[])
 
         except ExtractionError as ex:
             if pipelined:  # extracted pipelined group is preflushed
@@ -5015,6 +5585,217 @@ class Parser:
                                 "attachment group of size={}.".format(pags))
             raise  # no pipeline group so can't preflush, must flush stream
 
+        if self.frames:  # apply pending pipelined frames first to keep order
+            self.processFrames(cloned=cloned, kvy=kvy, tvy=tvy)
+
+        self._dispatch(serder=serder, atc=atc, cloned=cloned, kvy=kvy, tvy=tvy)
+
+        return True  # done state
+
+
+    def _attachmentsExtractor(self, ims, ctr, cold=Colds.txt, framed=True,
+                              pipelined=False):
+        """
+        Returns generator that extracts all the attachment groups of one msg
+        from incoming message stream, ims, starting with the already extracted
+        first group counter, ctr. Generator returns Attachage instance of the
+        extracted attachments when finished.
+
+        Parameters:
+            ims is bytearray of serialized incoming message stream
+            ctr is Counter instance of first attachment group
+            cold is stream state txt or bny of attachments
+            framed is Boolean, True means ims contains only one frame of msg plus
+                counted attachments instead of stream with multiple messages
+            pipelined is Boolean, True means ims is the full substream of one
+                pipelined attachment group so abort on shortage
+        """
+        sigers = []  # list of Siger instances of attached indexed controller signatures
+        wigers = []  # list of Siger instance of attached indexed witness signatures
+        cigars = []  # List of cigars to hold nontrans rct couplets
+        # List of tuples from extracted transferable receipt (vrc) quadruples
+        trqs = []  # each converted quadruple is (prefixer, seqner, diger, siger)
+        # List of tuples from extracted transferable indexed sig groups
+        tsgs = []  # each converted group is tuple of (i,s,d) triple plus list of sigs
+        # List of tuples from extracted first seen replay couples
+        frcs = []  # each converted couple is (seqner, dater)
+        # List of tuples from extracted source seal couples (delegator or issuer)
+        sscs = []  # each converted couple is (seqner, diger) for delegating/issuing event
+
+        # iteratively process attachment counters (all non pipelined)
+        while True:  # do while already extracted first counter is ctr
+            if ctr.code == CtrDex.ControllerIdxSigs:
+                for i in range(ctr.count): # extract each attached signature
+                    siger = yield from self._extractor(ims=ims,
+                                                       klas=Siger,
+                                                       cold=cold,
+                                                       abort=pipelined)
+                    sigers.append(siger)
+
+            elif ctr.code == CtrDex.WitnessIdxSigs:
+                for i in range(ctr.count): # extract each attached signature
+                    wiger = yield from self._extractor(ims=ims,
+                                                       klas=Siger,
+                                                       cold=cold,
+                                                       abort=pipelined)
+                    wigers.append(wiger)
+
+            elif ctr.code == CtrDex.NonTransReceiptCouples:
+                # extract attached rct couplets into list of sigvers
+                # verfer property of cigar is the identifier prefix
+                # cigar itself has the attached signature
+
+                for i in range(ctr.count): # extract each attached couple
+                    verfer = yield from self._extractor(ims=ims,
+                                                        klas=Verfer,
+                                                        cold=cold,
+                                                        abort=pipelined)
+                    cigar = yield from self._extractor(ims=ims,
+                                                       klas=Cigar,
+                                                       cold=cold,
+                                                       abort=pipelined)
+                    cigar.verfer = verfer
+                    cigars.append(cigar)
+
+            elif ctr.code == CtrDex.TransReceiptQuadruples:
+                # extract attaced trans receipt vrc quadruple
+                # spre+ssnu+sdig+sig
+                # spre is pre of signer of vrc
+                # ssnu is sn of signer's est evt when signed
+                # sdig is dig of signer's est event when signed
+                # sig is indexed signature of signer on this event msg
+                for i in range(ctr.count): # extract each attached quadruple
+                    prefixer = yield from  self._extractor(ims,
+                                                           klas=Prefixer,
+                                                           cold=cold,
+                                                           abort=pipelined)
+                    seqner = yield from  self._extractor(ims,
+                                                         klas=Seqner,
+                                                         cold=cold,
+                                                         abort=pipelined)
+                    diger = yield from  self._extractor(ims,
+                                                        klas=Diger,
+                                                        cold=cold,
+                                                        abort=pipelined)
+                    siger = yield from self._extractor(ims=ims,
+                                                       klas=Siger,
+                                                       cold=cold,
+                                                       abort=pipelined)
+                    trqs.append((prefixer, seqner, diger, siger))
+
+            elif ctr.code == CtrDex.TransIndexedSigGroups:
+                # extract attaced trans indexed sig groups each made of
+                # triple pre+snu+dig plus indexed sig group
+                # pre is pre of signer (endorser) of msg
+                # snu is sn of signer's est evt when signed
+                # dig is dig of signer's est event when signed
+                # followed by counter for ControllerIdxSigs with attached
+                # indexed sigs from trans signer (endorser).
+                for i in range(ctr.count): # extract each attached groups
+                    prefixer = yield from  self._extractor(ims,
+                                                           klas=Prefixer,
+                                                           cold=cold,
+                                                           abort=pipelined)
+                    seqner = yield from  self._extractor(ims,
+                                                         klas=Seqner,
+                                                         cold=cold,
+                                                         abort=pipelined)
+                    diger = yield from  self._extractor(ims,
+                                                        klas=Diger,
+                                                        cold=cold,
+                                                        abort=pipelined)
+                    ictr = ctr = yield from self._extractor(ims=ims,
+                                                            klas=Counter,
+                                                            cold=cold,
+                                                            abort=pipelined)
+                    if ctr.code != CtrDex.ControllerIdxSigs:
+                        raise UnexpectedCountCodeError("Wrong count code={}."
+                                   "Expected code={}.".format(ictr.code,
+                                             CtrDex.ControllerIdxSigs))
+                    isigers = []
+                    for i in range(ictr.count): # extract each attached signature
+                        isiger = yield from self._extractor(ims=ims,
+                                                            klas=Siger,
+                                                            cold=cold,
+                                                            abort=pipelined)
+                        isigers.append(isiger)
+                    tsgs.append((prefixer, seqner, diger, isigers))
+
+            elif ctr.code == CtrDex.FirstSeenReplayCouples:
+                # extract attached first seen replay couples
+                # snu+dtm
+                # snu is fn (first seen ordinal) of event
+                # dtm is dt of event
+                for i in range(ctr.count): # extract each attached quadruple
+                    firner = yield from  self._extractor(ims,
+                                                         klas=Seqner,
+                                                         cold=cold,
+                                                         abort=pipelined)
+                    dater = yield from  self._extractor(ims,
+                                                        klas=Dater,
+                                                        cold=cold,
+                                                        abort=pipelined)
+                    frcs.append((firner, dater))
+
+            elif ctr.code == CtrDex.SealSourceCouples:
+                # extract attached first seen replay couples
+                # snu+dig
+                # snu is sequence number  of event
+                # dig is digest of event
+                for i in range(ctr.count): # extract each attached quadruple
+                    seqner = yield from  self._extractor(ims,
+                                                        klas=Seqner,
+                                                        cold=cold,
+                                                        abort=pipelined)
+                    diger = yield from  self._extractor(ims,
+                                                        klas=Diger,
+                                                        cold=cold,
+                                                        abort=pipelined)
+                    sscs.append((seqner, diger))
+
+            else:
+                raise UnexpectedCountCodeError("Unsupported count code={}."
+                                          "".format(ctr.code))
+
+            if pipelined:  # process to end of stream (group)
+                if not ims:  # end of pipelined group frame
+                    break
+            elif framed:
+                # because not all in one pipeline group, each attachment
+                # group may switch stream state txt or bny
+                if not ims:  # end of frame
+                    break
+                cold = self._sniff(ims)
+                if cold == Colds.msg:  # new message so attachments done
+                    break  # finished attachments since new message
+            else:  # process until next message
+                # because not all in one pipeline group, each attachment
+                # group may switch stream state txt or bny
+                while not ims:
+                    yield  # no frame so must wait for next message
+                cold = self._sniff(ims)  # ctr or msg
+                if cold == Colds.msg:  # new message
+                    break  # finished attachments since new message
+
+            ctr = yield from self._extractor(ims=ims, klas=Counter, cold=cold)
+
+        return Attachage(sigers=sigers, wigers=wigers, cigars=cigars, trqs=trqs,
+                         tsgs=tsgs, frcs=frcs, sscs=sscs)
+
+
+    def _dispatch(self, serder, atc, cloned=False, kvy=None, tvy=None):
+        """
+        Dispatches processing of extracted msg with its attachments to kvy
+        or tvy based on ilk of msg.
+
+        Parameters:
+            serder is Serder instance of extracted msg
+            atc is Attachage instance of extracted attachments of msg
+            cloned is Boolen, True means use attached first seen datetimes
+            kvy (Kevery): route KERI KEL message types to this instance
+            tvy (Tevery): route TEL message types to this instance
+        """
+        sigers, wigers, cigars, trqs, tsgs, frcs, sscs = atc
 
         ilk = serder.ked["t"]  # dispatch abased on ilk
         if ilk in [Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt]:  # event msg
@@ -5109,4 +5890,181 @@ class Parser:
             raise ValidationError("Unexpected message ilk = {} for evt ="
                                   " {}.".format(ilk, serder.ked))
 
-        return True  # done state
+
+    def processFrames(self, cloned=None, kvy=None, tvy=None):
+        """
+        Processes pending pipelined frames in .frames in three stages:
+            extract: extract attachments from each frame's pipelined group.
+            verify: collect the signatures whose keys are known from the frames
+                themselves or from current key state and verify them all as
+                one batch in parallel with kvy.verifier.prime.
+            apply: dispatch each frame in stream order to kvy or tvy. Their
+                signature verification then hits the primed verifier memo and
+                all their kvy.db writes group commit in one write batch.
+        Errors are logged per frame so one bad frame does not drop the others.
+        Each frame applies in a nested batch so a frame that fails unexpectedly
+        rolls back only its own writes. Frames that raise KeriError keep their
+        writes since escrows are written before raising. When the group batch
+        aborts, such as on a full map which grows it, key state and cues in
+        memory are rolled back with it and each frame is applied again in its
+        own batch. Without kvy there is no group batch so lmdb errors raise.
+
+        Parameters:
+            cloned is Boolen, True means use attached first seen datetimes
+            kvy (Kevery): route KERI KEL message types to this instance
+            tvy (Tevery): route TEL message types to this instance
+        """
+        cloned = cloned if cloned is not None else self.cloned
+        kvy = kvy if kvy is not None else self.kvy
+        tvy = tvy if tvy is not None else self.tvy
+
+        frames = self.frames
+        self.frames = []
+
+        msgs = []  # extracted (serder, atc) duples
+        for serder, ims, cold in frames:
+            try:
+                ctr = self._extract(ims=ims, klas=Counter, cold=cold)
+                extractor = self._attachmentsExtractor(ims=ims,
+                                                       ctr=ctr,
+                                                       cold=cold,
+                                                       pipelined=True)
+                while True:  # pipelined frame is complete so never yields
+                    next(extractor)
+            except StopIteration as ex:
+                msgs.append((serder, ex.value))
+            except ExtractionError as ex:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Parser pipelined frame extraction error: "
+                                     "%s\n", ex.args[0])
+                else:
+                    logger.error("Parser pipelined frame extraction error: "
+                                 "%s\n", ex.args[0])
+
+        verifier = getattr(kvy, "verifier", None)
+        if verifier is not None:
+            verifier.prime(self._primeTriples(msgs=msgs, kvy=kvy))
+
+        try:
+            try:
+                with (kvy.db.batch() if kvy is not None else nullcontext()):
+                    for serder, atc in msgs:  # group commit of writes for all frames
+                        self._applyFrame(serder=serder, atc=atc, cloned=cloned,
+                                         kvy=kvy, tvy=tvy)
+            except (lmdb.Error, DatabaseError):  # aborted and rolled back
+                if kvy is None:  # no group batch so nothing rolled back
+                    raise
+                for serder, atc in msgs:  # so apply each frame in own batch
+                    while True:
+                        try:
+                            self._applyFrame(serder=serder, atc=atc, cloned=cloned,
+                                             kvy=kvy, tvy=tvy)
+                            break
+                        except lmdb.MapFullError:  # batch grew map so retry
+                            if not kvy.db.grow:
+                                raise
+        finally:
+            if verifier is not None:
+                verifier.clear()
+
+
+    def _applyFrame(self, serder, atc, cloned, kvy=None, tvy=None):
+        """
+        Dispatches extracted frame serder with attachments atc in its own
+        batch of kvy.db, nested when in the group batch, so that a frame
+        that fails unexpectedly rolls back only its own writes. A frame that
+        raises KeriError keeps its writes since escrows are written before
+        raising. Cues of the frame are dropped when its batch aborts.
+        Errors are logged. lmdb errors are raised.
+
+        Parameters:
+            serder is Serder instance of frame msg
+            atc is dict of extracted attachments of frame
+            cloned is Boolen, True means use attached first seen datetimes
+            kvy (Kevery): route KERI KEL message types to this instance
+            tvy (Tevery): route TEL message types to this instance
+        """
+        try:
+            with (kvy.db.batch() if kvy is not None else nullcontext()):
+                if kvy is not None:  # drop cues of frame when its batch aborts
+                    size = len(kvy.cues)
+                    kvy.db.onAbort(lambda: self._trimCues(kvy.cues, size))
+                try:
+                    self._dispatch(serder=serder, atc=atc, cloned=cloned,
+                                   kvy=kvy, tvy=tvy)
+                except KeriError as ex:  # keep writes such as escrows
+                    self._logFrameError(ex)
+        except lmdb.Error:  # map full or env failure
+            raise
+        except Exception as ex:  # unexpected so frame writes rolled back
+            self._logFrameError(ex)
+
+
+    @staticmethod
+    def _trimCues(cues, size):
+        """
+        Removes cues appended to deque cues after it had length size
+        """
+        while len(cues) > size:
+            cues.pop()
+
+
+    @staticmethod
+    def _logFrameError(ex):
+        """
+        Logs non extraction error ex of applying pipelined frame
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Parser msg non-extraction error: %s\n",
+                             ex.args[0] if ex.args else ex)
+        else:
+            logger.error("Parser msg non-extraction error: %s\n",
+                         ex.args[0] if ex.args else ex)
+
+
+    @staticmethod
+    def _primeTriples(msgs, kvy=None):
+        """
+        Returns list of (verfer, sig, ser) triples of signatures in msgs whose
+        verification keys can be determined ahead of applying the msgs.
+        Keys for establishment events are in the events themselves. Keys for
+        interaction events are from the last preceding establishment event in
+        msgs or else from the current key state in kvy.kevers. A wrong guess
+        only means a memo miss in the apply stage not a wrong result.
+
+        Parameters:
+            msgs is list of (serder, atc) duples of extracted msgs
+            kvy (Kevery): provides .kevers of current key state
+        """
+        kevers = kvy.kevers if kvy is not None else {}
+        keys = {}  # latest known signing verfers by prefix
+        triples = []
+        for serder, atc in msgs:
+            ilk = serder.ked["t"]
+            if ilk not in (Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt):
+                continue  # only key events
+
+            pre = serder.pre
+            if ilk == Ilks.ixn:
+                if pre not in keys:
+                    keys[pre] = kevers[pre].verfers if pre in kevers else []
+            else:  # establishment event
+                keys[pre] = serder.verfers
+            verfers = keys[pre]
+
+            for siger in atc.sigers:
+                if siger.index < len(verfers):
+                    triples.append((verfers[siger.index], siger.raw, serder.raw))
+
+            if ilk in (Ilks.icp, Ilks.dip):  # witnesses in event
+                wits = serder.ked["b"]
+                for wiger in atc.wigers:
+                    if wiger.index < len(wits):
+                        triples.append((Verfer(qb64=wits[wiger.index]),
+                                        wiger.raw, serder.raw))
+
+            for cigar in atc.cigars:  # attached nontrans receipt couples
+                if not cigar.verfer.transferable:
+                    triples.append((cigar.verfer, cigar.raw, serder.raw))
+
+        return triples
@@ -45,10 +45,17 @@ l
 
 """
 
+import functools
+import hashlib
 import os
 import shutil
 import tempfile
-from contextlib import contextmanager
+import threading
+import time
+from base64 import urlsafe_b64encode as encodeB64
+from base64 import urlsafe_b64decode as decodeB64
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 
 import lmdb
 
@@ -64,6 +71,7 @@ ProemSize =  33
 MaxProem = int("f"*(ProemSize-1), 16)
 
 MaxON = int("f"*32, 16)  # largest possible ordinal number, sequence or first seen
+MaxKey = b'\xff'  # sorts after every key of Base64 prefix
 
 
 def dgKey(pre, dig):
@@ -173,6 +181,86 @@ def clearDatabaserDir(path):
         shutil.rmtree(path)
 
 
+def growing(f):
+    """
+    Decorator for write methods of LMDBer that retries the method after
+    growing the map of the LMDBer when its write transaction raises
+    lmdb.MapFullError. Does not retry when the LMDBer .grow is False or when
+    the write joined a batch since the whole batch aborted. LMDBer.batch grows
+    the map on such an abort so that a retry of the batch may succeed.
+    """
+    @functools.wraps(f)
+    def wrapper(self, *pa, **kwa):
+        while True:
+            try:
+                return f(self, *pa, **kwa)
+            except lmdb.MapFullError:
+                if not self.grow or self.batching:
+                    raise
+                self.growMap()
+    return wrapper
+
+
+def regrowing(name):
+    """
+    Returns decorator for methods of objects whose LMDBer is attribute name
+    and whose writes run in batches of that LMDBer. Retries the whole method
+    when lmdb.MapFullError aborted its outermost batch, since LMDBer.batch
+    then grew the map and called the .onAbort callables that restore the in
+    memory state changed along with the aborted writes. Does not retry when
+    the LMDBer .grow is False or when called inside an open batch, whose
+    owner must retry instead.
+
+    Parameters:
+        name is str attribute name of LMDBer instance such as "db". None
+            means methods of the LMDBer itself
+    """
+    def decorator(f):
+        @functools.wraps(f)
+        def wrapper(self, *pa, **kwa):
+            db = getattr(self, name) if name is not None else self
+            if not db.grow or db.batching:
+                return f(self, *pa, **kwa)
+            while True:
+                try:
+                    return f(self, *pa, **kwa)
+                except lmdb.MapFullError:  # batch grew map so retry
+                    pass
+        return wrapper
+    return decorator
+
+
+# Base64 two character counts of counters indexed by count for clone replay
+CtrCnts = tuple(coring.intToB64b(i, l=2) for i in range(64 ** 2))
+DaterToB64 = bytes.maketrans(b":.+", b"cdp")
+
+
+def _counter(code, count):
+    """
+    Returns qb64b of two character count counter of code with count
+    """
+    if count < len(CtrCnts):
+        return code.encode("utf-8") + CtrCnts[count]
+    return coring.Counter(code=code, count=count).qb64b  # raises as Counter
+
+
+def _seqner(sn):
+    """
+    Returns qb64b of Seqner of int sn
+    """
+    raw = sn.to_bytes(16, "big")  # Seqner raw size
+    return coring.MtrDex.Salt_128.encode("utf-8") + encodeB64(raw)[:-2]  # strip pad
+
+
+def _dater(dts):
+    """
+    Returns qb64b of Dater of ISO8601 datetime bytes dts
+    """
+    if len(dts) != 32:
+        return coring.Dater(dts=dts).qb64b  # raises as Dater
+    return coring.MtrDex.DateTime.encode("utf-8") + dts.translate(DaterToB64)
+
+
 @contextmanager
 def openLMDB(cls=None, name="test", temp=True, **kwa):
     """
@@ -221,8 +309,30 @@ class LMDBer:
         .env is LMDB main (super) database environment
         .opened is Boolean, True means LMDB .env at .path is opened.
                             Otherwise LMDB .env is closed
+        .mapSize is int size in bytes of LMDB memory map which bounds the size
+            of the database. Updated when the map grows or when an existing
+            database is larger
+        .grow is Boolean, True means grow the map by .MapGrowth when a write
+            raises lmdb.MapFullError. Otherwise raise MapFullError
+        .durability is str durability mode from .Durabilities
+            'sync' means flush data and meta pages on every commit (default)
+            'nometasync' means flush data on commit but meta pages only on
+                .sync. A crash may lose the last commit but not corrupt
+            'writemap' means write through a writeable memory map and flush
+                only on .sync every .syncPeriod seconds or on close. A crash
+                may lose commits since the last .sync
+        .syncPeriod is float seconds between flushes when not synced on commit
 
     Properties:
+        .batching is Boolean, True means a write batch transaction is open
+            in the calling thread so its reads and writes join it until it
+            commits
+
+    Hidden:
+        ._txn is innermost open write batch transaction of the calling thread
+            if any else None
+        ._local is threading.local of per thread batch state
+        ._synced is float monotonic time of last .sync
 
 
     """
@@ -233,10 +343,15 @@ class LMDBer:
     TempHeadDir = "/tmp"
     TempPrefix = "keri_lmdb_"
     TempSuffix = "_test"
-    MaxNamedDBs = 20
+    MaxNamedDBs = 32
+    MapSize = 10485760  # 10 MiB lmdb default
+    MapGrowth = 2  # multiplier of map size on grow
+    SyncPeriod = 1.0  # seconds
+    Durabilities = ('sync', 'nometasync', 'writemap')
 
     def __init__(self, name='main', temp=False, headDirPath=None, dirMode=None,
-                 reopen=True):
+                 reopen=True, mapSize=None, grow=True, durability=None,
+                 syncPeriod=None):
         """
         Setup main database directory at .dirpath.
         Create main database environment at .env using .dirpath.
@@ -253,15 +368,31 @@ class LMDBer:
             dirMode is int numeric os dir permissions for database directory
                 default is use os defaults and not set the dirMode
             reopen is boolean, IF True then database will be reopened by this init
-
-        """
+            mapSize is int initial map size in bytes. Default is .MapSize
+            grow is boolean, True means grow map when full
+            durability is str mode from .Durabilities. Default is 'sync'
+            syncPeriod is float seconds between flushes for durability modes
+                that do not sync on commit. Default is .SyncPeriod
+
+        """
+        if durability is None:
+            durability = self.Durabilities[0]
+        if durability not in self.Durabilities:
+            raise kering.ConfigurationError("Invalid durability = {}."
+                                            "".format(durability))
         self.name = name
         self.temp = True if temp else False
         self.headDirPath = headDirPath
         self.dirMode = dirMode
+        self.mapSize = mapSize if mapSize is not None else self.MapSize
+        self.grow = True if grow else False
+        self.durability = durability
+        self.syncPeriod = syncPeriod if syncPeriod is not None else self.SyncPeriod
         self.path = None
         self.env = None
         self.opened = False
+        self._local = threading.local()  # batch state is per thread
+        self._synced = 0.0
 
         if reopen:
             self.reopen(headDirPath=self.headDirPath, dirMode=dirMode)
@@ -341,10 +472,48 @@ class LMDBer:
 
         # open lmdb major database instance
         # creates files data.mdb and lock.mdb in .dbDirPath
-        self.env = lmdb.open(self.path, max_dbs=self.MaxNamedDBs)
+        if self.durability == 'writemap':
+            opts = dict(writemap=True, sync=False, map_async=True)
+        elif self.durability == 'nometasync':
+            opts = dict(metasync=False)
+        else:
+            opts = dict()
+        self.env = lmdb.open(self.path, max_dbs=self.MaxNamedDBs,
+                             map_size=self.mapSize, **opts)
+        self.mapSize = self.env.info()['map_size']  # existing may be larger
+        self._synced = time.monotonic()
         self.opened = True
 
 
+    def growMap(self):
+        """
+        Grows map size of .env by .MapGrowth so writes that raised
+        lmdb.MapFullError may be retried. Must not be called while this
+        process has any transaction open on .env.
+        """
+        self.mapSize = self.mapSize * self.MapGrowth
+        self.env.set_mapsize(self.mapSize)
+
+
+    def sync(self):
+        """
+        Flushes .env buffers to disk regardless of .durability
+        """
+        self.env.sync(True)
+        self._synced = time.monotonic()
+
+
+    def flush(self):
+        """
+        Syncs .env when .durability does not sync on every commit and
+        .syncPeriod has elapsed since the last sync. Called after each commit
+        and periodically by BaserDoer so that idle databases also get flushed.
+        """
+        if (self.durability != 'sync' and
+                time.monotonic() - self._synced >= self.syncPeriod):
+            self.sync()
+
+
     def close(self, clear=False):
         """
         Close lmdb at .env and if clear or .temp then remove lmdb directory at .path
@@ -353,6 +522,8 @@ class LMDBer:
         """
         if self.env:
             try:
+                if self.durability != 'sync':
+                    self.sync()
                 self.env.close()
             except:
                 pass
@@ -372,7 +543,158 @@ class LMDBer:
             shutil.rmtree(self.path)
 
 
+    @property
+    def _txn(self):
+        """
+        Returns innermost open write batch transaction of calling thread if any
+        """
+        return getattr(self._local, "txn", None)
+
+
+    @_txn.setter
+    def _txn(self, txn):
+        self._local.txn = txn
+
+
+    @property
+    def batching(self):
+        """
+        Returns True if a write batch transaction is open in the calling
+        thread else False
+        """
+        return self._txn is not None
+
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager for a write batch. All reads and writes made through
+        the methods of this LMDBer within the context by the calling thread
+        join one write transaction that commits once on exit. So the many
+        writes for an event or group of events cost a single commit. An
+        exception raised out of the context aborts the whole batch.
+        Iterators started inside the batch must be exhausted or abandoned
+        before the batch exits.
+
+        A nested batch is a child transaction of the enclosing one. An
+        exception raised out of the nested context aborts only the writes
+        made within it and the enclosing batch may go on. Its writes commit
+        with the outermost batch. With 'writemap' durability lmdb does not
+        support child transactions so a nested batch joins the enclosing one
+        and an exception raised out of it makes the outermost batch abort
+        on exit with DatabaseError.
+
+        When a batch aborts the callables registered with .onAbort while it
+        was open are called in reverse order so in memory state may be
+        restored to match the database.
+
+        Usage:
+            with baser.batch():
+                baser.putEvt(key, val)
+                baser.addKe(key, dig)
+        """
+        outer = self._txn
+        if outer is not None:  # nested
+            if self.durability == 'writemap':  # no child txns so join outer
+                try:
+                    yield outer
+                except BaseException:
+                    self._local.doomed = True  # outermost must abort
+                    raise
+                return
+
+            txn = self.env.begin(write=True, parent=outer, buffers=False)
+            self._txn = txn
+            self._local.aborts.append([])
+            try:
+                yield txn
+            except BaseException:
+                txn.abort()  # only writes of this nested batch
+                self._txn = outer
+                self._rollback(self._local.aborts.pop())
+                raise
+            else:
+                txn.commit()  # into outer
+                self._txn = outer
+                aborts = self._local.aborts.pop()
+                self._local.aborts[-1].extend(aborts)  # abort with outer
+            return
+
+        self._local.doomed = False
+        self._local.aborts = [[]]
+        try:
+            # no buffers since writes in txn may invalidate buffers of prior reads
+            with self.env.begin(write=True, buffers=False) as txn:
+                self._txn = txn
+                try:
+                    yield txn
+                    if self._local.doomed:
+                        raise kering.DatabaseError("Batch aborted since nested"
+                                                   " batch failed.")
+                finally:
+                    self._txn = None
+        except BaseException as ex:
+            self._rollback(self._local.aborts.pop())
+            if isinstance(ex, lmdb.MapFullError) and self.grow:
+                self.growMap()  # batch aborted so grow for retry by caller
+            raise
+        finally:
+            self._local.aborts = []
+        self.flush()
+
+
+    def onAbort(self, fn):
+        """
+        Registers callable fn to be called without arguments if the innermost
+        open batch of the calling thread aborts so that in memory state
+        changed along with its writes may be restored. When a nested batch
+        commits its callables carry over to the enclosing batch. They are
+        dropped when the outermost batch commits. Ignored when not batching.
+
+        Parameters:
+            fn is callable
+        """
+        if self._txn is not None:
+            self._local.aborts[-1].append(fn)
+
+
+    @staticmethod
+    def _rollback(aborts):
+        """
+        Calls aborts callables in reverse order of registration
+        """
+        for fn in reversed(aborts):
+            fn()
+
+
+    def _begin(self, write=False):
+        """
+        Returns transaction context for methods of this LMDBer.
+        When the calling thread is batching returns its open batch transaction
+        so the method joins it, otherwise begins a new transaction.
+
+        Parameters:
+            write is Boolean True means write transaction else read only
+        """
+        if self._txn is not None:
+            return nullcontext(self._txn)
+        if write and self.durability != 'sync':
+            return self._write()
+        return self.env.begin(write=write, buffers=True)
+
+
+    @contextmanager
+    def _write(self):
+        """
+        Returns write transaction context that flushes when due on commit
+        """
+        with self.env.begin(write=True, buffers=True) as txn:
+            yield txn
+        self.flush()
+
+
     # For subdbs with no duplicate values allowed at each key. (dupsort==False)
+    @growing
     def putVal(self, db, key, val):
         """
         Write serialized bytes val to location key in db
@@ -385,10 +707,11 @@ class LMDBer:
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.put(key, val, overwrite=False))
+        with self._begin(write=True) as txn:
+            return (txn.put(key, val, overwrite=False, db=db))
 
 
+    @growing
     def setVal(self, db, key, val):
         """
         Write serialized bytes val to location key in db
@@ -400,8 +723,8 @@ class LMDBer:
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.put(key, val))
+        with self._begin(write=True) as txn:
+            return (txn.put(key, val, db=db))
 
 
     def getVal(self, db, key):
@@ -414,10 +737,11 @@ class LMDBer:
             key is bytes of key within sub db's keyspace
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            return( txn.get(key))
+        with self._begin() as txn:
+            return( txn.get(key, db=db))
 
 
+    @growing
     def delVal(self, db, key):
         """
         Deletes value at key in db.
@@ -427,13 +751,73 @@ class LMDBer:
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.delete(key))
+        with self._begin(write=True) as txn:
+            return (txn.delete(key, db=db))
+
+
+    def getAllItemIter(self, db, key=b''):
+        """
+        Returns iterator of duple item, (key, val), at each key over all
+        keys in db starting at key.
+        Each returned item is duple (key, val) both as bytes.
+
+        Raises StopIteration Error when empty.
+
+        Parameters:
+            db is opened named sub db with dupsort=False
+            key is key location in db to resume replay,
+                   If empty then start at first key in database
+        """
+        with self._begin() as txn:
+            cursor = txn.cursor(db=db)
+            if not cursor.set_range(key):  #  moves to val at key >= key, first if empty
+                return  # no values end of db
+
+            for key, val in cursor.iternext():  # return key, val at cursor
+                yield (bytes(key), bytes(val))
+
+
+    def getItemChunk(self, db, item=None, size=1024):
+        """
+        Returns list of at most size duple items, (key, val), of db in order
+        starting just after item read in one short transaction so that a
+        large db may be walked in chunks without holding a reader open or
+        the whole db in memory. Works for dupsort db as well.
+        Returns empty list when no more items.
+
+        Parameters:
+            db is opened named sub db
+            item is duple (key, val) of last item of previous chunk.
+                None means start at first item in db
+            size is int maximum number of items in chunk
+        """
+        items = []
+        with self._begin() as txn:
+            cursor = txn.cursor(db=db)
+            if item is None:
+                found = cursor.first()
+            else:
+                key, val = item
+                if db.flags(txn)["dupsort"]:
+                    found = cursor.set_range_dup(key, val)
+                    if not found:  # no dup at or after val so next key
+                        found = cursor.set_range(key)
+                        if found and cursor.key() == key:
+                            found = cursor.next_nodup()
+                else:
+                    found = cursor.set_range(key)
+                if found and cursor.item() == (key, val):  # skip item itself
+                    found = cursor.next()
+            while found and len(items) < size:
+                items.append((bytes(cursor.key()), bytes(cursor.value())))
+                found = cursor.next()
+        return items
 
 
     # For subdbs with no duplicate values allowed at each key. (dupsort==False)
     # and use keys with ordinal as monotonically increasing number part
     # such as sn or fn
+    @growing
     def appendOrdValPre(self, db, pre, val):
         """
         Appends val in order after last previous key with same pre in db.
@@ -452,9 +836,9 @@ class LMDBer:
         # set key with fn at max and then walk backwards to find last entry at pre
         # if any otherwise zeroth entry at pre
         key = snKey(pre, MaxON)
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(write=True) as txn:
             on = 0  # unless other cases match then zeroth entry at pre
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if not cursor.set_range(key):  # max is past end of database
                 #  so either empty database or last is earlier pre or
                 #  last is last entry  at same pre
@@ -499,8 +883,8 @@ class LMDBer:
             pre is bytes of itdentifier prefix
             on is int ordinal number to resume replay
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin() as txn:
+            cursor = txn.cursor(db=db)
             key = onKey(pre, on)  # start replay at this enty 0 is earliest
             if not cursor.set_range(key):  #  moves to val at key >= key
                 return  # no values end of db
@@ -512,6 +896,34 @@ class LMDBer:
                 yield (cn, bytes(val))  # (on, dig) of event
 
 
+    def getOrdItemPreLast(self, db, pre, on=MaxON):
+        """
+        Returns duple item, (on, val), of entry with greatest ordinal number
+        not greater than on among ordinal numbered keys with same prefix, pre,
+        in db in one range seek. Returns None if no such entry.
+
+        Parameters:
+            db is opened named sub db with dupsort=False
+            pre is bytes of itdentifier prefix
+            on is int ordinal number at or below which to find last entry
+        """
+        if hasattr(pre, "encode"):
+            pre = pre.encode("utf-8")
+        with self._begin() as txn:
+            cursor = txn.cursor(db=db)
+            key = onKey(pre, on)
+            if cursor.set_range(key):  #  moves to val at key >= key
+                if cursor.key() != key and not cursor.prev():  # backup one entry
+                    return None  # no earlier entry
+            elif not cursor.last():  # past end so last entry if any
+                return None  # empty db
+
+            cpre, cn = splitKeyON(cursor.key())
+            if cpre != pre:  # earlier pre so no entry at pre
+                return None
+            return (cn, bytes(cursor.value()))
+
+
     def getAllOrdItemAllPreIter(self, db, key=b''):
         """
         Returns iterator of triple item, (pre, on, dig), at each key over all
@@ -527,8 +939,8 @@ class LMDBer:
             key is key location in db to resume replay,
                    If empty then start at first key in database
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin() as txn:
+            cursor = txn.cursor(db=db)
             if not cursor.set_range(key):  #  moves to val at key >= key, first if empty
                 return  # no values end of db
 
@@ -538,6 +950,7 @@ class LMDBer:
 
 
     # For subdbs that support duplicates at each key (dupsort==True)
+    @growing
     def putVals(self, db, key, vals):
         """
         Write each entry from list of bytes vals to key in db
@@ -554,13 +967,14 @@ class LMDBer:
             key is bytes of key within sub db's keyspace
             vals is list of bytes of values to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(write=True) as txn:
             result = True
             for val in vals:
-                result = result and txn.put(key, val, dupdata=True)
+                result = result and txn.put(key, val, dupdata=True, db=db)
             return result
 
 
+    @growing
     def addVal(self, db, key, val):
         """
         Add val bytes as dup to key in db
@@ -583,8 +997,8 @@ class LMDBer:
         dups = set(self.getVals(db, key))  #get preexisting dups if any
         result = False
         if val not in dups:
-            with self.env.begin(db=db, write=True, buffers=True) as txn:
-                result = txn.put(key, val, dupdata=True)
+            with self._begin(write=True) as txn:
+                result = txn.put(key, val, dupdata=True, db=db)
         return result
 
 
@@ -600,8 +1014,8 @@ class LMDBer:
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin() as txn:
+            cursor = txn.cursor(db=db)
             vals = []
             if cursor.set_key(key):  # moves to first_dup
                 vals = [val for val in cursor.iternext_dup()]
@@ -619,8 +1033,8 @@ class LMDBer:
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin() as txn:
+            cursor = txn.cursor(db=db)
             vals = []
             if cursor.set_key(key):  # moves to first_dup
                 for val in cursor.iternext_dup():
@@ -635,8 +1049,8 @@ class LMDBer:
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin() as txn:
+            cursor = txn.cursor(db=db)
             count = 0
             if cursor.set_key(key):  # moves to first_dup
                 count = cursor.count()
@@ -654,8 +1068,8 @@ class LMDBer:
             db is opened named sub db
             pre is bytes of key within sub db's keyspace pre.on
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin() as txn:
+            cursor = txn.cursor(db=db)
             key = onKey(pre, on)  # start replay at this enty 0 is earliest
             count = 0
             if not cursor.set_range(key):  #  moves to val at key >= key
@@ -669,6 +1083,7 @@ class LMDBer:
 
             return count
 
+    @growing
     def delVals(self, db, key, val=b''):
         """
         Deletes all values at key in db if val=b'' else deletes the dup
@@ -680,12 +1095,13 @@ class LMDBer:
             key is bytes of key within sub db's keyspace
             val is bytes of dup val at key to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.delete(key, val))
+        with self._begin(write=True) as txn:
+            return (txn.delete(key, val, db=db))
 
 
     # For subdbs that support insertion order preserving duplicates at each key.
     # dupsort==True and prepends and strips io val proem
+    @growing
     def putIoVals(self, db, key, vals):
         """
         Write each entry from list of bytes vals to key in db in insertion order
@@ -712,9 +1128,9 @@ class LMDBer:
 
         result = False
         dups = set(self.getIoVals(db, key))  #get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(write=True) as txn:
             idx = 0
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_key(key): # move to key if any
                 if cursor.last_dup(): # move to last dup
                     idx = 1 + int(bytes(cursor.value()[:32]), 16)  # get last index as int
@@ -722,7 +1138,7 @@ class LMDBer:
             for val in vals:
                 if val not in dups:
                     val = (b'%032x.' % (idx)) +  val  # prepend ordering proem
-                    txn.put(key, val, dupdata=True)
+                    txn.put(key, val, dupdata=True, db=db)
                     idx += 1
                     result = True
         return result
@@ -756,8 +1172,8 @@ class LMDBer:
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin() as txn:
+            cursor = txn.cursor(db=db)
             vals = []
             if cursor.set_key(key):  # moves to first_dup
                 # slice off prepended ordering proem
@@ -777,8 +1193,8 @@ class LMDBer:
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin() as txn:
+            cursor = txn.cursor(db=db)
             vals = []
             if cursor.set_key(key):  # moves to first_dup
                 for val in cursor.iternext_dup():
@@ -797,8 +1213,8 @@ class LMDBer:
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin() as txn:
+            cursor = txn.cursor(db=db)
             val = None
             if cursor.set_key(key):  # move to first_dup
                 if cursor.last_dup(): # move to last_dup
@@ -827,8 +1243,8 @@ class LMDBer:
                     Othewise don't skip for first pass
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin() as txn:
+            cursor = txn.cursor(db=db)
             items = []
             if cursor.set_range(key):  # moves to first_dup at key
                 found = True
@@ -861,8 +1277,8 @@ class LMDBer:
                     Othewise don't skip for first pass
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin() as txn:
+            cursor = txn.cursor(db=db)
             if cursor.set_range(key):  # moves to first_dup at key
                 found = True
                 if skip and key and cursor.key() == key:  # skip to next key
@@ -882,14 +1298,15 @@ class LMDBer:
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin() as txn:
+            cursor = txn.cursor(db=db)
             count = 0
             if cursor.set_key(key):  # moves to first_dup
                 count = cursor.count()
             return count
 
 
+    @growing
     def delIoVals(self,db, key):
         """
         Deletes all values at key in db if key present.
@@ -901,10 +1318,11 @@ class LMDBer:
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.delete(key))
+        with self._begin(write=True) as txn:
+            return (txn.delete(key, db=db))
 
 
+    @growing
     def delIoVal(self, db, key, val):
         """
         Deletes dup io val at key in db. Performs strip search to find match.
@@ -934,8 +1352,8 @@ class LMDBer:
             val is bytes of value to be deleted without intersion ordering proem
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(write=True) as txn:
+            cursor = txn.cursor(db=db)
             if cursor.set_key(key):  # move to first_dup
                 for proval in cursor.iternext_dup():  #  value with proem
                     if val == proval[33:]:  #  strip of proem
@@ -961,8 +1379,8 @@ class LMDBer:
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin() as txn:
+            cursor = txn.cursor(db=db)
             key = snKey(pre, cnt:=0)
             while cursor.set_key(key):  # moves to first_dup
                 for val in cursor.iternext_dup():
@@ -990,8 +1408,8 @@ class LMDBer:
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin() as txn:
+            cursor = txn.cursor(db=db)
             key = snKey(pre, cnt:=0)
             while cursor.set_key(key):  # moves to first_dup
                 if cursor.last_dup(): # move to last_dup
@@ -1022,8 +1440,8 @@ class LMDBer:
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin() as txn:
+            cursor = txn.cursor(db=db)
             key = snKey(pre, cnt:=0)
             while cursor.set_range(key):  #  moves to first dup of key >= key
                 key = cursor.key()  # actual key
@@ -1203,12 +1621,67 @@ class Baser(LMDBer):
             DB is keyed by identifer prefix plus sequence number of key event
             More than one value per DB key is allowed
 
+        .stts is named sub DB of latest key state records of each identifier
+            prefix. Values are serialized key state notice with first seen
+            ordinal of latest event used to reload Kevers without KEL replay.
+            DB is keyed by identifier prefix
+            Only one value per DB key is allowed
+
+        .ests is named sub DB of establishment event index that maps
+            sequence number of each first seen establishment event to its digest.
+            snKey
+            Values are digests used to lookup event in .evts sub DB
+            DB is keyed by identifer prefix plus sequence number of est event
+            so that the authoritative est event at any sn is found by one
+            range seek for the last entry at or before sn
+            Only one value per DB key is allowed
+
+        .exps is named sub DB of escrow expiry index over all escrow tables
+            that maps datetime when each entry was escrowed to that entry.
+            dtKey of escrow table name and escrow datetime
+            Values are escrow entry key and val joined by b' '
+            DB is keyed by escrow table name plus datetime so that a range
+            scan up to a cutoff datetime finds only the stale escrow entries
+            More than one value per DB key is allowed
+
+        .exds is named sub DB of the .exps key of the latest escrow of each
+            escrow entry so that a stale .exps entry left by an entry that was
+            unescrowed then escrowed again does not expire the fresh escrow.
+            Keyed by escrow table name plus digest of escrow entry key and val
+            Only one value per DB key is allowed
+
+        .gbls is named sub DB of global parameters of this database such as
+            the CESR storage domain at key b'cesr', at key b'exps' whether
+            escrow entries written before .exps existed have been indexed and
+            at key b'migr' the progress of an unfinished .migrate
+            Only one value per DB key is allowed
+
+        .migs is named sub DB scratch space of .migrate holding the converted
+            values of one table at a time
+            More than one value per DB key is allowed
+
+        .binary is Boolean True means values of the CESR tables in .CesrTables
+            are stored in binary qb2 domain, False means text qb64 domain.
+            Conversion is transparent at the Baser API boundary so callers
+            always put and get qb64b. Binary storage is 3/4 the size.
+            The domain is persisted in .gbls and fixed for the life of
+            the database unless changed with .migrate
+
+    Class Attributes:
+        CesrTables (tuple): names of sub DBs whose values are concatenated
+            fully qualified CESR primitives subject to .binary
+        IoTables (tuple): names in .CesrTables whose values carry an
+            insertion ordering proem
 
     Properties:
 
 
     """
-    def __init__(self, headDirPath=None, reopen=True, **kwa):
+    CesrTables = ('aess', 'sigs', 'wigs', 'rcts', 'ures', 'vrcs', 'vres',
+                  'pses', 'pwes', 'uwes', 'ooes', 'ldes')
+    IoTables = ('ures', 'vres', 'pses', 'pwes', 'uwes', 'ooes', 'ldes')
+
+    def __init__(self, headDirPath=None, reopen=True, binary=None, **kwa):
         """
         Setup named sub databases.
 
@@ -1224,6 +1697,13 @@ class Baser(LMDBer):
             mode is int numeric os dir permissions for database directory
             reopen is boolean, IF True then database will be reopened by this init
 
+        Parameters:
+            binary (bool): True means store CESR tables in binary qb2 domain.
+                False means text qb64 domain. None means use the domain
+                already persisted in the database or text when new.
+                Raises ConfigurationError when not None and not the
+                persisted domain. Use .migrate to change domain.
+
         Notes:
 
         dupsort=True for sub DB means allow unique (key,pair) duplicates at a key.
@@ -1236,13 +1716,19 @@ class Baser(LMDBer):
         Duplicates are inserted in lexocographic order by value, insertion order.
 
         """
+        self.binary = binary
         super(Baser, self).__init__(headDirPath=headDirPath, reopen=reopen, **kwa)
 
 
-    def reopen(self, **kwa):
+    def reopen(self, binary=None, **kwa):
         """
         Open sub databases
+
+        Parameters:
+            binary (bool): see __init__. None means keep .binary
         """
+        if binary is not None:
+            self.binary = binary
         super(Baser, self).reopen(**kwa)
 
         # Create by opening first time named sub DBs within main DB instance
@@ -1267,7 +1753,194 @@ class Baser(LMDBer):
         self.ooes = self.env.open_db(key=b'ooes.', dupsort=True)
         self.dels = self.env.open_db(key=b'dels.', dupsort=True)
         self.ldes = self.env.open_db(key=b'ldes.', dupsort=True)
+        self.stts = self.env.open_db(key=b'stts.')
+        self.exps = self.env.open_db(key=b'exps.', dupsort=True)
+        self.exds = self.env.open_db(key=b'exds.')
+        self.ests = self.env.open_db(key=b'ests.')
+        self.gbls = self.env.open_db(key=b'gbls.')
+        self.migs = self.env.open_db(key=b'migs.', dupsort=True)
+
+        # resolve CESR storage domain against domain persisted in database
+        domain = self.getVal(self.gbls, b'cesr')
+        if domain is None:  # new database or written before domain was kept
+            fresh = not any(True for _ in self.getAllItemIter(self.evts))
+            domain = (b'bny' if (self.binary and fresh) else b'txt')
+            self.setVal(self.gbls, b'cesr', domain)
+        domain = bytes(domain)
+        stored = (domain == b'bny')
+        if self.binary is not None and self.binary != stored:
+            self.close()
+            raise kering.ConfigurationError("Database {} stores CESR as {} "
+                                            "not {}. Use migrate to convert."
+                                            "".format(self.path,
+                                                      domain.decode(),
+                                                      "bny" if self.binary else "txt"))
+        self.binary = stored
+
+        if (self.getVal(self.gbls, b'exps') is None and  # written before .exps
+                self.getVal(self.gbls, b'migr') is None):  # not mid migration
+            self.indexEscrows()
+            self.setVal(self.gbls, b'exps', b'1')
+
+
+
+    def _packVal(self, val):
+        """
+        Returns val converted from qb64b to stored domain
+        """
+        if self.binary and val:
+            return decodeB64(val)
+        return val
+
+
+    def _packVals(self, vals):
+        """
+        Returns list of vals converted from qb64b to stored domain
+        """
+        if self.binary:
+            return [decodeB64(val) for val in vals]
+        return vals
+
+
+    def _unpackVal(self, val):
+        """
+        Returns stored val converted to qb64b or None if val is None
+        """
+        if self.binary and val is not None:
+            return encodeB64(val)
+        return val
+
+
+    def _unpackVals(self, vals):
+        """
+        Returns list of stored vals converted to qb64b
+        """
+        if self.binary:
+            return [encodeB64(val) for val in vals]
+        return vals
+
+
+    def _unpackValsIter(self, vals):
+        """
+        Returns iterator of stored vals converted to qb64b
+        """
+        if self.binary:
+            return (encodeB64(val) for val in vals)
+        return vals
+
 
+    def _unpackItems(self, items):
+        """
+        Returns list of (key, val) items with stored val converted to qb64b
+        """
+        if self.binary:
+            return [(key, encodeB64(val)) for key, val in items]
+        return items
+
+
+    def _unpackItemsIter(self, items):
+        """
+        Returns iterator of (key, val) items with stored val converted to qb64b
+        """
+        if self.binary:
+            return ((key, encodeB64(val)) for key, val in items)
+        return items
+
+
+    def migrate(self, binary=True, size=1024):
+        """
+        Converts all values of .CesrTables plus the escrow entries indexed by
+        .exps to the binary qb2 domain when binary is True else to the text
+        qb64 domain and persists the new domain.
+        Converts one table at a time in chunks of size values so memory is
+        bounded. Each chunk is written in its own batch so the map grows as
+        needed. A table is first converted into scratch sub db .migs then
+        emptied and refilled from .migs. Progress is persisted in .gbls at
+        b'migr' so that a migration interrupted by a failure resumes where it
+        left off when called again with the same binary. The new domain is
+        persisted only once every table is converted.
+        Returns int number of values converted
+
+        Parameters:
+            binary (bool): True means convert to qb2 else to qb64
+            size (int): maximum number of values per chunk
+        """
+        binary = True if binary else False
+        target = b'bny' if binary else b'txt'
+        marker = self.getVal(self.gbls, b'migr')
+        if marker is not None:  # resume unfinished migration
+            mtarget, mname, mphase = bytes(marker).split(b'|')
+            if mtarget != target:
+                raise kering.ConfigurationError("Unfinished migration of {} to "
+                                                "{}.".format(self.path,
+                                                             mtarget.decode()))
+        elif binary == self.binary:
+            return 0
+
+        convert = decodeB64 if binary else encodeB64
+        count = 0
+        names = self.CesrTables + ('exps', )
+        if marker is not None:
+            names = names[names.index(mname.decode()):]
+        for name in names:
+            db = getattr(self, name)
+            phase = (mphase if (marker is not None and
+                                name == mname.decode()) else b'copy')
+            if phase == b'copy':  # convert db into empty .migs
+                self._migrateItems(self.migs, [],
+                                   marker=b'|'.join((target, name.encode(), b'copy')))
+                item = None
+                while (items := self.getItemChunk(db, item=item, size=size)):
+                    item = items[-1]
+                    converted = self._migrateItems(self.migs,
+                                                   [(key, self._convertVal(name, val, convert))
+                                                    for key, val in items])
+                    if name != 'exps':  # index vals not counted
+                        count += converted
+            # empty db and refill from .migs
+            self._migrateItems(db, [], drops=(db, ),
+                               marker=b'|'.join((target, name.encode(), b'fill')))
+            item = None
+            while (items := self.getItemChunk(self.migs, item=item, size=size)):
+                item = items[-1]
+                self._migrateItems(db, items)
+            self._migrateItems(self.migs, [], drops=(self.migs, ))
+
+        with self.batch():
+            self.setVal(self.gbls, b'cesr', target)
+            self.delVal(self.gbls, b'migr')
+
+        self.binary = binary
+        return count
+
+
+    def _convertVal(self, name, val, convert):
+        """
+        Returns stored val of table name converted by convert
+        """
+        if name == 'exps':  # escrow expiry index vals embed escrow vals
+            ekey, eval = val.split(b' ', 1)
+            return ekey + b' ' + convert(eval)
+        proem = ProemSize if name in self.IoTables else 0
+        return val[:proem] + convert(val[proem:])
+
+
+    @regrowing(None)
+    def _migrateItems(self, db, items, marker=None, drops=()):
+        """
+        Returns int number of items (key, val) put in db as dups when db is
+        dupsort. Empties each of drops first and sets migrate progress
+        marker when provided all in one batch.
+        """
+        with self.batch():
+            with self._begin(write=True) as txn:
+                for drop in drops:
+                    txn.drop(drop, delete=False)
+                if marker is not None:
+                    txn.put(b'migr', marker, db=self.gbls)
+                for key, val in items:
+                    txn.put(key, val, dupdata=True, db=db)
+        return len(items)
 
 
     def clonePreIter(self, pre, fn=0):
@@ -1279,70 +1952,10 @@ class Baser(LMDBer):
         if hasattr(pre, 'encode'):
             pre = pre.encode("utf-8")
 
-        for fn, dig in self.getFelItemPreIter(pre, fn=fn):
-            msg = bytearray()  # message
-            atc = bytearray()  # attachments
-            dgkey = dgKey(pre, dig) # get message
-            if not (raw := self.getEvt(key=dgkey)):
-                raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
-            msg.extend(raw)
-
-            # add indexed signatures to attachments
-            if not (sigs := self.getSigs(key=dgkey)):
-                raise kering.MissingEntryError("Missing sigs for dig={}.".format(dig))
-            atc.extend(coring.Counter(code=coring.CtrDex.ControllerIdxSigs,
-                                      count=len(sigs)).qb64b)
-            for sig in sigs:
-                atc.extend(sig)
-
-            # add indexed witness signatures to attachments
-            if (wigs := self.getWigs(key=dgkey)):
-                atc.extend(coring.Counter(code=coring.CtrDex.WitnessIdxSigs,
-                                                  count=len(wigs) ).qb64b)
-                for wig in wigs:
-                    atc.extend(wig)
-
-            # add authorizer (delegator/issure) source seal event couple to attachments
-            couple = self.getAes(dgkey)
-            if couple is not None:
-                atc.extend(coring.Counter(code=coring.CtrDex.SealSourceCouples,
-                                      count=1 ).qb64b)
-                atc.extend(couple)
-
-            # add trans receipts quadruples to attachments
-            if (quads := self.getVrcs(key=dgkey)):
-                atc.extend(coring.Counter(code=coring.CtrDex.TransReceiptQuadruples,
-                                      count=len(quads) ).qb64b)
-                for quad in quads:
-                    atc.extend(quad)
-
-            # add nontrans receipts couples to attachments
-            if (coups := self.getRcts(key=dgkey)):
-                atc.extend(coring.Counter(code=coring.CtrDex.NonTransReceiptCouples,
-                                                  count=len(coups) ).qb64b)
-                for coup in coups:
-                    atc.extend(coup)
-
-            # add first seen replay couple to attachments
-            atc.extend(coring.Counter(code=coring.CtrDex.FirstSeenReplayCouples,
-                                      count=1).qb64b)
-            atc.extend(coring.Seqner(sn=fn).qb64b)
-            if not (dts := self.getDts(key=dgkey)):
-                raise kering.MissingEntryError("Missing datetime for dig={}.".format(dig))
-            atc.extend(coring.Dater(dts=bytes(dts)).qb64b)
-
-            # prepend pipelining counter to attachments
-            if len(atc) % 4:
-                raise ValueError("Invalid attachments size={}, nonintegral"
-                                 " quadlets.".format(len(atc)))
-            pcnt = coring.Counter(code=coring.CtrDex.AttachedMaterialQuadlets,
-                                      count=(len(atc) // 4)).qb64b
-            msg.extend(pcnt)
-            msg.extend(atc)
-            yield msg
-
-
-    def cloneAllPreIter(self, key=b''):
+        return (msg for key, msg in self._cloneIter(key=fnKey(pre, fn), pre=pre))
+
+
+    def cloneAllPreIter(self, key=b'', stop=b''):
         """
         Returns iterator of first seen event messages with attachments for all
         identifier prefixes starting at key. If key == b'' then rstart at first
@@ -1352,68 +1965,284 @@ class Baser(LMDBer):
 
         Parameters:
             key (bytes): fnKey(pre, fn)
+            stop (bytes): key to stop before. Empty means end of database
+        """
+        return (msg for key, msg in self._cloneIter(key=key, stop=stop))
+
+
+    def cloneChunkIter(self, key=b'', pre=None, size=65536, stop=b''):
+        """
+        Returns iterator of memoryview chunks of concatenated first seen event
+        messages with attachments for streaming a clone to a file or socket.
+        Each chunk holds whole messages and is at least size bytes except the
+        last. When pre is provided clones only the FEL of pre starting at key
+        else all FELs starting at key. Same replay as .cloneAllPreIter.
+
+        Parameters:
+            key (bytes): fnKey(pre, fn) to resume replay at
+            pre (bytes): identifier prefix to limit clone to its FEL if any
+            size (int): minimum size of chunk in bytes
+            stop (bytes): key to stop before. Empty means end of database
+        """
+        if hasattr(pre, 'encode'):
+            pre = pre.encode("utf-8")
+        if pre is not None and not key:
+            key = fnKey(pre, 0)
+
+        for key, chunk in self._cloneChunkItemIter(key=key, pre=pre,
+                                                   size=size, stop=stop):
+            yield chunk
+
+
+    def cloneCursorIter(self, pre, fn=0, size=65536, limit=None):
+        """
+        Returns lazy cursor over the FEL of pre starting at fn as an iterator
+        of memoryview chunks of whole first seen event messages with
+        attachments. Unlike .cloneChunkIter no transaction is held open
+        between chunks. Each chunk is read in its own short read transaction
+        and the cursor resumes at the fn after the last message sent. So a
+        slow consumer such as a socket that pulls chunks as it drains does
+        not pin an LMDB reader or hold the whole log in memory.
+
+        Parameters:
+            pre (bytes): identifier prefix of FEL
+            fn (int): first seen ordinal number to start at
+            size (int): minimum size of chunk in bytes
+            limit (int): maximum number of messages. None means whole FEL
+        """
+        if hasattr(pre, 'encode'):
+            pre = pre.encode("utf-8")
+
+        while limit is None or limit > 0:
+            chunks = self._cloneChunkItemIter(key=fnKey(pre, fn), pre=pre,
+                                              size=size, limit=limit)
+            item = next(chunks, None)
+            chunks.close()  # ends read transaction
+            if item is None:
+                return
+            key, chunk = item
+            last, lfn = splitKeyON(key)
+            if limit is not None:
+                limit -= lfn + 1 - fn  # fns in FEL are contiguous
+            fn = lfn + 1
+            yield chunk
+
+
+    def _cloneChunkItemIter(self, key=b'', pre=None, size=65536, stop=b'',
+                            limit=None):
+        """
+        Returns iterator of duples (key, chunk) as .cloneChunkIter where key
+        is fnKey of last message in memoryview chunk. limit is maximum number
+        of messages if any.
+        """
+        cloner = self._cloneIter(key=key, pre=pre, out=bytearray(), stop=stop,
+                                 limit=limit)
+        chunk = None
+        try:
+            key, chunk = next(cloner)
+            while True:
+                if len(chunk) < size:
+                    key, chunk = next(cloner)  # appends next msg to chunk
+                    continue
+                yield (key, memoryview(chunk))
+                chunk = None
+                key, chunk = cloner.send(bytearray())  # start new chunk
+        except StopIteration:
+            pass
+        if chunk:
+            yield (key, memoryview(chunk))
+
+
+    def getFelShards(self, count):
+        """
+        Returns list of at most count duples (start, stop) of keys that split
+        the FELs of all prefixes into ranges of whole prefixes with about the
+        same number of events in each. Each range may be cloned independently
+        with .cloneAllPreIter(key=start, stop=stop). stop of last is empty.
+        Returns empty list when there are no FELs.
+        Seeks once per prefix so cost is proportional to number of prefixes.
+
+        Parameters:
+            count (int): desired number of shards
+        """
+        pres = []  # (pre, number of events) in key order
+        with self._begin() as txn:
+            cursor = txn.cursor(db=self.fels)
+            found = cursor.first()
+            while found:
+                pre, fn = splitKeyON(cursor.key())
+                found = cursor.set_range(pre + b'/')  # '/' sorts after '.'
+                if found:
+                    cursor.prev()
+                else:
+                    cursor.last()
+                last, fn = splitKeyON(cursor.key())
+                pres.append((pre, fn + 1))
+                if found:
+                    cursor.next()
+
+        if not pres:
+            return []
+        count = max(1, min(count, len(pres)))
+        total = sum(events for pre, events in pres)
+        starts = [pres[0][0]]
+        seen = 0
+        for pre, events in pres:
+            if seen >= total * len(starts) / count and pre != starts[-1]:
+                starts.append(pre)
+            seen += events
+        stops = starts[1:] + [b'']
+        return list(zip(starts, stops))
+
+
+    def cloneShards(self, outs, shards=None, cursors=None, size=65536):
+        """
+        Clones all FELs into outs one shard per out in parallel threads
+        Each thread streams its shard in its own read transaction as chunks
+        of whole messages. Returns cursors.
+        Raises DatabaseError when called inside .batch since its write
+        transaction must not be shared with the worker threads.
+
+        Parameters:
+            outs (list): of file like objects with .write such as open binary
+                files or socket.makefile('wb'). One per shard.
+            shards (list): of (start, stop) key duples as from .getFelShards.
+                None means .getFelShards(len(outs))
+            cursors (list): of fnKey per shard to resume at. Updated in place
+                after each chunk is written with the fnKey of the next
+                message so that a failed clone may be resumed by calling
+                again with the same shards and cursors. None means start of
+                each shard
+            size (int): minimum size of chunk in bytes for each .write
+        """
+        if self.batching:
+            raise kering.DatabaseError("Cannot clone shards inside write batch.")
+        if shards is None:
+            shards = self.getFelShards(len(outs))
+        if len(shards) > len(outs):
+            raise ValueError("Too few outs={} for shards={}."
+                             "".format(len(outs), len(shards)))
+        if cursors is None:
+            cursors = [start for start, stop in shards]
+
+        def clone(i):
+            stop = shards[i][1]
+            for key, chunk in self._cloneChunkItemIter(key=cursors[i],
+                                                       size=size, stop=stop):
+                outs[i].write(chunk)
+                pre, fn = splitKeyON(key)
+                cursors[i] = fnKey(pre, fn + 1)
+            cursors[i] = stop if stop else MaxKey  # shard done
+
+        if len(shards) <= 1:
+            for i in range(len(shards)):
+                clone(i)
+        else:
+            with ThreadPoolExecutor(max_workers=len(shards),
+                                    thread_name_prefix="keri-clone") as pool:
+                for future in [pool.submit(clone, i) for i in range(len(shards))]:
+                    future.result()  # reraises exception of shard if any
+        return cursors
+
+
+    def _cloneIter(self, key=b'', pre=None, out=None, stop=b'', limit=None):
         """
-        for pre, fn, dig in self.getFelItemAllPreIter(key=key):
-            msg = bytearray()  # message
-            atc = bytearray()  # attachments
-            dgkey = dgKey(pre, dig) # get message
-            if not (raw := self.getEvt(key=dgkey)):
-                raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
-            msg.extend(raw)
-
-            # add indexed signatures to attachments
-            if not (sigs := self.getSigs(key=dgkey)):
-                raise kering.MissingEntryError("Missing sigs for dig={}.".format(dig))
-            atc.extend(coring.Counter(code=coring.CtrDex.ControllerIdxSigs,
-                                      count=len(sigs)).qb64b)
-            for sig in sigs:
-                atc.extend(sig)
-
-            # add indexed witness signatures to attachments
-            if (wigs := self.getWigs(key=dgkey)):
-                atc.extend(coring.Counter(code=coring.CtrDex.WitnessIdxSigs,
-                                                  count=len(wigs) ).qb64b)
-                for wig in wigs:
-                    atc.extend(wig)
-
-            # add authorizer (delegator/issure) source seal event couple to attachments
-            couple = self.getAes(dgkey)
-            if couple is not None:
-                atc.extend(coring.Counter(code=coring.CtrDex.SealSourceCouples,
-                                      count=1 ).qb64b)
-                atc.extend(couple)
-
-            # add trans receipts quadruples to attachments
-            if (quads := self.getVrcs(key=dgkey)):
-                atc.extend(coring.Counter(code=coring.CtrDex.TransReceiptQuadruples,
-                                      count=len(quads) ).qb64b)
-                for quad in quads:
-                    atc.extend(quad)
-
-            # add nontrans receipts couples to attachments
-            if (coups := self.getRcts(key=dgkey)):
-                atc.extend(coring.Counter(code=coring.CtrDex.NonTransReceiptCouples,
-                                                  count=len(coups) ).qb64b)
-                for coup in coups:
-                    atc.extend(coup)
-
-            # add first seen replay couple to attachments
-            atc.extend(coring.Counter(code=coring.CtrDex.FirstSeenReplayCouples,
-                                      count=1).qb64b)
-            atc.extend(coring.Seqner(sn=fn).qb64b)
-            if not (dts := self.getDts(key=dgkey)):
-                raise kering.MissingEntryError("Missing datetime for dig={}.".format(dig))
-            atc.extend(coring.Dater(dts=bytes(dts)).qb64b)
-
-            # prepend pipelining counter to attachments
-            if len(atc) % 4:
-                raise ValueError("Invalid attachments size={}, nonintegral"
-                                 " quadlets.".format(len(atc)))
-            pcnt = coring.Counter(code=coring.CtrDex.AttachedMaterialQuadlets,
-                                      count=(len(atc) // 4)).qb64b
-            msg.extend(pcnt)
-            msg.extend(atc)
-            yield msg
+        Returns iterator of duples (key, msg) of fnKey and first seen event
+        message with attachments in fnKey order starting at key.
+        Stops at end of FEL of pre when pre or before stop when stop.
+        Whole clone is read in one read transaction with one cursor per sub db.
+        Counters come from the precomputed table CtrCnts and the first seen
+        couple is formed directly from fn and the stored datetime.
+
+        Parameters:
+            key (bytes): fnKey(pre, fn) to start at. Empty means first
+            pre (bytes): identifier prefix to limit clone to its FEL if any
+            out (bytearray): when provided each message is appended to out
+                and out is yielded in place of the message. The caller may
+                replace out with a new bytearray by .send
+            stop (bytes): key to stop before. Empty means end of database
+            limit (int): maximum number of messages. None means no limit
+        """
+        unpack = encodeB64 if self.binary else bytes
+        with self._begin() as txn:
+            fels = txn.cursor(db=self.fels)
+            evts = txn.cursor(db=self.evts)
+            sigs = txn.cursor(db=self.sigs)
+            wigs = txn.cursor(db=self.wigs)
+            aess = txn.cursor(db=self.aess)
+            vrcs = txn.cursor(db=self.vrcs)
+            rcts = txn.cursor(db=self.rcts)
+            dtss = txn.cursor(db=self.dtss)
+
+            if not fels.set_range(key):  # moves to key >= key, end of db
+                return
+
+            for key, dig in fels.iternext():
+                if limit is not None:
+                    if limit <= 0:
+                        break
+                    limit -= 1
+                key = bytes(key)
+                if stop and key >= stop:
+                    break
+                cpre, fn = splitKeyON(key)
+                if pre is not None and cpre != pre:  # end of FEL of pre
+                    break
+                dig = bytes(dig)
+                dgkey = dgKey(cpre, dig)
+                if (raw := evts.get(dgkey)) is None:
+                    raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
+
+                parts = []  # attachments
+
+                # add indexed signatures to attachments
+                if not sigs.set_key(dgkey):
+                    raise kering.MissingEntryError("Missing sigs for dig={}.".format(dig))
+                vals = [unpack(val) for val in sigs.iternext_dup()]
+                parts.append(_counter(coring.CtrDex.ControllerIdxSigs, len(vals)))
+                parts.extend(vals)
+
+                # add indexed witness signatures to attachments
+                if wigs.set_key(dgkey):
+                    vals = [unpack(val) for val in wigs.iternext_dup()]
+                    parts.append(_counter(coring.CtrDex.WitnessIdxSigs, len(vals)))
+                    parts.extend(vals)
+
+                # add authorizer (delegator/issure) source seal event couple to attachments
+                if (couple := aess.get(dgkey)) is not None:
+                    parts.append(_counter(coring.CtrDex.SealSourceCouples, 1))
+                    parts.append(unpack(couple))
+
+                # add trans receipts quadruples to attachments
+                if vrcs.set_key(dgkey):
+                    vals = [unpack(val) for val in vrcs.iternext_dup()]
+                    parts.append(_counter(coring.CtrDex.TransReceiptQuadruples, len(vals)))
+                    parts.extend(vals)
+
+                # add nontrans receipts couples to attachments
+                if rcts.set_key(dgkey):
+                    vals = [unpack(val) for val in rcts.iternext_dup()]
+                    parts.append(_counter(coring.CtrDex.NonTransReceiptCouples, len(vals)))
+                    parts.extend(vals)
+
+                # add first seen replay couple to attachments
+                if not (dts := dtss.get(dgkey)):
+                    raise kering.MissingEntryError("Missing datetime for dig={}.".format(dig))
+                parts.append(_counter(coring.CtrDex.FirstSeenReplayCouples, 1))
+                parts.append(_seqner(fn))
+                parts.append(_dater(bytes(dts)))
+
+                # prepend pipelining counter to attachments
+                size = sum(len(part) for part in parts)
+                if size % 4:
+                    raise ValueError("Invalid attachments size={}, nonintegral"
+                                     " quadlets.".format(size))
+                msg = bytearray() if out is None else out
+                msg.extend(raw)
+                msg.extend(_counter(coring.CtrDex.AttachedMaterialQuadlets, size // 4))
+                msg.extend(b''.join(parts))
+                if (sent := (yield (key, msg))) is not None:
+                    out = sent
 
 
     def putEvt(self, key, val):
@@ -1455,6 +2284,278 @@ class Baser(LMDBer):
         return self.delVal(self.evts, key)
 
 
+    def putState(self, key, val):
+        """
+        Use identifier prefix bytes as key
+        Write serialized key state record bytes val to key
+        Does not overwrite existing val if any
+        Returns True If val successfully written Else False
+        Return False if key already exists
+        """
+        return self.putVal(self.stts, key, val)
+
+
+    def setState(self, key, val):
+        """
+        Use identifier prefix bytes as key
+        Write serialized key state record bytes val to key
+        Overwrites existing val if any
+        Returns True If val successfully written Else False
+        """
+        return self.setVal(self.stts, key, val)
+
+
+    def getState(self, key):
+        """
+        Use identifier prefix bytes as key
+        Return key state record at key
+        Returns None if no entry at key
+        """
+        return self.getVal(self.stts, key)
+
+
+    def delState(self, key):
+        """
+        Use identifier prefix bytes as key
+        Deletes value at key.
+        Returns True If key exists in database Else False
+        """
+        return self.delVal(self.stts, key)
+
+
+    def cntStates(self):
+        """
+        Returns count of all key state records in db without a scan
+        """
+        with self._begin() as txn:
+            return txn.stat(self.stts)["entries"]
+
+
+    def delStates(self):
+        """
+        Deletes all key state records in db.
+        Returns True If any existed Else False
+        """
+        with self._begin(write=True) as txn:
+            existed = txn.stat(self.stts)["entries"] > 0
+            txn.drop(self.stts, delete=False)
+            return existed
+
+
+    def getStateItemIter(self, key=b''):
+        """
+        Returns iterator of duple item, (pre, state), over all key state
+        records in db starting at identifier prefix key, where pre is
+        identifier prefix bytes and state is serialized key state record bytes.
+
+        Raises StopIteration Error when empty.
+
+        Parameters:
+            key is identifier prefix bytes to resume at,
+                   If empty then start at first key state record in database
+        """
+        return self.getAllItemIter(db=self.stts, key=key)
+
+
+    def putEst(self, key, val):
+        """
+        Use snKey()
+        Write establishment event digest bytes val to key
+        Does not overwrite existing val if any
+        Returns True If val successfully written Else False
+        Return False if key already exists
+        """
+        return self.putVal(self.ests, key, val)
+
+
+    def setEst(self, key, val):
+        """
+        Use snKey()
+        Write establishment event digest bytes val to key
+        Overwrites existing val if any
+        Returns True If val successfully written Else False
+        """
+        return self.setVal(self.ests, key, val)
+
+
+    def getEst(self, key):
+        """
+        Use snKey()
+        Return establishment event digest at key
+        Returns None if no entry at key
+        """
+        return self.getVal(self.ests, key)
+
+
+    def delEst(self, key):
+        """
+        Use snKey()
+        Deletes value at key.
+        Returns True If key exists in database Else False
+        """
+        return self.delVal(self.ests, key)
+
+
+    def getEstItemLast(self, pre, sn):
+        """
+        Returns duple (sn, dig) of the authoritative establishment event for
+        the event at sn in KEL of identifier prefix pre i.e. the latest est
+        event at or before sn, where dig is event digest bytes.
+        Returns None if no est event indexed at or before sn.
+
+        Parameters:
+            pre is bytes of itdentifier prefix
+            sn is int sequence number of event
+        """
+        return self.getOrdItemPreLast(self.ests, pre, on=sn)
+
+
+    def addExp(self, key, val):
+        """
+        Use dtKey() of escrow table name and escrow datetime
+        Add escrow entry val bytes as dup to key in db
+        Returns True if written else False if dup val already exists
+        """
+        return self.putVals(self.exps, key, [val])
+
+
+    def getExpItemIter(self, key=b''):
+        """
+        Returns iterator of duple item, (key, val), over all escrow expiry
+        index entries in db starting at key in lexicographic order of key.
+
+        Parameters:
+            key is dtKey to resume at, If empty then start at first entry
+        """
+        return self.getAllItemIter(db=self.exps, key=key)
+
+
+    def delExp(self, key, val=b''):
+        """
+        Use dtKey() of escrow table name and escrow datetime
+        Deletes escrow entry val at key if val else all entries at key
+        Returns True If key exists in database Else False
+        """
+        return self.delVals(self.exps, key, val)
+
+
+    def addEscrowVal(self, db, name, key, val):
+        """
+        Add val bytes as dup in insertion order to key in escrow table db and
+        when written index entry in .exps at datetime now.
+        Returns True if written else False if dup val already exists
+
+        Parameters:
+            db is opened named escrow sub db with dupsort=True
+            name is bytes name of escrow sub db such as b'ooes'
+            key is bytes of key within sub db's keyspace
+            val is bytes escrow entry
+        """
+        with self.batch():
+            result = self.addIoVal(db, key, val)
+            if result:
+                exp = dtKey(name, helping.nowIso8601())
+                self.addExp(exp, bytes(key) + b' ' + bytes(val))
+                self.setVal(self.exds, self._exdKey(name, key, val), exp)
+        return result
+
+
+    def _exdKey(self, name, key, val):
+        """
+        Returns bytes key in .exds of escrow entry at key with stored val in
+        escrow table name. Digest is of qb64 val so that it survives .migrate
+        """
+        dig = hashlib.blake2b(bytes(key) + b' ' + bytes(self._unpackVal(val)),
+                              digest_size=16).hexdigest()
+        return name + b'|' + dig.encode("utf-8")
+
+
+    def indexEscrows(self, size=1024):
+        """
+        Indexes in .exps and .exds every escrow entry not yet indexed such as
+        one written before .exps existed so that it still expires. Uses the
+        datetime in .dtss of the escrowed event, or now when missing, as the
+        escrow datetime. Walks each escrow table in chunks of size entries
+        each indexed in its own batch.
+        Returns int number of entries indexed
+
+        Parameters:
+            size is int maximum number of entries per chunk
+        """
+        count = 0
+        for name in self.IoTables:  # all escrow tables
+            db = getattr(self, name)
+            item = None
+            while (items := self.getItemChunk(db, item=item, size=size)):
+                item = items[-1]
+                count += self._indexEscrowItems(name.encode("utf-8"), items)
+        return count
+
+
+    @regrowing(None)
+    def _indexEscrowItems(self, name, items):
+        """
+        Returns int number of escrow items (key, ival) of escrow table name
+        indexed in .exps where ival is stored val with ordinal proem
+        """
+        count = 0
+        with self.batch():
+            for key, ival in items:
+                val = ival[ProemSize:]
+                exd = self._exdKey(name, key, val)
+                if self.getVal(self.exds, exd) is not None:  # already indexed
+                    continue
+                pre, sn = splitKeySN(key)
+                dig = coring.Matter(qb64b=self._unpackVal(val)).qb64b  # event dig leads
+                dts = self.getVal(self.dtss, dgKey(pre, dig))
+                exp = dtKey(name, bytes(dts) if dts is not None
+                                  else helping.nowIso8601())
+                self.addExp(exp, key + b' ' + val)
+                self.setVal(self.exds, exd, exp)
+                count += 1
+        return count
+
+
+    def delExpiredEscrows(self, name, dts):
+        """
+        Deletes every entry of escrow table name escrowed before datetime
+        dts together with its .exps index entry in one range scan of .exps.
+        Cost is proportional to number of expired entries not escrow size.
+        An .exps entry superseded by a later escrow of the same entry, as
+        recorded in .exds, is deleted without deleting the escrow entry.
+        Returns list of duples (key, val) of expired escrow entries that
+        were still escrowed
+
+        Parameters:
+            name is bytes name of escrow sub db such as b'ooes'
+            dts is tz aware ISO8601 datetime str or bytes cutoff
+        """
+        if hasattr(name, "encode"):
+            name = name.encode("utf-8")
+        db = getattr(self, name.decode("utf-8"))
+        cutoff = dtKey(name, dts)
+        start = name + b'|'
+        expired = []
+        for key, val in self.getExpItemIter(key=start):
+            if not key.startswith(start) or key >= cutoff:
+                break
+            expired.append((key, val))
+
+        items = []
+        with self.batch():
+            for key, val in expired:
+                ekey, eval = val.split(b' ', 1)
+                self.delExp(key, val)
+                exd = self._exdKey(name, ekey, eval)
+                latest = self.getVal(self.exds, exd)
+                if latest is not None and bytes(latest) != key:  # escrowed again since
+                    continue
+                self.delVal(self.exds, exd)
+                if self.delIoVal(db, ekey, eval):  # not already unescrowed
+                    items.append((ekey, self._unpackVal(eval)))
+        return items
+
+
     def putFe(self, key, val):
         """
         Use fnKey()
@@ -1594,7 +2695,7 @@ class Baser(LMDBer):
         Returns True If val successfully written Else False
         Returns False if key already exists
         """
-        return self.putVal(self.aess, key, val)
+        return self.putVal(self.aess, key, self._packVal(val))
 
 
     def setAes(self, key, val):
@@ -1604,7 +2705,7 @@ class Baser(LMDBer):
         Overwrites existing val if any
         Returns True If val successfully written Else False
         """
-        return self.setVal(self.aess, key, val)
+        return self.setVal(self.aess, key, self._packVal(val))
 
 
     def getAes(self, key):
@@ -1613,7 +2714,7 @@ class Baser(LMDBer):
         Return source seal event couple at key
         Returns None if no entry at key
         """
-        return self.getVal(self.aess, key)
+        return self._unpackVal(self.getVal(self.aess, key))
 
 
     def delAes(self, key):
@@ -1632,7 +2733,7 @@ class Baser(LMDBer):
         Returns empty list if no entry at key
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getVals(self.sigs, key)
+        return self._unpackVals(self.getVals(self.sigs, key))
 
 
     def getSigsIter(self, key):
@@ -1642,7 +2743,7 @@ class Baser(LMDBer):
         Raises StopIteration Error when empty
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getValsIter(self.sigs, key)
+        return self._unpackValsIter(self.getValsIter(self.sigs, key))
 
 
     def putSigs(self, key, vals):
@@ -1654,7 +2755,7 @@ class Baser(LMDBer):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.putVals(self.sigs, key, vals)
+        return self.putVals(self.sigs, key, self._packVals(vals))
 
 
     def addSig(self, key, val):
@@ -1665,7 +2766,7 @@ class Baser(LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.addVal(self.sigs, key, val)
+        return self.addVal(self.sigs, key, self._packVal(val))
 
 
     def cntSigs(self, key):
@@ -1683,7 +2784,7 @@ class Baser(LMDBer):
         Deletes all values at key if val = b'' else deletes dup val = val.
         Returns True If key exists in database (or key, val if val not b'') Else False
         """
-        return self.delVals(self.sigs, key, val)
+        return self.delVals(self.sigs, key, self._packVal(val))
 
 
     def getWigs(self, key):
@@ -1693,7 +2794,7 @@ class Baser(LMDBer):
         Returns empty list if no entry at key
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getVals(self.wigs, key)
+        return self._unpackVals(self.getVals(self.wigs, key))
 
 
     def getWigsIter(self, key):
@@ -1703,7 +2804,7 @@ class Baser(LMDBer):
         Raises StopIteration Error when empty
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getValsIter(self.wigs, key)
+        return self._unpackValsIter(self.getValsIter(self.wigs, key))
 
 
     def putWigs(self, key, vals):
@@ -1715,7 +2816,7 @@ class Baser(LMDBer):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.putVals(self.wigs, key, vals)
+        return self.putVals(self.wigs, key, self._packVals(vals))
 
 
     def addWig(self, key, val):
@@ -1726,7 +2827,7 @@ class Baser(LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.addVal(self.wigs, key, val)
+        return self.addVal(self.wigs, key, self._packVal(val))
 
 
     def cntWigs(self, key):
@@ -1744,7 +2845,7 @@ class Baser(LMDBer):
         Deletes all values at key if val = b'' else deletes dup val = val.
         Returns True If key exists in database (or key, val if val not b'') Else False
         """
-        return self.delVals(self.wigs, key, val)
+        return self.delVals(self.wigs, key, self._packVal(val))
 
 
     def putRcts(self, key, vals):
@@ -1757,7 +2858,7 @@ class Baser(LMDBer):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.putVals(self.rcts, key, vals)
+        return self.putVals(self.rcts, key, self._packVals(vals))
 
 
     def addRct(self, key, val):
@@ -1769,7 +2870,7 @@ class Baser(LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.addVal(self.rcts, key, val)
+        return self.addVal(self.rcts, key, self._packVal(val))
 
 
     def getRcts(self, key):
@@ -1780,7 +2881,7 @@ class Baser(LMDBer):
         Returns empty list if no entry at key
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getVals(self.rcts, key)
+        return self._unpackVals(self.getVals(self.rcts, key))
 
 
     def getRctsIter(self, key):
@@ -1791,7 +2892,7 @@ class Baser(LMDBer):
         Raises StopIteration Error when empty
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getValsIter(self.rcts, key)
+        return self._unpackValsIter(self.getValsIter(self.rcts, key))
 
 
     def cntRcts(self, key):
@@ -1810,7 +2911,7 @@ class Baser(LMDBer):
         Deletes all values at key if val = b'' else deletes dup val = val.
         Returns True If key exists in database (or key, val if val not b'') Else False
         """
-        return self.delVals(self.rcts, key, val)
+        return self.delVals(self.rcts, key, self._packVal(val))
 
 
     def putUres(self, key, vals):
@@ -1822,7 +2923,7 @@ class Baser(LMDBer):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.ures, key, vals)
+        return self.putIoVals(self.ures, key, self._packVals(vals))
 
 
     def addUre(self, key, val):
@@ -1833,8 +2934,9 @@ class Baser(LMDBer):
         Adds to existing values at key if any
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
+        Indexes escrow datetime of written val in .exps
         """
-        return self.addIoVal(self.ures, key, val)
+        return self.addEscrowVal(self.ures, b'ures', key, self._packVal(val))
 
 
     def getUres(self, key):
@@ -1845,7 +2947,7 @@ class Baser(LMDBer):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoVals(self.ures, key)
+        return self._unpackVals(self.getIoVals(self.ures, key))
 
 
     def getUresIter(self, key):
@@ -1856,7 +2958,7 @@ class Baser(LMDBer):
         Raises StopIteration Error when empty
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoValsIter(self.ures, key)
+        return self._unpackValsIter(self.getIoValsIter(self.ures, key))
 
 
     def getUreLast(self, key):
@@ -1867,7 +2969,7 @@ class Baser(LMDBer):
         Returns None if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoValLast(self.ures, key)
+        return self._unpackVal(self.getIoValLast(self.ures, key))
 
 
     def getUreItemsNext(self, key=b'', skip=True):
@@ -1882,7 +2984,7 @@ class Baser(LMDBer):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoItemsNext(self.ures, key, skip)
+        return self._unpackItems(self.getIoItemsNext(self.ures, key, skip))
 
 
     def getUreItemsNextIter(self, key=b'', skip=True):
@@ -1897,7 +2999,7 @@ class Baser(LMDBer):
         Raises StopIteration Error when empty
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoItemsNextIter(self.ures, key, skip)
+        return self._unpackItemsIter(self.getIoItemsNextIter(self.ures, key, skip))
 
 
     def cntUres(self, key):
@@ -1928,7 +3030,7 @@ class Baser(LMDBer):
             key is bytes of key within sub db's keyspace
             val is dup val (does not include insertion ordering proem)
         """
-        return self.delIoVal(self.ures, key, val)
+        return self.delIoVal(self.ures, key, self._packVal(val))
 
 
     def putVrcs(self, key, vals):
@@ -1941,7 +3043,7 @@ class Baser(LMDBer):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.putVals(self.vrcs, key, vals)
+        return self.putVals(self.vrcs, key, self._packVals(vals))
 
 
     def addVrc(self, key, val):
@@ -1953,7 +3055,7 @@ class Baser(LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.addVal(self.vrcs, key, val)
+        return self.addVal(self.vrcs, key, self._packVal(val))
 
 
     def getVrcs(self, key):
@@ -1964,7 +3066,7 @@ class Baser(LMDBer):
         Returns empty list if no entry at key
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getVals(self.vrcs, key)
+        return self._unpackVals(self.getVals(self.vrcs, key))
 
 
     def getVrcsIter(self, key):
@@ -1975,7 +3077,7 @@ class Baser(LMDBer):
         Raises StopIteration Error when empty
         Duplicates are retrieved in lexocographic order not insertion order.
         """
-        return self.getValsIter(self.vrcs, key)
+        return self._unpackValsIter(self.getValsIter(self.vrcs, key))
 
 
     def cntVrcs(self, key):
@@ -1993,7 +3095,7 @@ class Baser(LMDBer):
         Deletes all values at key if val = b'' else deletes dup val = val.
         Returns True If key exists in database (or key, val if val not b'') Else False
         """
-        return self.delVals(self.vrcs, key, val)
+        return self.delVals(self.vrcs, key, self._packVal(val))
 
 
     def putVres(self, key, vals):
@@ -2005,7 +3107,7 @@ class Baser(LMDBer):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.vres, key, vals)
+        return self.putIoVals(self.vres, key, self._packVals(vals))
 
 
     def addVre(self, key, val):
@@ -2016,8 +3118,9 @@ class Baser(LMDBer):
         Adds to existing values at key if any
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
+        Indexes escrow datetime of written val in .exps
         """
-        return self.addIoVal(self.vres, key, val)
+        return self.addEscrowVal(self.vres, b'vres', key, self._packVal(val))
 
 
     def getVres(self, key):
@@ -2028,7 +3131,7 @@ class Baser(LMDBer):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoVals(self.vres, key)
+        return self._unpackVals(self.getIoVals(self.vres, key))
 
 
     def getVresIter(self, key):
@@ -2039,7 +3142,7 @@ class Baser(LMDBer):
         Raises StopIteration Error when empty
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoValsIter(self.vres, key)
+        return self._unpackValsIter(self.getIoValsIter(self.vres, key))
 
 
     def getVreLast(self, key):
@@ -2050,7 +3153,7 @@ class Baser(LMDBer):
         Returns None if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoValLast(self.vres, key)
+        return self._unpackVal(self.getIoValLast(self.vres, key))
 
 
     def getVreItemsNext(self, key=b'', skip=True):
@@ -2065,7 +3168,7 @@ class Baser(LMDBer):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoItemsNext(self.vres, key, skip)
+        return self._unpackItems(self.getIoItemsNext(self.vres, key, skip))
 
 
     def getVreItemsNextIter(self, key=b'', skip=True):
@@ -2080,7 +3183,7 @@ class Baser(LMDBer):
         Raises StopIteration Error when empty
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoItemsNextIter(self.vres, key, skip)
+        return self._unpackItemsIter(self.getIoItemsNextIter(self.vres, key, skip))
 
 
     def cntVres(self, key):
@@ -2111,7 +3214,7 @@ class Baser(LMDBer):
             key is bytes of key within sub db's keyspace
             val is dup val (does not include insertion ordering proem)
         """
-        return self.delIoVal(self.vres, key, val)
+        return self.delIoVal(self.vres, key, self._packVal(val))
 
 
     def putKes(self, key, vals):
@@ -2224,7 +3327,7 @@ class Baser(LMDBer):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.pses, key, vals)
+        return self.putIoVals(self.pses, key, self._packVals(vals))
 
 
     def addPse(self, key, val):
@@ -2234,8 +3337,9 @@ class Baser(LMDBer):
         Adds to existing event indexes at key if any
         Returns True if written else False if dup val already exists
         Duplicates are inserted in insertion order.
+        Indexes escrow datetime of written val in .exps
         """
-        return self.addIoVal(self.pses, key, val)
+        return self.addEscrowVal(self.pses, b'pses', key, self._packVal(val))
 
 
     def getPses(self, key):
@@ -2245,7 +3349,7 @@ class Baser(LMDBer):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoVals(self.pses, key)
+        return self._unpackVals(self.getIoVals(self.pses, key))
 
 
     def getPsesIter(self, key):
@@ -2255,7 +3359,7 @@ class Baser(LMDBer):
         Raises StopIteration Error when empty
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoValsIter(self.pses, key)
+        return self._unpackValsIter(self.getIoValsIter(self.pses, key))
 
 
     def getPseLast(self, key):
@@ -2265,7 +3369,7 @@ class Baser(LMDBer):
         Returns None if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoValLast(self.pses, key)
+        return self._unpackVal(self.getIoValLast(self.pses, key))
 
 
     def getPseItemsNext(self, key=b'', skip=True):
@@ -2278,7 +3382,7 @@ class Baser(LMDBer):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoItemsNext(self.pses, key, skip)
+        return self._unpackItems(self.getIoItemsNext(self.pses, key, skip))
 
 
     def getPseItemsNextIter(self, key=b'', skip=True):
@@ -2291,7 +3395,7 @@ class Baser(LMDBer):
         Raises StopIteration Error when empty
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoItemsNextIter(self.pses, key, skip)
+        return self._unpackItemsIter(self.getIoItemsNextIter(self.pses, key, skip))
 
 
     def cntPses(self, key):
@@ -2322,7 +3426,7 @@ class Baser(LMDBer):
             key is bytes of key within sub db's keyspace
             val is dup val (does not include insertion ordering proem)
         """
-        return self.delIoVal(self.pses, key, val)
+        return self.delIoVal(self.pses, key, self._packVal(val))
 
 
     def putPde(self, key, val):
@@ -2372,7 +3476,7 @@ class Baser(LMDBer):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.pwes, key, vals)
+        return self.putIoVals(self.pwes, key, self._packVals(vals))
 
 
     def addPwe(self, key, val):
@@ -2382,8 +3486,9 @@ class Baser(LMDBer):
         Adds to existing event indexes at key if any
         Returns True if written else False if dup val already exists
         Duplicates are inserted in insertion order.
+        Indexes escrow datetime of written val in .exps
         """
-        return self.addIoVal(self.pwes, key, val)
+        return self.addEscrowVal(self.pwes, b'pwes', key, self._packVal(val))
 
 
     def getPwes(self, key):
@@ -2393,7 +3498,7 @@ class Baser(LMDBer):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoVals(self.pwes, key)
+        return self._unpackVals(self.getIoVals(self.pwes, key))
 
 
     def getPwesIter(self, key):
@@ -2403,7 +3508,7 @@ class Baser(LMDBer):
         Raises StopIteration Error when empty
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoValsIter(self.pwes, key)
+        return self._unpackValsIter(self.getIoValsIter(self.pwes, key))
 
 
     def getPweLast(self, key):
@@ -2413,7 +3518,7 @@ class Baser(LMDBer):
         Returns None if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoValLast(self.pwes, key)
+        return self._unpackVal(self.getIoValLast(self.pwes, key))
 
 
     def getPweItemsNext(self, key=b'', skip=True):
@@ -2426,7 +3531,7 @@ class Baser(LMDBer):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoItemsNext(self.pwes, key, skip)
+        return self._unpackItems(self.getIoItemsNext(self.pwes, key, skip))
 
 
     def getPweItemsNextIter(self, key=b'', skip=True):
@@ -2439,7 +3544,7 @@ class Baser(LMDBer):
         Raises StopIteration Error when empty
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoItemsNextIter(self.pwes, key, skip)
+        return self._unpackItemsIter(self.getIoItemsNextIter(self.pwes, key, skip))
 
 
     def cntPwes(self, key):
@@ -2470,7 +3575,7 @@ class Baser(LMDBer):
             key is bytes of key within sub db's keyspace
             val is dup val (does not include insertion ordering proem)
         """
-        return self.delIoVal(self.pwes, key, val)
+        return self.delIoVal(self.pwes, key, self._packVal(val))
 
 
     def putUwes(self, key, vals):
@@ -2482,7 +3587,7 @@ class Baser(LMDBer):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.uwes, key, vals)
+        return self.putIoVals(self.uwes, key, self._packVals(vals))
 
 
     def addUwe(self, key, val):
@@ -2493,8 +3598,9 @@ class Baser(LMDBer):
         Adds to existing values at key if any
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
+        Indexes escrow datetime of written val in .exps
         """
-        return self.addIoVal(self.uwes, key, val)
+        return self.addEscrowVal(self.uwes, b'uwes', key, self._packVal(val))
 
 
     def getUwes(self, key):
@@ -2505,7 +3611,7 @@ class Baser(LMDBer):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoVals(self.uwes, key)
+        return self._unpackVals(self.getIoVals(self.uwes, key))
 
 
     def getUwesIter(self, key):
@@ -2516,7 +3622,7 @@ class Baser(LMDBer):
         Raises StopIteration Error when empty
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoValsIter(self.uwes, key)
+        return self._unpackValsIter(self.getIoValsIter(self.uwes, key))
 
 
     def getUweLast(self, key):
@@ -2527,7 +3633,7 @@ class Baser(LMDBer):
         Returns None if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoValLast(self.uwes, key)
+        return self._unpackVal(self.getIoValLast(self.uwes, key))
 
 
     def getUweItemsNext(self, key=b'', skip=True):
@@ -2542,7 +3648,7 @@ class Baser(LMDBer):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoItemsNext(self.uwes, key, skip)
+        return self._unpackItems(self.getIoItemsNext(self.uwes, key, skip))
 
 
     def getUweItemsNextIter(self, key=b'', skip=True):
@@ -2557,7 +3663,7 @@ class Baser(LMDBer):
         Raises StopIteration Error when empty
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoItemsNextIter(self.uwes, key, skip)
+        return self._unpackItemsIter(self.getIoItemsNextIter(self.uwes, key, skip))
 
 
     def cntUwes(self, key):
@@ -2588,7 +3694,7 @@ class Baser(LMDBer):
             key is bytes of key within sub db's keyspace
             val is dup val (does not include insertion ordering proem)
         """
-        return self.delIoVal(self.uwes, key, val)
+        return self.delIoVal(self.uwes, key, self._packVal(val))
 
 
     def putOoes(self, key, vals):
@@ -2599,7 +3705,7 @@ class Baser(LMDBer):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.ooes, key, vals)
+        return self.putIoVals(self.ooes, key, self._packVals(vals))
 
 
     def addOoe(self, key, val):
@@ -2609,8 +3715,9 @@ class Baser(LMDBer):
         Adds to existing event indexes at key if any
         Returns True if written else False if dup val already exists
         Duplicates are inserted in insertion order.
+        Indexes escrow datetime of written val in .exps
         """
-        return self.addIoVal(self.ooes, key, val)
+        return self.addEscrowVal(self.ooes, b'ooes', key, self._packVal(val))
 
 
     def getOoes(self, key):
@@ -2620,7 +3727,7 @@ class Baser(LMDBer):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoVals(self.ooes, key)
+        return self._unpackVals(self.getIoVals(self.ooes, key))
 
 
     def getOoeLast(self, key):
@@ -2630,7 +3737,7 @@ class Baser(LMDBer):
         Returns None if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoValLast(self.ooes, key)
+        return self._unpackVal(self.getIoValLast(self.ooes, key))
 
 
     def getOoeItemsNext(self, key=b'', skip=True):
@@ -2643,7 +3750,7 @@ class Baser(LMDBer):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoItemsNext(self.ooes, key, skip)
+        return self._unpackItems(self.getIoItemsNext(self.ooes, key, skip))
 
 
     def getOoeItemsNextIter(self, key=b'', skip=True):
@@ -2656,7 +3763,7 @@ class Baser(LMDBer):
         Raises StopIteration Error when empty
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoItemsNextIter(self.ooes, key, skip)
+        return self._unpackItemsIter(self.getIoItemsNextIter(self.ooes, key, skip))
 
 
     def cntOoes(self, key):
@@ -2688,7 +3795,7 @@ class Baser(LMDBer):
             key is bytes of key within sub db's keyspace
             val is dup val (does not include insertion ordering proem)
         """
-        return self.delIoVal(self.ooes, key, val)
+        return self.delIoVal(self.ooes, key, self._packVal(val))
 
 
     def putDes(self, key, vals):
@@ -2780,7 +3887,7 @@ class Baser(LMDBer):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.ldes, key, vals)
+        return self.putIoVals(self.ldes, key, self._packVals(vals))
 
 
     def addLde(self, key, val):
@@ -2790,8 +3897,9 @@ class Baser(LMDBer):
         Adds to existing event indexes at key if any
         Returns True if written else False if dup val already exists
         Duplicates are inserted in insertion order.
+        Indexes escrow datetime of written val in .exps
         """
-        return self.addIoVal(self.ldes, key, val)
+        return self.addEscrowVal(self.ldes, b'ldes', key, self._packVal(val))
 
 
     def getLdes(self, key):
@@ -2801,7 +3909,7 @@ class Baser(LMDBer):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoVals(self.ldes, key)
+        return self._unpackVals(self.getIoVals(self.ldes, key))
 
 
     def getLdeLast(self, key):
@@ -2811,7 +3919,7 @@ class Baser(LMDBer):
         Returns None if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoValLast(self.ldes, key)
+        return self._unpackVal(self.getIoValLast(self.ldes, key))
 
 
     def getLdeItemsNext(self, key=b'', skip=True):
@@ -2824,7 +3932,7 @@ class Baser(LMDBer):
         Returns empty list if no entry at key
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoItemsNext(self.ldes, key, skip)
+        return self._unpackItems(self.getIoItemsNext(self.ldes, key, skip))
 
 
     def getLdeItemsNextIter(self, key=b'', skip=True):
@@ -2837,7 +3945,7 @@ class Baser(LMDBer):
         Raises StopIteration Error when empty
         Duplicates are retrieved in insertion order.
         """
-        return self.getIoItemsNextIter(self.ldes, key, skip)
+        return self._unpackItemsIter(self.getIoItemsNextIter(self.ldes, key, skip))
 
 
     def cntLdes(self, key):
@@ -2869,7 +3977,7 @@ class Baser(LMDBer):
             key is bytes of key within sub db's keyspace
             val is dup val (does not include insertion ordering proem)
         """
-        return self.delIoVal(self.ldes, key, val)
+        return self.delIoVal(self.ldes, key, self._packVal(val))
 
 
 
@@ -2932,6 +4040,13 @@ class BaserDoer(doing.Doer):
             self.baser.reopen()
 
 
+    def recur(self, tyme):
+        """"""
+        if self.baser.opened:
+            self.baser.flush()  # periodic sync when not synced on commit
+        return False
+
+
     def exit(self):
         """"""
         self.baser.close()
@@ -11,7 +11,7 @@ import json
 
 from hio.base import doing
 from hio.core import wiring
-from hio.core.tcp import clienting, serving
+from hio.core.tcp import clienting
 
 from .. import kering
 from ..db import dbing
@@ -440,7 +440,7 @@ def setupDemoController(secrets, name="who", remotePort=5621, localPort=5620, in
 
     reactor = directing.Reactor(hab=hab, client=client, indirect=indirect)
 
-    server = serving.Server(host="", port=localPort, wl=wl)
+    server = directing.SelectServer(host="", port=localPort, wl=wl)
     serverDoer = doing.ServerDoer(server=server)
     directant = directing.Directant(hab=hab, server=server)
     # Reactants created on demand by directant
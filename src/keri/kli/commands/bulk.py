@@ -0,0 +1,77 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.kli.commands module
+
+"""
+import argparse
+import csv
+import time
+
+from keri.base import keeping
+from keri.base.basing import Habitat
+from keri.db import dbing
+
+parser = argparse.ArgumentParser(description='Initialize many prefixes at once')
+parser.set_defaults(handler=lambda args: bulk(args.name, args.count, args.file,
+                                              args.alias, args.size, args.workers))
+parser.add_argument('--name', '-n', help='Humane reference of database and keystore')
+parser.add_argument('--count', '-c', help='Number of prefixes to create when no file',
+                    type=int, default=1)
+parser.add_argument('--file', '-f', default="",
+                    help='CSV file with header of name and optional icount, isith, '
+                         'ncount, nsith and transferable columns. One prefix per row')
+parser.add_argument('--alias', '-a', help='Alias stem of prefixes made by count',
+                    default="id")
+parser.add_argument('--size', '-s', help='Number of prefixes per transaction',
+                    type=int, default=1000)
+parser.add_argument('--workers', '-w', help='Number of parallel key stretches',
+                    type=int, default=None)
+
+Ints = ("icount", "ncount")  # CSV columns of ints
+Bools = ("transferable", )  # CSV columns of booleans
+
+
+def load(file):
+    """
+    Returns duple (names, params) of lists from CSV file of prefix parameters
+    """
+    names = []
+    params = []
+    with open(file, newline='') as f:
+        for row in csv.DictReader(f):
+            names.append(row.pop("name"))
+            param = dict()
+            for key, val in row.items():
+                if val is None or val == "":  # empty cell means default
+                    continue
+                if key in Ints:
+                    val = int(val)
+                elif key in Bools:
+                    val = val.strip().lower() in ("1", "true", "yes")
+                param[key] = val
+            params.append(param)
+    return names, params
+
+
+def bulk(name, count=1, file="", alias="id", size=1000, workers=None):
+    if file:
+        names, params = load(file)
+    else:
+        names = ["{}{}".format(alias, i) for i in range(count)]
+        params = [dict() for n in names]
+
+    size = max(1, size)
+    start = time.perf_counter()
+    with dbing.openDB(name=name, temp=False) as db, keeping.openKS(name=name, temp=False) as ks:
+        kevers = dict()
+        for i in range(0, len(names), size):
+            habs = Habitat.inceptMany(names=names[i:i + size], ks=ks, db=db,
+                                      params=params[i:i + size],
+                                      kevers=kevers, workers=workers)
+            for hab in habs:
+                print(f'{hab.name}\t{hab.pre}')
+
+    elapsed = time.perf_counter() - start
+    print()
+    print(f'{len(names)} prefixes created in {elapsed:.2f} seconds '
+          f'({len(names) / elapsed if elapsed else 0.0:.1f} identifiers/second)')
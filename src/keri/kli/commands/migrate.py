@@ -0,0 +1,21 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.kli.commands module
+
+"""
+import argparse
+
+from keri.db import dbing
+
+parser = argparse.ArgumentParser(description='Convert CESR storage domain of existing KERI database')
+parser.set_defaults(handler=lambda args: migrate(args.name, args.text))
+parser.add_argument('--name', '-n', help='Humane reference')
+parser.add_argument('--text', '-t', action='store_true', default=False,
+                    help='Convert to text qb64 domain instead of binary qb2 domain')
+
+
+def migrate(name, text=False):
+    with dbing.openDB(name=name, temp=False) as db:
+        count = db.migrate(binary=not text)
+
+    print(f'Converted {count} values to {"qb64" if text else "qb2"}')
@@ -0,0 +1,25 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.kli.commands module
+
+"""
+import argparse
+
+from keri.base import directing, indirecting
+from keri.db import dbing
+
+parser = argparse.ArgumentParser(description='Run KERI witness')
+parser.set_defaults(handler=lambda args: witness(args.name, args.port,
+                                                 args.mapsize, args.durability))
+parser.add_argument('--name', '-n', help='Humane reference', default='witness')
+parser.add_argument('--port', '-p', help='Local TCP port to listen on', type=int, default=5621)
+parser.add_argument('--mapsize', '-m', help='Initial lmdb map size in bytes, grows when full',
+                    type=int, default=None)
+parser.add_argument('--durability', '-d', help='lmdb durability mode', default=None,
+                    choices=dbing.LMDBer.Durabilities)
+
+
+def witness(name, port, mapSize=None, durability=None):
+    doers = indirecting.setupWitness(name=name, localPort=port,
+                                     mapSize=mapSize, durability=durability)
+    directing.runController(doers=doers)
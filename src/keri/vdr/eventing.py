@@ -1085,21 +1085,37 @@ class Tevery:
             mgmt = qry["ri"]
             vcpre = qry["i"]
 
-            cloner = self.reger.cloneIter(pre=mgmt, fn=0)  # create iterator at 0
-            msgs = bytearray()  # outgoing messages
-            for msg in cloner:
-                msgs.extend(msg)
-
-            cloner = self.reger.cloneIter(pre=vcpre, fn=0)  # create iterator at 0
-            msgs = bytearray()  # outgoing messages
-            for msg in cloner:
-                msgs.extend(msg)
-
-            self.cues.append(dict(kin="replay", msgs=msgs))
+            try:
+                limit = int(qry["limit"], 16) if "limit" in qry else None
+            except (TypeError, ValueError) as ex:
+                raise ValidationError("Invalid limit in query = {}."
+                                      "".format(ked)) from ex
+            if limit is not None and limit < 0:
+                raise ValidationError("Invalid limit in query = {}."
+                                      "".format(ked))
+            # lazy cursor over management TEL then credential TEL so replay
+            # is streamed as the connection drains
+            vci = nsKey([mgmt, vcpre])  # credential TEL namespaced by registry
+            cursor = self._cloneTelsIter(pres=(mgmt, vci), limit=limit)
+            self.cues.append(dict(kin="replay", msgs=cursor))
         else:
             raise ValidationError("invalid query message {} for evt = {}".format(ilk, ked))
 
 
+    def _cloneTelsIter(self, pres, limit=None):
+        """
+        Returns lazy cursor of memoryview chunks over the TELs of each prefix
+        in pres in turn with at most limit messages in all. Each chunk is read
+        in its own short read transaction by Registry.cloneCursorIter.
+        """
+        for pre in pres:
+            if limit is not None and limit <= 0:
+                return
+            count = yield from self.reger.cloneCursorIter(pre=pre, fn=0, limit=limit)
+            if limit is not None:
+                limit -= count
+
+
     @staticmethod
     def registryKey(serder):
         ilk = serder.ked["t"]
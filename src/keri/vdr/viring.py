@@ -141,6 +141,53 @@ class Registry(dbing.LMDBer):
         TEL prefix pre starting at first seen order number, fn.
         Essentially a replay in first seen order with attachments
         """
+        for fn, msg in self._cloneItemIter(pre=pre, fn=fn):
+            yield msg
+
+
+    def cloneCursorIter(self, pre, fn=0, size=65536, limit=None):
+        """
+        Returns lazy cursor over the TEL of pre starting at fn as an iterator
+        of memoryview chunks of whole first seen event messages with
+        attachments as Baser.cloneCursorIter. Each chunk is read in its own
+        short read transaction and the cursor resumes at the fn after the
+        last message sent so no LMDB reader is held open between chunks.
+        Returns count of messages cloned as generator return value so that
+        cursors may be chained with yield from.
+
+        Parameters:
+            pre (bytes): identifier prefix of TEL
+            fn (int): first seen ordinal number to start at
+            size (int): minimum size of chunk in bytes
+            limit (int): maximum number of messages. None means whole TEL
+        """
+        if hasattr(pre, 'encode'):
+            pre = pre.encode("utf-8")
+
+        count = 0
+        while limit is None or count < limit:
+            chunk = bytearray()
+            cloner = self._cloneItemIter(pre=pre, fn=fn)
+            try:
+                for fn, msg in cloner:
+                    chunk.extend(msg)
+                    count += 1
+                    if len(chunk) >= size or (limit is not None and count >= limit):
+                        break
+            finally:
+                cloner.close()  # ends read transaction
+            if not chunk:
+                break
+            fn += 1
+            yield memoryview(chunk)
+        return count
+
+
+    def _cloneItemIter(self, pre, fn=0):
+        """
+        Returns iterator of duples (fn, msg) as .cloneIter where fn is first
+        seen order number of event message msg
+        """
         if hasattr(pre, 'encode'):
             pre = pre.encode("utf-8")
 
@@ -174,7 +221,7 @@ class Registry(dbing.LMDBer):
                                       count=(len(atc) // 4)).qb64b
             msg.extend(pcnt)
             msg.extend(atc)
-            yield msg
+            yield (fn, msg)
 
 
     def putTvt(self, key, val):
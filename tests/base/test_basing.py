@@ -8,10 +8,13 @@ import json
 import os
 from dataclasses import dataclass, asdict
 
+import lmdb
 import pytest
 
+from keri import kering
 from keri.base import basing, keeping
 from keri.base.basing import Habitat
+from keri.core import coring, eventing
 from keri.core.coring import Serials
 from keri.db import dbing
 from keri.help import helping
@@ -27,6 +30,16 @@ def test_habitat():
     hab.db.close(clear=True)
     hab.ks.close(clear=True)
 
+    # bounded kever cache
+    hab = Habitat(temp=True, keverCacheSize=1)
+    assert isinstance(hab.kevers, eventing.KeverCache)
+    assert hab.kevers.size == 1
+    assert hab.kever.prefixer.qb64 == hab.pre
+    assert hab.kevers.hits == 1
+
+    hab.db.close(clear=True)
+    hab.ks.close(clear=True)
+
     """End Test"""
 
 
@@ -41,6 +54,7 @@ def test_habitat_reinitialization():
         opre = hab.pre
         opub = hab.kever.verfers[0].qb64
         odig = hab.kever.serder.dig
+        ostate = hab.kever.state(fn=hab.kever.fn)
         assert hab.ridx == 0
 
     with dbing.openDB(name=name, temp=False) as db, keeping.openKS(name=name, temp=False) as ks:
@@ -61,11 +75,209 @@ def test_habitat_reinitialization():
         assert hab.kever.serder.dig != odig
         assert hab.kever.serder.dig == ndig
 
+        hab.interact()
+        nstate = hab.kever.state(fn=hab.kever.fn)
+        assert hab.kever.fn == 2
+
+    with dbing.openDB(name=name, temp=False) as db, keeping.openKS(name=name, temp=False) as ks:
+        # reloads kevers from persisted key state records
+        assert db.getState(key=opre.encode("utf-8")) == nstate.raw
+        hab = basing.Habitat(name=name, ks=ks, db=db, icount=1, temp=False)
+        assert hab.pre == opre
+        assert hab.ridx == 1
+        assert hab.kever.sn == 2
+        assert hab.kever.fn == 2
+        assert hab.kever.lastEst.s == 1
+        assert hab.kever.verfers[0].qb64 == npub
+        assert hab.kever.state(fn=hab.kever.fn).raw == nstate.raw
+
+        hab.reinitialize(verify=True)  # reverifies reloaded state against KEL
+        assert hab.kever.state(fn=hab.kever.fn).raw == nstate.raw
+
+        hab.rotate()  # reloaded state is usable
+        assert hab.kever.sn == 3
+        assert hab.ridx == 2
+
+        # missing key state records falls back to replay of KELs
+        assert db.delState(key=opre.encode("utf-8"))
+        hab.kevers.clear()
+        hab.reinitialize()
+        assert hab.kever.sn == 3
+        assert db.getState(key=opre.encode("utf-8")) is not None
+
+        # stale key state record does not reverify
+        assert db.setState(key=opre.encode("utf-8"), val=ostate.raw)
+        hab.kevers.clear()
+        with pytest.raises(kering.ConfigurationError):
+            hab.reinitialize(verify=True)
+        assert hab.kever.sn == 0
+        assert hab.kvy.cues[-1] == dict(kin="invalidKeyState", pre=opre)
+
         hab.db.close(clear=True)
         hab.ks.close(clear=True)
     """End Test"""
 
 
+def test_habitat_incept_many():
+    """
+    Test bulk inception of Habitats
+    """
+    names = ["ann", "bob", "cat"]
+    params = [dict(), dict(icount=2, isith="2"), dict(transferable=False)]
+    with dbing.openDB(name="bulk", temp=True) as db, keeping.openKS(name="bulk", temp=True) as ks:
+        habs = Habitat.inceptMany(names=names, ks=ks, db=db, params=params,
+                                  temp=True, workers=2)
+        assert [hab.name for hab in habs] == names
+        assert len(habs[1].kever.verfers) == 2
+        assert habs[1].kever.tholder.sith == "2"
+        assert not habs[2].kever.transferable
+        assert habs[0].kevers is habs[2].kevers  # shared kevers
+        assert keeping.Manager(keeper=ks).getPidx() == 3
+
+        # same keys and inceptions as one at a time
+        with dbing.openDB(name="one", temp=True) as odb, keeping.openKS(name="one", temp=True) as oks:
+            for hab, name, param in zip(habs, names, params):
+                ohab = Habitat(name=name, ks=oks, db=odb, temp=True, **param)
+                assert ohab.pre == hab.pre
+                assert ohab.iserder.raw == hab.iserder.raw
+                assert ohab.kever.fn == hab.kever.fn == 0
+
+        # own inceptions accepted unverified locally still verify remotely
+        with dbing.openDB(name="remote", temp=True) as rdb:
+            kvy = eventing.Kevery(db=rdb)
+            for hab in habs:
+                eventing.Parser().process(ims=hab.makeOwnInception(), kvy=kvy)
+                assert kvy.kevers[hab.pre].serder.dig == hab.kever.serder.dig
+
+        with pytest.raises(ValueError):  # already incepted name
+            Habitat.inceptMany(names=["dog", "ann"], ks=ks, db=db, temp=True)
+
+        # keys of same stem collide so whole batch aborts
+        with pytest.raises(ValueError):
+            Habitat.inceptMany(names=["eve", "eve"], ks=ks, db=db, temp=True)
+        assert keeping.Manager(keeper=ks).getPidx() == 3
+        assert basing.Komer(db=db, schema=basing.HabitatRecord,
+                            subdb='habitats.').get(keys=('hab', 'eve')) is None
+
+        # bad witness params rejected before any write so retry succeeds
+        pres = len(list(ks.getAllItemIter(db=ks.pres)))
+        with pytest.raises(ValueError):
+            Habitat.inceptMany(names=["fay", "gus"], ks=ks, db=db, temp=True,
+                               params=[dict(), dict(toad=5)])
+        assert len(list(ks.getAllItemIter(db=ks.pres))) == pres
+        assert keeping.Manager(keeper=ks).getPidx() == 3
+
+        # later failure aborts key writes along with Habitat writes
+        with pytest.raises(ValueError):
+            Habitat.inceptMany(names=["fay", "gus"], ks=ks, db=db, temp=True,
+                               params=[dict(), dict(isith="3")])  # sith > keys
+        assert len(list(ks.getAllItemIter(db=ks.pres))) == pres
+        assert keeping.Manager(keeper=ks).getPidx() == 3
+
+        habs = Habitat.inceptMany(names=["fay", "gus"], ks=ks, db=db, temp=True)
+        assert [hab.name for hab in habs] == ["fay", "gus"]
+        assert all(hab.pre in hab.kevers for hab in habs)
+        assert len(list(ks.getAllItemIter(db=ks.pres))) == pres + 4  # old and new
+    """End Test"""
+
+
+def test_habitat_local_ingest():
+    """
+    Test trusted local ingest of own msgs by Habitat
+    """
+    with dbing.openDB(name="ann", temp=True) as adb, keeping.openKS(name="ann", temp=True) as aks, \
+            dbing.openDB(name="bob", temp=True) as bdb, keeping.openKS(name="bob", temp=True) as bks:
+        ann = Habitat(name="ann", ks=aks, db=adb, temp=True)
+        bob = Habitat(name="bob", ks=bks, db=bdb, temp=True, strict=True)
+        assert not ann.strict
+        assert bob.strict
+        assert ann.kvy.owned(ann.pre)
+        assert not ann.kvy.owned(bob.pre)
+
+        msg = ann.rotate()
+        assert ann.kever.sn == 1
+        msg.extend(ann.interact())
+        assert ann.kever.sn == 2
+        assert adb.cntSigs(dbing.dgKey(ann.pre, ann.kever.serder.dig)) == 1
+        bob.interact()
+        assert bob.kever.sn == 1
+
+        # own msgs ingested without parse still verify remotely
+        msgs = ann.replay()
+        akvy = eventing.Kevery(kevers=bob.kevers, db=bdb, opre=bob.pre, local=False)
+        eventing.Parser().process(ims=msgs, kvy=akvy)
+        assert bob.kevers[ann.pre].serder.dig == ann.kever.serder.dig
+
+        # own transferable receipt of other event ingested locally
+        bob.receipt(ann.kever.serder)
+        assert bdb.cntVrcs(dbing.dgKey(ann.pre, ann.kever.serder.dig)) == 1
+
+        # strict reverifies so bad own signature rejected
+        serder = eventing.interact(pre=bob.pre, dig=bob.kever.serder.dig,
+                                   sn=bob.kever.sn + 1)
+        sigers = ann.mgr.sign(ser=serder.raw, verfers=ann.kever.verfers)
+        with pytest.raises(kering.ValidationError):
+            bob.kvy.processLocal(serder=serder, sigers=sigers, strict=True)
+        assert bob.kever.sn == 1
+
+        with pytest.raises(kering.ValidationError):  # missing sigs
+            bob.kvy.processLocal(serder=serder)
+
+        # own receipts only trusted by local mode Kevery so nonlocal verifies
+        reserder = eventing.receipt(pre=ann.pre, sn=ann.kever.sn,
+                                    dig=ann.kever.serder.dig)
+        sigers = ann.mgr.sign(ser=ann.kever.serder.raw, verfers=ann.kever.verfers)
+        tsgs = [(bob.kever.prefixer, coring.Seqner(sn=bob.kever.lastEst.s),
+                 coring.Diger(qb64=bob.kever.lastEst.d), sigers)]  # forged
+        nkvy = eventing.Kevery(kevers=bob.kevers, db=bdb, opre=bob.pre, local=False)
+        assert not nkvy.owned(bob.pre)
+        with pytest.raises(kering.ValidationError):
+            nkvy.processLocal(serder=reserder, tsgs=tsgs)
+        assert bdb.cntVrcs(dbing.dgKey(ann.pre, ann.kever.serder.dig)) == 1
+    """End Test"""
+
+
+def test_habitat_map_grow():
+    """
+    Test key state stays in step with database when full map grows mid write
+    """
+    hab = Habitat(name="small", temp=True, mapSize=200000)
+    size = hab.db.mapSize
+    for i in range(60):
+        hab.interact()
+    assert hab.db.mapSize > size  # grew and retried aborted batch
+    assert hab.kever.sn == 60
+    dig = hab.db.getKeLast(dbing.snKey(hab.pre, hab.kever.sn))
+    assert bytes(dig) == hab.kever.serder.digb
+    state = eventing.Serder(raw=bytes(hab.db.getState(hab.pre.encode("utf-8"))))
+    assert state.sn == hab.kever.sn
+
+    # pipelined group batch aborts on full map then each frame applied alone
+    msgs = hab.replay()
+    with dbing.openDB(name="tiny", mapSize=65536) as db:
+        kvy = eventing.Kevery(db=db)
+        parser = eventing.Parser(pipeline=True)
+        parser.Batch = 64
+        parser.process(ims=msgs, kvy=kvy)
+        assert not parser.frames
+        assert db.mapSize > 65536
+        assert kvy.kevers[hab.pre].sn == hab.kever.sn
+        assert len(kvy.cues) == 61  # one receipt cue per event none repeated
+        assert bytes(db.getKeLast(dbing.snKey(hab.pre, 60))) == hab.kever.serder.digb
+
+    # without kvy nothing to roll back so full map error is raised as is
+    def full(**kwa):
+        raise lmdb.MapFullError("full")
+    parser = eventing.Parser(pipeline=True)
+    parser._dispatch = full
+    with pytest.raises(lmdb.MapFullError):
+        parser.process(ims=hab.replay())
+
+    hab.db.close(clear=True)
+    hab.ks.close(clear=True)
+    """End Test"""
+
+
 def test_kom_happy_path():
     """
     Test Komer object class
@@ -190,6 +190,66 @@ def test_directing_basic():
     """End Test"""
 
 
+def test_directing_select():
+    """
+    Test readiness driven Directant with SelectServer
+    """
+    with dbing.openDB(name="eve") as eveDB, keeping.openKS(name="eve") as eveKS, \
+            dbing.openDB(name="bob") as bobDB, keeping.openKS(name="bob") as bobKS:
+
+        limit = 1.0
+        tock = 0.03125
+        doist = doing.Doist(limit=limit, tock=tock)
+
+        bobPort = 5622  # bob's TCP listening port for server
+        bobHab = basing.Habitat(name="bob", ks=bobKS, db=bobDB, temp=True)
+        eveHab = basing.Habitat(name="eve", ks=eveKS, db=eveDB, temp=True)
+
+        bobServer = directing.SelectServer(host="", port=bobPort, timeout=0.25)
+        bobServerDoer = doing.ServerDoer(server=bobServer)
+        bobDirectant = directing.Directant(hab=bobHab, server=bobServer)
+
+        eveClient = clienting.Client(tymth=doist.tymen(), host='127.0.0.1', port=bobPort)
+        eveClientDoer = doing.ClientDoer(tymth=doist.tymen(), client=eveClient)
+        eveClient.tx(eveHab.makeOwnInception())
+
+        seen = dict(rants=0, doers=0)
+
+        @doing.doize()
+        def watchDo(tymth=None, tock=0.0, **opts):
+            while True:
+                seen["rants"] = max(seen["rants"], len(bobDirectant.rants))
+                seen["doers"] = max(seen["doers"], len(bobDirectant.doers))
+                yield
+
+        doers = [bobServerDoer, bobDirectant, eveClientDoer, watchDo]
+        doist.do(doers=doers)
+        assert doist.tyme == limit
+
+        assert bobServer.opened == False
+        assert eveClient.opened == False
+
+        # bob accepted and processed eve's inception then sent its receipt
+        assert eveHab.pre in bobHab.kevers
+        assert not eveClient.txbs
+        assert eveClient.rxbs
+        assert eveHab.pre.encode("utf-8") in eveClient.rxbs
+
+        # Reactant was serviced by readiness not run as a doer
+        assert seen["rants"] == 1
+        assert seen["doers"] == 1
+        assert not bobDirectant.active
+
+        # idle connection timed out so it and its Reactant were removed
+        assert not bobServer.ixes
+        assert not bobDirectant.rants
+        assert not bobServer.deadlines
+
+    assert not os.path.exists(eveDB.path)
+    assert not os.path.exists(bobDB.path)
+    """End Test"""
+
+
 def test_runcontroller_demo():
     """
     Test demo runController function
@@ -759,6 +759,27 @@ def test_manager():
         assert psigs == vsigs
         assert psigs == ['0BGu9G-EJ0zrRjrDKnHszLVcwhbkSRxniDJFmB2eWcRiFzNFw1QM5GHQnmnXz385SgunZH4sLidCMyzhJWmp1IBw']
 
+        # signers are cached by public key so db read only once
+        assert list(manager._signers) == ps.new.pubs
+        assert manager._signer(ps.new.pubs[0]) is manager._signers[ps.new.pubs[0]]
+        assert manager._signer(ps.new.pubs[0].encode("utf-8")) is manager._signers[ps.new.pubs[0]]
+
+        # batch sign many sers in one call
+        sers = [ser, b'abcdefghijklmnopqrstuvwxyz', ser]
+        sigerses = manager.signMany(sers=sers, verfers=verfers, indices=indices)
+        assert len(sigerses) == 3
+        assert [siger.qb64 for siger in sigerses[0]] == [siger.qb64 for siger in vsigers]
+        assert sigerses[2][0].qb64 == sigerses[0][0].qb64
+        assert sigerses[1][0].index == 3
+        assert sigerses[1][0].verfer.verify(sigerses[1][0].raw, sers[1])
+        cigarses = manager.signMany(sers=sers, pubs=ps.new.pubs, indexed=False)
+        assert [cigar.qb64 for cigar in cigarses[0]] == psigs
+
+        manager.clearSigners()
+        assert not manager._signers
+        assert manager.sign(ser=ser, verfers=verfers, indexed=False)[0].qb64 == psigs[0]
+        assert list(manager._signers) == ps.new.pubs
+
         # salty algorithm rotate
         oldpubs = [verfer.qb64 for verfer in verfers]
         verfers, digers, cst, nst = manager.rotate(pre=spre.decode("utf-8"))
@@ -813,6 +834,7 @@ def test_manager():
 
         for pub in deadpubs:
             assert not manager.keeper.getPri(key=pub.encode("utf-8"))
+            assert pub not in manager._signers  # erased from cache too
 
         # test .pubs db
         pl = json.loads(bytes(manager.keeper.getPubs(key=keeping.riKey(spre, ps.new.ridx))).decode("utf-8"))
@@ -1164,5 +1186,68 @@ def test_manager():
     """End Test"""
 
 
+def test_manager_stretch():
+    """
+    test Manager parallel and background key stretching
+    """
+    raw = b'0123456789abcdef'
+    salt = coring.Salter(raw=raw).qb64
+
+    with keeping.openKS() as keeper:
+        serial = keeping.Manager(keeper=keeper, salt=salt, workers=1)
+        assert serial.workers == 1
+        assert not serial.prestretch
+        sverfers, sdigers, cst, nst = serial.incept(icount=3, ncount=3, stem="a")
+        spre = sverfers[0].qb64
+        assert not serial._stretches
+        assert serial._pool is None  # serial never makes pool
+        srots = [serial.rotate(pre=spre, count=3) for i in range(2)]
+
+    with keeping.openKS() as keeper:
+        manager = keeping.Manager(keeper=keeper, salt=salt, workers=4,
+                                  prestretch=True)
+        verfers, digers, cst, nst = manager.incept(icount=3, ncount=3, stem="a")
+        pre = verfers[0].qb64
+        assert [verfer.qb64 for verfer in verfers] == [verfer.qb64 for verfer in sverfers]
+        assert [diger.qb64 for diger in digers] == [diger.qb64 for diger in sdigers]
+        assert pre in manager._stretches  # next rotation stretching in background
+
+        for srot in srots:  # rotate consumes prestretched set and queues next
+            params, futures = manager._stretches[pre]
+            rot = manager.rotate(pre=pre, count=3)
+            assert [v.qb64 for v in rot[0]] == [v.qb64 for v in srot[0]]
+            assert [d.qb64 for d in rot[1]] == [d.qb64 for d in srot[1]]
+            ps = helping.datify(keeping.PreSit,
+                                json.loads(bytes(keeper.getSit(key=pre)).decode("utf-8")))
+            assert params[5:8] == (manager.getPidx(), ps.nxt.ridx, ps.nxt.kidx)
+            assert not any(future.cancelled() for future in futures)
+            assert manager._stretches[pre][0] != params
+
+        # guessed wrong so discards prestretch and stretches requested count
+        verfers, digers, cst, nst = manager.rotate(pre=pre, count=1)
+        assert len(digers) == 1
+        assert manager._stretches[pre][0][4] == (coring.MtrDex.Ed25519_Seed, )
+
+        # prestretch moves with pre so rotate of new pre consumes it
+        verfers, digers, cst, nst = manager.incept(icount=1, ncount=1, stem="b")
+        old = verfers[0].qb64
+        new = coring.Diger(ser=old.encode("utf-8")).qb64  # stand in for derived pre
+        params, futures = manager._stretches[old]
+        manager.move(old=old, new=new)
+        assert old not in manager._stretches
+        assert manager._stretches[new] == (params, futures)
+        manager.rotate(pre=new)
+        assert not any(future.cancelled() for future in futures)  # consumed
+        assert manager._stretches[new][0] != params  # next one queued
+
+        manager.clearSigners()
+        assert not manager._stretches
+        assert manager._pool is not None
+        manager.close()
+        assert manager._pool is None
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_publot_pubsit()
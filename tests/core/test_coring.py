@@ -10,6 +10,7 @@ import blake3
 import json
 import hashlib
 import dataclasses
+import threading
 
 import msgpack
 import cbor2 as cbor
@@ -20,14 +21,16 @@ from fractions import Fraction
 
 from keri.kering import Version, Versionage
 from keri.kering import (EmptyMaterialError,  RawMaterialError, DerivationError,
-                         ValidationError, ShortageError)
+                         ValidationError, ShortageError, UnexpectedCodeError,
+                         UnexpectedCountCodeError, UnexpectedOpCodeError)
 from keri.help.helping import sceil
 
 from keri.core.coring import Sizage, MtrDex, Matter, IdrDex, Indexer, CtrDex, Counter
-from keri.core.coring import (Verfer, Cigar, Signer, Salter,
+from keri.core.coring import (Verfer, Verifier, Cigar, Signer, Salter,
                               Diger, Nexter, Prefixer)
 from keri.core.coring import generateSigners,  generateSecrets
 from keri.core.coring import intToB64, intToB64b, b64ToInt, b64ToB2, b2ToB64, nabSextets
+from keri.core.coring import B64ChrByIdx
 from keri.core.coring import Seqner, Siger, Dater
 from keri.core.coring import Serialage, Serials, Mimes, Vstrings
 from keri.core.coring import Versify, Deversify, Rever, VERFULLSIZE, MINSNIFFSIZE
@@ -200,6 +203,20 @@ def test_b64_conversions():
     p = nabSextets(b, 1)
     assert p == b'\xf8'
 
+    # table driven round trips and rejects non Base64 chars
+    for i in (0, 1, 63, 64, 4095, 4096, 2 ** 30 - 1, 2 ** 48 + 7):
+        for l in (1, 2, 5, 9):
+            cs = intToB64(i, l=l)
+            assert len(cs) >= l
+            assert b64ToInt(cs) == i
+            assert b64ToInt(cs.encode("utf-8")) == i
+            assert b64ToInt(memoryview(cs.encode("utf-8"))) == i
+    assert intToB64(3000, l=5) == "AAAu4"
+    with pytest.raises(ValueError):
+        b64ToInt("A=B")
+    with pytest.raises(ValueError):
+        b64ToInt("Aé")
+
     """End Test"""
 
 
@@ -307,6 +324,20 @@ def test_matter():
         ckey = b64ToB2(skey)
         assert Matter.Bizes[ckey] == sval
 
+    # Hards and Bards flatten Sizes into first byte dispatch tables
+    assert len(Matter.Hards) == len(Matter.Bards) == 256
+    for o in range(256):
+        assert Matter.Hards[o] == Matter.Sizes.get(chr(o), 0)
+        assert Matter.Bards[o] == Matter.Sizes.get(B64ChrByIdx[o >> 2], 0)
+
+    # unexpected starts raise same errors in both text and binary domains
+    for qb64 in ('-AAB', '_AAB'):
+        klas = UnexpectedCountCodeError if qb64[0] == '-' else UnexpectedOpCodeError
+        with pytest.raises(klas):
+            Matter(qb64b=qb64.encode("utf-8"))
+        with pytest.raises(klas):
+            Matter(qb2=b64ToB2(qb64))
+
     # verkey,  sigkey = pysodium.crypto_sign_keypair()
     verkey = b'iN\x89Gi\xe6\xc3&~\x8bG|%\x90(L\xd6G\xddB\xef`\x07\xd2T\xfc\xe1\xcd.\x9b\xe4#'
     prefix = 'BaU6JR2nmwyZ-i0d8JZAoTNZH3ULvYAfSVPzhzS6b5CM'  #  str
@@ -734,6 +765,46 @@ def test_matter():
     assert matter.transferable == False
     assert matter.digestive == False
     assert ims == extra   # stripped not include extra
+
+    # test zero copy memoryview of stream
+    ims = bytearray(prefixb) + extra
+    matter = Matter(qb64b=memoryview(ims))
+    assert matter.code == MtrDex.Ed25519N
+    assert matter.raw == verkey
+    assert matter.qb64b == prefixb
+    ims = bytearray(prebin) + extra
+    matter = Matter(qb2=memoryview(ims))
+    assert matter.raw == verkey
+    assert matter.qb2 == prebin
+
+    # test strip of variable length material
+    matter = Matter(raw=b'abcdef', code="9A", size=2)
+    assert matter.qb64 == '9AACYWJjZGVm'
+    assert matter._fullSize() == 12
+    extra = bytearray(b"ABCD")
+    ims = bytearray(matter.qb64b) + extra
+    vmatter = Matter(qb64b=ims, strip=True)
+    assert vmatter.raw == b'abcdef'
+    assert vmatter.size == 2
+    assert ims == extra
+    extra = bytearray([1, 2, 3, 4, 5])
+    ims = bytearray(matter.qb2) + extra
+    vmatter = Matter(qb2=ims, strip=True)
+    assert vmatter.raw == b'abcdef'
+    assert vmatter.qb64 == matter.qb64
+    assert ims == extra
+
+    # test slotted with lazily derived and cached qb64b and qb2
+    matter = Matter(raw=verkey, code=MtrDex.Ed25519N)
+    assert not hasattr(matter, "__dict__")
+    assert matter._qb64b is None and matter._qb2 is None
+    assert matter.qb64b == prefixb
+    assert matter.qb64b is matter._qb64b  # cached
+    assert matter.qb2 == prebin
+    assert matter.qb2 is matter._qb2
+    assert not hasattr(Verfer(qb64b=prefixb), "__dict__")
+    with pytest.raises(AttributeError):
+        matter.extra = True
     """ Done Test """
 
 
@@ -793,6 +864,12 @@ def test_indexer():
         ckey = b64ToB2(skey)
         assert Indexer.Bizes[ckey] == sval
 
+    # Hards and Bards flatten Sizes into first byte dispatch tables
+    assert len(Indexer.Hards) == len(Indexer.Bards) == 256
+    for o in range(256):
+        assert Indexer.Hards[o] == Indexer.Sizes.get(chr(o), 0)
+        assert Indexer.Bards[o] == Indexer.Sizes.get(B64ChrByIdx[o >> 2], 0)
+
 
     with pytest.raises(EmptyMaterialError):
         indexer = Indexer()
@@ -1027,6 +1104,41 @@ def test_indexer():
     assert indexer.qb64b == qsig64b
     assert indexer.qb2 == qsig2b
     assert ims == extra
+
+    # test zero copy memoryview of stream
+    ims = bytearray(qsig64b) + extra
+    indexer = Indexer(qb64b=memoryview(ims))
+    assert indexer.raw == sig
+    assert indexer.index == 5
+    assert indexer.qb64b == qsig64b
+    ims = bytearray(qsig2b) + extra
+    indexer = Indexer(qb2=memoryview(ims))
+    assert indexer.raw == sig
+    assert indexer.qb2 == qsig2b
+
+    # test strip of variable length material
+    indexer = Indexer(raw=b'abcdef', code=IdrDex.Label, index=2)
+    assert indexer._fullSize() == 12
+    extra = bytearray(b"ABCD")
+    ims = bytearray(indexer.qb64b) + extra
+    vindexer = Indexer(qb64b=ims, strip=True)
+    assert vindexer.raw == b'abcdef'
+    assert vindexer.index == 2
+    assert ims == extra
+    extra = bytearray([1, 2, 3, 4, 5])
+    ims = bytearray(indexer.qb2) + extra
+    vindexer = Indexer(qb2=ims, strip=True)
+    assert vindexer.qb64 == indexer.qb64
+    assert ims == extra
+
+    # test slotted with lazily derived and cached qb64b and qb2
+    indexer = Indexer(raw=sig, index=5)
+    assert not hasattr(indexer, "__dict__")
+    assert indexer.qb64b == qsig64b
+    assert indexer.qb64b is indexer._qb64b  # cached
+    assert indexer.qb2 == qsig2b
+    assert indexer.qb2 is indexer._qb2
+    assert not hasattr(Siger(qb64b=qsig64b), "__dict__")
     """ Done Test """
 
 
@@ -1130,6 +1242,26 @@ def test_counter():
         ckey = b64ToB2(skey)
         assert Counter.Bizes[ckey] == sval
 
+    # Hards flattens Sizes into second byte dispatch and Bards into first 12 bits
+    assert len(Counter.Hards) == 256
+    for o in range(256):
+        assert Counter.Hards[o] == Counter.Sizes.get('-' + chr(o), 0)
+    assert len(Counter.Bards) == 4096
+    for i in range(4096):
+        assert Counter.Bards[i] == Counter.Sizes.get(intToB64(i, l=2), 0)
+
+    # unsupported starts in either domain
+    with pytest.raises(ShortageError):
+        Counter(qb64b=b'-')
+    with pytest.raises(ShortageError):
+        Counter(qb2=b'\xf8')
+    with pytest.raises(UnexpectedOpCodeError):
+        Counter(qb64b=b'_AAB')
+    with pytest.raises(UnexpectedOpCodeError):
+        Counter(qb2=b64ToB2('_AAB'))
+    with pytest.raises(UnexpectedCodeError):
+        Counter(qb2=b64ToB2('AAAB'))
+
 
     with pytest.raises(EmptyMaterialError):
         counter = Counter()
@@ -1667,6 +1799,67 @@ def test_verfer():
         verfer = Verfer(raw=verkey, code=MtrDex.Blake3_256)
     """ Done Test """
 
+def test_verifier():
+    """
+    Test Verifier batch signature verification engine
+    """
+    signers = generateSigners(salt=b'0123456789abcdef', count=8)
+    ser = b'abcdefghijklmnopqrstuvwxyz0123456789'
+    triples = []
+    for i in range(32):
+        signer = signers[i % len(signers)]
+        cigar = signer.sign(ser)
+        if i % 5 == 0:  # wrong key so does not verify
+            verfer = signers[(i + 1) % len(signers)].verfer
+        else:
+            verfer = signer.verfer
+        triples.append((verfer, cigar.raw, ser))
+    expected = [i % 5 != 0 for i in range(32)]
+
+    verifier = Verifier(workers=0)  # serial
+    assert verifier.workers == 0
+    assert verifier.batch == Verifier.Batch
+    assert verifier.verify(triples) == expected
+    assert verifier._pool is None
+    assert verifier.verify([]) == []
+
+    verifier = Verifier(workers=4, batch=2)  # parallel
+    assert verifier.verify(triples) == expected
+    assert verifier._pool is not None
+    assert verifier.verify(triples[:1]) == expected[:1]  # small batch is serial
+    assert verifier.verify(iter(triples)) == expected  # any iterable
+    verifier.close()
+    assert verifier._pool is None
+    assert verifier.verify(triples) == expected  # recreates pool
+    verifier.close()
+
+    verifier = Verifier()  # defaults to cpu count
+    assert verifier.workers >= 1
+
+    # parallel matches serial in order over many chunks of one large batch
+    triples = triples * 32
+    expected = expected * 32
+    verifier = Verifier(workers=4, batch=2)
+    assert Verifier(workers=0).verify(triples) == expected
+    assert verifier.verify(triples) == expected
+    assert len(verifier._pool._threads) <= 4
+
+    # memo is per thread so shared verifier primes do not cross threads
+    verifier.prime(triples[:2])
+    assert len(verifier.memo) == 1  # only valid triple memoized
+    memos = []
+    thread = threading.Thread(target=lambda: memos.append(len(verifier.memo)))
+    thread.start()
+    thread.join()
+    assert memos == [0]
+    assert verifier.verify(triples) == expected  # memo hits and misses merge
+    verifier.clear()
+    assert not verifier.memo
+    verifier.close()
+    assert verifier._pool is None
+    """ Done Test """
+
+
 def test_cigar():
     """
     Test Cigar subclass of CryMat
@@ -2827,6 +3020,50 @@ def test_serder():
     assert not srdr.compare(dig=Diger(ser=ser1).qb64)  # codes match
     assert not srdr.compare(diger=Diger(ser=ser1, code=MtrDex.SHA3_256)) # codes not match
     assert not srdr.compare(dig=Diger(ser=ser1, code=MtrDex.SHA2_256).qb64b)     # codes not match
+
+    # test zero copy memoryview of stream
+    ims = bytearray(srdr.raw) + bytearray(b"-AAB")
+    vsrdr = Serder(raw=memoryview(ims))
+    assert vsrdr.raw == srdr.raw
+    assert isinstance(vsrdr.raw, bytes)
+    assert vsrdr.ked == srdr.ked
+    assert vsrdr.size == srdr.size
+    counter = Counter(qb64b=memoryview(ims)[vsrdr.size:])
+    assert counter.code == CtrDex.ControllerIdxSigs
+    assert counter.count == 1
+
+    # test lazy memoized views
+    vsrdr = Serder(raw=srdr.raw)
+    assert vsrdr._diger is None
+    assert vsrdr._verfers is None
+    assert vsrdr._sn is None and vsrdr._pre is None
+    diger = vsrdr.diger  # computed on first access
+    assert diger.qb64 == srdr.dig
+    assert vsrdr.diger is diger  # memoized
+    assert vsrdr.verfers is vsrdr.verfers
+    assert [verfer.qb64 for verfer in vsrdr.verfers] == vsrdr.ked.get("k", [])
+    vsrdr.raw = srdr.raw  # reset clears memoized views
+    assert vsrdr._diger is None and vsrdr._verfers is None
+    assert vsrdr.dig == srdr.dig
+
+    # test single pass exhale splices version string only when changed
+    ked = dict(v=Versify(kind=Serials.json, size=0), i="ABCDEFG", s="1", t="ixn")
+    srdr = Serder(ked=ked)
+    assert srdr.ked["v"] == Versify(kind=Serials.json, size=srdr.size)
+    assert srdr.raw.startswith(b'{"v":"' + srdr.ked["v"].encode("utf-8"))
+    raw = srdr.raw
+    srdr.ked = dict(srdr.ked)  # unchanged so no splice
+    assert srdr.raw == raw
+    for kind in (Serials.mgpk, Serials.cbor):
+        srdr.kind = kind
+        assert srdr.ked["v"] == Versify(kind=kind, size=srdr.size)
+        assert Serder(raw=srdr.raw).ked == srdr.ked
+    with pytest.raises(ValueError):
+        Serder(ked=dict(v=Versify(size=0) + "_", i="ABCDEFG"))  # bad size
+    with pytest.raises(ValueError):  # already correct but not leading
+        Serder(ked=dict(t="icp", i="", v=Versify(kind=Serials.json, size=42)))
+    with pytest.raises(ValueError):  # changed and not leading
+        Serder(ked=dict(t="icp", i="", v=Versify(kind=Serials.json, size=0)))
     """Done Test """
 
 
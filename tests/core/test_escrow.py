@@ -1426,6 +1426,80 @@ def test_unverified_trans_receipt_escrow():
     """End Test"""
 
 
+def test_woken_escrows():
+    """
+    Test dependency indexed event driven escrow processing
+    """
+    # two single sig transferable prefixes
+    salter = coring.Salter(raw=b'0123456789abcdef')
+    signers = [salter.signer(path="A", temp=True), salter.signer(path="B", temp=True)]
+    icps = []
+    ixns = []
+    for signer in signers:
+        nexter = coring.Nexter(keys=[signer.verfer.qb64])  # reuse key for next
+        srdr = eventing.incept(keys=[signer.verfer.qb64], nxt=nexter.qb64,
+                               code=coring.MtrDex.Blake3_256)
+        icps.append(eventing.messagize(srdr, sigers=[signer.sign(srdr.raw, index=0)]))
+        srdr = eventing.interact(pre=srdr.pre, dig=srdr.dig, sn=1)
+        ixns.append(eventing.messagize(srdr, sigers=[signer.sign(srdr.raw, index=0)]))
+    preA = coring.Serder(raw=icps[0]).pre
+    preB = coring.Serder(raw=icps[1]).pre
+
+    with dbing.openDB(name="edy") as db:
+        kvy = eventing.Kevery(db=db)
+        psr = eventing.Parser(kvy=kvy)
+
+        kvy.processWokenEscrows()  # first pass walks all escrows
+        assert kvy.walked is not None
+        assert not kvy.wakes
+
+        psr.process(ims=bytearray(ixns[0]))  # out of order for both
+        psr.process(ims=bytearray(ixns[1]))
+        assert kvy.wakes == {preA, preB}
+        assert len(kvy.db.getOoes(dbing.snKey(preA, 1))) == 1
+        assert len(kvy.db.getOoes(dbing.snKey(preB, 1))) == 1
+
+        # only escrows of pre
+        items = list(kvy._escrowItemsIter(kvy.db.getOoeItemsNextIter, pres={preB}))
+        assert len(items) == 1
+        assert dbing.splitKeySN(items[0][0]) == (preB.encode("utf-8"), 1)
+        items = list(kvy._escrowItemsIter(kvy.db.getOoeItemsNextIter))
+        assert len(items) == 2
+
+        kvy.processWokenEscrows()  # still out of order and reprocess does not rewake
+        assert not kvy.wakes
+        assert len(kvy.db.getOoes(dbing.snKey(preA, 1))) == 1
+
+        psr.process(ims=bytearray(icps[0]))  # accepted so wakes preA
+        assert kvy.wakes == {preA}
+        kvy.processWokenEscrows()
+        assert kvy.kevers[preA].sn == 1
+        assert not kvy.db.getOoes(dbing.snKey(preA, 1))
+        assert len(kvy.db.getOoes(dbing.snKey(preB, 1))) == 1  # not woken
+        assert preB not in kvy.kevers
+
+        # dependents woken by acceptance of event of prefix waited on
+        kvy.wakes = set()
+        kvy.depend(preB, preA)
+        assert kvy.deps == {preA: {preB}}
+        kvy.wake(preA.encode("utf-8"))
+        assert kvy.wakes == {preA, preB}
+        assert not kvy.deps
+
+        # periodic full walk
+        kvy.wakes = set()
+        kvy.walked -= kvy.TimeoutWalk
+        psr.process(ims=bytearray(icps[1]))
+        kvy.wakes = set()  # not woken but walk due
+        kvy.processWokenEscrows()
+        assert kvy.kevers[preB].sn == 1
+        assert not kvy.db.getOoes(dbing.snKey(preB, 1))
+
+    assert not os.path.exists(db.path)
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_out_of_order_escrow()
 
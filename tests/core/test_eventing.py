@@ -13,12 +13,12 @@ from math import ceil
 
 from keri.kering import Version
 from keri.kering import (ValidationError, EmptyMaterialError, DerivationError,
-                         ShortageError)
+                         ShortageError, VersionError)
 
 from keri.core.coring import MtrDex, Matter, IdrDex, Indexer, CtrDex, Counter
-from keri.core.coring import Seqner, Verfer, Signer, Diger, Nexter, Prefixer
+from keri.core.coring import Seqner, Verfer, Verifier, Signer, Diger, Nexter, Prefixer
 from keri.core.coring import Salter, Serder, Siger, Cigar
-from keri.core.coring import Ilks
+from keri.core.coring import Ilks, MINSNIFFSIZE
 
 from keri.core.eventing import (TraitDex, LastEstLoc, Serials, Versify,
                                 simple,  ample)
@@ -29,7 +29,7 @@ from keri.core.eventing import (SealDigest, SealRoot, SealEvent, SealLocation,
                                 StateEvent, StateEstEvent)
 from keri.core.eventing import (incept, rotate, interact, receipt,
                                 delcept, deltate, state, messagize)
-from keri.core.eventing import Kever, Kevery, Parser
+from keri.core.eventing import Kever, Kevery, KeverCache, Parser, DefaultVerifier
 
 from keri.db.dbing import dgKey, snKey, openDB, Baser
 from keri.base.keeping import openKS, Manager
@@ -2328,8 +2328,11 @@ def test_multisig_digprefix():
             msgs.extend(siger.qb64b)
 
         assert len(msgs) == 2699
+        pmsgs = bytearray(msgs)  # copy for parallel verifier below
 
         kevery = Kevery(db=vallgr)
+        assert kevery.verifier is DefaultVerifier  # shared so no pool per Kevery
+        assert Kevery(db=vallgr).verifier is kevery.verifier
         Parser().process(ims=msgs, kvy=kevery)
         # kevery.process(ims=msgs)
 
@@ -2340,6 +2343,17 @@ def test_multisig_digprefix():
         assert vkever.verfers[0].qb64 == kever.verfers[0].qb64
         assert vkever.verfers[0].qb64 == signers[5].verfer.qb64
 
+        # same stream with parallel batch verifier gives same key state
+        with openDB("pvalidator") as pvallgr:
+            verifier = Verifier(workers=2, batch=2)
+            pkevery = Kevery(db=pvallgr, verifier=verifier)
+            Parser().process(ims=pmsgs, kvy=pkevery)
+            assert pkevery.kevers[pre].verifier is verifier
+            assert pkevery.kevers[pre].sn == kever.sn
+            assert pkevery.kevers[pre].serder.dig == kever.serder.dig
+            assert verifier._pool is not None  # used pool for sigs
+            verifier.close()
+
     assert not os.path.exists(kevery.db.path)
 
     """ Done Test """
@@ -4381,6 +4395,183 @@ def test_parser():
     """ Done Test """
 
 
+def test_msg_extractor(monkeypatch):
+    """
+    Test Parser._msgExtractor resumable message framing
+    """
+    signer = Signer(qb64='ArwXoACJgOleVZ2PY7kXn7rA0II0mHYDhc6WrBH8fDAc')
+    serder = incept(keys=[signer.verfer.qb64])
+    siger = signer.sign(serder.raw, index=0)
+    counter = Counter(CtrDex.ControllerIdxSigs)
+    msg = serder.raw + counter.qb64b + siger.qb64b
+
+    inhales = []
+    inhale = Serder._inhale
+    def countInhale(self, raw):
+        inhales.append(len(raw))
+        return inhale(self, raw)
+    monkeypatch.setattr(Serder, "_inhale", countInhale)
+
+    ims = bytearray()
+    extractor = Parser._msgExtractor(ims=ims)
+    chunks = [msg[i:i+7] for i in range(0, len(msg), 7)]
+    result = None
+    for chunk in chunks:
+        ims.extend(chunk)
+        try:
+            next(extractor)
+        except StopIteration as ex:
+            result = ex.value
+            break
+
+    assert result.raw == serder.raw
+    assert len(inhales) == 1  # deserialized once only when all bytes received
+    assert inhales[0] >= serder.size
+    assert ims == msg[serder.size:len(ims) + serder.size]  # event stripped
+
+    # unsupported version is rejected as soon as version string is sniffed
+    raw = bytearray(serder.raw.replace(b"KERI10", b"KERI20", 1))
+    extractor = Parser._msgExtractor(ims=raw[:MINSNIFFSIZE])
+    with pytest.raises(VersionError):
+        next(extractor)
+
+    # whole stream still parses
+    with openDB("validator") as valDB:
+        kevery = Kevery(db=valDB)
+        parser = Parser(kvy=kevery)
+        parser.process(ims=bytearray(msg))
+        assert serder.pre in kevery.kevers
+
+    """ Done Test """
+
+
+def test_fetch_est_event():
+    """
+    Test Kevery.fetchEstEvent using establishment event index
+    """
+    salter = Salter(raw=b'0123456789abcdef')
+    signers = [salter.signer(path="{}".format(i), temp=True) for i in range(3)]
+
+    with openDB(name="controller") as db:
+        kvy = Kevery(db=db)
+        srdr = incept(keys=[signers[0].verfer.qb64],
+                      nxt=Nexter(keys=[signers[1].verfer.qb64]).qb64,
+                      code=MtrDex.Blake3_256)
+        pre = srdr.pre
+        icpdig = srdr.dig
+        kvy.processEvent(srdr, [signers[0].sign(srdr.raw, index=0)])
+        srdr = interact(pre=pre, dig=srdr.dig, sn=1)
+        kvy.processEvent(srdr, [signers[0].sign(srdr.raw, index=0)])
+        srdr = rotate(pre=pre, keys=[signers[1].verfer.qb64], dig=srdr.dig,
+                      nxt=Nexter(keys=[signers[2].verfer.qb64]).qb64, sn=2)
+        rotdig = srdr.dig
+        kvy.processEvent(srdr, [signers[1].sign(srdr.raw, index=0)])
+        srdr = interact(pre=pre, dig=srdr.dig, sn=3)
+        kvy.processEvent(srdr, [signers[1].sign(srdr.raw, index=0)])
+        assert kvy.kevers[pre].sn == 3
+
+        assert db.getEstItemLast(pre, 3) == (2, rotdig.encode("utf-8"))
+        assert kvy.fetchEstEvent(pre, 0).dig == icpdig
+        assert kvy.fetchEstEvent(pre, 1).dig == icpdig
+        assert kvy.fetchEstEvent(pre, 2).dig == rotdig
+        assert kvy.fetchEstEvent(pre, 3).dig == rotdig
+        assert kvy.fetchEstEvent(pre, 4) is None  # no event at sn
+
+        # not indexed so walks back
+        assert db.delEst(snKey(pre, 2))
+        assert db.delEst(snKey(pre, 0))
+        assert kvy.fetchEstEvent(pre, 3).dig == rotdig
+        assert kvy.fetchEstEvent(pre, 1).dig == icpdig
+
+    assert not os.path.exists(db.path)
+
+    """ Done Test """
+
+
+def test_kever_cache():
+    """
+    Test KeverCache bounded LRU Kevers rehydrated from key state records
+    """
+    salter = Salter(raw=b'0123456789abcdef')
+    signers = [salter.signer(path="{}".format(i), temp=True) for i in range(3)]
+
+    with openDB(name="controller") as db:
+        kevers = KeverCache(db=db, size=2)
+        kvy = Kevery(kevers=kevers, db=db)
+        assert kevers.loader == kvy.loadKever
+        assert kvy.reloadKevers() == 0  # rehydrates on demand instead
+
+        pres = []
+        for signer in signers:
+            srdr = incept(keys=[signer.verfer.qb64],
+                          nxt=Nexter(keys=[signer.verfer.qb64]).qb64,
+                          code=MtrDex.Blake3_256)
+            kvy.processEvent(srdr, [signer.sign(srdr.raw, index=0)])
+            pres.append(srdr.pre)
+
+        assert kevers.evicts == 1  # pres[0] evicted
+        assert list(kevers._kevers) == pres[1:]
+        assert pres[0] in kevers  # persisted so contained
+        assert "E" + "A" * 43 not in kevers
+        assert len(kevers) == 3
+        assert set(kevers) == set(pres)
+
+        kever = kevers[pres[0]]  # miss so rehydrate and evict pres[1]
+        assert kever.prefixer.qb64 == pres[0]
+        assert kever.sn == 0
+        assert kevers.misses == 1
+        assert kevers.evicts == 2
+        assert list(kevers._kevers) == [pres[2], pres[0]]
+        assert kevers[pres[0]] is kever  # hit
+        assert kevers.hits == 1
+
+        ixn = interact(pre=pres[0], dig=kever.serder.dig, sn=1)
+        kvy.processEvent(ixn, [signers[0].sign(ixn.raw, index=0)])
+        kevers[pres[1]]  # evicts pres[2]
+        kevers[pres[2]]  # evicts pres[0]
+        assert pres[0] not in kevers._kevers
+        assert kevers[pres[0]].sn == 1  # rehydrated with latest state
+        assert kevers.get("E" + "A" * 43) is None
+        assert kevers.metrics == dict(size=2, held=2, hits=2, misses=5, evicts=5)
+
+        del kevers[pres[0]]  # held and persisted
+        assert pres[0] not in kevers._kevers
+        assert pres[0] not in kevers
+        assert db.getState(pres[0].encode("utf-8")) is None
+        assert len(kevers) == 2
+        with pytest.raises(KeyError):
+            del kevers[pres[0]]
+        del kevers[pres[1]]
+        assert pres[1] not in kevers
+        kevers[pres[2]]
+        kevers._kevers.clear()  # drop from memory so only persisted
+        del kevers[pres[2]]
+        assert pres[2] not in kevers
+        assert len(kevers) == 0
+        assert list(kevers) == []
+
+        # clear removes held and persisted including held but not persisted
+        for signer in signers:
+            srdr = incept(keys=[signer.verfer.qb64],
+                          nxt=Nexter(keys=[signer.verfer.qb64]).qb64,
+                          code=MtrDex.Blake3_256)
+            kvy.processEvent(srdr, [signer.sign(srdr.raw, index=0)])
+        assert len(kevers) == 3
+        held = "E" + "B" * 43
+        kevers[held] = kevers[pres[0]]  # held without key state record
+        assert held in kevers
+        assert len(kevers) == 4
+        assert set(kevers) == set(pres + [held])
+        kevers.clear()  # used to loop forever
+        assert len(kevers) == 0
+        assert pres[0] not in kevers
+        assert held not in kevers
+        assert db.cntStates() == 0
+
+    assert not os.path.exists(db.path)
+
+    """ Done Test """
+
 
 if __name__ == "__main__":
     test_receipt()
@@ -3,12 +3,15 @@
 tests delegation primaily from keri.core.eventing
 
 """
+import io
 import os
+import re
 import datetime
 
 import pytest
 
 from keri import help
+from keri.kering import ShortageError, DatabaseError, ValidationError
 from keri.help import helping
 from keri.db import dbing
 from keri.base import basing, keeping, directing
@@ -623,6 +626,68 @@ def test_replay_all():
         debAllFelMsgs = debHab.replayAll()
         assert len(debAllFelMsgs) == 11267
 
+        # streamed clone in chunks of whole messages matches replay
+        chunks = list(debHab.db.cloneChunkIter(size=4096))
+        assert len(chunks) > 1
+        assert all(isinstance(chunk, memoryview) for chunk in chunks)
+        assert all(len(chunk) >= 4096 for chunk in chunks[:-1])
+        assert b''.join(chunks) == debAllFelMsgs
+        chunks = list(debHab.db.cloneChunkIter(pre=debHab.pre))
+        assert b''.join(chunks) == debHab.replay(pre=debHab.pre)
+
+        # lazy paged cursor reads each chunk in own short read transaction
+        pages = list(debHab.db.cloneCursorIter(pre=debHab.pre, fn=2, limit=3, size=1))
+        assert len(pages) == 3  # one msg per chunk since size=1
+        msgs = list(debHab.db.clonePreIter(pre=debHab.pre, fn=2))
+        assert [bytes(page) for page in pages] == msgs[:3]
+        assert (b''.join(debHab.db.cloneCursorIter(pre=debHab.pre)) ==
+                debHab.replay(pre=debHab.pre))
+        assert list(debHab.db.cloneCursorIter(pre=debHab.pre, fn=7)) == []
+
+        # query for logs page cues lazy cursor that is pulled as sent
+        serder = eventing.query(pre=debHab.pre, res="logs", fn=2, limit=3)
+        assert serder.ked["q"] == dict(i=debHab.pre, fn="2", limit="3")
+        qryKevery = eventing.Kevery(db=debHab.db)
+        qryKevery.processQuery(serder=serder)
+        cue = qryKevery.cues.popleft()
+        assert cue["kin"] == "replay"
+        assert not isinstance(cue["msgs"], (bytes, bytearray))
+        qryKevery.cues.append(cue)
+        assert b''.join(debHab.processCuesIter(qryKevery.cues)) == b''.join(msgs[:3])
+        serder = eventing.query(pre=debHab.pre, res="logs", fn=-1)
+        with pytest.raises(ValidationError):
+            qryKevery.processQuery(serder=serder)
+
+        # sharded clone by prefix ranges in parallel each to own out
+        shards = debHab.db.getFelShards(3)
+        assert len(shards) == 2  # Deb's 7 events outweigh the others
+        assert shards[-1][1] == b''
+        outs = [io.BytesIO() for shard in shards]
+        cursors = debHab.db.cloneShards(outs, shards=shards, size=1024)
+        assert b''.join(out.getvalue() for out in outs) == debAllFelMsgs
+        assert cursors == [stop for start, stop in shards[:-1]] + [dbing.MaxKey]
+        assert debHab.db.cloneShards(outs, shards=shards, cursors=cursors) == cursors
+        assert debHab.db.getFelShards(1) == [(shards[0][0], b'')]
+        with pytest.raises(DatabaseError):  # workers must not share write txn
+            with debHab.db.batch():
+                debHab.db.cloneShards(outs, shards=shards)
+
+        class Flaky(io.BytesIO):  # fails on second write
+            def write(self, data):
+                if self.tell():
+                    raise IOError("broken pipe")
+                return super().write(data)
+
+        outs = [Flaky() for shard in shards]
+        cursors = [start for start, stop in shards]
+        with pytest.raises(IOError):
+            debHab.db.cloneShards(outs, shards=shards, cursors=cursors, size=1024)
+        assert cursors != [start for start, stop in shards]  # progress kept
+        resumes = [io.BytesIO() for shard in shards]
+        debHab.db.cloneShards(resumes, shards=shards, cursors=cursors)
+        assert (b''.join(out.getvalue() + resume.getvalue()
+                         for out, resume in zip(outs, resumes)) == debAllFelMsgs)
+
         # create non-local kevery for Art to process conjoint replay msgs from Deb
         artKevery = eventing.Kevery(kevers=artHab.kevers,
                                         db=artHab.db,
@@ -642,6 +707,36 @@ def test_replay_all():
         artAllFelMsgs = artHab.replayAll()
         assert len(artAllFelMsgs) == 11016
 
+        # process same replay with pipelined parser and parallel verifier
+        with dbing.openDB(name="pip") as pipDB:
+            verifier = coring.Verifier(workers=2, batch=2)
+            pipKevery = eventing.Kevery(db=pipDB, verifier=verifier)
+            parser = eventing.Parser(pipeline=True)
+            parser.Batch = 4  # force multiple batches
+            parser.process(ims=bytearray(camIcpMsg), kvy=pipKevery)
+            parser.process(ims=bytearray(debAllFelMsgs), kvy=pipKevery, cloned=True)
+            assert not parser.frames
+            assert not verifier.memo  # cleared after each batch
+            assert debHab.pre in pipKevery.kevers
+            assert pipKevery.kevers[debHab.pre].sn == debHab.kever.sn == 6
+            assert pipKevery.kevers[camHab.pre].sn == camHab.kever.sn == 0
+            assert bevHab.pre in pipKevery.kevers
+            pipDebFelMsgs = bytearray(b''.join(pipDB.clonePreIter(pre=debHab.pre)))
+            assert len(pipDebFelMsgs) == len(artHab.replay(pre=debHab.pre))
+            verifier.close()
+
+            # clone from binary qb2 storage is same qb64 stream
+            with dbing.openDB(name="bin", binary=True) as binDB:
+                binKevery = eventing.Kevery(db=binDB)
+                parser = eventing.Parser()
+                parser.process(ims=bytearray(camIcpMsg), kvy=binKevery)
+                parser.process(ims=bytearray(debAllFelMsgs), kvy=binKevery, cloned=True)
+                assert binKevery.kevers[debHab.pre].sn == debHab.kever.sn == 6
+                # first seen datetimes differ so mask them
+                dater = re.compile(rb'1AAG[A-Za-z0-9_-]{32}')
+                assert (dater.sub(b'', b''.join(binDB.clonePreIter(pre=debHab.pre))) ==
+                        dater.sub(b'', b''.join(pipDB.clonePreIter(pre=debHab.pre))))
+
 
     assert not os.path.exists(artKS.path)
     assert not os.path.exists(artDB.path)
@@ -655,5 +750,78 @@ def test_replay_all():
     """End Test"""
 
 
+def test_convert_stream():
+    """
+    Test en masse conversion of attachment groups between text and binary
+    """
+    with dbing.openDB(name="deb") as debDB, keeping.openKS(name="deb") as debKS, \
+         dbing.openDB(name="cam") as camDB, keeping.openKS(name="cam") as camKS, \
+         dbing.openDB(name="bev") as bevDB, keeping.openKS(name="bev") as bevKS, \
+         dbing.openDB(name="art") as artDB:
+
+        debHab = basing.Habitat(ks=debKS, db=debDB, isith='2', icount=3,
+                                temp=True)
+        camHab = basing.Habitat(ks=camKS, db=camDB, isith='2', icount=3,
+                                temp=True)
+        bevHab = basing.Habitat(ks=bevKS, db=bevDB, isith='1', icount=1,
+                                transferable=False, temp=True)
+
+        # own events with ControllerIdxSigs groups
+        msgs = bytearray()
+        msgs.extend(debHab.makeOwnInception())
+        msgs.extend(debHab.interact())
+        msgs.extend(debHab.rotate())
+        msgs.extend(camHab.makeOwnInception())
+        camHab.psr.process(ims=bytearray(msgs))
+        bevHab.psr.process(ims=bytearray(msgs))
+
+        # receipts with TransIndexedSigGroups and NonTransReceiptCouples
+        serder = coring.Serder(raw=bytes(debHab.makeOwnEvent(sn=1)))
+        msgs.extend(camHab.receipt(serder))
+        msgs.extend(bevHab.receipt(serder))
+        # replay with pipelined FirstSeenReplayCouples
+        msgs.extend(debHab.replay())
+
+        # sizeGroup walks counted group without creating primitives
+        serder = coring.Serder(raw=bytes(msgs))
+        size = eventing.sizeGroup(msgs[serder.size:], cold=eventing.Colds.txt)
+        ims = bytearray(msgs[serder.size:])
+        ctr = coring.Counter(qb64b=ims, strip=True)
+        assert ctr.code == coring.CtrDex.ControllerIdxSigs
+        for i in range(ctr.count):
+            coring.Siger(qb64b=ims, strip=True)
+        assert size == len(msgs) - serder.size - len(ims)
+        with pytest.raises(ShortageError):
+            eventing.sizeGroup(msgs[serder.size:serder.size + size - 1])
+
+        # text to binary and back round trips
+        bny = eventing.convertStream(msgs, cold=eventing.Colds.bny, strip=False)
+        assert len(bny) < len(msgs)
+        assert bny.count(b'{"v":"KERI10JSON') == msgs.count(b'{"v":"KERI10JSON')
+        assert eventing.sizeGroup(bny[serder.size:],
+                                  cold=eventing.Colds.bny) == size * 3 // 4
+        txt = eventing.convertStream(bny, cold=eventing.Colds.txt, strip=False)
+        assert txt == msgs
+        assert eventing.convertStream(bny, cold=eventing.Colds.bny,
+                                      strip=False) == bny
+
+        # incremental conversion of live stream leaves partial tail in ims
+        ims = bytearray()
+        out = bytearray()
+        for i in range(0, len(msgs), 97):
+            ims.extend(msgs[i:i + 97])
+            out.extend(eventing.convertStream(ims))
+        assert not ims
+        assert out == bny
+
+        # binary stream parses to same key state
+        artKvy = eventing.Kevery(db=artDB)
+        eventing.Parser().process(ims=bytearray(bny), kvy=artKvy)
+        assert artKvy.kevers[debHab.pre].sn == debHab.kever.sn
+        assert artKvy.kevers[camHab.pre].sn == camHab.kever.sn
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_replay_all()
@@ -6,6 +6,9 @@ tests.db.dbing module
 import pytest
 
 import os
+import shutil
+import tempfile
+import threading
 import json
 import datetime
 import lmdb
@@ -18,6 +21,7 @@ from keri.db.dbing import (dgKey, onKey, fnKey, snKey, dtKey, splitKey,
                            splitKeyON, splitKeyFN, splitKeySN, splitKeyDT)
 from keri.db.dbing import LMDBer, Baser
 
+from keri import kering
 from keri.core.coring import Signer, Nexter, Prefixer, Serder
 from keri.core.coring import MtrDex, MtrDex, MtrDex
 from keri.core.coring import Serials, Vstrings, Versify
@@ -229,6 +233,81 @@ def test_lmdber():
         assert dber.delVal(db, key) == True
         assert dber.getVal(db, key) == None
 
+        # test write batch commits all writes at once on exit
+        assert not dber.batching
+        with dber.batch():
+            assert dber.batching
+            assert dber.putVal(db, key, val) == True
+            assert dber.getVal(db, key) == val  # sees own uncommitted write
+            with dber.batch():  # nested commits into outer batch
+                assert dber.setVal(db, b'B', val) == True
+            assert list(dber.getAllItemIter(db)) == [(key, val), (b'B', val)]
+            with dber.env.begin(db=db) as txn:  # other readers see nothing yet
+                assert txn.get(key) == None
+        assert not dber.batching
+        assert dber.getVal(db, key) == val
+        assert dber.getVal(db, b'B') == val
+
+        # test write batch aborts all writes on exception
+        with pytest.raises(ValueError):
+            with dber.batch():
+                assert dber.delVal(db, key) == True
+                assert dber.setVal(db, b'C', val) == True
+                raise ValueError("abort")
+        assert not dber.batching
+        assert dber.getVal(db, key) == val
+        assert dber.getVal(db, b'C') == None
+
+        # test failed nested batch rolls back only its own writes
+        with dber.batch():
+            assert dber.setVal(db, b'C', val) == True
+            with pytest.raises(ValueError):
+                with dber.batch():
+                    assert dber.setVal(db, b'D', val) == True
+                    assert dber.delVal(db, key) == True
+                    raise ValueError("abort nested")
+            assert dber.batching
+            assert dber.getVal(db, b'D') == None
+            assert dber.getVal(db, key) == val
+        assert dber.getVal(db, b'C') == val
+        assert dber.getVal(db, b'D') == None
+        assert dber.getVal(db, key) == val
+        assert dber.delVal(db, b'C') == True
+
+        # test onAbort callables run when their batch aborts
+        aborted = []
+        dber.onAbort(lambda: aborted.append("none"))  # ignored not batching
+        with pytest.raises(ValueError):
+            with dber.batch():
+                dber.onAbort(lambda: aborted.append("outer"))
+                with pytest.raises(ValueError):
+                    with dber.batch():
+                        dber.onAbort(lambda: aborted.append("failed"))
+                        raise ValueError("abort nested")
+                with dber.batch():
+                    dber.onAbort(lambda: aborted.append("nested"))
+                assert aborted == ["failed"]
+                raise ValueError("abort")
+        assert aborted == ["failed", "nested", "outer"]  # reverse order
+        with dber.batch():
+            dber.onAbort(lambda: aborted.append("committed"))
+        assert aborted == ["failed", "nested", "outer"]
+
+        # test batch is per thread so other threads neither join nor see it
+        seen = []
+        with dber.batch():
+            assert dber.setVal(db, b'C', val) == True
+            thread = threading.Thread(target=lambda: seen.append((dber.batching,
+                                                                  dber.getVal(db, b'C'))))
+            thread.start()
+            thread.join()
+        assert seen == [(False, None)]
+        assert dber.getVal(db, b'C') == val
+        assert dber.delVal(db, b'C') == True
+
+        assert dber.delVal(db, key) == True
+        assert dber.delVal(db, b'B') == True
+
         # test OrdVal OrdItem ordinal numbered event sub db
         db = dber.env.open_db(key=b'seen.')
 
@@ -357,6 +436,17 @@ def test_lmdber():
         items = [item for item in dber.getAllOrdItemAllPreIter(db, key=onKey(preC, 1))]
         assert items == []
 
+        # last entry at or before on for pre
+        assert dber.getOrdItemPreLast(db, preB) == (4, digY)
+        assert dber.getOrdItemPreLast(db, preB, on=2) == (2, digW)
+        assert dber.getOrdItemPreLast(db, preC, on=7) == (0, digC)  # last in db
+        assert dber.getOrdItemPreLast(db, preB.decode("utf-8"), on=0) == (0, digU)
+        assert dber.delVal(db, keyB0) == True
+        assert dber.getOrdItemPreLast(db, preB, on=0) == None  # earlier pre only
+        assert dber.delVal(db, keyA0) == True
+        assert dber.getOrdItemPreLast(db, preB, on=0) == None  # empty before
+        assert dber.getOrdItemPreLast(db, preA) == None
+
 
         # test Vals dup methods.  dup vals are lexocographic
         key = b'A'
@@ -638,6 +728,89 @@ def test_lmdber():
     """ End Test """
 
 
+def test_lmdber_map_durability():
+    """
+    Test LMDBer map size, growth on full map, and durability modes
+    """
+    with pytest.raises(kering.ConfigurationError):
+        LMDBer(name="bad", temp=True, durability="never")
+
+    key = b'A' * 44
+    val = b'x' * 1024
+    with openLMDB(name="grow", mapSize=65536) as dber:
+        assert dber.mapSize == 65536
+        assert dber.env.info()['map_size'] == 65536
+        assert dber.durability == 'sync'
+        db = dber.env.open_db(key=b'beep.')
+        for i in range(200):  # about 200 KiB overflows 64 KiB map
+            assert dber.putVal(db, b'%s.%032x' % (key, i), val) == True
+        assert dber.mapSize > 65536
+        assert dber.env.info()['map_size'] == dber.mapSize
+        assert dber.getVal(db, b'%s.%032x' % (key, 199)) == val
+
+        # batch aborts on full map but grows so retry succeeds
+        size = dber.mapSize
+        count = size // len(val)  # enough to overflow current map
+        with pytest.raises(lmdb.MapFullError):
+            with dber.batch():
+                for i in range(count):
+                    dber.putVal(db, b'%s.%032x' % (b'B' * 44, i), val)
+        assert dber.mapSize == size * dber.MapGrowth
+        assert dber.getVal(db, b'%s.%032x' % (b'B' * 44, 0)) == None
+        while True:  # caller retries aborted batch until map is big enough
+            try:
+                with dber.batch():
+                    for i in range(count):
+                        dber.putVal(db, b'%s.%032x' % (b'B' * 44, i), val)
+                break
+            except lmdb.MapFullError:
+                pass
+        assert dber.mapSize > size * dber.MapGrowth
+        assert dber.getVal(db, b'%s.%032x' % (b'B' * 44, count - 1)) == val
+
+    with openLMDB(name="nogrow", mapSize=65536, grow=False) as dber:
+        db = dber.env.open_db(key=b'beep.')
+        with pytest.raises(lmdb.MapFullError):
+            for i in range(200):
+                dber.putVal(db, b'%s.%032x' % (key, i), val)
+        assert dber.mapSize == 65536
+
+    for durability in ('nometasync', 'writemap'):
+        with openLMDB(name=durability, durability=durability, syncPeriod=0.0) as dber:
+            assert dber.durability == durability
+            synced = dber._synced
+            db = dber.env.open_db(key=b'beep.')
+            assert dber.putVal(db, key, val) == True
+            assert dber._synced >= synced
+            with dber.batch():
+                assert dber.setVal(db, key, b'y') == True
+            assert dber.getVal(db, key) == b'y'
+            # failed nested batch aborts outer batch only when no child txns
+            try:
+                with dber.batch():
+                    assert dber.setVal(db, key, b'z') == True
+                    with pytest.raises(ValueError):
+                        with dber.batch():
+                            raise ValueError("abort nested")
+            except kering.DatabaseError:
+                assert durability == 'writemap'
+                assert dber.getVal(db, key) == b'y'
+            else:
+                assert durability == 'nometasync'
+                assert dber.getVal(db, key) == b'z'
+
+    with openDB(name="witness", durability='writemap', syncPeriod=3600.0,
+                mapSize=1048576) as baser:
+        synced = baser._synced
+        assert baser.putVal(baser.evts, key, val) == True
+        assert baser._synced == synced  # not due
+        baser.sync()
+        assert baser._synced > synced
+        assert baser.mapSize == 1048576
+
+    """End Test"""
+
+
 def test_baser():
     """
     Test Baser class
@@ -661,6 +834,9 @@ def test_baser():
     assert isinstance(baser.pses, lmdb._Database)
     assert isinstance(baser.dels, lmdb._Database)
     assert isinstance(baser.ldes, lmdb._Database)
+    assert isinstance(baser.stts, lmdb._Database)
+    assert isinstance(baser.exps, lmdb._Database)
+    assert isinstance(baser.exds, lmdb._Database)
 
     baser.close(clear=True)
     assert not os.path.exists(baser.path)
@@ -770,6 +946,111 @@ def test_baser():
         assert db.delEvt(key) == True
         assert db.getEvt(key) == None
 
+        #  test .stts sub db methods
+        assert db.getState(preb) == None
+        assert db.delState(preb) == False
+        assert db.putState(preb, val=skedb) == True
+        assert db.getState(preb) == skedb
+        assert db.putState(preb, val=skedb) == False
+        assert db.setState(preb, val=skedb) == True
+        assert db.getState(preb) == skedb
+        assert db.setState(vdigb, val=valb) == True
+        assert list(db.getStateItemIter()) == [(preb, skedb), (vdigb, valb)]
+        assert list(db.getStateItemIter(key=vdigb)) == [(vdigb, valb)]
+        assert db.delState(preb) == True
+        assert db.delState(vdigb) == True
+        assert db.getState(preb) == None
+        assert list(db.getStateItemIter()) == []
+
+        # test .ests establishment event index
+        assert db.getEst(snKey(preb, 0)) == None
+        assert db.getEstItemLast(preb, 3) == None
+        assert db.putEst(snKey(preb, 0), val=digb) == True
+        assert db.putEst(snKey(preb, 0), val=digb) == False
+        assert db.setEst(snKey(preb, 2), val=vdigb) == True
+        assert db.getEst(snKey(preb, 2)) == vdigb
+        assert db.getEstItemLast(preb, 0) == (0, digb)
+        assert db.getEstItemLast(preb, 1) == (0, digb)
+        assert db.getEstItemLast(preb, 5) == (2, vdigb)
+        assert db.delEst(snKey(preb, 2)) == True
+        assert db.getEstItemLast(preb, 5) == (0, digb)
+        assert db.delEst(snKey(preb, 0)) == True
+        assert db.getEstItemLast(preb, 5) == None
+
+        # test .exps escrow expiry index
+        dtsA = b'2021-02-13T19:16:50.750302+00:00'
+        dtsB = b'2021-02-13T19:16:51.750302+00:00'
+        ekey = snKey(preb, 1)
+        assert db.addExp(dtKey(b'ooes', dtsA), val=ekey + b' ' + digb) == True
+        assert list(db.getExpItemIter()) == [(dtKey(b'ooes', dtsA), ekey + b' ' + digb)]
+        assert db.delExp(dtKey(b'ooes', dtsA)) == True
+        assert list(db.getExpItemIter()) == []
+
+        assert db.addOoe(ekey, val=digb) == True  # indexes escrow time
+        assert db.addOoe(ekey, val=digb) == False  # dup so not reindexed
+        assert db.addPse(ekey, val=digb) == True
+        items = list(db.getExpItemIter())
+        assert len(items) == 2
+        assert splitKey(items[0][0], sep=b'|')[0] == b'ooes'
+        assert items[0][1] == ekey + b' ' + digb
+        assert splitKey(items[1][0], sep=b'|')[0] == b'pses'
+        assert db.delExpiredEscrows(b'ooes', dtsA) == []  # none before cutoff
+        assert db.getOoes(ekey) == [digb]
+        dts = nowIso8601()  # cutoff after escrow
+        assert db.delExpiredEscrows(b'ooes', dts) == [(ekey, digb)]
+        assert db.getOoes(ekey) == []
+        assert db.getPses(ekey) == [digb]  # other escrow tables unaffected
+        assert len(list(db.getExpItemIter())) == 1
+        assert db.delExpiredEscrows("pses", dts) == [(ekey, digb)]
+        assert list(db.getExpItemIter()) == []
+
+        # unescrowed then escrowed again so stale index entry does not expire it
+        assert db.addPse(ekey, val=digb) == True
+        dts = nowIso8601()  # cutoff after first escrow
+        assert db.delPse(ekey, digb) == True
+        assert db.addPse(ekey, val=digb) == True
+        assert len(list(db.getExpItemIter())) == 2
+        assert db.delExpiredEscrows(b'pses', dts) == []
+        assert db.getPses(ekey) == [digb]
+        assert len(list(db.getExpItemIter())) == 1  # stale entry removed
+        assert db.delExpiredEscrows(b'pses', nowIso8601()) == [(ekey, digb)]
+        assert db.getPses(ekey) == []
+        assert list(db.getExpItemIter()) == []
+        assert list(db.getAllItemIter(db.exds)) == []
+
+        # entry already unescrowed by processing is not reported as expired
+        assert db.addOoe(ekey, val=digb) == True
+        assert db.delOoe(ekey, digb) == True
+        assert db.delExpiredEscrows(b'ooes', nowIso8601()) == []
+        assert list(db.getExpItemIter()) == []
+
+        # entries escrowed before .exps existed are indexed from .dtss
+        assert db.getVal(db.gbls, b'exps') == b'1'  # indexed when opened
+        assert db.putDts(dgKey(preb, digb), val=dtsA) == True
+        assert db.addIoVal(db.ooes, ekey, digb) == True  # unindexed
+        assert db.addIoVal(db.ooes, ekey, vdigb) == True  # no dts so now
+        assert db.indexEscrows(size=1) == 2
+        assert db.indexEscrows() == 0  # already indexed
+        assert db.delExpiredEscrows(b'ooes', dtsB) == [(ekey, digb)]
+        assert db.delExpiredEscrows(b'ooes', nowIso8601()) == [(ekey, vdigb)]
+        assert db.getOoes(ekey) == []
+        assert db.delDts(dgKey(preb, digb)) == True
+
+        # chunked walk resumes after last item across dups and keys
+        assert db.putVals(db.sigs, b'a', [b'1', b'2', b'3']) == True
+        assert db.putVals(db.sigs, b'b', [b'1']) == True
+        chunks, item = [], None
+        while (items := db.getItemChunk(db.sigs, item=item, size=2)):
+            chunks.append(items)
+            item = items[-1]
+        assert chunks == [[(b'a', b'1'), (b'a', b'2')], [(b'a', b'3'), (b'b', b'1')]]
+        assert db.getItemChunk(db.sigs, item=(b'a', b'9')) == [(b'b', b'1')]
+        assert db.putVal(db.evts, b'a', b'x') == True
+        assert db.putVal(db.evts, b'b', b'y') == True
+        assert db.getItemChunk(db.evts, item=(b'a', b'x')) == [(b'b', b'y')]
+        assert db.delVals(db.sigs, b'a') and db.delVals(db.sigs, b'b')
+        assert db.delVal(db.evts, b'a') and db.delVal(db.evts, b'b')
+
         # test first seen event log .fels sub db
         preA = b'B8KY1sKmgyjAiUDdUBPNPyrSz_ad_Qf9yzhDNZlEKiMc'
         preB = b'EH7Oq9oxCgYa-nnNLvwhp9sFZpALILlRYyB-6n4WDi7w'
@@ -2314,6 +2595,99 @@ def test_baser():
 
     """ End Test """
 
+def test_baser_binary():
+    """
+    Test Baser CESR storage domain binary qb2 versus text qb64 and migrate
+    """
+    preb = 'BWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc'.encode("utf-8")
+    digb = 'EGAPkzNZMtX-QiVgbRbyAIZGoXvbGv9IPb0foWTZvI_4'.encode("utf-8")
+    sigs = [b'AAFdGIbFqeTKwT9dpD-EYK2zkMhsRx2D9FhSkmcm8Ra3-G2zVeQMXwRsVUq1qmaR'
+            b'9o_sZlMnfXKzSLnbs6HSGnBw',
+            b'ABlLy1krhY2GFSu3fYh1ZtXb6rHlDmFAGYpohCKjR-HeLmx64mwJkxs5LS1E2UMs'
+            b'_9tl7oDVrtsXYzvhCOvkjvAQ']
+    dgkey = dgKey(preb, digb)
+    snkey = snKey(preb, 0)
+
+    head = tempfile.mkdtemp()
+    db = Baser(name="bin", headDirPath=head, temp=False, binary=True)
+    assert db.binary == True
+    assert db.getVal(db.gbls, b'cesr') == b'bny'
+    assert db.putSigs(dgkey, sigs) == True
+    assert db.getSigs(dgkey) == sigs
+    assert [val for val in db.getSigsIter(dgkey)] == sigs
+    assert db.addPse(snkey, digb) == True
+    assert db.getPses(snkey) == [digb]
+    # stored in binary at 3/4 the size of text
+    assert [len(val) for val in db.getVals(db.sigs, dgkey)] == [66, 66]
+    assert len(db.getIoVals(db.pses, snkey)[0]) == 33
+    db.close()
+
+    with pytest.raises(kering.ConfigurationError):
+        Baser(name="bin", headDirPath=head, temp=False, binary=False)
+
+    db = Baser(name="bin", headDirPath=head, temp=False)  # adopts stored domain
+    assert db.binary == True
+    assert db.getSigs(dgkey) == sigs
+
+    assert db.migrate(binary=False) == 3
+    assert db.binary == False
+    assert db.getVal(db.gbls, b'cesr') == b'txt'
+    assert db.getSigs(dgkey) == sigs
+    assert db.getPses(snkey) == [digb]
+    assert [len(val) for val in db.getVals(db.sigs, dgkey)] == [88, 88]
+    assert db.migrate(binary=False) == 0  # already text
+    db.close()
+
+    # interrupted chunked migration resumes where it left off
+    db = Baser(name="bin", headDirPath=head, temp=False, binary=False)
+    migrateItems = db._migrateItems
+    calls = []
+    def crashing(*pa, **kwa):
+        if len(calls) == 6:
+            raise IOError("crash")
+        calls.append(pa)
+        return migrateItems(*pa, **kwa)
+    db._migrateItems = crashing
+    with pytest.raises(IOError):
+        db.migrate(binary=True, size=1)
+    assert db.getVal(db.gbls, b'migr') is not None
+    assert db.getVal(db.gbls, b'cesr') == b'txt'  # domain not yet changed
+    del db._migrateItems
+    with pytest.raises(kering.ConfigurationError):  # must finish same way
+        db.migrate(binary=False)
+    db.migrate(binary=True, size=1)
+    assert db.getVal(db.gbls, b'migr') is None
+    assert list(db.getAllItemIter(db.migs)) == []
+    db.close()
+
+    db = Baser(name="bin", headDirPath=head, temp=False, binary=True)
+    assert db.getSigs(dgkey) == sigs
+    assert db.getPses(snkey) == [digb]
+    # escrow expiry index entries migrate with their escrow entries
+    assert db.delExpiredEscrows(b'pses', '2100-01-01T00:00:00.000000+00:00') == [(snkey, digb)]
+    assert db.getPses(snkey) == []
+    db.close(clear=True)
+    shutil.rmtree(head)
+
+    # existing database without recorded domain is text
+    with openDB() as db:
+        assert db.binary == False
+        assert db.getVal(db.gbls, b'cesr') == b'txt'
+
+    # migration grows small map as it goes
+    with openDB(name="small", mapSize=65536, binary=True) as db:
+        psize, i = db.env.stat()["psize"], 0
+        while (db.env.info()["last_pgno"] * psize) < db.mapSize * 3 // 4:
+            assert db.putSigs(dgKey(preb, b'%d' % i), sigs) == True
+            i += 1
+        size = db.mapSize  # three quarters full so no room for copy
+        db.migrate(binary=False, size=64)  # text is 4/3 size of binary
+        assert db.mapSize > size
+        assert db.getSigs(dgKey(preb, b'%d' % (i - 1))) == sigs
+
+    """End Test"""
+
+
 def test_fetchkeldel():
     """
     Test fetching full KEL and full DEL from Baser
@@ -2,7 +2,7 @@ import pytest
 
 from keri.base import basing, keeping, directing
 from keri.core.coring import Versify, Serials, Ilks, MtrDex, Prefixer, Serder, Signer, Seqner, Diger
-from keri.core.eventing import TraitDex, SealEvent
+from keri.core.eventing import TraitDex, SealEvent, query
 from keri.db import dbing
 from keri.db.dbing import snKey, dgKey
 from keri.vdr import eventing, viring
@@ -701,6 +701,26 @@ def test_tevery():
         assert tev.vcState(vcdig) == VcStates.revoked
         assert tev.vcSn(vcdig) == 1
 
+        # query for tels cues lazy cursor paged over management then vc TEL
+        msgs = list(reg.cloneIter(regk)) + list(reg.cloneIter(nsKey([regk, vcdig])))
+        assert len(msgs) == 3
+        qry = query(pre=vcdig.decode("utf-8"), res="tels", limit=2).ked
+        qry["q"]["ri"] = regk
+        tvy.processQuery(serder=Serder(ked=qry))
+        cue = tvy.cues.pop()
+        assert cue["kin"] == "replay"
+        assert not isinstance(cue["msgs"], (bytes, bytearray))
+        assert b''.join(cue["msgs"]) == b''.join(msgs[:2])
+
+        qry = query(pre=vcdig.decode("utf-8"), res="tels").ked
+        qry["q"]["ri"] = regk
+        tvy.processQuery(serder=Serder(ked=qry))
+        assert b''.join(tvy.cues.pop()["msgs"]) == b''.join(msgs)
+
+        qry["q"]["limit"] = "-1"
+        with pytest.raises(ValidationError):
+            tvy.processQuery(serder=Serder(ked=qry))
+
 
 def buildHab(db, kpr):
     kevers = dict()
@@ -339,6 +339,14 @@ def test_clone():
             b'PjioY7Ycna6ouhSSH0QcKsEjce10HCXIW_XtmEYr9SrB5BA-GAB0AAAAAAAAAAAAAAAAAAAAABCEzpq06UecHwzy-K9FpNoRxCJp2wIG'
             b'M9u2Edk-PLMZ1H4')
 
+        # lazy paged cursor reads each chunk in own short read transaction
+        pages = list(issuer.cloneCursorIter(regk, fn=1, size=1))
+        assert len(pages) == 2  # one msg per chunk since size=1
+        assert [bytes(page) for page in pages] == list(issuer.cloneIter(regk, fn=1))
+        assert b''.join(issuer.cloneCursorIter(regk)) == msgs
+        assert len(list(issuer.cloneCursorIter(regk, size=1, limit=2))) == 2
+        assert list(issuer.cloneCursorIter(regk, fn=3)) == []
+
 
 if __name__ == "__main__":
     test_clone()